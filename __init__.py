@@ -29,6 +29,7 @@ from .load import *
 from .load import __all__ as load_all
 from . import plot
 from . import defect
+from . import analysis
 
 
 __all__ = ['__version__'] + dump_all + core_all + load_all
@@ -0,0 +1,322 @@
+# coding: utf-8
+# Standard Python libraries
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+from .. import NeighborList, System
+from ..load import load
+from ..defect import slip_vector, disregistry, Strain
+from ..defect.batch_strain import batch_strain
+from ..tools import aslist
+
+class Pipeline():
+    """
+    Streams the frames of a trajectory through per-frame analyses that are
+    all computed relative to a single reference system.  The reference
+    neighbor list and p vectors are built once and reused for every frame,
+    and the per-frame results are collected into chunks of stacked arrays.
+    """
+
+    def __init__(self, reference, analyses=None, neighbors=None, cutoff=None,
+                 theta_max=27, strainkeys=None, m=[1.0, 0.0, 0.0],
+                 n=[0.0, 1.0, 0.0], planepos=[0.0, 0.0, 0.0], symbols=None,
+                 nprocs=1, maxpending=None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        reference : atomman.System
+            The reference system.  The atoms of every frame must directly
+            correspond to the atoms of the reference, i.e. have the same
+            number and order of atoms.
+        analyses : str or list, optional
+            The analyses to run for each frame: 'slip_vector', 'strain' and/or
+            'disregistry'.  Default value of None runs 'slip_vector' and
+            'strain'.
+        neighbors : atomman.NeighborList, optional
+            The neighbor list associated with reference to use.  Either
+            neighbors or cutoff must be given, or reference must have a
+            neighbors attribute.
+        cutoff : float, optional
+            Cutoff distance for computing a neighbor list for reference.
+        theta_max : float, optional
+            The maximum theta angle in degrees to use when matching p and q
+            vectors for the strain analysis.  Default value is 27.
+        strainkeys : str or list, optional
+            The per-atom properties to keep from the strain analysis.  Any of
+            'G', 'strain', 'invariant1', 'invariant2', 'invariant3',
+            'rotation', 'angularvelocity' and 'nye'.  Default value of None
+            keeps the same properties as Strain.asdict().  The Nye tensor is
+            only computed if 'nye' is kept.
+        m : array-like object, optional
+            The m unit vector to use for the disregistry analysis.  Default
+            value is [1,0,0].
+        n : array-like object, optional
+            The n unit vector to use for the disregistry analysis.  Default
+            value is [0,1,0].
+        planepos : array-like object, optional
+            A position on the slip plane for the disregistry analysis.
+            Default value is [0,0,0].
+        symbols : tuple, optional
+            Element symbols to assign when loading frames from dump files.
+        nprocs : int, optional
+            The number of processes to use for analyzing frames.  Default
+            value is 1, which analyzes the frames in the calling process.
+        maxpending : int, optional
+            The maximum number of frames that are submitted to the workers
+            but not yet collected.  Together with chunksize, this bounds the
+            memory used by the pipeline.  Default value of None uses
+            2 * nprocs.
+        """
+        if analyses is None:
+            analyses = ['slip_vector', 'strain']
+        analyses = aslist(analyses)
+        for analysis in analyses:
+            if analysis not in ['slip_vector', 'strain', 'disregistry']:
+                raise ValueError(f'unknown analysis {analysis}')
+
+        strainallkeys = ['G', 'strain', 'invariant1', 'invariant2', 'invariant3',
+                         'rotation', 'angularvelocity', 'nye']
+        if strainkeys is None:
+            strainkeys = ['strain', 'invariant1', 'invariant2', 'invariant3',
+                          'angularvelocity', 'nye']
+        strainkeys = aslist(strainkeys)
+        for key in strainkeys:
+            assert key in strainallkeys, 'unknown strain property ' + key
+
+        # Neighbor list setup
+        if neighbors is not None:
+            assert cutoff is None, 'neighbors and cutoff cannot both be given'
+        elif cutoff is not None:
+            neighbors = NeighborList(system=reference, cutoff=cutoff)
+        elif hasattr(reference, 'neighbors'):
+            neighbors = reference.neighbors
+        else:
+            raise ValueError('neighbors or cutoff is required')
+
+        # Build the p vectors once from the reference
+        if 'strain' in analyses:
+            p_vectors = Strain(reference, neighbors=neighbors, basesystem=reference,
+                               baseneighbors=neighbors).p_vectors
+        else:
+            p_vectors = None
+
+        self.__reference = reference
+        self.__neighbors = neighbors
+        self.__analyses = analyses
+        self.__settings = {'analyses': analyses,
+                           'p_vectors': p_vectors,
+                           'theta_max': theta_max,
+                           'strainkeys': strainkeys,
+                           'm': m,
+                           'n': n,
+                           'planepos': planepos,
+                           'symbols': symbols}
+        self.nprocs = nprocs
+        self.maxpending = maxpending
+
+    @property
+    def reference(self):
+        """atomman.System : The reference system"""
+        return self.__reference
+
+    @property
+    def neighbors(self):
+        """atomman.NeighborList : The reference neighbor list"""
+        return self.__neighbors
+
+    @property
+    def analyses(self):
+        """list : The analyses run for each frame"""
+        return self.__analyses
+
+    @property
+    def nprocs(self):
+        """int : The number of processes used for analyzing frames"""
+        return self.__nprocs
+
+    @nprocs.setter
+    def nprocs(self, value):
+        value = int(value)
+        assert value >= 1, 'nprocs must be >= 1'
+        self.__nprocs = value
+
+    @property
+    def maxpending(self):
+        """int : The maximum number of frames held by the pipeline at once"""
+        if self.__maxpending is None:
+            return 2 * self.nprocs
+        return self.__maxpending
+
+    @maxpending.setter
+    def maxpending(self, value):
+        if value is not None:
+            value = int(value)
+            assert value >= 1, 'maxpending must be >= 1'
+        self.__maxpending = value
+
+    def analyze(self, frame):
+        """
+        Runs the analyses for a single frame.
+
+        Parameters
+        ----------
+        frame : atomman.System or str
+            The frame system, or the path to a LAMMPS atom dump file.
+
+        Returns
+        -------
+        dict
+            The per-frame results, with one entry per strain property in
+            strainkeys and/or 'slip_vector', 'disregistry' and
+            'disregistry_coord'.
+        """
+        return _analyze(frame, self.reference, self.neighbors, self.__settings)
+
+    def iterchunks(self, frames, chunksize=100):
+        """
+        Streams frames through the analyses and yields the results in chunks.
+        Frames are only read from the frames iterable as workers become
+        available, so that at most maxpending analyzed frames and one chunk
+        are held in memory at any time.
+
+        Parameters
+        ----------
+        frames : iterable
+            The frames to analyze, given as atomman.System objects and/or
+            paths to LAMMPS atom dump files.  Can be a generator.
+        chunksize : int, optional
+            The number of frames to include in each chunk.  Default value is
+            100.
+
+        Yields
+        ------
+        dict
+            The results for a chunk of frames in columnar form.  'frame' is
+            the indices of the frames in frames, and each result is stacked
+            into a (nframes, ...) array.  'disregistry_coord' is shared by all
+            frames and is not stacked.
+        """
+        chunk = []
+        for index, results in enumerate(self.__iterresults(frames)):
+            chunk.append(results)
+            if len(chunk) == chunksize:
+                yield _stack(chunk, index + 1 - len(chunk))
+                chunk = []
+        if len(chunk) > 0:
+            yield _stack(chunk, index + 1 - len(chunk))
+
+    def run(self, frames, outdir, chunksize=100, prefix='chunk'):
+        """
+        Streams frames through the analyses and saves each chunk of results
+        to a numpy .npz file as soon as it is complete.
+
+        Parameters
+        ----------
+        frames : iterable
+            The frames to analyze, given as atomman.System objects and/or
+            paths to LAMMPS atom dump files.  Can be a generator.
+        outdir : path-like object
+            The directory to save the chunk files in.  Will be created if it
+            does not exist.
+        chunksize : int, optional
+            The number of frames to include in each chunk file.  Default value
+            is 100.
+        prefix : str, optional
+            The file name prefix for the chunk files.  Default value is
+            'chunk'.
+
+        Returns
+        -------
+        list of pathlib.Path
+            The saved chunk files, in frame order.
+        """
+        outdir = Path(outdir)
+        outdir.mkdir(parents=True, exist_ok=True)
+
+        filenames = []
+        for i, chunk in enumerate(self.iterchunks(frames, chunksize=chunksize)):
+            filename = Path(outdir, f'{prefix}_{i:05d}.npz')
+            np.savez(filename, **chunk)
+            filenames.append(filename)
+
+        return filenames
+
+    def __iterresults(self, frames):
+        """Yields the results of each frame in order"""
+
+        # Analyze frames serially
+        if self.nprocs == 1:
+            for frame in frames:
+                yield self.analyze(frame)
+            return
+
+        # Analyze frames in parallel, limiting the number of pending frames
+        with ProcessPoolExecutor(max_workers=self.nprocs, initializer=_init_worker,
+                                 initargs=(self.reference, self.neighbors,
+                                           self.__settings)) as executor:
+            pending = deque()
+            for frame in frames:
+                if len(pending) >= self.maxpending:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_worker, frame))
+            while len(pending) > 0:
+                yield pending.popleft().result()
+
+def _analyze(frame, reference, neighbors, settings):
+    """Runs the selected analyses for one frame"""
+    if not isinstance(frame, System):
+        frame = load('atom_dump', frame, symbols=settings['symbols'])
+    if frame.natoms != reference.natoms:
+        raise ValueError('frame and reference have different number of atoms')
+
+    results = {}
+    if 'slip_vector' in settings['analyses']:
+        results['slip_vector'] = slip_vector(reference, frame, neighbors=neighbors)
+
+    if 'strain' in settings['analyses']:
+        strain = batch_strain(frame.atoms.pos, frame.box, frame.pbc,
+                              neighbors.nlist, p_vectors=settings['p_vectors'],
+                              theta_max=settings['theta_max'],
+                              nye='nye' in settings['strainkeys'])
+        for key in settings['strainkeys']:
+            results[key] = strain[key]
+
+    if 'disregistry' in settings['analyses']:
+        coord, disreg = disregistry(reference, frame, m=settings['m'],
+                                    n=settings['n'],
+                                    planepos=settings['planepos'])
+        results['disregistry_coord'] = coord
+        results['disregistry'] = disreg
+
+    return results
+
+def _stack(chunk, start):
+    """Stacks per-frame results into columnar chunk arrays"""
+    stacked = {'frame': np.arange(start, start + len(chunk))}
+    for key in chunk[0]:
+        if key == 'disregistry_coord':
+            stacked[key] = chunk[0][key]
+        else:
+            stacked[key] = np.array([results[key] for results in chunk])
+    return stacked
+
+# Reference data held by each worker process
+_worker_data = {}
+
+def _init_worker(reference, neighbors, settings):
+    """Stores the reference data once in each worker process"""
+    _worker_data['reference'] = reference
+    _worker_data['neighbors'] = neighbors
+    _worker_data['settings'] = settings
+
+def _worker(frame):
+    """Runs the analyses for one frame using the worker's reference data"""
+    return _analyze(frame, _worker_data['reference'], _worker_data['neighbors'],
+                    _worker_data['settings'])
@@ -0,0 +1,10 @@
+# coding: utf-8
+from .neighbor_vectors import neighbor_vectors
+from .centrosymmetry import centrosymmetry
+from .common_neighbor_analysis import (common_neighbor_analysis, cna_signatures,
+                                       cna_structures)
+from .Pipeline import Pipeline
+
+__all__ = ['Pipeline', 'neighbor_vectors', 'centrosymmetry',
+           'common_neighbor_analysis', 'cna_signatures', 'cna_structures']
+__all__.sort()
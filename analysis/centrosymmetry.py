@@ -0,0 +1,73 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+from .. import NeighborList
+from .neighbor_vectors import neighbor_vectors
+
+def centrosymmetry(system, neighbors=None, cutoff=None, nnn=12, chunksize=65536):
+    """
+    Computes the centrosymmetry parameter for all atoms.
+
+        c_i = Σ |r_j + r_j'|^2
+
+    where the sum is over the nnn/2 smallest values among all pairs j, j' of
+    the nnn nearest neighbors of atom i, and r_j is the vector from atom i to
+    neighbor j.  This follows the LAMMPS centro/atom convention.
+
+    Parameters
+    ----------
+    system : atomman.System
+        The atomic system.
+    neighbors : atomman.NeighborList, optional
+        The neighbor list associated with system to use.  Either neighbors
+        or cutoff must be given, or system must have a neighbors attribute.
+    cutoff : float, optional
+        Cutoff distance for computing a neighbor list for system.  Either
+        neighbors or cutoff must be given, or system have a neighbors
+        attribute.
+    nnn : int, optional
+        The number of nearest neighbors to use, which should be even.
+        Default value is 12 (fcc).  Use 8 for bcc.
+    chunksize : int, optional
+        The maximum number of atoms to evaluate at once.  Default value is
+        65536.
+
+    Returns
+    -------
+    numpy.ndarray
+        The (natoms,) centrosymmetry values.  Atoms with fewer than nnn
+        neighbors are given values of 0.0.
+    """
+    if nnn < 2 or nnn % 2 != 0:
+        raise ValueError('nnn must be a positive even number')
+
+    # Neighbor list setup
+    if neighbors is not None:
+        assert cutoff is None, 'neighbors and cutoff cannot both be given'
+    elif cutoff is not None:
+        neighbors = NeighborList(system=system, cutoff=cutoff)
+    elif hasattr(system, 'neighbors'):
+        neighbors = system.neighbors
+    else:
+        raise ValueError('neighbors or cutoff is required')
+
+    # Index pairs of the nnn nearest neighbors
+    k, l = np.triu_indices(nnn, 1)
+
+    csp = np.zeros(system.natoms)
+    for start in range(0, system.natoms, chunksize):
+        stop = min(start + chunksize, system.natoms)
+        vects, coord = neighbor_vectors(system, neighbors, start, stop, nmax=nnn)
+        if vects.shape[1] < nnn:
+            continue
+
+        # Sum the nnn/2 smallest pair values for atoms with enough neighbors
+        full = np.where(coord == nnn)[0]
+        pairs = np.sum((vects[full][:, k] + vects[full][:, l])**2, axis=2)
+        pairs = np.partition(pairs, nnn // 2 - 1, axis=1)[:, :nnn // 2]
+        csp[start + full] = pairs.sum(axis=1)
+
+    return csp
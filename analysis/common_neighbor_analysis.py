@@ -0,0 +1,188 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+from .. import NeighborList
+from .neighbor_vectors import neighbor_vectors
+
+# Structure names corresponding to the integer structure types
+cna_structures = ['other', 'fcc', 'hcp', 'bcc', 'ico']
+
+def common_neighbor_analysis(system, neighbors=None, cutoff=None,
+                             adaptive=True, chunksize=4096):
+    """
+    Identifies the local crystal structure of all atoms using common neighbor
+    analysis (CNA).  For each pair of bonded atoms, the signature is the
+    number of common neighbors, the number of bonds between the common
+    neighbors, and the number of bonds in the longest chain of bonds between
+    the common neighbors.  Atoms are then classified as
+
+    - fcc: 12 neighbors with (4,2,1) signatures.
+    - hcp: 12 neighbors, 6 with (4,2,1) and 6 with (4,2,2) signatures.
+    - bcc: 14 neighbors, 8 with (6,6,6) and 6 with (4,4,4) signatures.
+    - ico: 12 neighbors with (5,5,5) signatures.
+
+    Parameters
+    ----------
+    system : atomman.System
+        The atomic system.
+    neighbors : atomman.NeighborList, optional
+        The neighbor list associated with system to use.  For the adaptive
+        CNA, either neighbors or cutoff must be given, or system must have a
+        neighbors attribute, and the list must include at least the 14
+        nearest neighbors of the atoms to classify.  For the conventional
+        CNA, the list must include all neighbors within cutoff.
+    cutoff : float, optional
+        For the adaptive CNA, the cutoff distance for computing a neighbor
+        list for system.  For the conventional CNA, cutoff is required and
+        is the bond cutoff, and is also used to compute a neighbor list if
+        neighbors is not given.
+    adaptive : bool, optional
+        If True (default), the adaptive CNA of Stukowski, Modelling Simul.
+        Mater. Sci. Eng. 20, 045021 (2012) is used, which determines a local
+        bond cutoff for each atom from its 12 (fcc, hcp, ico) or 14 (bcc)
+        nearest neighbors.  If False, the conventional CNA with a fixed bond
+        cutoff is used.
+    chunksize : int, optional
+        The maximum number of atoms to evaluate at once.  Default value is
+        4096.
+
+    Returns
+    -------
+    numpy.ndarray
+        The (natoms,) integer structure types, which are indices of
+        cna_structures: 0 = other, 1 = fcc, 2 = hcp, 3 = bcc, 4 = ico.
+    """
+    # Neighbor list setup
+    if not adaptive:
+        if cutoff is None:
+            raise ValueError('cutoff is required for the conventional CNA')
+        if neighbors is None:
+            neighbors = NeighborList(system=system, cutoff=cutoff)
+    elif neighbors is not None:
+        assert cutoff is None, 'neighbors and cutoff cannot both be given'
+    elif cutoff is not None:
+        neighbors = NeighborList(system=system, cutoff=cutoff)
+    elif hasattr(system, 'neighbors'):
+        neighbors = system.neighbors
+    else:
+        raise ValueError('neighbors or cutoff is required')
+
+    structure = np.zeros(system.natoms, dtype=int)
+    for start in range(0, system.natoms, chunksize):
+        stop = min(start + chunksize, system.natoms)
+
+        if adaptive:
+            vects, coord = neighbor_vectors(system, neighbors, start, stop, nmax=14)
+            if vects.shape[1] < 12:
+                continue
+            r = np.linalg.norm(vects, axis=2)
+
+            # fcc, hcp and ico use the 12 nearest neighbors
+            atoms = np.where(coord >= 12)[0]
+            rcut = (1 + 2**0.5) / 2 * r[atoms, :12].mean(axis=1)
+            signatures = cna_signatures(vects[atoms, :12], rcut)
+            structure[start + atoms] = _classify12(signatures)
+
+            # bcc uses the 14 nearest neighbors
+            if vects.shape[1] < 14:
+                continue
+            atoms = np.where((coord == 14) & (structure[start:stop] == 0))[0]
+            rcut = (1 + 2**0.5) / 2 * (2 / 3**0.5 * r[atoms, :8].mean(axis=1)
+                                       + r[atoms, 8:14].mean(axis=1)) / 2
+            signatures = cna_signatures(vects[atoms], rcut)
+            structure[start + atoms] = _classify14(signatures)
+
+        else:
+            vects = neighbor_vectors(system, neighbors, start, stop)[0]
+            coord = np.sum(np.linalg.norm(vects, axis=2) <= cutoff, axis=1)
+            for n, classify in [(12, _classify12), (14, _classify14)]:
+                if vects.shape[1] < n:
+                    continue
+                atoms = np.where(coord == n)[0]
+                signatures = cna_signatures(vects[atoms, :n], np.full(len(atoms), cutoff))
+                structure[start + atoms] = classify(signatures)
+
+    return structure
+
+def cna_signatures(vects, rcut):
+    """
+    Computes the CNA signatures of the bonds between atoms and their
+    neighbors, where bonds are only considered among each atom's given
+    neighbors.
+
+    Parameters
+    ----------
+    vects : numpy.ndarray
+        The (natoms, n, 3) vectors from each atom to its neighbors.
+    rcut : numpy.ndarray
+        The (natoms,) bond cutoff for each atom.
+
+    Returns
+    -------
+    numpy.ndarray
+        The (natoms, n, 3) integer signatures for the bonds between each atom
+        and its neighbors: the number of common neighbors, the number of
+        bonds between the common neighbors, and the number of bonds in the
+        longest chain of bonds between the common neighbors.
+    """
+    natoms, n = vects.shape[:2]
+
+    # Bonds between neighbors k and l of each atom
+    d = vects[:, :, np.newaxis] - vects[:, np.newaxis]
+    bonded = np.sum(d**2, axis=3) <= rcut[:, np.newaxis, np.newaxis]**2
+    bonded[:, np.arange(n), np.arange(n)] = False
+
+    # The common neighbors of the atom and neighbor j are the neighbors k
+    # bonded to j, and their bonds are k-l bonds with both bonded to j
+    common = bonded[:, :, :, np.newaxis] & bonded[:, :, np.newaxis, :] & bonded[:, np.newaxis]
+    common = common.reshape(natoms * n, n, n)
+    degree = common.sum(axis=2)
+
+    # Label connected clusters of common neighbor bonds by their lowest index
+    labels = np.broadcast_to(np.arange(n, dtype=np.int16), (natoms * n, n))
+    while True:
+        newlabels = np.where(common, labels[:, np.newaxis, :], np.int16(n)).min(axis=2)
+        newlabels = np.minimum(labels, newlabels)
+        if np.array_equal(newlabels, labels):
+            break
+        labels = newlabels
+
+    # Number of bonds in each cluster
+    index = np.arange(natoms * n)[:, np.newaxis] * n + labels
+    clusterbonds = np.bincount(index.ravel(), weights=degree.ravel(),
+                               minlength=natoms * n * n).reshape(natoms * n, n)
+
+    signatures = np.empty((natoms, n, 3), dtype=int)
+    signatures[..., 0] = bonded.sum(axis=2)
+    signatures[..., 1] = degree.sum(axis=1).reshape(natoms, n) // 2
+    signatures[..., 2] = clusterbonds.max(axis=1, initial=0).reshape(natoms, n) // 2
+
+    return signatures
+
+def _count(signatures, signature):
+    """Counts the bonds of each atom with the given signature"""
+    return np.all(signatures == signature, axis=2).sum(axis=1)
+
+def _classify12(signatures):
+    """Classifies atoms with 12 neighbors as fcc, hcp, ico or other"""
+    n421 = _count(signatures, [4, 2, 1])
+    n422 = _count(signatures, [4, 2, 2])
+    n555 = _count(signatures, [5, 5, 5])
+
+    structure = np.zeros(len(signatures), dtype=int)
+    structure[n421 == 12] = 1
+    structure[(n421 == 6) & (n422 == 6)] = 2
+    structure[n555 == 12] = 4
+    return structure
+
+def _classify14(signatures):
+    """Classifies atoms with 14 neighbors as bcc or other"""
+    n666 = _count(signatures, [6, 6, 6])
+    n444 = _count(signatures, [4, 4, 4])
+
+    structure = np.zeros(len(signatures), dtype=int)
+    structure[(n666 == 8) & (n444 == 6)] = 3
+    return structure
@@ -0,0 +1,61 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+from ..core import dvect
+from ..defect.batch_strain import pair_table
+
+def neighbor_vectors(system, neighbors, start=0, stop=None, nmax=None):
+    """
+    Computes the vectors from each atom to its neighbors, sorted by distance
+    and padded into a regular array.
+
+    Parameters
+    ----------
+    system : atomman.System
+        The atomic system.
+    neighbors : atomman.NeighborList
+        The neighbor list associated with system.
+    start : int, optional
+        The index of the first atom to include.  Default value is 0.
+    stop : int, optional
+        The index after the last atom to include.  Default value of None
+        includes all atoms after start.
+    nmax : int, optional
+        The maximum number of nearest neighbors to keep for each atom.
+        Default value of None keeps all neighbors.
+
+    Returns
+    -------
+    vects : numpy.ndarray
+        The (natoms, nmax, 3) neighbor vectors ordered from nearest to
+        farthest.  Atoms with fewer than nmax neighbors are padded at the end
+        with nan values.
+    coord : numpy.ndarray
+        The (natoms,) number of neighbor vectors given for each atom, i.e.
+        the coordination number limited to nmax.
+    """
+    i, j = pair_table(neighbors.nlist, start, stop)
+    pos = system.atoms.pos
+    vects = dvect(pos[i], pos[j], system.box, system.pbc).reshape(-1, 3)
+    distances = np.linalg.norm(vects, axis=1)
+
+    # Sort pairs by atom and then by distance
+    order = np.lexsort((distances, i))
+    i = i[order] - start
+    vects = vects[order]
+
+    # Position of each pair within its atom's sorted neighbors
+    coord = np.bincount(i, minlength=len(neighbors.nlist[start:stop]))
+    rank = np.arange(len(i)) - np.repeat(np.cumsum(coord) - coord, coord)
+
+    if nmax is None:
+        nmax = coord.max(initial=0)
+    keep = rank < nmax
+
+    padded = np.full((len(coord), nmax, 3), np.nan)
+    padded[i[keep], rank[keep]] = vects[keep]
+
+    return padded, np.minimum(coord, nmax)
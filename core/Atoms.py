@@ -317,6 +317,10 @@ class Atoms(object):
                 d[key] = deepcopy(self.view[key])
         return Atoms(atype=atype, pos=pos, **d)
     
+    def __reduce__(self):
+        """Properly handle pickling"""
+        return (Atoms, (self.natoms, None, None, OrderedDict(self.view)))
+    
     def __getitem__(self, index):
         """Index getting of Atoms."""
         view = OrderedDict()
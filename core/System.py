@@ -15,7 +15,7 @@ from DataModelDict import DataModelDict as DM
 
 # atomman imports
 import atomman.unitconvert as uc
-from . import Atoms, Box, dvect, dmag, NeighborList
+from . import Atoms, Box, dvect, dmag, NeighborList, SystemSelection
 from ..lammps import normalize as lmp_normalize
 from ..tools import indexstr, miller, ishexagonal, aslist
 from .. import dump
@@ -524,7 +524,28 @@ class System(object):
 
         # Generate and return new System
         return System(atoms=atoms, box=box, pbc=self.pbc, symbols=symbols)
-    
+
+    def select(self, index):
+        """
+        Selects a subset of the atoms without copying any per-atom
+        properties.  Unlike atoms_ix, the returned view only stores the
+        indices of the selected atoms.  Property values are gathered when
+        accessed, and the view can be further filtered or converted into a
+        new System with materialize().
+
+        Parameters
+        ----------
+        index : array-like object or slice
+            The atoms to select, given as a bool mask with natoms values,
+            integer atom indices, or a slice.
+
+        Returns
+        -------
+        atomman.SystemSelection
+            The view of the selected atoms.
+        """
+        return SystemSelection(self, index)
+
     def box_set(self, **kwargs):
         """
         Extends box.set() with a scale argument.
@@ -0,0 +1,169 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+from . import Atoms
+
+class SystemSelection(object):
+    """
+    A lightweight view of a subset of the atoms in a System.  Only the
+    indices of the selected atoms are stored, and per-atom property values
+    are gathered from the parent System when accessed.  Selections can be
+    further filtered with select() at a cost that scales with the number of
+    selected atoms, and converted into an independent System with
+    materialize().
+    """
+
+    def __init__(self, system, index=None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        system : atomman.System
+            The parent system.
+        index : array-like object or slice, optional
+            The atoms of system to select, given as a bool mask with natoms
+            values, integer atom indices, or a slice.  Default value of None
+            selects all atoms.
+        """
+        self.__system = system
+        if index is None:
+            self.__index = np.arange(system.natoms)
+        else:
+            self.__index = _asindex(index, system.natoms)
+
+    def __str__(self):
+        """str : The string representation of the selection."""
+        return ' '.join(['SystemSelection of', str(self.natoms), 'of',
+                         str(self.system.natoms), 'atoms'])
+
+    def __len__(self):
+        return self.natoms
+
+    def __getattr__(self, name):
+        """Gets the selected values of per-atom properties as attributes"""
+        if name[:1] != '_' and name in self.system.atoms.view:
+            return self.prop(name)
+        raise AttributeError(f"'SystemSelection' object has no attribute '{name}'")
+
+    @property
+    def system(self):
+        """atomman.System : The parent system."""
+        return self.__system
+
+    @property
+    def index(self):
+        """numpy.ndarray : The indices of the selected atoms in system."""
+        return self.__index
+
+    @property
+    def natoms(self):
+        """int : The number of selected atoms."""
+        return len(self.__index)
+
+    @property
+    def box(self):
+        """atomman.Box : The parent system's box."""
+        return self.system.box
+
+    @property
+    def pbc(self):
+        """list of bool : The parent system's periodic boundary conditions."""
+        return self.system.pbc
+
+    @property
+    def symbols(self):
+        """tuple : The parent system's element symbols for each atom type."""
+        return self.system.symbols
+
+    @property
+    def masses(self):
+        """tuple : The parent system's masses for each atom type."""
+        return self.system.masses
+
+    def prop(self, key=None, value=None):
+        """
+        Accesses the per-atom properties of the selected atoms.  Getting
+        values gathers them from the parent system, and setting values
+        assigns them to the selected atoms of the parent system.
+
+        Parameters
+        ----------
+        key : str, optional
+            Per-atom property name.
+        value : any, optional
+            Property values to assign to the selected atoms.
+
+        Returns
+        -------
+        list
+            If no parameters given, returns a list of all assigned property
+            keys.
+        numpy.ndarray
+            If key is given without value, returns the values of that
+            property for the selected atoms.
+        """
+        if key is None:
+            if value is not None:
+                raise ValueError('key is required for setting values')
+            return list(self.system.atoms.view.keys())
+
+        if value is None:
+            return self.system.atoms.view[key][self.index]
+        else:
+            self.system.atoms.view[key][self.index] = value
+
+    def select(self, index):
+        """
+        Filters the selection further.
+
+        Parameters
+        ----------
+        index : array-like object or slice
+            The atoms of the selection to keep, given as a bool mask with
+            natoms values, integer indices of the selected atoms, or a
+            slice.
+
+        Returns
+        -------
+        atomman.SystemSelection
+            A new selection of the parent system.
+        """
+        return SystemSelection(self.system, self.index[_asindex(index, self.natoms)])
+
+    def materialize(self):
+        """
+        Copies the selected atoms into a new System.
+
+        Returns
+        -------
+        atomman.System
+            A new System with the same box, pbc, symbols and masses as the
+            parent system and copies of the selected atoms' properties.
+        """
+        from . import System
+
+        atoms = Atoms(natoms=self.natoms, **{key: self.prop(key) for key in self.prop()})
+        return System(atoms=atoms, box=self.box, pbc=self.pbc,
+                      symbols=self.symbols, masses=self.masses)
+
+def _asindex(index, natoms):
+    """Converts a bool mask, integer indices or slice to integer indices"""
+    if isinstance(index, slice):
+        return np.arange(natoms)[index]
+
+    index = np.asarray(index)
+    if index.dtype == bool:
+        if index.shape != (natoms, ):
+            raise ValueError('bool mask must have natoms values')
+        return np.flatnonzero(index)
+
+    index = np.array(index, dtype=np.int64, ndmin=1)
+    if index.ndim != 1:
+        raise ValueError('index must be one-dimensional')
+    if len(index) > 0 and (index.min() < -natoms or index.max() >= natoms):
+        raise IndexError('atom index out of range')
+    return np.where(index < 0, index + natoms, index)
@@ -5,9 +5,10 @@ from .nlist import nlist # pylint: disable=no-name-in-module
 from .NeighborList import NeighborList
 from .Atoms import Atoms
 from .Box import Box
+from .SystemSelection import SystemSelection
 from .ElasticConstants import ElasticConstants
 from .System import System
 from .displacement import displacement
 
 __all__ = ['displacement', 'dvect', 'dmag', 'nlist', 'Atoms', 'Box',
-           'ElasticConstants', 'NeighborList', 'System']
\ No newline at end of file
+           'ElasticConstants', 'NeighborList', 'System', 'SystemSelection']
\ No newline at end of file
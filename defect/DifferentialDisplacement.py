@@ -5,16 +5,22 @@ import numpy as np
 
 # https://matplotlib.org/
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 from matplotlib import cm
+from matplotlib.colors import to_rgba
+from matplotlib.collections import EllipseCollection, PolyCollection
 from matplotlib.pyplot import MultipleLocator
 
 # atomman imports
 from ..tools import axes_check
 from .. import Box, NeighborList
+from .batch_strain import pair_table
+
+# Number of plotted atoms above which raster=None renders the atoms as an image
+RASTER_NATOMS = 100000
 
 class DifferentialDisplacement():
-    def __init__(self, system_0, system_1, neighbors=None, cutoff=None, reference=1):
+    def __init__(self, system_0, system_1, neighbors=None, cutoff=None, reference=1,
+                 half=False):
         """
         Class initializer.  Calls solve if either neighbors or cutoff are given.
         
@@ -36,10 +42,15 @@ class DifferentialDisplacement():
             used for the calculation and neighbors should be for system_0.  If
             1 (default), then system_1's atomic positions will be used
             for the calculation and neighbors should be for system_1.   
+        half : bool, optional
+            If False (default), the differential displacements are computed
+            for both i-j and j-i of each neighbor pair.  If True, each pair is
+            only included once.
         """
         
         if neighbors is not None or cutoff is not None:
-            self.solve(system_0, system_1, neighbors=neighbors, cutoff=cutoff, reference=reference)
+            self.solve(system_0, system_1, neighbors=neighbors, cutoff=cutoff,
+                       reference=reference, half=half)
         else:
             assert system_0.natoms == system_1.natoms
             
@@ -91,7 +102,8 @@ class DifferentialDisplacement():
         """numpy.array or None : The unit vectors between all pairs of atoms for which the ddvectors have been computed."""
         return self.__arrowuvectors
     
-    def solve(self, system0=None, system1=None, neighbors=None, cutoff=None, reference=None):
+    def solve(self, system0=None, system1=None, neighbors=None, cutoff=None, reference=None,
+              half=False):
         """
         Solves the differential displacement vectors.
         
@@ -112,6 +124,10 @@ class DifferentialDisplacement():
             If 0 (default), then system0's atomic positions will be used for the calculation and
             neighbors should be for system0.  If 1, then system1's atomic positions will be used
             for the calculation and neighbors should be for system1.   
+        half : bool, optional
+            If False (default), the differential displacements are computed
+            for both i-j and j-i of each neighbor pair.  If True, each pair is
+            only included once, i.e. only for i < j.
         """
         # Handle parameters
         if system0 is not None:
@@ -144,49 +160,34 @@ class DifferentialDisplacement():
         else:
             self.__neighbors = neighbors
         
-        all_ddvectors = []
-        all_arrowcenters = []
-        all_arrowuvectors = []
+        # Build the table of all atom pairs i-j from the neighbor list
+        i, j = pair_table(neighbors.nlist)
+        if half:
+            keep = i < j
+            i = i[keep]
+            j = j[keep]
         
-        # Loop over all atoms i in ref system
-        for i in np.arange(refsystem.natoms):
-            neighs = neighbors[i]
-            if len(neighs) == 0:
-                continue
-            
-            # Compute distance vectors between atom i and its neighbors for both systems
-            dvectors0 = system0.dvect(int(i), neighs)
-            dvectors1 = system1.dvect(int(i), neighs)
-            if dvectors0.shape == (3,):
-                dvectors0.shape = (1,3)
-                dvectors1.shape = (1,3)
-
-            # Compute differential displacement vectors
-            ddvectors = dvectors1 - dvectors0
-
-            # Compite center points and direction vectors
-            if reference == 0:
-                arrowcenters = system0.atoms.pos[i] + dvectors0 / 2
-                arrowuvectors = dvectors0 / np.linalg.norm(dvectors0, axis=1)[:,np.newaxis]    
-            else:    
-                arrowcenters = system1.atoms.pos[i] + dvectors1 / 2
-                arrowuvectors = dvectors1 / np.linalg.norm(dvectors1, axis=1)[:,np.newaxis]
-                
-            # Append calculation values to associated lists            
-            all_ddvectors.append(ddvectors)
-            all_arrowcenters.append(arrowcenters)
-            all_arrowuvectors.append(arrowuvectors)
+        # Compute distance vectors between all pairs for both systems
+        dvectors0 = system0.dvect(i, j).reshape(-1, 3)
+        dvectors1 = system1.dvect(i, j).reshape(-1, 3)
         
-        # Save computed values to object properties 
-        self.__ddvectors = np.concatenate(all_ddvectors)
-        self.__arrowcenters = np.concatenate(all_arrowcenters)
-        self.__arrowuvectors = np.concatenate(all_arrowuvectors)
+        # Compute differential displacement vectors
+        self.__ddvectors = dvectors1 - dvectors0
+        
+        # Compute center points and direction vectors
+        if reference == 0:
+            dvectors = dvectors0
+        else:
+            dvectors = dvectors1
+        self.__arrowcenters = refsystem.atoms.pos[i] + dvectors / 2
+        self.__arrowuvectors = dvectors / np.linalg.norm(dvectors, axis=1)[:,np.newaxis]
         
     def plot(self, system, component, ddmax, plotxaxis='x', plotyaxis='y',
              xlim=None, ylim=None, zlim=None,
              arrowscale=1, arrowwidth=0.005,  use0z=False,
              atomcolor=None, atomcmap=None, atomsize=0.5, figsize=10,
-             matplotlib_axes=None, cmap='bwr', xbins=200, ybins=200, scale=1, nye_index=[0,0],alat=4.05,calculation=True):
+             matplotlib_axes=None, cmap='bwr', xbins=200, ybins=200, scale=1, nye_index=[0,0],alat=4.05,calculation=True,
+             raster=None):
 
         r"""
         Creates a matplotlib figure of a differential displacement map.  Atom
@@ -280,6 +281,12 @@ class DifferentialDisplacement():
             allows for subplots to be constructed.  Note that figsize will be ignored
             as the figure would have to be created beforehand and no automatic
             optimum scaling of the figure's dimensions will occur.
+        raster : bool, optional
+            If False, the atoms are drawn as a single collection of vector
+            circles.  If True, the atoms are drawn into one image at the axes'
+            pixel resolution, which keeps very large selections interactive and
+            the arrows are rasterized in vector outputs.  Default value (None)
+            will use raster only if more than RASTER_NATOMS atoms are plotted.
             
         Returns
         -------
@@ -349,20 +356,9 @@ class DifferentialDisplacement():
 
         ######################## Add atom circles to plot ##############################
         
-        # Loop over all atoms i in plotting box
-        for i in np.arange(refsystem.natoms)[plotbox.inside(atompos)]:
-            atype = refsystem.atoms.atype[i]
-            atype_index = refsystem.atypes.index(atype)
-
-            # Plot a circle for atom i
-            if atomcmap[atype_index] is not None:
-                color = atomcmap[atype_index]((atompos[i, 2] - zlim[0]) / (zlim[1] - zlim[0]))
-            elif atomcolor[atype_index] is not None:
-                color = atomcolor[atype_index]
-            else:
-                color = None
-            if color is not None:
-                ax1.add_patch(mpatches.Circle(atompos[i, :2], atomsize, fc=color, ec='k', linewidth=figsize[0]/5))
+        # Plot all atoms in plotting box as a single collection or image
+        raster = self.__plotatoms(ax1, refsystem, atompos, plotbox, xlim, ylim, zlim,
+                                  atomcolor, atomcmap, atomsize, figsize[0]/5, raster)
 
         ######### NYE ############################
         import atomman.unitconvert as uc
@@ -383,36 +379,23 @@ class DifferentialDisplacement():
         y = atompos[in_bounds, 1]
         v = -uc.get_in_units(property[in_bounds], None)
         xy = np.vstack((x,y))
-        # delete repeat value
-        set = []
-        for i in np.arange(xy.shape[1]):
-            for j in np.arange(i+1, xy.shape[1]):
-                if list(xy[:,i]) == list(xy[:,j]):
-                    set.append(j)
-        x = np.delete(x,set)
-        y = np.delete(y,set)
-        v = np.delete(v,set)
+        # delete repeat value, keeping the first occurrence of each point
+        first = np.sort(np.unique(xy, axis=1, return_index=True)[1])
+        x = x[first]
+        y = y[first]
+        v = v[first]
 
         # calculate dislocation line position, standard deviation, and moving direction
         if calculation==True:
             # ave position
             dxdy = 2.93849*4.65842*np.sqrt(3)/4 ## have to be changed when change material or orientation
-            x0 = 0
-            y0 = 0
-            x_sq = 0
-            y_sq = 0
-            xy = 0
-            frac = 0
-            for i in np.arange(x.shape[0]):
-                x0 += x[i]*v[i]*dxdy
-                y0 += y[i]*v[i]*dxdy
-                frac += v[i]*dxdy
-            x0 = x0/frac
-            y0 = y0/frac
-            for i in np.arange(x.shape[0]):
-                x_sq += x[i]**2*v[i]*dxdy
-                y_sq += y[i]**2*v[i]*dxdy
-                xy += x[i]*y[i]*v[i]*dxdy
+            w = v*dxdy
+            frac = np.sum(w)
+            x0 = np.sum(x*w)/frac
+            y0 = np.sum(y*w)/frac
+            x_sq = np.sum(x**2*w)
+            y_sq = np.sum(y**2*w)
+            xy = np.sum(x*y*w)
             x_sq = x_sq/frac - x0**2
             y_sq = y_sq/frac - y0**2
             xy = xy/frac -x0*y0
@@ -504,11 +487,8 @@ class DifferentialDisplacement():
         arrowwidths = arrowwidth * (arrowlengths[:,0]**2 + arrowlengths[:,1]**2)**0.5
 
         # Plot the arrows
-        for center, length, width in zip(arrowcenters, arrowlengths, arrowwidths):
-            if width > 1e-7:
-                ax1.quiver(center[0], center[1], length[0], length[1],
-                           pivot='middle', angles='xy', scale_units='xy',
-                           scale=1, width=width, minshaft=2)
+        self.__plotarrows(ax1, arrowcenters, arrowlengths, arrowwidths,
+                          xlim[1] - xlim[0], raster)
 
         #ax1.plot(2.93749682368896/2,0,color='blue',marker="+",linestyle='dashed',
                # linewidth=4, markersize=60.0)
@@ -652,11 +632,141 @@ class DifferentialDisplacement():
         
         return arrowlengths, arrowcenters
 
+    def __plotatoms(self, ax1, refsystem, atompos, plotbox, xlim, ylim, zlim,
+                    atomcolor, atomcmap, atomsize, linewidth, raster):
+        """
+        Internal method for plotting the atom circles either as one vector
+        collection or as one image.  Returns the raster value used.
+        """
+        
+        # Build an RGBA color for every atom, leaving unplotted atoms as nan
+        inbounds = plotbox.inside(atompos)
+        colors = np.full((refsystem.natoms, 4), np.nan)
+        for atype_index, atype in enumerate(refsystem.atypes):
+            mask = inbounds & (refsystem.atoms.atype == atype)
+            if atomcmap[atype_index] is not None:
+                colors[mask] = atomcmap[atype_index]((atompos[mask, 2] - zlim[0]) / (zlim[1] - zlim[0]))
+            elif atomcolor[atype_index] is not None:
+                colors[mask] = to_rgba(atomcolor[atype_index])
+        
+        # Keep plotted atoms in index order, which is also the drawing order
+        plotted = ~np.isnan(colors[:, 0])
+        xy = atompos[plotted, :2]
+        colors = colors[plotted]
+        
+        if raster is None:
+            raster = len(xy) > RASTER_NATOMS
+        
+        if not raster:
+            # All circles share one collection with offsets in data units
+            circles = EllipseCollection(2 * atomsize, 2 * atomsize, 0.0, units='xy',
+                                        offsets=xy, offset_transform=ax1.transData,
+                                        facecolors=colors, edgecolors='k',
+                                        linewidths=linewidth)
+            ax1.add_collection(circles, autolim=False)
+            return raster
+        
+        # Size the image to the axes' pixel extent
+        bbox = ax1.get_window_extent()
+        nx = max(int(np.ceil(bbox.width)), 1)
+        ny = max(int(np.ceil(bbox.height)), 1)
+        dx = (xlim[1] - xlim[0]) / nx
+        dy = (ylim[1] - ylim[0]) / ny
+        
+        # Pixel stencil covering one circle and the width of its black edge
+        edge = linewidth * ax1.figure.dpi / 72 * dx
+        outer = atomsize + edge / 2
+        rx = int(np.ceil(outer / dx)) + 1
+        ry = int(np.ceil(outer / dy)) + 1
+        sx, sy = np.meshgrid(np.arange(-rx, rx+1), np.arange(-ry, ry+1))
+        sx = sx.ravel()
+        sy = sy.ravel()
+        
+        # Splat atoms in chunks, with later atoms painted over earlier ones
+        image = np.zeros((ny, nx, 4))
+        chunksize = max(2**22 // len(sx), 1)
+        for start in range(0, len(xy), chunksize):
+            pos = xy[start:start+chunksize]
+            ix = np.floor((pos[:, 0] - xlim[0]) / dx).astype(int)[:, np.newaxis] + sx
+            iy = np.floor((pos[:, 1] - ylim[0]) / dy).astype(int)[:, np.newaxis] + sy
+            r = np.hypot(xlim[0] + (ix + 0.5) * dx - pos[:, 0, np.newaxis],
+                         ylim[0] + (iy + 0.5) * dy - pos[:, 1, np.newaxis])
+            pixcolors = np.broadcast_to(colors[start:start+chunksize, np.newaxis], r.shape + (4,)).copy()
+            pixcolors[r > atomsize - edge / 2] = [0.0, 0.0, 0.0, 1.0]
+            keep = (r <= outer) & (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+            image[iy[keep], ix[keep]] = pixcolors[keep]
+        
+        ax1.imshow(image, origin='lower', extent=(xlim[0], xlim[1], ylim[0], ylim[1]),
+                   interpolation='nearest', aspect=ax1.get_aspect(), zorder=1)
+        ax1.axis([xlim[0], xlim[1], ylim[0], ylim[1]])
+        return raster
+    
+    def __plotarrows(self, ax1, arrowcenters, arrowlengths, arrowwidths, axeswidth, raster):
+        """
+        Internal method for plotting all arrows as one polygon collection.  The
+        arrows match the shape of quiver(pivot='middle', angles='xy',
+        scale_units='xy', scale=1, width=width, minshaft=2) for each arrow,
+        but are not pixel-identical to quiver output as the anti-aliasing of
+        the collection edges differs.  With raster, arrows shorter than one
+        pixel are left out.
+        """
+        
+        # Skip arrows with negligible widths, and sub-pixel arrows if raster
+        mask = arrowwidths > 1e-7
+        if raster:
+            pixelsize = axeswidth / ax1.get_window_extent().width
+            mask &= arrowlengths[:, 0]**2 + arrowlengths[:, 1]**2 >= pixelsize**2
+        centers = arrowcenters[mask, :2]
+        lengths = arrowlengths[mask]
+        
+        # Shaft widths in data units and arrow lengths in shaft widths
+        norms = np.linalg.norm(lengths, axis=1)
+        widths = arrowwidths[mask] * axeswidth
+        length = np.clip(norms / widths, 0, 2**16)[:, np.newaxis]
+        
+        # Quiver default head shape with minshaft=2.  The outline geometry
+        # below copies the private matplotlib.quiver.Quiver._h_arrows as of
+        # matplotlib 3.8 and must be updated if quiver's arrows change.
+        headwidth = 3.0
+        headlength = 5.0
+        headaxislength = 4.5
+        minsh = 2 * headlength
+        ii = [0, 1, 2, 3, 2, 1, 0, 0]
+        sign = np.array([1, 1, 1, 1, -1, -1, -1, 1])
+        
+        # Outlines of horizontal arrows, shrinking short arrows without shafts
+        x = (np.array([0, -headaxislength, -headlength, 0]) + np.array([0, 1, 1, 1]) * length)[:, ii]
+        x0 = np.array([0, minsh - headaxislength, minsh - headlength, minsh])[ii] * length / minsh
+        y = np.broadcast_to(sign * 0.5 * np.array([1, 1, headwidth, 0])[ii], x.shape)
+        short = length < minsh
+        x = np.where(short, x0, x)
+        y = np.where(short, y * length / minsh, y)
+        x = x - 0.5 * x[:, 3, np.newaxis]
+        
+        # Replace arrows shorter than one width with dots
+        th = np.arange(8) * (np.pi / 3.0)
+        tooshort = length < 1
+        x = np.where(tooshort, 0.5 * np.cos(th), x)
+        y = np.where(tooshort, 0.5 * np.sin(th), y)
+        
+        # Rotate, scale and translate outlines to data coordinates
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c = np.where(norms > 0, lengths[:, 0] / norms, 1.0)[:, np.newaxis]
+            s = np.where(norms > 0, lengths[:, 1] / norms, 0.0)[:, np.newaxis]
+        verts = np.empty(x.shape + (2,))
+        verts[..., 0] = centers[:, 0, np.newaxis] + widths[:, np.newaxis] * (c * x - s * y)
+        verts[..., 1] = centers[:, 1, np.newaxis] + widths[:, np.newaxis] * (s * x + c * y)
+        
+        arrows = PolyCollection(verts, facecolors='k', edgecolors='none',
+                                linewidths=0, zorder=1)
+        arrows.set_rasterized(raster)
+        ax1.add_collection(arrows, autolim=False)
+
     def ddplot(self, component, ddmax, plotxaxis='x', plotyaxis='y',
              xlim=None, ylim=None, zlim=None,
              arrowscale=1, arrowwidth=0.005,  use0z=False,
              atomcolor=None, atomcmap=None, atomsize=0.5, figsize=10,
-             matplotlib_axes=None):
+             matplotlib_axes=None, raster=None):
 
         r"""
         Creates a matplotlib figure of a differential displacement map.  Atom
@@ -750,6 +860,12 @@ class DifferentialDisplacement():
             allows for subplots to be constructed.  Note that figsize will be ignored
             as the figure would have to be created beforehand and no automatic
             optimum scaling of the figure's dimensions will occur.
+        raster : bool, optional
+            If False, the atoms are drawn as a single collection of vector
+            circles.  If True, the atoms are drawn into one image at the axes'
+            pixel resolution, which keeps very large selections interactive and
+            the arrows are rasterized in vector outputs.  Default value (None)
+            will use raster only if more than RASTER_NATOMS atoms are plotted.
 
         Returns
         -------
@@ -810,20 +926,9 @@ class DifferentialDisplacement():
 
         ######################## Add atom circles to plot ##############################
 
-        # Loop over all atoms i in plotting box
-        for i in np.arange(refsystem.natoms)[plotbox.inside(atompos)]:
-            atype = refsystem.atoms.atype[i]
-            atype_index = refsystem.atypes.index(atype)
-
-            # Plot a circle for atom i
-            if atomcmap[atype_index] is not None:
-                color = atomcmap[atype_index]((atompos[i, 2] - zlim[0]) / (zlim[1] - zlim[0]))
-            elif atomcolor[atype_index] is not None:
-                color = atomcolor[atype_index]
-            else:
-                color = None
-            if color is not None:
-                ax1.add_patch(mpatches.Circle(atompos[i, :2], atomsize, fc=color, ec='k',linewidth=figsize[0]/5))
+        # Plot all atoms in plotting box as a single collection or image
+        raster = self.__plotatoms(ax1, refsystem, atompos, plotbox, xlim, ylim, zlim,
+                                  atomcolor, atomcmap, atomsize, figsize[0]/5, raster)
 
         ######################## Arrow setup ##############################
 
@@ -837,11 +942,8 @@ class DifferentialDisplacement():
         arrowwidths = arrowwidth * (arrowlengths[:,0]**2 + arrowlengths[:,1]**2)**0.5
 
         # Plot the arrows
-        for center, length, width in zip(arrowcenters, arrowlengths, arrowwidths):
-            if width > 1e-7:
-                ax1.quiver(center[0], center[1], length[0], length[1],
-                           pivot='middle', angles='xy', scale_units='xy',
-                           scale=1, width=width, minshaft=2)
+        self.__plotarrows(ax1, arrowcenters, arrowlengths, arrowwidths,
+                          xlim[1] - xlim[0], raster)
         #ax1.plot(0,0,"r+",markersize=25.0)
         #ax1.plot(np.sqrt(6)/12*4.05,np.sqrt(3)/6*4.05,"r+",markersize=25.0)
         if matplotlib_axes is None:
@@ -1,6 +1,7 @@
 # coding: utf-8
 # Standard Python libraries
 from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 # http://www.numpy.org/
 import numpy as np
@@ -50,6 +51,13 @@ def boolean(value):
     else:
         raise ValueError('Invalid Boolean string')
 
+def _dump_atom_data(system, filename, dumpkwargs):
+    """
+    Writes a system to an atom_data file.  Used by Dislocation.dump_monopole()
+    as the worker process function.
+    """
+    return system.dump('atom_data', f=filename, **dumpkwargs)
+
 class Dislocation():
     
     def __init__(self, ucell, C, burgers, ξ_uvw, slip_hkl, m=[0,1,0],
@@ -189,6 +197,7 @@ class Dislocation():
         # Set base_system and disl_system to None
         self.__base_system = None
         self.__disl_system = None
+        self.__field_maps = None
 
     @classmethod
     def fromref(cls, ucell, C, model, tol=1e-8):
@@ -440,6 +449,113 @@ class Dislocation():
 
         return Cylinder(center1, center2, radius, endcaps=False)
     
+    def __sizemults(self, sizemults, amin, bmin, cmin):
+        """
+        Checks sizemults and the min parameters and converts them into the
+        supersize multipliers for the base system.
+        """
+        # Set default sizemults
+        if sizemults is None:
+            sizemults = [2,2,2]
+            sizemults[self.lineindex] = 1
+        else:
+            sizemults = list(sizemults)
+            try:
+                assert len(sizemults) == 3
+                assert isinstance(sizemults[0], int) and sizemults[0] > 0
+                assert isinstance(sizemults[1], int) and sizemults[1] > 0
+                assert isinstance(sizemults[2], int) and sizemults[2] > 0
+                assert sizemults[self.lineindex - 1] % 2 == 0
+                assert sizemults[self.lineindex - 2] % 2 == 0
+            except:
+                raise TypeError('Invalid sizemults: must be 3 positive integers, and the two not along the dislocation line must be even')
+        
+        # Adjust multipliers based on min parameters
+        if amin > 0.0:
+            amult = int(np.ceil(amin / self.rcell.box.a))
+            if self.lineindex != 0 and amult % 2 == 1:
+                amult += 1
+            if amult > sizemults[0]:
+                sizemults[0] = amult
+
+        if bmin > 0.0:
+            bmult = int(np.ceil(bmin / self.rcell.box.b))
+            if self.lineindex != 1 and bmult % 2 == 1:
+                bmult += 1
+            if bmult > sizemults[1]:
+                sizemults[1] = bmult
+                
+        if cmin > 0.0:
+            cmult = int(np.ceil(cmin / self.rcell.box.c))
+            if self.lineindex != 2 and cmult % 2 == 1:
+                cmult += 1
+            if cmult > sizemults[2]:
+                sizemults[2] = cmult
+                
+        # Modify the non-periodic size multipliers
+        sizemults[self.lineindex] = (0, sizemults[self.lineindex])
+        sizemults[self.lineindex - 1] = (-sizemults[self.lineindex - 1] // 2,
+                                          sizemults[self.lineindex - 1] // 2)
+        sizemults[self.lineindex - 2] = (-sizemults[self.lineindex - 2] // 2,
+                                          sizemults[self.lineindex - 2] // 2)
+        
+        return sizemults
+
+    def __set_shift(self, shift, shiftindex, shiftscale):
+        """
+        Handles the shift parameters, updating and returning the shift value
+        to use.
+        """
+        if shift is not None:
+            if shiftindex is not None:
+                raise ValueError('shift and shiftindex cannot both be given')
+            if shiftscale is True:
+                self.__shift = miller.vector_crystal_to_cartesian(shift, self.rcell.box)
+            else:
+                self.__shift = np.asarray(shift)
+                assert self.__shift.shape == (3,) 
+        elif shiftindex is not None:
+            self.__shift = self.shifts[shiftindex]
+        return self.shift
+
+    def __build_base_system(self, sizemults, shift):
+        """
+        Creates the dislocation-free base system by supersizing and shifting
+        rcell.
+        """
+        base_system = self.rcell.supersize(*sizemults)
+        base_system.atoms.pos += shift
+        base_system.wrap()
+        return base_system
+    
+    def __build_monopole(self, base_system, displacement, boundaryshape,
+                         boundarywidth):
+        """
+        Creates a monopole dislocation system by copying base_system,
+        displacing the atoms and applying the boundary region.
+        """
+        # Copy the system and displace atoms according to the dislocation solution
+        disl_system = deepcopy(base_system)
+        disl_system.atoms.pos += displacement
+        disl_system.pbc = [False, False, False]
+        disl_system.pbc[self.lineindex] = True
+        disl_system.wrap()
+        
+        # Apply boundary region
+        if boundarywidth > 0.0:
+            
+            if boundaryshape == 'box':
+                shape = self.box_boundary(base_system.box, boundarywidth)
+                
+            elif boundaryshape == 'cylinder':
+                shape = self.cylinder_boundary(base_system.box, boundarywidth)
+            
+            # Change atypes of atoms outside box
+            disl_system.atoms.atype[shape.outside(disl_system.atoms.pos)] += base_system.natypes
+            disl_system.symbols = 2 * base_system.symbols
+        
+        return disl_system
+
     def monopole(self, sizemults=None, amin=0.0, bmin=0.0, cmin=0.0,
                  shift=None, shiftindex=None, shiftscale=False,
                  boundaryshape='cylinder', boundarywidth=0.0,
@@ -528,62 +644,9 @@ class Dislocation():
         disl_system : atomman.System
             The generated dislocation monopole system.
         """
-        # Set default sizemults
-        if sizemults is None:
-            sizemults = [2,2,2]
-            sizemults[self.lineindex] = 1
-        else:
-            try:
-                assert len(sizemults) == 3
-                assert isinstance(sizemults[0], int) and sizemults[0] > 0
-                assert isinstance(sizemults[1], int) and sizemults[1] > 0
-                assert isinstance(sizemults[2], int) and sizemults[2] > 0
-                assert sizemults[self.lineindex - 1] % 2 == 0
-                assert sizemults[self.lineindex - 2] % 2 == 0
-            except:
-                raise TypeError('Invalid sizemults: must be 3 positive integers, and the two not along the dislocation line must be even')
-        
-        # Adjust multipliers based on min parameters
-        if amin > 0.0:
-            amult = int(np.ceil(amin / self.rcell.box.a))
-            if self.lineindex != 0 and amult % 2 == 1:
-                amult += 1
-            if amult > sizemults[0]:
-                sizemults[0] = amult
-
-        if bmin > 0.0:
-            bmult = int(np.ceil(bmin / self.rcell.box.b))
-            if self.lineindex != 1 and bmult % 2 == 1:
-                bmult += 1
-            if bmult > sizemults[1]:
-                sizemults[1] = bmult
-                
-        if cmin > 0.0:
-            cmult = int(np.ceil(cmin / self.rcell.box.c))
-            if self.lineindex != 2 and cmult % 2 == 1:
-                cmult += 1
-            if cmult > sizemults[2]:
-                sizemults[2] = cmult
-                
-        # Modify the non-periodic size multipliers
-        sizemults[self.lineindex] = (0, sizemults[self.lineindex])
-        sizemults[self.lineindex - 1] = (-sizemults[self.lineindex - 1] // 2,
-                                          sizemults[self.lineindex - 1] // 2)
-        sizemults[self.lineindex - 2] = (-sizemults[self.lineindex - 2] // 2,
-                                          sizemults[self.lineindex - 2] // 2)
-        
-        # Handle shift parameters
-        if shift is not None:
-            if shiftindex is not None:
-                raise ValueError('shift and shiftindex cannot both be given')
-            if shiftscale is True:
-                self.__shift = miller.vector_crystal_to_cartesian(shift, self.rcell.box)
-            else:
-                self.__shift = np.asarray(shift)
-                assert shift.shape == (3,) 
-        elif shiftindex is not None:
-            self.__shift = self.shifts[shiftindex]
-        shift = self.shift
+        # Handle size and shift parameters
+        sizemults = self.__sizemults(sizemults, amin, bmin, cmin)
+        shift = self.__set_shift(shift, shiftindex, shiftscale)
         
         # Handle boundary parameters
         if boundaryscale is True:
@@ -592,37 +655,177 @@ class Dislocation():
             raise ValueError('boundaryshape must be "cylinder" or "box"')
         
         # Create the system where the dislocation will be inserted
-        base_system = self.rcell.supersize(*sizemults)
-        base_system.atoms.pos += shift
-        base_system.wrap()
+        base_system = self.__build_base_system(sizemults, shift)
         self.__base_system = base_system
+        self.__field_maps = None
         
-        # Copy the system and displace atoms according to the dislocation solution
-        disl_system = deepcopy(base_system)
-        disl_system.atoms.pos += self.dislsol.displacement(disl_system.atoms.pos)
-        disl_system.pbc = [False, False, False]
-        disl_system.pbc[self.lineindex] = True
-        disl_system.wrap()
+        # Displace atoms according to the dislocation solution
+        displacement = self.dislsol.displacement(base_system.atoms.pos)
+        disl_system = self.__build_monopole(base_system, displacement,
+                                            boundaryshape, boundarywidth)
         self.__disl_system = disl_system
         
-        # Apply boundary region
-        if boundarywidth > 0.0:
-            
-            if boundaryshape == 'box':
-                shape = self.box_boundary(base_system.box, boundarywidth)
-                
-            elif boundaryshape == 'cylinder':
-                shape = self.cylinder_boundary(base_system.box, boundarywidth)
-            
-            # Change atypes of atoms outside box
-            disl_system.atoms.atype[shape.outside(disl_system.atoms.pos)] += base_system.natypes
-            disl_system.symbols = 2 * base_system.symbols
-        
         if return_base_system:
             return base_system, disl_system
         else:
             return disl_system
 
+    def iter_monopole(self, variations, chunksize=None, nthreads=None,
+                      return_base_system=False, **kwargs):
+        """
+        Generator that constructs dislocation monopole systems for a series
+        of monopole() parameter variations.  Consecutive variations that
+        result in the same size multipliers and shift reuse the same base
+        system, displacement field and field_maps() values, with only the
+        boundary region being reapplied.  Order variations such that those
+        sharing sizes and shifts are adjacent to get the most reuse.
+        
+        Parameters
+        ----------
+        variations : list of dict
+            Each dict contains monopole() parameters for one system to
+            generate.  Allowed keys are 'sizemults', 'amin', 'bmin', 'cmin',
+            'shift', 'shiftindex', 'shiftscale', 'boundaryshape',
+            'boundarywidth' and 'boundaryscale'.
+        chunksize : int, optional
+            The maximum number of atoms to evaluate the dislocation solution
+            for at one time.  Default value of None evaluates all atoms
+            together.
+        nthreads : int, optional
+            The number of threads to use for evaluating the dislocation
+            solution.  Default value of None performs the evaluation serially.
+        return_base_system : bool, optional
+            If True then the dislocation-free base system corresponding to the
+            dislocation system will also be yielded.  Note that base systems
+            are shared by consecutive variations with the same sizes and
+            shifts and should not be modified.
+        **kwargs : any, optional
+            Default monopole() parameter values to use for all variations.
+        
+        Yields
+        ------
+        base_system : atomman.System
+            The base "perfect crystal" reference system associated with the
+            dislocation system. Only yielded if return_base_system is True.
+        disl_system : atomman.System
+            The generated dislocation monopole system.
+        """
+        allowed = ['sizemults', 'amin', 'bmin', 'cmin', 'shift', 'shiftindex',
+                   'shiftscale', 'boundaryshape', 'boundarywidth',
+                   'boundaryscale']
+        
+        key = None
+        for variation in variations:
+            params = deepcopy(kwargs)
+            params.update(variation)
+            for name in params:
+                if name not in allowed:
+                    raise TypeError(f'Unsupported monopole parameter {name}')
+            
+            # Handle size and shift parameters
+            sizemults = self.__sizemults(params.get('sizemults', None),
+                                         params.get('amin', 0.0),
+                                         params.get('bmin', 0.0),
+                                         params.get('cmin', 0.0))
+            shift = self.__set_shift(params.get('shift', None),
+                                     params.get('shiftindex', None),
+                                     params.get('shiftscale', False))
+            
+            # Handle boundary parameters
+            boundaryshape = params.get('boundaryshape', 'cylinder')
+            boundarywidth = params.get('boundarywidth', 0.0)
+            if params.get('boundaryscale', False) is True:
+                boundarywidth = boundarywidth * self.ucell.box.a
+            if boundaryshape not in ['cylinder', 'box']:
+                raise ValueError('boundaryshape must be "cylinder" or "box"')
+            
+            # Build new base system and displacements only when needed
+            newkey = (tuple(sizemults), tuple(shift))
+            if newkey != key:
+                key = newkey
+                base_system = self.__build_base_system(sizemults, shift)
+                displacement = self.dislsol.displacement(base_system.atoms.pos,
+                                                         chunksize=chunksize,
+                                                         nthreads=nthreads)
+                self.__base_system = base_system
+                self.__field_maps = None
+            
+            disl_system = self.__build_monopole(base_system, displacement,
+                                                boundaryshape, boundarywidth)
+            self.__disl_system = disl_system
+            
+            if return_base_system:
+                yield base_system, disl_system
+            else:
+                yield disl_system
+
+    def dump_monopole(self, variations, filenames, nprocs=None,
+                      chunksize=None, nthreads=None, dumpkwargs=None,
+                      **kwargs):
+        """
+        Constructs dislocation monopole systems for a series of monopole()
+        parameter variations using iter_monopole() and writes each to a LAMMPS
+        atom_data file.  The file writing can be done by parallel worker
+        processes while the next systems are being generated.
+        
+        Parameters
+        ----------
+        variations : list of dict
+            Each dict contains monopole() parameters for one system to
+            generate.  See iter_monopole() for allowed keys.
+        filenames : list of str
+            The atom_data file paths to write, one for each variation.
+        nprocs : int, optional
+            The number of worker processes to use for writing the files.
+            Default value of None writes the files in the calling process.
+        chunksize : int, optional
+            The maximum number of atoms to evaluate the dislocation solution
+            for at one time.  Default value of None evaluates all atoms
+            together.
+        nthreads : int, optional
+            The number of threads to use for evaluating the dislocation
+            solution.  Default value of None performs the evaluation serially.
+        dumpkwargs : dict, optional
+            Extra keyword arguments to pass to the atom_data dump method,
+            such as units, atom_style or potential.
+        **kwargs : any, optional
+            Default monopole() parameter values to use for all variations.
+        
+        Returns
+        -------
+        list of str
+            The LAMMPS input command lines to read in each created data file.
+        """
+        if len(filenames) != len(variations):
+            raise ValueError('filenames and variations must be the same length')
+        if dumpkwargs is None:
+            dumpkwargs = {}
+        
+        systems = self.iter_monopole(variations, chunksize=chunksize,
+                                     nthreads=nthreads, **kwargs)
+        
+        # Write files serially
+        if nprocs is None or nprocs <= 1:
+            return [_dump_atom_data(system, filename, dumpkwargs)
+                    for system, filename in zip(systems, filenames)]
+        
+        # Write files in parallel, limiting the number of pending systems
+        read_info = [None for i in range(len(filenames))]
+        with ProcessPoolExecutor(max_workers=nprocs) as executor:
+            pending = {}
+            for i, (system, filename) in enumerate(zip(systems, filenames)):
+                if len(pending) >= 2 * nprocs:
+                    done, notdone = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        read_info[pending.pop(future)] = future.result()
+                future = executor.submit(_dump_atom_data, system, filename,
+                                         dumpkwargs)
+                pending[future] = i
+            for future in pending:
+                read_info[pending[future]] = future.result()
+        
+        return read_info
+
     def periodicarray(self, sizemults=None, amin=0.0, bmin=0.0, cmin=0.0,
                       shift=None, shiftindex=None, shiftscale=False,
                       boundarywidth=0.0, boundaryscale=False, linear=False,
@@ -719,62 +922,9 @@ class Dislocation():
         disl_system : atomman.System
             The generated periodic array of dislocations system.
         """
-        # Set default sizemults
-        if sizemults is None:
-            sizemults = [2,2,2]
-            sizemults[self.lineindex] = 1
-        else:
-            try:
-                assert len(sizemults) == 3
-                assert isinstance(sizemults[0], int) and sizemults[0] > 0
-                assert isinstance(sizemults[1], int) and sizemults[1] > 0
-                assert isinstance(sizemults[2], int) and sizemults[2] > 0
-                assert sizemults[self.lineindex - 1] % 2 == 0
-                assert sizemults[self.lineindex - 2] % 2 == 0
-            except:
-                raise TypeError('Invalid sizemults: must be 3 positive integers, and the two not along the dislocation line must be even')
-        
-        # Adjust multipliers based on min parameters
-        if amin > 0.0:
-            amult = int(np.ceil(amin / self.rcell.box.a))
-            if self.lineindex != 0 and amult % 2 == 1:
-                amult += 1
-            if amult > sizemults[0]:
-                sizemults[0] = amult
-
-        if bmin > 0.0:
-            bmult = int(np.ceil(bmin / self.rcell.box.b))
-            if self.lineindex != 1 and bmult % 2 == 1:
-                bmult += 1
-            if bmult > sizemults[1]:
-                sizemults[1] = bmult
-                
-        if cmin > 0.0:
-            cmult = int(np.ceil(cmin / self.rcell.box.c))
-            if self.lineindex != 2 and cmult % 2 == 1:
-                cmult += 1
-            if cmult > sizemults[2]:
-                sizemults[2] = cmult
-                
-        # Modify the non-periodic size multipliers
-        sizemults[self.lineindex] = (0, sizemults[self.lineindex])
-        sizemults[self.lineindex - 1] = (-sizemults[self.lineindex - 1] // 2,
-                                          sizemults[self.lineindex - 1] // 2)
-        sizemults[self.lineindex - 2] = (-sizemults[self.lineindex - 2] // 2,
-                                          sizemults[self.lineindex - 2] // 2)
-        
-        # Handle shift parameters
-        if shift is not None:
-            if shiftindex is not None:
-                raise ValueError('shift and shiftindex cannot both be given')
-            if shiftscale is True:
-                self.__shift = miller.vector_crystal_to_cartesian(shift, self.rcell.box)
-            else:
-                self.__shift = np.asarray(shift)
-                assert shift.shape == (3,) 
-        elif shiftindex is not None:
-            self.__shift = self.shifts[shiftindex]
-        shift = self.shift
+        # Handle size and shift parameters
+        sizemults = self.__sizemults(sizemults, amin, bmin, cmin)
+        shift = self.__set_shift(shift, shiftindex, shiftscale)
         
         # Handle boundary parameters
         if boundaryscale is True:
@@ -795,6 +945,7 @@ class Dislocation():
         self.__disl_system = disl_system
         base_system = base_system.atoms_ix[disl_system.atoms.old_id]
         self.__base_system = base_system
+        self.__field_maps = None
 
         # Apply boundary region
         if boundarywidth > 0.0:
@@ -809,4 +960,124 @@ class Dislocation():
             return base_system, disl_system
         else:
             return disl_system
-        
\ No newline at end of file
+        
+
+    def field_maps(self, chunksize=None, nthreads=None, prefix='elastic_'):
+        """
+        Evaluates the elastic displacement, stress and strain fields of the
+        dislocation solution at the reference positions of all atoms in
+        disl_system.  The fields are computed in one pass, cached, and
+        assigned to disl_system as per-atom properties so that they can be
+        reused for plotting, boundary assignment and dumping without
+        re-evaluating the solution.  The cache is cleared whenever a new
+        system is built with monopole() or periodicarray().
+        
+        Parameters
+        ----------
+        chunksize : int, optional
+            The maximum number of atoms to evaluate the solution for at one
+            time.  Default value of None evaluates all atoms together.
+        nthreads : int, optional
+            The number of threads to use for evaluating the solution.
+            Default value of None performs the evaluation serially.
+        prefix : str, optional
+            Prefix added to the per-atom property names "displacement",
+            "stress" and "strain" when they are assigned to disl_system.
+            Default value is 'elastic_'.
+        
+        Returns
+        -------
+        dict
+            Contains the per-atom 'displacement', 'stress' and 'strain'
+            numpy.ndarrays.
+        """
+        if self.__field_maps is None:
+            pos = self.base_system.atoms.pos
+            self.__field_maps = self.__fields(pos, chunksize=chunksize,
+                                              nthreads=nthreads)
+        
+        # Assign the fields to disl_system
+        for key, value in self.__field_maps.items():
+            self.disl_system.atoms.view[prefix + key] = value
+        
+        return self.__field_maps
+
+    def field_grid(self, xlim=None, ylim=None, bins=50, chunksize=None,
+                   nthreads=None):
+        """
+        Evaluates the elastic displacement, stress and strain fields of the
+        dislocation solution on a regular grid in the plane perpendicular to
+        the dislocation line.  Useful for plotting the solution.
+        
+        Parameters
+        ----------
+        xlim : tuple, optional
+            The minimum and maximum coordinates along the solution's m
+            direction to use for the grid.  If not given, will use the
+            range of the atomic positions in disl_system.
+        ylim : tuple, optional
+            The minimum and maximum coordinates along the solution's n
+            direction to use for the grid.  If not given, will use the
+            range of the atomic positions in disl_system.
+        bins : int or tuple, optional
+            The number of grid points to use along the m and n directions.
+            Default value is 50.
+        chunksize : int, optional
+            The maximum number of grid points to evaluate the solution for at
+            one time.  Default value of None evaluates all points together.
+        nthreads : int, optional
+            The number of threads to use for evaluating the solution.
+            Default value of None performs the evaluation serially.
+        
+        Returns
+        -------
+        dict
+            Contains the grid coordinates 'x' and 'y', and the 'displacement',
+            'stress' and 'strain' values at each grid point.  The first two
+            dimensions of all values correspond to the (y, x) grid indices
+            for compatibility with matplotlib.
+        """
+        m = self.dislsol.m
+        n = self.dislsol.n
+        
+        # Set default limits based on the disl_system positions
+        if xlim is None or ylim is None:
+            pos = self.disl_system.atoms.pos
+            if xlim is None:
+                x = pos.dot(m)
+                xlim = (x.min(), x.max())
+            if ylim is None:
+                y = pos.dot(n)
+                ylim = (y.min(), y.max())
+        
+        # Build the grid
+        if isinstance(bins, (int, np.integer)):
+            bins = (bins, bins)
+        x, y = np.meshgrid(np.linspace(xlim[0], xlim[1], bins[0]),
+                           np.linspace(ylim[0], ylim[1], bins[1]))
+        pos = np.outer(x.flatten(), m) + np.outer(y.flatten(), n)
+        
+        # Evaluate the fields and reshape to the grid
+        grid = {'x': x, 'y': y}
+        for key, value in self.__fields(pos, chunksize=chunksize,
+                                        nthreads=nthreads).items():
+            grid[key] = value.reshape(x.shape + value.shape[1:])
+        
+        return grid
+
+    def __fields(self, pos, chunksize=None, nthreads=None):
+        """
+        Computes the displacement, stress and strain fields of the dislocation
+        solution at the given positions.
+        """
+        displacement = self.dislsol.displacement(pos, chunksize=chunksize,
+                                                 nthreads=nthreads)
+        stress = self.dislsol.stress(pos, chunksize=chunksize,
+                                     nthreads=nthreads)
+        
+        # ε_ij = S_ijkl σ_kl
+        Sijkl = self.dislsol.C.Sijkl.reshape(9, 9)
+        strain = stress.reshape(-1, 9).dot(Sijkl.T).reshape(stress.shape)
+        
+        return {'displacement': displacement, 'stress': stress,
+                'strain': strain}
@@ -10,7 +10,7 @@ import pandas as pd
 import numpy as np
 
 # https://www.scipy.org/
-from scipy.interpolate import griddata, Rbf, NearestNDInterpolator
+from scipy.interpolate import griddata, Rbf, NearestNDInterpolator, RectBivariateSpline
 
 # http://matplotlib.org/
 import matplotlib.pyplot as plt
@@ -30,7 +30,8 @@ class GammaSurface(object):
     """
     
     def __init__(self, model=None, a1vect=None, a2vect=None,
-                 a1=None, a2=None, E_gsf=None, box=None, delta=None):
+                 a1=None, a2=None, E_gsf=None, box=None, delta=None,
+                 interpolation='rbf'):
         """
         Class initializer. Parameter model must be given alone. Otherwise,
         all or none of a1vect, a2vect, a1, a2, and E_gsf must be given.
@@ -63,7 +64,17 @@ class GammaSurface(object):
             List of change in displacements normal to the fault plane for the
             positions associated with the corresponding (a1, a2) fractional
             coordinates.
+        interpolation : str, optional
+            The interpolation backend used for the smooth E_gsf and delta
+            values: 'rbf' (default) uses a radial basis function fit of all
+            points, and 'spline' uses a periodic bicubic spline which requires
+            the a1, a2 values to form a regular grid.
         """
+        if interpolation not in ['rbf', 'spline']:
+            raise ValueError("interpolation must be 'rbf' or 'spline'")
+        self.__interpolation = interpolation
+        self.__transforms = {}
+        self.__grids = {}
     
         # Load model if given
         if model is not None:
@@ -142,7 +153,8 @@ class GammaSurface(object):
         else:
             raise AttributeError('gamma surface data not set')
     
-    def set(self, a1vect, a2vect, a1, a2, E_gsf,  box=None, delta=None):
+    def set(self, a1vect, a2vect, a1, a2, E_gsf,  box=None, delta=None,
+            interpolation=None):
         """
         Sets generalized stacking fault data.
         
@@ -172,6 +184,9 @@ class GammaSurface(object):
             List of change in displacements normal to the fault plane for the
             positions associated with the corresponding (a1, a2) fractional
             coordinates.
+        interpolation : str, optional
+            The interpolation backend to use, either 'rbf' or 'spline'.
+            Default value of None keeps the current setting.
         """
         # Set a1vect
         if isinstance(a1vect, str):
@@ -199,6 +214,7 @@ class GammaSurface(object):
         if not isinstance(box, Box):
             raise TypeError('box must be an atomman.Box')
         self.__box = box
+        self.__transforms = {}
 
         # Set plane normal
         a1vect = np.dot(a1vect, box.vects)
@@ -217,12 +233,40 @@ class GammaSurface(object):
 
         # Fit
         self.__hasdata = True
-        self.fit()        
+        self.fit(interpolation=interpolation)
     
-    def fit(self):
+    @property
+    def interpolation(self):
+        """str : The interpolation backend, 'rbf' or 'spline'."""
+        return self.__interpolation
+    
+    @interpolation.setter
+    def interpolation(self, value):
+        if self.__hasdata:
+            self.fit(interpolation=value)
+        elif value not in ['rbf', 'spline']:
+            raise ValueError("interpolation must be 'rbf' or 'spline'")
+        else:
+            self.__interpolation = value
+    
+    def fit(self, interpolation=None):
         """
         Defines the interpolation functions from the raw data.
+        
+        Parameters
+        ----------
+        interpolation : str, optional
+            The interpolation backend to use for the smooth values.  'rbf'
+            uses a radial basis function fit of all points, and 'spline' uses
+            a periodic bicubic spline which requires the a1, a2 values to
+            form a regular grid.  Default value of None keeps the current
+            setting.  The current fits and setting are only replaced if
+            all new fits are successfully built.
         """
+        if interpolation is None:
+            interpolation = self.__interpolation
+        if interpolation not in ['rbf', 'spline']:
+            raise ValueError("interpolation must be 'rbf' or 'spline'")
         
         # Ignore a1, a2=1.0 values if included
         shortdata = self.data[~(np.isclose(self.data.a1, 1.0) | np.isclose(self.data.a2, 1.0))]
@@ -242,16 +286,65 @@ class GammaSurface(object):
         a2max = ua2[np.where(np.isclose(ua2, 1.0))[0][-1] + 1] + 1e-8
         ix = np.where((a1 >= a1min) & (a1 <= a1max) & (a2 >= a2min) & (a2 <= a2max))
         
+        # Fit periodic splines
+        if interpolation == 'spline':
+            E_gsf_fit, delta_fit = self.__spline_fit(shortdata)
+        
         # Fit energy
         E_gsf = np.concatenate([shortdata.E_gsf] * 9)
-        self.__E_gsf_fit = Rbf(a1[ix], a2[ix], E_gsf[ix])
-        self.__E_gsf_nearest = NearestNDInterpolator(np.array([a1[ix], a2[ix]]).T, E_gsf[ix])
+        E_gsf_nearest = NearestNDInterpolator(np.array([a1[ix], a2[ix]]).T, E_gsf[ix])
+        if interpolation == 'rbf':
+            E_gsf_fit = Rbf(a1[ix], a2[ix], E_gsf[ix])
         
         # Fit delta
         if 'delta' in self.data:
             delta = np.concatenate([shortdata.delta] * 9)
-            self.__delta_fit = Rbf(a1[ix], a2[ix], delta[ix])
-            self.__delta_nearest = NearestNDInterpolator(np.array([a1[ix], a2[ix]]).T, delta[ix])
+            delta_nearest = NearestNDInterpolator(np.array([a1[ix], a2[ix]]).T, delta[ix])
+            if interpolation == 'rbf':
+                delta_fit = Rbf(a1[ix], a2[ix], delta[ix])
+        
+        # Save the new fits
+        self.__interpolation = interpolation
+        self.__E_gsf_fit = E_gsf_fit
+        self.__E_gsf_nearest = E_gsf_nearest
+        if 'delta' in self.data:
+            self.__delta_fit = delta_fit
+            self.__delta_nearest = delta_nearest
+        self.__grids = {}
+    
+    def __spline_fit(self, shortdata):
+        """
+        Builds periodic bicubic spline interpolation functions from raw data
+        that lies on a regular a1, a2 grid.  Returns the E_gsf fit and the
+        delta fit, which is None if there is no delta data.
+        """
+        # Identify the grid
+        ua1, i1 = np.unique(np.round(shortdata.a1.values, 8), return_inverse=True)
+        ua2, i2 = np.unique(np.round(shortdata.a2.values, 8), return_inverse=True)
+        count = np.zeros((len(ua1), len(ua2)), dtype=int)
+        np.add.at(count, (i1, i2), 1)
+        if not np.all(count == 1):
+            raise ValueError('spline interpolation requires a1, a2 values on a regular grid')
+        
+        # Extend grid by one period on each side for periodicity
+        a1 = np.concatenate([ua1 - 1, ua1, ua1 + 1])
+        a2 = np.concatenate([ua2 - 1, ua2, ua2 + 1])
+        
+        def fitgrid(values):
+            grid = np.empty((len(ua1), len(ua2)))
+            grid[i1, i2] = values
+            return RectBivariateSpline(a1, a2, np.tile(grid, (3, 3)), kx=3, ky=3, s=0)
+        
+        # Fit energy
+        E_gsf_fit = fitgrid(shortdata.E_gsf.values)
+        
+        # Fit delta
+        if 'delta' in self.data:
+            delta_fit = fitgrid(shortdata.delta.values)
+        else:
+            delta_fit = None
+        
+        return E_gsf_fit, delta_fit
     
     def model(self, model=None, length_unit='angstrom',
               energyperarea_unit='mJ/m^2'):
@@ -342,21 +435,11 @@ class GammaSurface(object):
         np.array
             3D Cartesian position vector(s).
         """
-        # Handle a1vect and a2vect
-        if a1vect is None:
-            a1vect = self.a1vect
-        a1vect = np.asarray(a1vect)
-
-        if a2vect is None:
-            a2vect = self.a2vect
-        a2vect = np.asarray(a2vect)
-        
-        # Convert a1vect and a2vect from crystal to Cartesian coordinates
-        a1vect = np.dot(a1vect, self.box.vects)
-        a2vect = np.dot(a2vect, self.box.vects)
+        # Get Cartesian a1vect and a2vect
+        a12vects = self.__a12_transform(a1vect, a2vect)[0]
         
         # Transform a1, a2 to Cartesian pos
-        return np.outer(a1, a1vect) + np.outer(a2, a2vect)
+        return np.outer(a1, a12vects[0]) + np.outer(a2, a12vects[1])
         
     def pos_to_xy(self, pos, xvect=None):
         """
@@ -378,20 +461,11 @@ class GammaSurface(object):
         y : float(s)
             Plotting y coordinate(s).
         """
-        # Handle xvect
-        if xvect is None:
-            xvect = np.dot(self.a1vect, self.box.vects)
-        xvect = np.asarray(xvect)        
-        if not np.isclose(np.dot(xvect, self.planenormal), 0.0):
-            raise ValueError('xvect must be in plane defined by a1vect and a2vect')
-        
-        # Build transformation tensor
-        yvect = np.cross(self.planenormal, xvect)
-        transform = np.array([xvect, yvect, self.planenormal])
-        transform = (transform.T / np.linalg.norm(transform, axis=1)).T
+        # Get transformation tensor
+        transform = self.__xy_transform(xvect)[0]
         
         # Transform coordinates to x,y,z orientation
-        pos = transform.dot(pos.T).T
+        pos = np.dot(pos, transform.T)
         
         # Return x, y coordinates
         return pos[...,0], pos[...,1]
@@ -426,7 +500,7 @@ class GammaSurface(object):
         """
         # Set xvect as given a1vect if needed
         if a1vect is not None and xvect is None:
-            xvect = np.dot(a1vect, self.box.vects)
+            xvect = self.__a12_transform(a1vect, a2vect)[0][0]
         
         # Transform from a1, a2 to pos
         pos = self.a12_to_pos(a1, a2, a1vect=a1vect, a2vect=a2vect)
@@ -458,25 +532,11 @@ class GammaSurface(object):
             Fractional distance(s) along a2 vector.
         """
 
-        # Handle a1vect and a2vect
-        if a1vect is None:
-            a1vect = self.a1vect
-        a1vect = np.asarray(a1vect)
-
-        if a2vect is None:
-            a2vect = self.a2vect
-        a2vect = np.asarray(a2vect)
-        
-        # Convert a1vect and a2vect from crystal to Cartesian coordinates
-        a1vect = np.dot(a1vect, self.box.vects)
-        a2vect = np.dot(a2vect, self.box.vects)
+        # Get inverse of the [a1vect, a2vect, a1vect x a2vect] matrix
+        inverse = self.__a12_transform(a1vect, a2vect)[1]
         
         # Solve for a1, a2, a3
-        a3vect = np.cross(a1vect, a2vect)
-        coeffs = np.array([a1vect, a2vect, a3vect]).T
-        if pos.ndim == 2:
-            coeffs = np.array([coeffs])
-        a123 = np.linalg.solve(coeffs, pos)
+        a123 = np.dot(pos, inverse.T)
         assert np.allclose(a123[...,2], 0.0, atol=1e-6), np.abs(a123[...,2]).max()
 
         # Return a1, a2
@@ -502,25 +562,77 @@ class GammaSurface(object):
         pos: np.array
             3D Cartesian position vector(s).
         """
+        # Get inverse transformation tensor
+        inverse = self.__xy_transform(xvect)[1]
+        
+        # Transform coords
+        return np.outer(x, inverse[:, 0]) + np.outer(y, inverse[:, 1])
+    
+    def __a12_transform(self, a1vect=None, a2vect=None):
+        """
+        Returns the (2,3) array of Cartesian a1vect, a2vect and the inverse
+        of the [a1vect, a2vect, a1vect x a2vect] column matrix.  Values are
+        cached for each a1vect, a2vect combination.
+        """
+        # Handle a1vect and a2vect
+        if a1vect is None:
+            a1vect = self.a1vect
+        a1vect = np.asarray(a1vect, dtype=float)
+        if a2vect is None:
+            a2vect = self.a2vect
+        a2vect = np.asarray(a2vect, dtype=float)
+        
+        key = ('a12', a1vect.tobytes(), a2vect.tobytes())
+        try:
+            return self.__transforms[key]
+        except KeyError:
+            pass
+        
+        # Convert a1vect and a2vect from crystal to Cartesian coordinates
+        a1vect = np.dot(a1vect, self.box.vects)
+        a2vect = np.dot(a2vect, self.box.vects)
+        a3vect = np.cross(a1vect, a2vect)
+        
+        transform = (np.array([a1vect, a2vect]),
+                     np.linalg.inv(np.array([a1vect, a2vect, a3vect]).T))
+        self.__cache_transform(key, transform)
+        
+        return transform
+    
+    def __xy_transform(self, xvect=None):
+        """
+        Returns the transformation tensor from Cartesian to plotting x, y, z
+        coordinates and its inverse.  Values are cached for each xvect.
+        """
         # Assign default xvect if needed
         if xvect is None:
-            xvect = np.dot(self.a1vect, self.box.vects)
-        xvect = np.asarray(xvect)
+            xvect = self.__a12_transform()[0][0]
+        xvect = np.asarray(xvect, dtype=float)
+        
+        key = ('xy', xvect.tobytes())
+        try:
+            return self.__transforms[key]
+        except KeyError:
+            pass
+        
         if not np.isclose(np.dot(xvect, self.planenormal), 0.0):
             raise ValueError('xvect must be in plane defined by a1vect and a2vect')
-       
+        
         # Build transformation tensor
         yvect = np.cross(self.planenormal, xvect)
         transform = np.array([xvect, yvect, self.planenormal])
         transform = (transform.T / np.linalg.norm(transform, axis=1)).T
-        transform = np.linalg.inv(transform)
         
-        # Transform coords
-        pos = np.outer(x, [1,0,0]) + np.outer(y, [0,1,0])
-        pos = transform.dot(pos.T).T
+        transform = (transform, np.linalg.inv(transform))
+        self.__cache_transform(key, transform)
         
-        # Return Cartesian pos
-        return pos
+        return transform
+    
+    def __cache_transform(self, key, transform):
+        """Saves a transform to the cache, limiting the number stored."""
+        if len(self.__transforms) >= 64:
+            self.__transforms.clear()
+        self.__transforms[key] = transform
     
     def xy_to_a12(self, x, y, a1vect=None, a2vect=None, xvect=None):
         """
@@ -553,7 +665,7 @@ class GammaSurface(object):
         
         # Set xvect to given a1vect if needed
         if a1vect is not None and xvect is None:
-            xvect = np.dot(a1vect, self.box.vects)
+            xvect = self.__a12_transform(a1vect, a2vect)[0][0]
 
         # Convert x, y to pos    
         pos = self.xy_to_pos(x, y, xvect=xvect)
@@ -589,13 +701,24 @@ class GammaSurface(object):
             Cartesian vector corresponding to the plotting x-axis. If None
             (default), this is taken as the Cartesian of a1vect.
         smooth : bool, optional
-            If True (default) the returned values are smoothed using a RBF fit.
-            If False, the closest measured values are returned.
+            If True (default) the returned values are smoothed using the
+            selected interpolation backend, i.e. a RBF fit or a periodic
+            bicubic spline.  If False, the closest measured values are
+            returned.
+        out : numpy.ndarray, optional
+            An existing array with the same shape as the coordinates to write
+            the values to.  If given, out is returned.
+        
+        Returns
+        -------
+        numpy.ndarray
+            The interpolated values.
         """
         if not self.__hasdata:
             raise AttributeError('gamma surface data not set')
         
         smooth = kwargs.pop('smooth', True)
+        out = kwargs.pop('out', None)
 
         # Convert x, y to a1, a2
         if 'x' in kwargs:
@@ -631,47 +754,120 @@ class GammaSurface(object):
                 a2 = a2.reshape(shape)
 
         # Return interpolated values
-        if smooth:
-            cushion = (1 - self.data.a1.max()) / 2
+        cushion = (1 - self.data.a1.max()) / 2
+        return self.__evaluate(self.__E_gsf_fit, self.__E_gsf_nearest, a1, a2,
+                               smooth=smooth, cushion=cushion, out=out)
     
-            # Wrap all a1, a2 values within [-cushion, 1.0 - cushion)
-            while np.any(a1 >= 1.0 - cushion): 
-                a1[a1 >= 1.0 - cushion] -= 1.0
-            while np.any(a1 < -cushion): 
-                a1[a1 < -cushion] += 1.0
-            while np.any(a2 >= 1.0 - cushion): 
-                a2[a2 >= 1.0 - cushion] -= 1.0
-            while np.any(a2 < -cushion): 
-                a2[a2 < -cushion] += 1.0
-            
-            # Compute weighting factors
-            def zone1(x):
-                return (x + cushion) / (2 * cushion)
-            def zone2(x):
-                return np.ones_like(x)
-            x = np.piecewise(a1, [a1 < cushion, a1>= cushion], [zone1, zone2])
-            y = np.piecewise(a2, [a2 < cushion, a2>= cushion], [zone1, zone2])
-            
-            # Linear smoothing across boundaries
-            return ( x * y * self.__E_gsf_fit(a1, a2)
-                + x * (1 - y) * self.__E_gsf_fit(a1, a2 + 1)
-                + (1 - x) * y * self.__E_gsf_fit(a1 + 1, a2)
-                + (1 - x) * (1 - y) * self.__E_gsf_fit(a1 + 1, a2 + 1))
+    def E_gsf_gradient(self, **kwargs):
+        """
+        Returns the gradient of the interpolated generalized stacking fault
+        energy with respect to the coordinates that the values are given in.
+        The derivatives with respect to a1, a2 are evaluated analytically from
+        the spline or RBF fit, including the linear smoothing across the cell
+        boundaries used by 'rbf', and then transformed to the requested
+        coordinates.
+        
+        Parameters
+        ----------
+        a1 : float(s), optional
+            Fractional coordinate(s) along a1vect.
+        a2 : float(s), optional
+            Fractional coordinate(s) along a2vect.
+        pos : np.array, optional
+            3D Cartesian position vector(s).
+        x : float(s), optional
+            Plotting x coordinate(s).
+        y : float(s), optional
+            Plotting y coordinate(s).
+        a1vect : np.array, optional
+            Vector for the a1 fractional coordinates.  Default value of None 
+            uses the saved a1vect.
+        a2vect : np.array, optional
+            Vector for the a2 fractional coordinates.  Default value of None 
+            uses the saved a2vect.
+        xvect : np.array, optional
+            Cartesian vector corresponding to the plotting x-axis. If None
+            (default), this is taken as the Cartesian of a1vect.
+        
+        Returns
+        -------
+        tuple
+            The derivatives (dE/da1, dE/da2) if a1, a2 are given, or
+            (dE/dx, dE/dy) if x, y are given.
+        np.array
+            The 3D Cartesian gradient vector(s) if pos is given.
+        """
+        if not self.__hasdata:
+            raise AttributeError('gamma surface data not set')
+        
+        cartesian = False
+        
+        # Identify a1, a2 and the transformation d(a1, a2)/d(coordinates)
+        if 'x' in kwargs:
+            x = kwargs.pop('x')
+            y = kwargs.pop('y')
+            a1vect = kwargs.pop('a1vect', None)
+            a2vect = kwargs.pop('a2vect', None)
+            xvect = kwargs.pop('xvect', None)
+            assert len(kwargs) == 0, 'Unknown/incompatible arguments given'
+            a1, a2 = self.xy_to_a12(x, y, a1vect=a1vect, a2vect=a2vect, xvect=xvect)
+            jacobian = np.array([self.xy_to_a12(1.0, 0.0, a1vect=a1vect, a2vect=a2vect, xvect=xvect),
+                                 self.xy_to_a12(0.0, 1.0, a1vect=a1vect, a2vect=a2vect, xvect=xvect)]).reshape(2, 2).T
+        
+        elif 'pos' in kwargs:
+            pos = kwargs.pop('pos')
+            cartesian = True
+            a1vect = kwargs.pop('a1vect', None)
+            a2vect = kwargs.pop('a2vect', None)
+            assert len(kwargs) == 0, 'Unknown/incompatible arguments given'
+            a1, a2 = self.pos_to_a12(pos, a1vect=a1vect, a2vect=a2vect)
+            jacobian = self.__a12_transform(a1vect, a2vect)[1][:2]
         
-        # Return nearest values
         else:
-
-            # Wrap all values within 0.0 < a1, a2 < 1.0
-            while np.any(a1 > 1.0): 
-                a1[a1 > 1.0] -= 1.0
-            while np.any(a1 < 0.0): 
-                a1[a1 < 0.0] += 1.0
-            while np.any(a2 > 1.0): 
-                a2[a2 > 1.0] -= 1.0
-            while np.any(a2 < 0.0): 
-                a2[a2 < 0.0] += 1.0
-
-            return self.__E_gsf_nearest(np.array([a1.flatten(), a2.flatten()]).T).reshape(a1.shape)
+            a1 = np.array(kwargs.pop('a1'), dtype=float)
+            a2 = np.array(kwargs.pop('a2'), dtype=float)
+            a1vect = kwargs.pop('a1vect', None)
+            a2vect = kwargs.pop('a2vect', None)
+            assert len(kwargs) == 0, 'Unknown/incompatible arguments given'
+            if a1vect is not None or a2vect is not None:
+                shape = a1.shape
+                pos = self.a12_to_pos(a1, a2, a1vect=a1vect, a2vect=a2vect)
+                a1, a2 = self.pos_to_a12(pos)
+                a1 = a1.reshape(shape)
+                a2 = a2.reshape(shape)
+                jacobian = np.array([self.pos_to_a12(self.a12_to_pos(1.0, 0.0, a1vect=a1vect, a2vect=a2vect)),
+                                     self.pos_to_a12(self.a12_to_pos(0.0, 1.0, a1vect=a1vect, a2vect=a2vect))]).reshape(2, 2).T
+            else:
+                jacobian = np.identity(2)
+        
+        a1 = np.asarray(a1, dtype=float)
+        a2 = np.asarray(a2, dtype=float)
+        
+        # Analytic spline derivatives with respect to a1, a2
+        if self.interpolation == 'spline':
+            a1 = np.mod(a1, 1.0)
+            a2 = np.mod(a2, 1.0)
+            dE_da1 = self.__E_gsf_fit.ev(a1, a2, dx=1).reshape(a1.shape)
+            dE_da2 = self.__E_gsf_fit.ev(a1, a2, dy=1).reshape(a1.shape)
+        
+        # Analytic rbf derivatives with respect to a1, a2
+        else:
+            cushion = (1 - self.data.a1.max()) / 2
+            dE_da1, dE_da2 = self.__rbf_gradient(self.__E_gsf_fit,
+                                                 a1.reshape(-1), a2.reshape(-1),
+                                                 cushion)
+            dE_da1 = dE_da1.reshape(a1.shape)
+            dE_da2 = dE_da2.reshape(a1.shape)
+        
+        # Transform to the given coordinates
+        gradient = np.tensordot(np.array([dE_da1, dE_da2]), jacobian, axes=(0, 0))
+        
+        if cartesian:
+            if np.asarray(pos).ndim == 1:
+                return gradient.reshape(3)
+            return gradient
+        else:
+            return gradient[..., 0], gradient[..., 1]
     
     def delta(self, **kwargs):
         """
@@ -701,8 +897,18 @@ class GammaSurface(object):
             Cartesian vector corresponding to the plotting x-axis. If None
             (default), this is taken as the Cartesian of a1vect.
         smooth : bool, optional
-            If True (default) the returned values are smoothed using a RBF fit.
-            If False, the closest measured values are returned.
+            If True (default) the returned values are smoothed using the
+            selected interpolation backend, i.e. a RBF fit or a periodic
+            bicubic spline.  If False, the closest measured values are
+            returned.
+        out : numpy.ndarray, optional
+            An existing array with the same shape as the coordinates to write
+            the values to.  If given, out is returned.
+        
+        Returns
+        -------
+        numpy.ndarray
+            The interpolated values.
         """
         if not self.__hasdata:
             raise AttributeError('gamma surface data not set')
@@ -710,6 +916,7 @@ class GammaSurface(object):
             raise AttributeError('delta data not set')
         
         smooth = kwargs.pop('smooth', True)
+        out = kwargs.pop('out', None)
 
         # Convert x, y to a1, a2
         if 'x' in kwargs:
@@ -744,20 +951,254 @@ class GammaSurface(object):
                 a1 = a1.reshape(shape)
                 a2 = a2.reshape(shape)
         
-        # Wrap all values within 0.0 < a1, a2 < 1.0
-        while np.any(a1 > 1.0): 
-            a1[a1 > 1.0] -= 1.0
-        while np.any(a1 < 0.0): 
-            a1[a1 < 0.0] += 1.0
-        while np.any(a2 > 1.0): 
-            a2[a2 > 1.0] -= 1.0
-        while np.any(a2 < 0.0): 
-            a2[a2 < 0.0] += 1.0
-        
-        if smooth:
-            return self.__delta_fit(a1, a2)
+        # Return interpolated values
+        return self.__evaluate(self.__delta_fit, self.__delta_nearest, a1, a2,
+                               smooth=smooth, out=out)
+    
+    def __evaluate(self, fit, nearest, a1, a2, smooth=True, cushion=None,
+                   out=None):
+        """
+        Evaluates an interpolation at a1, a2 after wrapping them into the
+        unit cell.  For rbf fits with a cushion, values within the cushion of
+        the cell boundaries are linearly smoothed with the periodic images.
+        """
+        a1 = np.asarray(a1, dtype=float)
+        a2 = np.asarray(a2, dtype=float)
+        shape = a1.shape
+        if out is not None and out.shape != shape:
+            raise ValueError('out must have the same shape as the coordinates')
+        a1 = a1.reshape(-1)
+        a2 = a2.reshape(-1)
+        
+        if smooth and self.interpolation == 'spline':
+            values = fit.ev(np.mod(a1, 1.0), np.mod(a2, 1.0))
+        
+        elif smooth and cushion is not None:
+            
+            # Wrap all a1, a2 values within [-cushion, 1.0 - cushion)
+            a1 = np.mod(a1 + cushion, 1.0) - cushion
+            a2 = np.mod(a2 + cushion, 1.0) - cushion
+            
+            # Compute weighting factors for values that need periodic images
+            i1 = np.nonzero(a1 < cushion)[0]
+            i2 = np.nonzero(a2 < cushion)[0]
+            i12 = np.nonzero((a1 < cushion) & (a2 < cushion))[0]
+            n, n1, n2 = len(a1), len(i1), len(i2)
+            x = np.ones(n)
+            x[i1] = (a1[i1] + cushion) / (2 * cushion)
+            y = np.ones(n)
+            y[i2] = (a2[i2] + cushion) / (2 * cushion)
+            
+            # Evaluate all terms at once
+            fits = self.__rbf_evaluate(fit,
+                np.concatenate([a1, a1[i2], a1[i1] + 1, a1[i12] + 1]),
+                np.concatenate([a2, a2[i2] + 1, a2[i1], a2[i12] + 1]))
+            
+            # Linear smoothing across boundaries
+            values = x * y * fits[:n]
+            values[i2] += x[i2] * (1 - y[i2]) * fits[n:n+n2]
+            values[i1] += (1 - x[i1]) * y[i1] * fits[n+n2:n+n2+n1]
+            values[i12] += (1 - x[i12]) * (1 - y[i12]) * fits[n+n2+n1:]
+        
+        elif smooth:
+            values = self.__rbf_evaluate(fit, np.mod(a1, 1.0), np.mod(a2, 1.0))
+        
+        else:
+            values = nearest(np.array([np.mod(a1, 1.0), np.mod(a2, 1.0)]).T)
+        
+        if out is None:
+            return values.reshape(shape)
         else:
-            return self.__delta_nearest(np.array([a1.flatten(), a2.flatten()]).T).reshape(a1.shape)
+            out[...] = values.reshape(shape)
+            return out
+    
+    def __rbf_evaluate(self, fit, a1, a2):
+        """
+        Evaluates a Rbf fit in chunks to limit the size of the intermediate
+        distance arrays.
+        """
+        chunksize = max(1, 2**22 // fit.N)
+        if len(a1) <= chunksize:
+            return fit(a1, a2)
+        
+        values = np.empty(len(a1))
+        for i in range(0, len(a1), chunksize):
+            values[i:i+chunksize] = fit(a1[i:i+chunksize], a2[i:i+chunksize])
+        return values
+    
+    def __rbf_gradient(self, fit, a1, a2, cushion):
+        """
+        Evaluates the analytic a1, a2 derivatives of a rbf fit including the
+        linear smoothing with the periodic images used by __evaluate.
+        """
+        # Wrap all a1, a2 values within [-cushion, 1.0 - cushion)
+        a1 = np.mod(a1 + cushion, 1.0) - cushion
+        a2 = np.mod(a2 + cushion, 1.0) - cushion
+        
+        # Compute weighting factors and their derivatives
+        i1 = np.nonzero(a1 < cushion)[0]
+        i2 = np.nonzero(a2 < cushion)[0]
+        i12 = np.nonzero((a1 < cushion) & (a2 < cushion))[0]
+        n, n1, n2 = len(a1), len(i1), len(i2)
+        x = np.ones(n)
+        dx = np.zeros(n)
+        if n1 > 0:
+            x[i1] = (a1[i1] + cushion) / (2 * cushion)
+            dx[i1] = 1 / (2 * cushion)
+        y = np.ones(n)
+        dy = np.zeros(n)
+        if n2 > 0:
+            y[i2] = (a2[i2] + cushion) / (2 * cushion)
+            dy[i2] = 1 / (2 * cushion)
+        
+        # Evaluate all terms at once
+        f, f1, f2 = self.__rbf_derivatives(fit,
+            np.concatenate([a1, a1[i2], a1[i1] + 1, a1[i12] + 1]),
+            np.concatenate([a2, a2[i2] + 1, a2[i1], a2[i12] + 1]))
+        b = [0, n, n + n2, n + n2 + n1, len(f)]
+        
+        # Product rule for each of the smoothed terms
+        dE_da1 = x * y * f1[:n] + dx * y * f[:n]
+        dE_da2 = x * y * f2[:n] + x * dy * f[:n]
+        
+        j = slice(b[1], b[2])
+        dE_da1[i2] += x[i2] * (1 - y[i2]) * f1[j] + dx[i2] * (1 - y[i2]) * f[j]
+        dE_da2[i2] += x[i2] * (1 - y[i2]) * f2[j] - x[i2] * dy[i2] * f[j]
+        
+        j = slice(b[2], b[3])
+        dE_da1[i1] += (1 - x[i1]) * y[i1] * f1[j] - dx[i1] * y[i1] * f[j]
+        dE_da2[i1] += (1 - x[i1]) * y[i1] * f2[j] + (1 - x[i1]) * dy[i1] * f[j]
+        
+        j = slice(b[3], b[4])
+        dE_da1[i12] += ((1 - x[i12]) * (1 - y[i12]) * f1[j]
+                        - dx[i12] * (1 - y[i12]) * f[j])
+        dE_da2[i12] += ((1 - x[i12]) * (1 - y[i12]) * f2[j]
+                        - (1 - x[i12]) * dy[i12] * f[j])
+        
+        return dE_da1, dE_da2
+    
+    def __rbf_derivatives(self, fit, a1, a2):
+        """
+        Evaluates the values and the analytic a1, a2 derivatives of a
+        multiquadric Rbf fit in chunks.  With phi(r) = sqrt((r/epsilon)^2 + 1),
+        the derivatives are sum_i nodes_i * (a - xi_i) / (epsilon^2 phi(r_i)).
+        """
+        if fit.function != 'multiquadric':
+            raise ValueError('analytic gradients require a multiquadric Rbf fit')
+        
+        chunksize = max(1, 2**22 // fit.N)
+        values = np.empty(len(a1))
+        d_da1 = np.empty(len(a1))
+        d_da2 = np.empty(len(a1))
+        for i in range(0, len(a1), chunksize):
+            j = slice(i, i + chunksize)
+            r1 = a1[j, np.newaxis] - fit.xi[0]
+            r2 = a2[j, np.newaxis] - fit.xi[1]
+            phi = np.sqrt((r1**2 + r2**2) / fit.epsilon**2 + 1)
+            values[j] = phi.dot(fit.nodes)
+            w = fit.nodes / (fit.epsilon**2 * phi)
+            d_da1[j] = np.sum(w * r1, axis=1)
+            d_da2[j] = np.sum(w * r2, axis=1)
+        
+        return values, d_da1, d_da2
+    
+    def E_gsf_grid(self, num_a1=100, num_a2=100, a1vect=None, a2vect=None,
+                   smooth=True):
+        """
+        Evaluates E_gsf on a regular grid of a1, a2 fractional coordinates
+        spanning [0, 1].  The results are memoized such that repeated calls
+        with the same parameters, e.g. when replotting, return the saved
+        read-only arrays.  The memoized values are reset when the data is
+        refit.
+        
+        Parameters
+        ----------
+        num_a1 : int, optional
+            The number of grid points along a1.  Default value is 100.
+        num_a2 : int, optional
+            The number of grid points along a2.  Default value is 100.
+        a1vect : np.array, optional
+            Crystal vector for the a1 vector.  Default value of None uses the
+            saved a1vect.
+        a2vect : np.array, optional
+            Crystal vector for the a2 vector.  Default value of None uses the
+            saved a2vect.
+        smooth : bool, optional
+            If True (default) the values are interpolated.  If False, the
+            closest measured values are used.
+        
+        Returns
+        -------
+        a1_grid : numpy.ndarray
+            The (num_a2, num_a1) grid of a1 values.
+        a2_grid : numpy.ndarray
+            The (num_a2, num_a1) grid of a2 values.
+        E_gsf_grid : numpy.ndarray
+            The (num_a2, num_a1) grid of E_gsf values.
+        """
+        return self.__grid(self.E_gsf, num_a1, num_a2, a1vect, a2vect, smooth)
+    
+    def delta_grid(self, num_a1=100, num_a2=100, a1vect=None, a2vect=None,
+                   smooth=True):
+        """
+        Evaluates delta on a regular grid of a1, a2 fractional coordinates
+        spanning [0, 1].  The results are memoized such that repeated calls
+        with the same parameters, e.g. when replotting, return the saved
+        read-only arrays.  The memoized values are reset when the data is
+        refit.
+        
+        Parameters
+        ----------
+        num_a1 : int, optional
+            The number of grid points along a1.  Default value is 100.
+        num_a2 : int, optional
+            The number of grid points along a2.  Default value is 100.
+        a1vect : np.array, optional
+            Crystal vector for the a1 vector.  Default value of None uses the
+            saved a1vect.
+        a2vect : np.array, optional
+            Crystal vector for the a2 vector.  Default value of None uses the
+            saved a2vect.
+        smooth : bool, optional
+            If True (default) the values are interpolated.  If False, the
+            closest measured values are used.
+        
+        Returns
+        -------
+        a1_grid : numpy.ndarray
+            The (num_a2, num_a1) grid of a1 values.
+        a2_grid : numpy.ndarray
+            The (num_a2, num_a1) grid of a2 values.
+        delta_grid : numpy.ndarray
+            The (num_a2, num_a1) grid of delta values.
+        """
+        return self.__grid(self.delta, num_a1, num_a2, a1vect, a2vect, smooth)
+    
+    def __grid(self, fxn, num_a1, num_a2, a1vect, a2vect, smooth):
+        """
+        Evaluates E_gsf or delta on a regular a1, a2 grid with memoization.
+        """
+        key = (fxn.__name__, int(num_a1), int(num_a2), bool(smooth),
+               None if a1vect is None else np.asarray(a1vect, dtype=float).tobytes(),
+               None if a2vect is None else np.asarray(a2vect, dtype=float).tobytes())
+        try:
+            return self.__grids[key]
+        except KeyError:
+            pass
+        
+        a1_grid, a2_grid = np.meshgrid(np.linspace(0, 1, num_a1),
+                                       np.linspace(0, 1, num_a2))
+        values = fxn(a1=a1_grid, a2=a2_grid, a1vect=a1vect, a2vect=a2vect, smooth=smooth)
+        
+        grid = (a1_grid, a2_grid, values)
+        for array in grid:
+            array.setflags(write=False)
+        
+        if len(self.__grids) >= 16:
+            self.__grids.clear()
+        self.__grids[key] = grid
+        
+        return grid
     
     def E_gsf_surface_plot(self, normalize=False, smooth=True, 
                            a1vect=None, a2vect=None, xvect=None,
@@ -820,12 +1261,9 @@ class GammaSurface(object):
             a2vect = self.a2vect
         a2vect = np.asarray(a2vect)
 
-        # Generate grids of a1, a2 values from numx, numy
-        x_grid, y_grid = np.meshgrid(np.linspace(0, 1, numx),
-                                     np.linspace(0, 1, numy))
-        
-        # Generate grid of values either with or without interpolation
-        C = self.E_gsf(a1=x_grid, a2=y_grid, a1vect=a1vect, a2vect=a2vect, smooth=smooth)
+        # Generate grids of a1, a2 and values either with or without interpolation
+        x_grid, y_grid, C = self.E_gsf_grid(num_a1=numx, num_a2=numy, a1vect=a1vect,
+                                         a2vect=a2vect, smooth=smooth)
         
         # Convert units of C using energyperarea_unit
         C = uc.get_in_units(C, energyperarea_unit)
@@ -1021,12 +1459,9 @@ class GammaSurface(object):
             a2vect = self.a2vect
         a2vect = np.asarray(a2vect)
 
-        # Generate grids of a1, a2 values from numx, numy
-        x_grid, y_grid = np.meshgrid(np.linspace(0, 1, numx),
-                                     np.linspace(0, 1, numy))
-        
-        # Generate grid of values either with or without interpolation
-        C = self.delta(a1=x_grid, a2=y_grid, a1vect=a1vect, a2vect=a2vect, smooth=smooth)
+        # Generate grids of a1, a2 and values either with or without interpolation
+        x_grid, y_grid, C = self.delta_grid(num_a1=numx, num_a2=numy, a1vect=a1vect,
+                                         a2vect=a2vect, smooth=smooth)
         
         # Convert units of C using length_unit
         C = uc.get_in_units(C, length_unit)
@@ -1194,7 +1629,9 @@ class GammaSurface(object):
         
         # Define energyfxn for the path
         def energyfxn(xy):
-            return self.E_gsf(x=xy[..., 0], y=xy[..., 1])
+            xy = np.asarray(xy)
+            energy = self.E_gsf(x=xy[..., 0].flatten(), y=xy[..., 1].flatten())
+            return energy.reshape(xy.shape[:-1])
 
         return create_path(coord, energyfxn, style=style, gradientfxn=gradientfxn,
                            gradientkwargs=gradientkwargs, integratorfxn=integratorfxn)
@@ -1262,4 +1699,125 @@ class GammaSurface(object):
         
         return self.path(coord, style=style, gradientfxn=gradientfxn,
                         gradientkwargs=gradientkwargs, integratorfxn=integratorfxn)
-    
\ No newline at end of file
+    
+    def mep(self, pos=None, coord=None, npoints=None, relaxsteps=10000,
+            climbsteps=0, timestep=None, tolerance=None, climbpoints=1,
+            integratorfxn='rk45', verbose=False):
+        """
+        Finds the minimum energy path across the gamma surface between two
+        points, optionally passing through an intermediate point, using the
+        improved string method.  The path gradients are evaluated directly
+        from the interpolation using E_gsf_gradient, which is analytic and
+        fully vectorized for the 'spline' interpolation.
+        
+        Parameters
+        ----------
+        pos : array-like object, optional
+            2x3 or 3x3 array of Miller vector points that defines the end
+            points of the initial path's line segment(s).  Either pos or
+            coord must be given.
+        coord : array-like object, optional
+            The plotting xy coordinates of the points along an arbitrary
+            initial path.  Either pos or coord must be given.
+        npoints : int, optional
+            The number of points to include along the path when pos is given.
+            Must be odd if pos has 3 points so that the intermediate point
+            lies on the path.  Default value of None uses 50 for 2 points and
+            51 for 3 points.
+        relaxsteps : int, optional
+            The maximum number of relaxation steps to perform.  Default value
+            is 10000.
+        climbsteps : int, optional
+            The maximum number of climbing steps to perform to refine the
+            barrier maximum.  Default value is 0.
+        timestep : float, optional
+            The size of the timestep to use.  Default value of None uses 0.05
+            for the 'rk45' integratorfxn, and the path's default_timestep
+            otherwise.  As the path points are redistributed only after each
+            full timestep, the relaxed path drifts away from the minimum
+            energy path if the timestep is too large, even when the
+            relaxation converges.
+        tolerance : float, optional
+            The coordinate displacement tolerance to use.  Default value of
+            None uses the path's default_tolerance.
+        climbpoints : int, optional
+            The maximum number of points to subject the climbing to.  Default
+            value is 1.
+        integratorfxn : str or function, optional
+            The function to use to integrate relaxation steps.  Default value
+            of 'rk45' uses the adaptive atomman.mep.integrator.rk45, which
+            subdivides each timestep to control the integration error.  'rk'
+            uses the fixed timestep atomman.mep.integrator.rungekutta.
+        verbose : bool, optional
+            If True, informative statements about the relaxation are printed.
+            Default value is False.
+        
+        Returns
+        -------
+        dict
+            The results with keys 'path' for the relaxed path object,
+            'E_usf' for the maximum (unstable stacking fault) energy along
+            the path, 'usf_xy' for the xy coordinates of the maximum, and
+            'barrier_forward' and 'barrier_backward' for the energy barriers
+            relative to the path's first and last points, respectively.
+            'converged' indicates if the relaxation (and climbing, if
+            climbsteps > 0) reached the tolerance, and 'relaxsteps' and
+            'climbsteps' give the number of steps performed.
+        """
+        if not self.__hasdata:
+            raise AttributeError('gamma surface data not set')
+        
+        # Set default timestep for the adaptive integrator
+        if timestep is None and integratorfxn == 'rk45':
+            timestep = 0.05
+        
+        # Linear transformation from x, y to a1, a2
+        xy_to_a12 = np.array([self.xy_to_a12(1.0, 0.0),
+                              self.xy_to_a12(0.0, 1.0)]).reshape(2, 2).T
+        
+        # Define the analytic gradient function using the interpolation
+        def gradfxn(coord):
+            a12 = np.dot(coord, xy_to_a12.T)
+            dE_da12 = self.E_gsf_gradient(a1=a12[..., 0], a2=a12[..., 1])
+            return np.dot(np.stack(dE_da12, axis=-1), xy_to_a12)
+        
+        # Build the initial path
+        if pos is not None:
+            if coord is not None:
+                raise ValueError('pos and coord cannot both be given')
+            if npoints is None:
+                npoints = 51 if len(pos) == 3 else 50
+            elif len(pos) == 3 and npoints % 2 != 1:
+                raise ValueError('npoints must be odd when pos has 3 points')
+            path = self.build_path(pos, npoints=npoints, gradientfxn='analytic',
+                                   gradientkwargs={'gradfxn': gradfxn},
+                                   integratorfxn=integratorfxn)
+        elif coord is not None:
+            path = self.path(coord, gradientfxn='analytic',
+                             gradientkwargs={'gradfxn': gradfxn},
+                             integratorfxn=integratorfxn)
+        else:
+            raise ValueError('pos or coord must be given')
+        
+        # Relax the path
+        path, info = path.relax(relaxsteps=relaxsteps, climbsteps=climbsteps,
+                                timestep=timestep, tolerance=tolerance,
+                                climbpoints=climbpoints, verbose=verbose,
+                                return_info=True)
+        
+        # Identify the unstable stacking fault and barriers
+        energy = path.energy()
+        imax = np.argmax(energy)
+        
+        results = {}
+        results['path'] = path
+        results['E_usf'] = energy[imax]
+        results['usf_xy'] = path.coord[imax]
+        results['barrier_forward'] = energy[imax] - energy[0]
+        results['barrier_backward'] = energy[imax] - energy[-1]
+        results['converged'] = (info['relaxconverged']
+                                and (climbsteps == 0 or info['climbconverged']))
+        results['relaxsteps'] = info['relaxsteps']
+        results['climbsteps'] = info['climbsteps']
+        
+        return results
@@ -128,7 +128,7 @@ class IsotropicVolterraDislocation(VolterraDislocation):
         
         return theta
     
-    def displacement(self, pos):
+    def displacement(self, pos, chunksize=None, nthreads=None):
         """
         Compute the position-dependent isotropic displacements.
         
@@ -136,15 +136,24 @@ class IsotropicVolterraDislocation(VolterraDislocation):
         ----------
         pos : array-like object
             3D vector position(s).
+        chunksize : int, optional
+            The maximum number of positions to evaluate at one time.  Setting
+            this limits the memory used by the intermediate arrays.  Default
+            value of None evaluates all positions together.
+        nthreads : int, optional
+            The number of threads to use for evaluating the position chunks.
+            Default value of None performs the evaluation serially.
         
         Returns
         -------
         numpy.ndarray
             The computed 3D vector displacements at all given points.
         """
-        pos = np.asarray(pos)
-        if pos.shape == (3,):
-            pos = pos.reshape(1,3)
+        return self._evaluate_chunked(self.__displacement_chunk, pos, (3,),
+                                      chunksize=chunksize, nthreads=nthreads)
+
+    def __displacement_chunk(self, pos):
+        """Computes the displacements for an (n, 3) array of positions"""
 
         # Split pos, burgers into components
         x = pos.dot(self.m)
@@ -162,13 +171,9 @@ class IsotropicVolterraDislocation(VolterraDislocation):
         disp_ξ = b_s / (2 * np.pi) * (self.theta(pos))
 
         # Combine into array
-        disp = np.outer(disp_ξ, self.ξ) + np.outer(disp_m, self.m) + np.outer(disp_n, self.n)
-        if disp.shape[0] == 1:
-            return disp[0]
-        else:
-            return disp
+        return np.outer(disp_ξ, self.ξ) + np.outer(disp_m, self.m) + np.outer(disp_n, self.n)
 
-    def stress(self, pos):
+    def stress(self, pos, chunksize=None, nthreads=None):
         """
         Compute the position-dependent isotropic stresses.
         
@@ -176,15 +181,25 @@ class IsotropicVolterraDislocation(VolterraDislocation):
         ----------
         pos : array-like object
             3D vector position(s).
+        chunksize : int, optional
+            The maximum number of positions to evaluate at one time.  Setting
+            this limits the memory used by the intermediate arrays.  Default
+            value of None evaluates all positions together.
+        nthreads : int, optional
+            The number of threads to use for evaluating the position chunks.
+            Default value of None performs the evaluation serially.
         
         Returns
         -------
         numpy.ndarray
-            The computed 3x3 stress states at all given points.
+            The computed 3x3 stress states at all given points.  A single
+            position returns a single 3x3 stress state.
         """
-        pos = np.asarray(pos)
-        if pos.shape == (3,):
-            pos = pos.reshape(1,3)
+        return self._evaluate_chunked(self.__stress_chunk, pos, (3,3),
+                                      chunksize=chunksize, nthreads=nthreads)
+
+    def __stress_chunk(self, pos):
+        """Computes the stresses for an (n, 3) array of positions"""
 
         # Split pos, burgers into components
         x = pos.dot(self.m)
@@ -1,5 +1,7 @@
 # coding: utf-8
 # Standard Python libraries
+from concurrent.futures import ProcessPoolExecutor
+import copy
 import warnings
 
 # http://www.numpy.org/
@@ -8,6 +10,9 @@ import numpy as np
 # https://www.scipy.org/
 from scipy.optimize import minimize
 
+# http://pandas.pydata.org/
+import pandas as pd
+
 import matplotlib.pyplot as plt
 
 # https://github.com/usnistgov/DataModelDict
@@ -18,6 +23,34 @@ import atomman.unitconvert as uc
 from ..tools import axes_check
 from .GammaSurface import GammaSurface
 
+# scipy.optimize.minimize methods that use the jac argument
+gradient_methods = ['cg', 'bfgs', 'newton-cg', 'l-bfgs-b', 'tnc', 'slsqp',
+                    'dogleg', 'trust-ncg', 'trust-krylov', 'trust-exact',
+                    'trust-constr']
+
+def _solve_branch(sdvpn, branch, warmstart):
+    """
+    Solves a series of SDVPN parameter variations.  Used by SDVPN.solve_many
+    so that branches can be solved in separate processes.
+    """
+    initial = sdvpn.disregistry
+    results = []
+    for variation in branch:
+        if not warmstart and 'disregistry' not in variation:
+            sdvpn.disregistry = initial
+        sdvpn.solve(**variation)
+        
+        res = sdvpn.res
+        results.append({
+            'total_energy': sdvpn.total_energy(),
+            'success': res.success,
+            'message': res.message,
+            'nit': res.get('nit', None),
+            'nfev': res.get('nfev', None),
+            'disregistry': sdvpn.disregistry,
+        })
+    return results
+
 class SDVPN(object):
     """
     Class representation of the semidiscrete variational Peierls-Nabarro
@@ -83,6 +116,8 @@ class SDVPN(object):
             Any options to pass on to scipy.optimize.minimize. Default value
             is {}.
         """
+        # Cache for the elastic energy χ kernel
+        self.__χ_kernel = None
         
         # Load solution from existing model
         if model is not None:
@@ -146,7 +181,7 @@ class SDVPN(object):
     
     @property
     def x(self):
-        """numpy.ndarray : The x coordinates."""
+        """numpy.ndarray : The x coordinates, which may be non-uniformly spaced."""
         try:
             return self.__x
         except:
@@ -157,8 +192,7 @@ class SDVPN(object):
         value = np.asarray(value, dtype=float)
         assert value.ndim == 1
         diff = value[1:] - value[:-1]
-        assert np.allclose(diff[0], diff), 'x values must be evenly spaced'
-        assert diff[0] > 0, 'x values must be in increasing order'
+        assert np.all(diff > 0), 'x values must be in increasing order'
         self.__x = value
 
     @property
@@ -368,10 +402,13 @@ class SDVPN(object):
             component is computed with central difference (True) or simply
             neighboring values (False).  Only matters if fullstress is True.
         min_method : str, optional
-            The scipy.optimize.minimize method to use.
+            The scipy.optimize.minimize method to use.  For gradient-based
+            methods, such as 'CG', 'BFGS' and 'L-BFGS-B', the analytic
+            total_gradient is passed in as jac.
         min_kwargs : dict, optional
             Any keyword arguments to pass on to scipy.optimize.minimize besides
-            the coordinates, method and options.
+            the coordinates, method and options.  A jac value given here is
+            used instead of the analytic gradient.
         min_options : dict, optional
             Any options to pass on to scipy.optimize.minimize.
         """
@@ -431,14 +468,91 @@ class SDVPN(object):
             disregistry = recompose(d13, first, last)
             return self.total_energy(disregistry=disregistry)
         
+        def min_jac(d13, first, last):
+            """Gradient of the function for minimizing"""
+            disregistry = recompose(d13, first, last)
+            return decompose(self.total_gradient(disregistry=disregistry))[0]
+        
+        # Use the analytic gradient for gradient-based methods
+        min_kwargs = dict(self.min_kwargs)
+        if (self.min_method.lower() in gradient_methods
+            and 'jac' not in min_kwargs):
+            min_kwargs['jac'] = min_jac
+        
         # Solve disregistry
         d13, first, last = decompose(self.disregistry)
         res = minimize(min_func, d13, args=(first, last),
-                    method=self.min_method, options=self.min_options, **self.min_kwargs)
+                    method=self.min_method, options=self.min_options, **min_kwargs)
         self.disregistry = recompose(res.x, first, last)
 
         self.__res = res
     
+    def solve_many(self, branches, warmstart=True, nprocs=None):
+        """
+        Solves the disregistry for multiple parameter variations, such as
+        sweeps of the applied stress, tau, or of the alpha and beta
+        coefficients.  The variations within a branch are solved in order
+        with each one starting from the previous branch solution if warmstart
+        is True.  Independent branches can be solved in parallel.  The
+        current object is not changed.
+        
+        Parameters
+        ----------
+        branches : list
+            The parameter variations to solve.  Each variation is a dict of
+            keyword arguments for solve().  branches can either be a list of
+            variations, which are solved as a single branch, or a list of
+            lists of variations with each inner list being a separate branch.
+        warmstart : bool, optional
+            If True (default), each solve within a branch starts from the
+            disregistry solution of the previous variation.  If False, each
+            starts from the current disregistry of this object unless the
+            variation gives a disregistry.
+        nprocs : int, optional
+            The number of processes to use for solving separate branches.
+            Default value of None solves all branches serially in the current
+            process.
+        
+        Returns
+        -------
+        pandas.DataFrame
+            The results with one row per variation.  Columns include the
+            branch and step indices, the variation parameters, the
+            total_energy, the minimization success, message, nit and nfev,
+            and the solved disregistry.
+        """
+        # Interpret branches
+        branches = list(branches)
+        if len(branches) > 0 and isinstance(branches[0], dict):
+            branches = [branches]
+        branches = [[dict(variation) for variation in branch] for branch in branches]
+        
+        # Cache the elastic kernel so that it is shared by the copies
+        if len(self.x) != len(self.disregistry):
+            raise ValueError('x and disregistry are not of the same length')
+        self.elastic_energy()
+        
+        # Solve branches
+        if nprocs is None or nprocs <= 1 or len(branches) == 1:
+            branchresults = [_solve_branch(copy.copy(self), branch, warmstart)
+                             for branch in branches]
+        else:
+            with ProcessPoolExecutor(max_workers=nprocs) as executor:
+                futures = [executor.submit(_solve_branch, copy.copy(self), branch, warmstart)
+                           for branch in branches]
+                branchresults = [future.result() for future in futures]
+        
+        # Build results table
+        results = []
+        for b, (branch, branchresult) in enumerate(zip(branches, branchresults)):
+            for step, (variation, result) in enumerate(zip(branch, branchresult)):
+                row = {'branch': b, 'step': step}
+                row.update(variation)
+                row.update(result)
+                results.append(row)
+        
+        return pd.DataFrame(results)
+    
     def disldensity(self, x=None, disregistry=None, cdiff=False):
         """
         Computes the dislocation density as the numerical derivative of
@@ -498,6 +612,9 @@ class SDVPN(object):
         
             E_misfit = Σ γ(δ)Δx
         
+        For non-uniform x, Δx[i] is half the distance between the
+        neighboring x coordinates, or the distance to the neighbor at the ends.
+        
         Parameters
         ----------
         x : numpy.ndarray, optional
@@ -519,7 +636,7 @@ class SDVPN(object):
         
         # Extract values
         δ = disregistry
-        Δx = x[1] - x[0]
+        Δx = self.__node_widths(x)
         transform = self.transform
         gamma = self.gamma
         
@@ -528,7 +645,7 @@ class SDVPN(object):
         pos = np.inner(disreg, transform.T)
         
         # Σ γ(δ)Δx
-        return Δx * gamma.E_gsf(pos=pos).sum()
+        return np.sum(Δx * gamma.E_gsf(pos=pos))
     
     def elastic_energy(self, x=None, disregistry=None):
         r"""
@@ -541,6 +658,12 @@ class SDVPN(object):
             
             ψ(i,j,Δx) = (1/2) (i-j)² Δx² ln(\|i-j\|Δx)
         
+        As χ only depends on i-j, the sum over j is evaluated as an FFT-based
+        Toeplitz product using a χ kernel that is cached for the current
+        number of points and Δx.  For non-uniform x, χ is the generalization
+        for the actual widths of the dislocation density elements and the
+        cached χ matrix is used directly.
+        
         Parameters
         ----------
         x : numpy.ndarray, optional
@@ -554,33 +677,6 @@ class SDVPN(object):
         float
             The elastic energy for the dislocation.
         """
-        # Define subfunctions
-        def χ(i, j, Δx):
-            """
-            Computes the chi subfunction:
-                χ(i,j,Δx) = (3/2) Δx² + ψ(i-1,j-1,Δx) + ψ(i,j,Δx)
-                                      - ψ(i,j-1,Δx) - ψ(j,i-1,Δx)
-            """
-            return 3./2. * Δx**2 + (ψ(i-1, j-1, Δx) + ψ(i, j, Δx)
-                                    - ψ(i, j-1, Δx) - ψ(j, i-1, Δx))
-
-        def ψ(i, j, Δx):
-            """
-            Computes the psi subfunction:
-                ψ(i,j,Δx) = (1/2) (i-j)² Δx² ln(|i-j|Δx)
-            """
-            # Suppress NaN runtime warnings
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", category=RuntimeWarning)
-                
-                # ψ(i,j,Δx) = (1/2) (i-j)² Δx² ln(|i-j|Δx)
-                p = 0.5 * (i - j)**2 * Δx**2 * np.log(np.abs(i - j) * Δx)
-            
-            # Replace NaN values with 0.0
-            p[np.isnan(p)] = 0.0
-            
-            return p
-        
         # Default values are class properties
         if x is None:
             x = self.x
@@ -589,21 +685,14 @@ class SDVPN(object):
         
         # Extract values
         δ = disregistry
-        Δx = x[1] - x[0]
         cdiff = self.cdiffelastic
         Kij = self.K_tensor
         
         ρ = self.disldensity(x=x, disregistry=δ, cdiff=cdiff)[1]
-        j = np.arange(len(ρ), dtype=int)
-        
-        energy = 0.0
-        
-        # Compute elastic energy (looping over i, vectorization over j)
-        # 1/(4π) Σ_i Σ_j χ(i,j,Δx) K_lm ρ_l[i] ρ_m[j]
-        for i in j:
-            energy += np.sum( χ(i, j, Δx) * np.inner(ρ[i].dot(Kij), ρ) ) / (4 * np.pi)
         
-        return energy
+        # 1/(4π) Σ_i K_lm ρ_l[i] Σ_j χ(i,j,Δx) ρ_m[j]
+        χρ = self.__chi_product(ρ, x, cdiff)
+        return np.sum(ρ.dot(Kij) * χρ) / (4 * np.pi)
     
     def longrange_energy(self):
         """
@@ -638,7 +727,7 @@ class SDVPN(object):
         If fullstress is False, the alternate stress expression by
         Shen and Cheng 10.1016/j.scriptamat.2009.04.047 will be used:
         
-            E_stress = -1/2 Σ_i τ_2l (δ_l[i] + δ_l[i+1]) Δx
+            E_stress = -1/2 Σ_i τ_2l (δ_l[i] + δ_l[i+1]) (x[i+1] - x[i])
         
         Note that the Shen and Cheng expression will have a constant
         error associated with it giving an incorrect overall energy, but
@@ -665,7 +754,7 @@ class SDVPN(object):
         
         # Extract values
         δ = disregistry
-        Δx = x[1] - x[0]
+        Δx = x[1:] - x[:-1]
         τ = self.tau
         full = self.fullstress
         cdiff = self.cdiffstress
@@ -679,8 +768,8 @@ class SDVPN(object):
             # Flip sign on tau so energies match full=True
             τ = -τ
             
-            # -1/2 Σ_i τ_2l (δ_l[i] + δ_l[i+1]) Δx
-            return -0.5 * np.sum(np.inner(τ[1,:], (δ[:-1] + δ[1:]) * Δx))
+            # -1/2 Σ_i τ_2l (δ_l[i] + δ_l[i+1]) (x[i+1] - x[i])
+            return -0.5 * np.sum(np.inner(τ[1,:], (δ[:-1] + δ[1:]) * Δx[:, np.newaxis]))
     
     def surface_energy(self, x=None, disregistry=None):
         """
@@ -689,6 +778,9 @@ class SDVPN(object):
         
             E_surface = Σ_j β_lj / 4 Σ_i ρ_l[i]² Δx
         
+        For non-uniform x, Δx[i] is the width of the x range that ρ[i] is
+        computed over.
+        
         Parameters
         ----------
         x : numpy.ndarray, optional
@@ -710,14 +802,14 @@ class SDVPN(object):
             
         # Extract values
         δ = disregistry
-        Δx = x[1] - x[0]
+        Δx = self.__density_widths(x, cdiff=self.cdiffsurface)
         β = self.beta
         cdiff = self.cdiffsurface
         
         ρ = self.disldensity(x=x, disregistry=δ, cdiff=cdiff)[1]
         
         # Σ_j β_lj / 4 Σ_i ρ_l[i]² Δx
-        return np.sum( np.inner(ρ**2 * Δx, β) ) / 4
+        return np.sum( np.inner(ρ**2 * Δx[:, np.newaxis], β) ) / 4
     
     def nonlocal_energy(self, x=None, disregistry=None):
         """
@@ -725,6 +817,9 @@ class SDVPN(object):
         
             E_nonlocal = Σ_m α_m Σ_i δ[i] (δ[i] - (δ[i+m] + δ[i-m]) / 2) Δx
         
+        The neighbors i±m are taken by index.  For non-uniform x, Δx[i] is
+        the same point width used by the misfit energy.
+        
         Parameters
         ----------
         x : numpy.ndarray, optional
@@ -746,7 +841,7 @@ class SDVPN(object):
             
         # Extract values
         δ = disregistry
-        Δx = x[1] - x[0]
+        Δx = self.__node_widths(x)
         αs = self.alpha
         
         energy = 0.0
@@ -755,7 +850,7 @@ class SDVPN(object):
         for num, α in enumerate(αs):
             m = num + 1
             dd = δ[m:-m] - 0.5 * (δ[2*m:] + δ[:-2*m])
-            energy += α * np.sum(δ[m:-m] * dd * Δx)
+            energy += α * np.sum(δ[m:-m] * dd * Δx[m:-m, np.newaxis])
             
         return energy
     
@@ -791,6 +886,398 @@ class SDVPN(object):
                 + self.nonlocal_energy(x, disregistry)
                 + self.surface_energy(x, disregistry))
     
+    def misfit_gradient(self, x=None, disregistry=None):
+        """
+        Computes the gradient of the misfit energy with respect to the
+        disregistry vectors
+        
+            dE_misfit/dδ[i] = ∇γ(δ[i]) Δx
+        
+        Parameters
+        ----------
+        x : numpy.ndarray, optional
+            x-coordinates.  Default value is the stored x-coordinates.
+        disregistry : numpy.ndarray, optional
+            (N, 3) shaped array of disregistry vectors at each x-coordinate.
+            Default value is the stored disregistry values.
+            
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) shaped array of the misfit energy gradient.
+        """
+        # Default values are class properties
+        if x is None:
+            x = self.x
+        if disregistry is None:
+            disregistry = self.disregistry
+        
+        # Extract values
+        δ = disregistry
+        Δx = self.__node_widths(x)
+        transform = self.transform
+        gamma = self.gamma
+        
+        # Strip out y-component of disregistry and transform for gamma
+        disreg = np.vstack([δ[:,0], np.zeros(len(δ)), δ[:,2]]).T
+        pos = np.inner(disreg, transform.T)
+        
+        # Transform ∇γ back and remove y-component
+        gradient = Δx[:, np.newaxis] * gamma.E_gsf_gradient(pos=pos).dot(transform.T)
+        gradient[:, 1] = 0.0
+        
+        return gradient
+    
+    def elastic_gradient(self, x=None, disregistry=None):
+        """
+        Computes the gradient of the short-range configuration-dependent
+        elastic energy with respect to the disregistry vectors.  The gradient
+        with respect to the dislocation density
+        
+            dE_elastic/dρ_l[i] = 1/(4π) Σ_j χ(i,j,Δx) (K_lm + K_ml) ρ_m[j]
+            
+        is transformed to be with respect to δ.
+        
+        Parameters
+        ----------
+        x : numpy.ndarray, optional
+            x-coordinates.  Default value is the stored x-coordinates.
+        disregistry : numpy.ndarray, optional
+            (N, 3) shaped array of disregistry vectors at each x-coordinate.
+            Default value is the stored disregistry values.
+        
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) shaped array of the elastic energy gradient.
+        """
+        # Default values are class properties
+        if x is None:
+            x = self.x
+        if disregistry is None:
+            disregistry = self.disregistry
+        
+        # Extract values
+        δ = disregistry
+        cdiff = self.cdiffelastic
+        Kij = self.K_tensor
+        
+        ρ = self.disldensity(x=x, disregistry=δ, cdiff=cdiff)[1]
+        
+        # 1/(4π) Σ_j χ(i,j,Δx) (K_lm + K_ml) ρ_m[j]
+        χρ = self.__chi_product(ρ, x, cdiff)
+        gradient = χρ.dot(Kij + Kij.T) / (4 * np.pi)
+        
+        return self.__disldensity_gradient(x, gradient, cdiff)
+    
+    def stress_gradient(self, x=None, disregistry=None):
+        """
+        Computes the gradient of the stress energy with respect to the
+        disregistry vectors.  Uses the same fullstress and cdiffstress
+        settings as stress_energy().
+        
+        Parameters
+        ----------
+        x : numpy.ndarray, optional
+            x-coordinates.  Default value is the stored x-coordinates.
+        disregistry : numpy.ndarray, optional
+            (N, 3) shaped array of disregistry vectors at each x-coordinate.
+            Default value is the stored disregistry values.
+        
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) shaped array of the stress energy gradient.
+        """
+        # Default values are class properties
+        if x is None:
+            x = self.x
+        if disregistry is None:
+            disregistry = self.disregistry
+        
+        # Extract values
+        δ = disregistry
+        Δx = x[1:] - x[:-1]
+        τ = self.tau
+        full = self.fullstress
+        cdiff = self.cdiffstress
+        
+        if full is True:
+            # -1/2 (x[i]² - x[i-1]²) τ_2l
+            gradient = -0.5 * np.outer(x[1:]**2 - x[:-1]**2, τ[1,:])
+            return self.__disldensity_gradient(x, gradient, cdiff)
+        
+        else:
+            # Flip sign on tau so energies match full=True
+            τ = -τ
+            
+            # -1/2 τ_2l (x[i+1] - x[i]) for each neighboring pair that δ[i] belongs to
+            gradient = np.zeros((len(δ), 3))
+            gradient[:-1] += -0.5 * np.outer(Δx, τ[1,:])
+            gradient[1:] += -0.5 * np.outer(Δx, τ[1,:])
+            return gradient
+    
+    def surface_gradient(self, x=None, disregistry=None):
+        """
+        Computes the gradient of the surface energy with respect to the
+        disregistry vectors.  The gradient with respect to the dislocation
+        density
+        
+            dE_surface/dρ_l[i] = Σ_j β_lj / 2 ρ_l[i] Δx
+        
+        is transformed to be with respect to δ.
+        
+        Parameters
+        ----------
+        x : numpy.ndarray, optional
+            x-coordinates.  Default value is the stored x-coordinates.
+        disregistry : numpy.ndarray, optional
+            (N, 3) shaped array of disregistry vectors at each x-coordinate.
+            Default value is the stored disregistry values.
+        
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) shaped array of the surface energy gradient.
+        """
+        # Default values are class properties
+        if x is None:
+            x = self.x
+        if disregistry is None:
+            disregistry = self.disregistry
+            
+        # Extract values
+        δ = disregistry
+        Δx = self.__density_widths(x, cdiff=self.cdiffsurface)
+        β = self.beta
+        cdiff = self.cdiffsurface
+        
+        ρ = self.disldensity(x=x, disregistry=δ, cdiff=cdiff)[1]
+        
+        # Σ_j β_lj / 2 ρ_l[i] Δx
+        gradient = ρ * Δx[:, np.newaxis] * β.sum(axis=0) / 2
+        
+        return self.__disldensity_gradient(x, gradient, cdiff)
+    
+    def nonlocal_gradient(self, x=None, disregistry=None):
+        """
+        Computes the gradient of the nonlocal energy with respect to the
+        disregistry vectors.
+        
+        Parameters
+        ----------
+        x : numpy.ndarray, optional
+            x-coordinates.  Default value is the stored x-coordinates.
+        disregistry : numpy.ndarray, optional
+            (N, 3) shaped array of disregistry vectors at each x-coordinate.
+            Default value is the stored disregistry values.
+        
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) shaped array of the nonlocal energy gradient.
+        """
+        # Default values are class properties
+        if x is None:
+            x = self.x
+        if disregistry is None:
+            disregistry = self.disregistry
+            
+        # Extract values
+        δ = disregistry
+        Δx = self.__node_widths(x)
+        αs = self.alpha
+        
+        gradient = np.zeros((len(δ), 3))
+        
+        for num, α in enumerate(αs):
+            m = num + 1
+            w = α * Δx[m:-m, np.newaxis]
+            
+            # Terms from δ[i] (δ[i] - (δ[i+m] + δ[i-m]) / 2)
+            gradient[m:-m] += w * (2 * δ[m:-m] - 0.5 * (δ[2*m:] + δ[:-2*m]))
+            
+            # Terms from δ[i±m] appearing as neighbors
+            gradient[2*m:] -= 0.5 * w * δ[m:-m]
+            gradient[:-2*m] -= 0.5 * w * δ[m:-m]
+            
+        return gradient
+    
+    def total_gradient(self, x=None, disregistry=None):
+        """
+        Computes the gradient of the total energy with respect to the
+        disregistry vectors.  The long-range energy term is
+        configuration-independent and does not contribute.
+        
+        Parameters
+        ----------
+        x : numpy.ndarray, optional
+            x-coordinates.  Default value is the stored x-coordinates.
+        disregistry : numpy.ndarray, optional
+            (N, 3) shaped array of disregistry vectors at each x-coordinate.
+            Default value is the stored disregistry values.
+        
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) shaped array of the total energy gradient.
+        """
+        # Default values are class properties
+        if x is None:
+            x = self.x
+        if disregistry is None:
+            disregistry = self.disregistry
+            
+        return (self.misfit_gradient(x, disregistry)
+                + self.elastic_gradient(x, disregistry)
+                + self.stress_gradient(x, disregistry)
+                + self.nonlocal_gradient(x, disregistry)
+                + self.surface_gradient(x, disregistry))
+    
+    def __disldensity_gradient(self, x, gradient, cdiff):
+        """
+        Transforms a gradient with respect to the dislocation density values
+        into a gradient with respect to the disregistry values.
+        """
+        if cdiff is False:
+            # ρ[i] = (δ[i] - δ[i-1]) / (x[i] - x[i-1])
+            w = (gradient.T / (x[1:] - x[:-1])).T
+            newgradient = np.zeros((len(x), 3))
+            newgradient[1:] += w
+            newgradient[:-1] -= w
+        
+        elif cdiff is True:
+            # ρ[i] = (δ[i+1] - δ[i-1]) / (x[i+1] - x[i-1])
+            w = (gradient.T / (x[2:] - x[:-2])).T
+            newgradient = np.zeros((len(x), 3))
+            newgradient[2:] += w
+            newgradient[:-2] -= w
+        else:
+            raise TypeError('cdiff must be bool')
+        
+        return newgradient
+    
+    def __chi_kernel(self, n, Δx):
+        """
+        Returns the FFT of the circulant embedding of the χ(i,j,Δx) values
+        used by the elastic energy term.  As χ is Toeplitz, i.e. only depends
+        on k = i-j, the values are stored for k = -(n-1) to n-1.  The result
+        is cached for the last used n and Δx.
+        """
+        key = (n, Δx)
+        if self.__χ_kernel is not None and self.__χ_kernel[0] == key:
+            return self.__χ_kernel[1]
+        
+        def ψ(k):
+            """
+            Computes the psi subfunction in terms of k = i-j:
+                ψ(k,Δx) = (1/2) k² Δx² ln(|k|Δx)
+            """
+            # Suppress NaN runtime warnings
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                p = 0.5 * k**2 * Δx**2 * np.log(np.abs(k) * Δx)
+            
+            # Replace NaN values with 0.0
+            p[np.isnan(p)] = 0.0
+            
+            return p
+        
+        # χ(k,Δx) = (3/2) Δx² + 2 ψ(k,Δx) - ψ(k+1,Δx) - ψ(k-1,Δx)
+        k = np.arange(-(n-1), n, dtype=float)
+        χ = 3./2. * Δx**2 + 2 * ψ(k) - ψ(k+1) - ψ(k-1)
+        
+        # Embed in a circulant of fft-friendly length with χ(k) at k mod L 
+        L = 2**int(np.ceil(np.log2(2 * n - 1)))
+        c = np.zeros(L)
+        c[:n] = χ[n-1:]
+        c[L-n+1:] = χ[:n-1]
+        
+        kernel = (L, np.fft.rfft(c))
+        self.__χ_kernel = (key, kernel)
+        
+        return kernel
+    
+    def __chi_matrix(self, x, cdiff):
+        """
+        Returns the (n, n) matrix of χ values for a non-uniform x grid.  The
+        dislocation density elements are taken to span [lo, hi] ranges of
+        x, giving
+        
+            χ(i,j) = H(hi[i]-hi[j]) + H(lo[i]-lo[j]) - H(hi[i]-lo[j]) - H(lo[i]-hi[j])
+            
+            H(u) = (1/2) u² ln(|u|) - (3/4) u²
+        
+        which reduces to the uniform χ(i,j,Δx) expression for uniform x.  The
+        result is cached for the last used x and cdiff.
+        """
+        key = (cdiff, x.tobytes())
+        if self.__χ_kernel is not None and self.__χ_kernel[0] == key:
+            return self.__χ_kernel[1]
+        
+        if cdiff is False:
+            lo = x[:-1]
+            hi = x[1:]
+        else:
+            lo = (x[:-2] + x[1:-1]) / 2
+            hi = (x[1:-1] + x[2:]) / 2
+        
+        def H(u):
+            # Suppress NaN runtime warnings
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                h = 0.5 * u**2 * np.log(np.abs(u)) - 0.75 * u**2
+            
+            # Replace NaN values with 0.0
+            h[np.isnan(h)] = 0.0
+            
+            return h
+        
+        χ = (H(hi[:, np.newaxis] - hi) + H(lo[:, np.newaxis] - lo)
+             - H(hi[:, np.newaxis] - lo) - H(lo[:, np.newaxis] - hi))
+        self.__χ_kernel = (key, χ)
+        
+        return χ
+    
+    def __chi_product(self, ρ, x, cdiff):
+        """
+        Computes Σ_j χ(i,j,Δx) ρ[j] for all i using the cached χ kernel for
+        uniform x, or the cached χ matrix for non-uniform x.
+        """
+        Δx = x[1] - x[0]
+        if not np.allclose(x[1:] - x[:-1], Δx):
+            return self.__chi_matrix(x, cdiff).dot(ρ)
+        
+        n = len(ρ)
+        L, kernel = self.__chi_kernel(n, Δx)
+        
+        ρ_fft = np.fft.rfft(ρ, n=L, axis=0)
+        return np.fft.irfft(kernel[:, np.newaxis] * ρ_fft, n=L, axis=0)[:n]
+    
+    def __node_widths(self, x):
+        """
+        Returns the x width associated with each x coordinate: half the
+        distance between its neighbors, or the full distance to its neighbor
+        at the ends.  All values equal Δx for uniform x.
+        """
+        Δx = np.empty(len(x))
+        Δx[1:-1] = (x[2:] - x[:-2]) / 2
+        Δx[0] = x[1] - x[0]
+        Δx[-1] = x[-1] - x[-2]
+        return Δx
+    
+    def __density_widths(self, x, cdiff):
+        """
+        Returns the x width that each dislocation density value is computed
+        over.  All values equal Δx for uniform x.
+        """
+        if cdiff is False:
+            return x[1:] - x[:-1]
+        elif cdiff is True:
+            return (x[2:] - x[:-2]) / 2
+        else:
+            raise TypeError('cdiff must be bool')
+    
     def check_energies(self, x=None, disregistry=None, 
                        energyperlength_unit='eV/Å'):
         """
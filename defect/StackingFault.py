@@ -1,4 +1,9 @@
 from copy import deepcopy
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import json
+import os
+from pathlib import Path
 
 import numpy as np
 from ..tools import miller
@@ -327,17 +332,24 @@ class StackingFault(FreeSurface):
         elif faultpos_rel is not None:
             self.faultpos_rel = faultpos_rel
 
+        # Calculate faultshift
+        faultshift = self.__faultshift(a1, a2, outofplane, faultshift)
+
+        # Shift atoms above the fault by faultshift
+        sfsystem = deepcopy(self.system)
+        self.__shift(sfsystem, self.system.atoms.pos, faultshift, minimum_r)
+        
+        return sfsystem
+    
+    def __faultshift(self, a1, a2, outofplane, faultshift):
+        """
+        Computes the full fault shift vector from the a1, a2, outofplane
+        or faultshift parameters.
+        """
         # Define out of plane unit vector 
         ovect = np.zeros(3)
         ovect[self.cutindex] = 1.0
         
-        # Identify the two non-cut indices
-        inindex = []
-        for i in range(3):
-            if i != self.cutindex:
-                inindex.append(i)
-        
-        # Calculate faultshift
         if a1 is not None or a2 is not None or outofplane is not None:
             if faultshift is not None:
                 raise ValueError('a1, a2, outofplane cannot be given with faultshift')
@@ -352,9 +364,26 @@ class StackingFault(FreeSurface):
         # Set default faultshift
         elif faultshift is None:
             faultshift = np.array([0.0, 0.0, 0.0])
-
+        
+        return faultshift
+    
+    def __shift(self, sfsystem, basepos, faultshift, minimum_r):
+        """
+        Sets the atomic positions of sfsystem to basepos with the atoms above
+        the fault displaced by faultshift.  sfsystem is modified in place.
+        """
+        # Define out of plane unit vector 
+        ovect = np.zeros(3)
+        ovect[self.cutindex] = 1.0
+        
+        # Identify the two non-cut indices
+        inindex = []
+        for i in range(3):
+            if i != self.cutindex:
+                inindex.append(i)
+        
         # Shift atoms above the fault by faultshift
-        sfsystem = deepcopy(self.system)
+        sfsystem.atoms.pos[:] = basepos
         sfsystem.atoms.pos[self.abovefault] += faultshift
         sfsystem.wrap()
         
@@ -386,12 +415,11 @@ class StackingFault(FreeSurface):
                     faultshift = outofplane * ovect
                     sfsystem.atoms.pos[self.abovefault] += faultshift
                     sfsystem.wrap()
-        
-        return sfsystem
     
     def iterfaultmap(self, num_a1=None, num_a2=None, outofplane=None,
                      minimum_r=None, a1vect_uvw=None, a2vect_uvw=None,
-                     faultpos_cart=None, faultpos_rel=None):
+                     faultpos_cart=None, faultpos_rel=None, inplace=False,
+                     points=None):
         """
         Iterates over generalized stacking fault configurations associated
         with a 2D map of equally spaced a1, a2 coordinates.
@@ -430,6 +458,17 @@ class StackingFault(FreeSurface):
             Cartesian coordinate along the out-of-plane direction.  Included
             here for those wishing to override the value set when surface()
             was called.  faultpos_rel and faultpos_cart cannot both be given.
+        inplace : bool, optional
+            If False (default), each yielded system is an independent copy of
+            the free surface system.  If True, a single system is created and
+            its atomic positions are reset and shifted for each a1, a2 point,
+            i.e. the same System object is yielded every time and is only
+            valid until the next iteration.  This avoids copying the full
+            system for every point.
+        points : list, optional
+            A list of (a1, a2) fractional coordinates to generate systems for.
+            Allows for arbitrary points to be used instead of the regular
+            map.  Cannot be given with num_a1 or num_a2.
         
         Yields
         ------
@@ -452,15 +491,207 @@ class StackingFault(FreeSurface):
         elif faultpos_rel is not None:
             self.faultpos_rel = faultpos_rel
 
+        if points is None:
+            if num_a1 is None:
+                num_a1 = 1
+            if num_a2 is None:
+                num_a2 = 1
+
+            # Construct mesh of regular points
+            a1s, a2s = np.meshgrid(np.linspace(0, 1, num_a1, endpoint=False),
+                                   np.linspace(0, 1, num_a2, endpoint=False))
+            points = zip(a1s.flat, a2s.flat)
+        
+        elif num_a1 is not None or num_a2 is not None:
+            raise ValueError('points cannot be given with num_a1 or num_a2')
+
+        # Create the single system to shift in place
+        if inplace:
+            sfsystem = deepcopy(self.system)
+            basepos = self.system.atoms.pos
+
+        for a1, a2 in points:
+            if inplace:
+                faultshift = self.__faultshift(a1, a2, outofplane, None)
+                self.__shift(sfsystem, basepos, faultshift, minimum_r)
+                yield a1, a2, sfsystem
+            else:
+                yield a1, a2, self.fault(a1=a1, a2=a2, outofplane=outofplane,
+                                         minimum_r=minimum_r)
+
+    def dumpfaultmap(self, num_a1=None, num_a2=None, outofplane=None,
+                     minimum_r=None, directory='.', namefmt='fault-{i1}-{i2}',
+                     nprocs=None, chunksize=None, dumpkwargs=None,
+                     manifest='manifest.json'):
+        """
+        Writes LAMMPS data files and the LAMMPS commands for reading them
+        for all generalized stacking fault configurations associated with a
+        2D map of equally spaced a1, a2 coordinates.  The configurations are
+        generated in place with iterfaultmap(), and the files can be written
+        by parallel worker processes.  A manifest file lists every completed
+        point, allowing interrupted map generation to be resumed by calling
+        dumpfaultmap() again with the same parameters, including namefmt and
+        dumpkwargs.
+
+        Parameters
+        ----------
+        num_a1 : int
+            The number of a1 values to generate systems for.  
+            Default value is 1 (only generate for a1=0.0).
+        num_a2 : int
+            The number of a2 values to generate systems for.  
+            Default value is 1 (only generate for a2=0.0).
+        outofplane : float, optional
+            An out-of-plane shift, given in absolute units.
+            Default value is 0.0.
+        minimum_r : float, optional
+            Specifies the minimum allowed interatomic spacing across the slip
+            plane.  If any sets of atoms are closer than this value then the
+            outofplane shift is increased.  Default value is None, which
+            performs no adjustment.
+        directory : str, optional
+            The directory where the files are saved.  Default value is the
+            current working directory.
+        namefmt : str, optional
+            Format string used to name the files for each point.  The data
+            file will be named namefmt + '.dat' and the commands file
+            namefmt + '.in'.  Allowed format fields are i1, i2 (the integer
+            map indices) and a1, a2 (the fractional coordinates).  Default
+            value is 'fault-{i1}-{i2}'.
+        nprocs : int, optional
+            The number of worker processes to use for writing the files.
+            Default value of None writes the files in the calling process.
+        chunksize : int, optional
+            The number of points that each worker process task generates
+            before reporting back and the manifest is updated.  Default value
+            divides the points into four tasks per process.
+        dumpkwargs : dict, optional
+            Extra keyword arguments to pass to the atom_data dump method,
+            such as units, atom_style or potential.  Potential objects are
+            identified in the manifest by their id.
+        manifest : str, optional
+            The name of the JSON manifest file saved in directory.  Default
+            value is 'manifest.json'.
+
+        Returns
+        -------
+        dict
+            The manifest contents, with 'points' listing the a1, a2
+            coordinates and file names for every point in the map.
+        """
         if num_a1 is None:
             num_a1 = 1
         if num_a2 is None:
             num_a2 = 1
+        if dumpkwargs is None:
+            dumpkwargs = {}
+        
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        manifestfile = Path(directory, manifest)
+        
+        # Load the existing manifest or start a new one
+        params = OrderedDict()
+        params['num_a1'] = num_a1
+        params['num_a2'] = num_a2
+        params['outofplane'] = outofplane
+        params['minimum_r'] = minimum_r
+        params['a1vect_uvw'] = np.asarray(self.a1vect_uvw).tolist()
+        params['a2vect_uvw'] = np.asarray(self.a2vect_uvw).tolist()
+        params['faultpos_rel'] = float(self.faultpos_rel)
+        params['namefmt'] = namefmt
+        params['dumpkwargs'] = json.loads(json.dumps(dumpkwargs, sort_keys=True,
+                                                     default=_manifest_value))
+        if manifestfile.exists():
+            with open(manifestfile) as f:
+                content = json.load(f, object_pairs_hook=OrderedDict)
+            if content['parameters'] != json.loads(json.dumps(params)):
+                raise ValueError('existing manifest was created with different parameters')
+        else:
+            content = OrderedDict()
+            content['parameters'] = params
+            content['points'] = OrderedDict()
+        
+        # Identify the points still to be done
+        a1s = np.linspace(0, 1, num_a1, endpoint=False)
+        a2s = np.linspace(0, 1, num_a2, endpoint=False)
+        todo = []
+        for i2, a2 in enumerate(a2s):
+            for i1, a1 in enumerate(a1s):
+                name = namefmt.format(i1=i1, i2=i2, a1=a1, a2=a2)
+                datafile = Path(directory, name + '.dat')
+                if name in content['points'] and datafile.exists():
+                    continue
+                todo.append((name, a1, a2, str(datafile),
+                             str(Path(directory, name + '.in'))))
+        
+        def update(results):
+            """Adds finished points to the manifest and saves it"""
+            for name, a1, a2, datafile, infile in results:
+                point = OrderedDict()
+                point['a1'] = float(a1)
+                point['a2'] = float(a2)
+                point['data'] = Path(datafile).name
+                point['commands'] = Path(infile).name
+                content['points'][name] = point
+            tempfile = Path(directory, manifest + '.tmp')
+            with open(tempfile, 'w') as f:
+                json.dump(content, f, indent=4)
+            os.replace(tempfile, manifestfile)
+        
+        if len(todo) == 0:
+            update([])
+            return content
+        
+        # Divide the points into chunks
+        if chunksize is None:
+            if nprocs is None or nprocs <= 1:
+                chunksize = 1
+            else:
+                chunksize = -(-len(todo) // (4 * nprocs))
+        chunks = [todo[i:i + chunksize] for i in range(0, len(todo), chunksize)]
+        
+        if nprocs is None or nprocs <= 1:
+            for chunk in chunks:
+                update(_dump_faults(self, chunk, outofplane, minimum_r,
+                                    dumpkwargs))
+        else:
+            with ProcessPoolExecutor(max_workers=nprocs) as executor:
+                futures = [executor.submit(_dump_faults, self, chunk,
+                                           outofplane, minimum_r, dumpkwargs)
+                           for chunk in chunks]
+                for future in as_completed(futures):
+                    update(future.result())
+        
+        return content
 
-        # Construct mesh of regular points
-        a1s, a2s = np.meshgrid(np.linspace(0, 1, num_a1, endpoint=False),
-                               np.linspace(0, 1, num_a2, endpoint=False))
+def _manifest_value(obj):
+    """
+    Gives a JSON representation for dumpkwargs values, such as potential
+    objects, that are not directly JSON serializable.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if hasattr(obj, 'id'):
+        return str(obj.id)
+    return repr(obj)
 
-        for a1, a2 in zip(a1s.flat, a2s.flat):
-            yield a1, a2, self.fault(a1=a1, a2=a2, outofplane=outofplane,
-                                     minimum_r=minimum_r)
\ No newline at end of file
+def _dump_faults(stackingfault, todo, outofplane, minimum_r, dumpkwargs):
+    """
+    Writes the data and commands files for a list of fault map points.  Used
+    by StackingFault.dumpfaultmap() as the worker process function.
+    """
+    points = [(a1, a2) for name, a1, a2, datafile, infile in todo]
+    faults = stackingfault.iterfaultmap(outofplane=outofplane,
+                                        minimum_r=minimum_r, inplace=True,
+                                        points=points)
+    
+    for (name, a1, a2, datafile, infile), fault in zip(todo, faults):
+        read_info = fault[2].dump('atom_data', f=datafile, **dumpkwargs)
+        if read_info is not None:
+            with open(infile, 'w') as f:
+                f.write(read_info)
+    
+    return todo
@@ -1384,37 +1384,17 @@ static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObje
 /* PyIntCompare.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2, long intval, long inplace);
 
-/* ListAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
-        Py_INCREF(x);
-        PyList_SET_ITEM(list, len, x);
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
-#else
-#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
-#endif
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
 
-/* ObjectGetItem.proto */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
-#else
-#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
-#endif
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
 
-/* PyFloatBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyFloat_TrueDivideObjC(PyObject *op1, PyObject *op2, double floatval, int inplace, int zerodivision_check);
-#else
-#define __Pyx_PyFloat_TrueDivideObjC(op1, op2, floatval, inplace, zerodivision_check)\
-    (inplace ? PyNumber_InPlaceTrueDivide(op1, op2) : PyNumber_TrueDivide(op1, op2))
-#endif
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
 
 /* SliceObject.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
@@ -1422,17 +1402,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
         PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
         int has_cstart, int has_cstop, int wraparound);
 
-/* BufferIndexError.proto */
-static void __Pyx_RaiseBufferIndexError(int axis);
-
-/* PyIntBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
-#else
-#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
-    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
-#endif
-
 /* SliceObject.proto */
 #define __Pyx_PyObject_DelSlice(obj, cstart, cstop, py_start, py_stop, py_slice, has_cstart, has_cstop, wraparound)\
     __Pyx_PyObject_SetSlice(obj, (PyObject*)NULL, cstart, cstop, py_start, py_stop, py_slice, has_cstart, has_cstop, wraparound)
@@ -1441,6 +1410,17 @@ static CYTHON_INLINE int __Pyx_PyObject_SetSlice(
         PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
         int has_cstart, int has_cstop, int wraparound);
 
+/* DictGetItem.proto */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
+#define __Pyx_PyObject_Dict_GetItem(obj, name)\
+    (likely(PyDict_CheckExact(obj)) ?\
+     __Pyx_PyDict_GetItem(obj, name) : PyObject_GetItem(obj, name))
+#else
+#define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
+#define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
+#endif
+
 /* ArgTypeTest.proto */
 #define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
     ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
@@ -1472,6 +1452,13 @@ static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t, Py_ssize_t);
 
 static CYTHON_UNUSED int __pyx_array_getbuffer(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
 static PyObject *__pyx_array_get_memview(struct __pyx_array_obj *); /*proto*/
+/* ObjectGetItem.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
+#else
+#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
+#endif
+
 /* decode_c_string_utf16.proto */
 static CYTHON_INLINE PyObject *__Pyx_PyUnicode_DecodeUTF16(const char *s, Py_ssize_t size, const char *errors) {
     int byteorder = 0;
@@ -1503,12 +1490,6 @@ static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tsta
 /* GetAttr3.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
 
-/* RaiseTooManyValuesToUnpack.proto */
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
-
-/* RaiseNeedMoreValuesToUnpack.proto */
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
-
 /* RaiseNoneIterError.proto */
 static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
 
@@ -1581,6 +1562,14 @@ static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
 #define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
 #endif
 
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
 /* ListExtend.proto */
 static CYTHON_INLINE int __Pyx_PyList_Extend(PyObject* L, PyObject* v) {
 #if CYTHON_COMPILING_IN_CPYTHON
@@ -1594,6 +1583,23 @@ static CYTHON_INLINE int __Pyx_PyList_Extend(PyObject* L, PyObject* v) {
 #endif
 }
 
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
 /* None.proto */
 static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname);
 
@@ -1772,9 +1778,6 @@ static CYTHON_INLINE PyObject *__pyx_capsule_create(void *p, const char *sig);
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value);
-
 /* MemviewSliceCopyTemplate.proto */
 static __Pyx_memviewslice
 __pyx_memoryview_copy_new_contig(const __Pyx_memviewslice *from_mvs,
@@ -1783,10 +1786,10 @@ __pyx_memoryview_copy_new_contig(const __Pyx_memviewslice *from_mvs,
                                  int dtype_is_object);
 
 /* CIntFromPy.proto */
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
 /* CIntFromPy.proto */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
@@ -1826,15 +1829,6 @@ static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_d
 /* ObjectToMemviewSlice.proto */
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(PyObject *, int writable_flag);
 
-/* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_PY_LONG_LONG(PyObject *, int writable_flag);
-
-/* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_PY_LONG_LONG(PyObject *, int writable_flag);
-
-/* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double(PyObject *, int writable_flag);
-
 /* ObjectToMemviewSlice.proto */
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double(PyObject *, int writable_flag);
 
@@ -1873,15 +1867,12 @@ static PyObject *contiguous = 0;
 static PyObject *indirect_contiguous = 0;
 static int __pyx_memoryview_thread_locks_used;
 static PyThread_type_lock __pyx_memoryview_thread_locks[8];
-static PyObject *__pyx_f_7atomman_6defect_6Strain_match_pq(__Pyx_memviewslice, __Pyx_memviewslice, double, __Pyx_memviewslice, __Pyx_memviewslice); /*proto*/
 static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice); /*proto*/
 static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant1_c(__Pyx_memviewslice); /*proto*/
 static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslice); /*proto*/
 static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslice); /*proto*/
 static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice); /*proto*/
 static PyObject *__pyx_f_7atomman_6defect_6Strain_angularvelocity_c(__Pyx_memviewslice); /*proto*/
-static PyObject *__pyx_f_7atomman_6defect_6Strain_dG_c(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, Py_ssize_t); /*proto*/
-static PyObject *__pyx_f_7atomman_6defect_6Strain_nye_c(__Pyx_memviewslice, __Pyx_memviewslice, Py_ssize_t); /*proto*/
 static struct __pyx_array_obj *__pyx_array_new(PyObject *, Py_ssize_t, char *, char *, char *); /*proto*/
 static void *__pyx_align_pointer(void *, size_t); /*proto*/
 static PyObject *__pyx_memoryview_new(PyObject *, int, int, __Pyx_TypeInfo *); /*proto*/
@@ -1917,7 +1908,6 @@ static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize
 static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *, PyObject *); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_double__const__ = { "const double", NULL, sizeof(double const ), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_double = { "double", NULL, sizeof(double), { 0 }, 0, 'R', 0, 0 };
-static __Pyx_TypeInfo __Pyx_TypeInfo_PY_LONG_LONG = { "long long", NULL, sizeof(PY_LONG_LONG), { 0 }, 0, IS_UNSIGNED(PY_LONG_LONG) ? 'U' : 'I', IS_UNSIGNED(PY_LONG_LONG), 0 };
 #define __Pyx_MODULE_NAME "atomman.defect.Strain"
 extern int __pyx_module_is_main_atomman__defect__Strain;
 int __pyx_module_is_main_atomman__defect__Strain = 0;
@@ -1926,6 +1916,7 @@ int __pyx_module_is_main_atomman__defect__Strain = 0;
 static PyObject *__pyx_builtin_property;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_object;
 static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_enumerate;
 static PyObject *__pyx_builtin_TypeError;
@@ -1934,26 +1925,21 @@ static PyObject *__pyx_builtin_id;
 static PyObject *__pyx_builtin_IndexError;
 static const char __pyx_k_G[] = "G";
 static const char __pyx_k_O[] = "O";
-static const char __pyx_k_P[] = "P";
-static const char __pyx_k_Q[] = "Q";
 static const char __pyx_k_c[] = "c";
 static const char __pyx_k_i[] = "i";
-static const char __pyx_k_n[] = "n";
+static const char __pyx_k_j[] = "j";
 static const char __pyx_k_p[] = "p";
-static const char __pyx_k_q[] = "q";
-static const char __pyx_k_x[] = "x";
-static const char __pyx_k_y[] = "y";
-static const char __pyx_k_z[] = "z";
-static const char __pyx_k_dG[] = "dG";
-static const char __pyx_k_gG[] = "gG";
 static const char __pyx_k_id[] = "id";
 static const char __pyx_k_np[] = "np";
-static const char __pyx_k__23[] = "";
+static const char __pyx_k__24[] = "";
+static const char __pyx_k_all[] = "all";
+static const char __pyx_k_box[] = "box";
 static const char __pyx_k_doc[] = "__doc__";
-static const char __pyx_k_max[] = "max";
 static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_nye[] = "nye";
 static const char __pyx_k_obj[] = "obj";
+static const char __pyx_k_pbc[] = "pbc";
+static const char __pyx_k_pos[] = "pos";
 static const char __pyx_k_axes[] = "axes";
 static const char __pyx_k_base[] = "base";
 static const char __pyx_k_dict[] = "__dict__";
@@ -1969,7 +1955,6 @@ static const char __pyx_k_step[] = "step";
 static const char __pyx_k_stop[] = "stop";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_view[] = "view";
-static const char __pyx_k_warn[] = "warn";
 static const char __pyx_k_ASCII[] = "ASCII";
 static const char __pyx_k_array[] = "array";
 static const char __pyx_k_atoms[] = "atoms";
@@ -1980,31 +1965,29 @@ static const char __pyx_k_dvect[] = "dvect";
 static const char __pyx_k_empty[] = "empty";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_flags[] = "flags";
-static const char __pyx_k_gradG[] = "gradG";
 static const char __pyx_k_inner[] = "inner";
-static const char __pyx_k_int64[] = "int64";
-static const char __pyx_k_lstsq[] = "lstsq";
 static const char __pyx_k_nlist[] = "nlist";
 static const char __pyx_k_numpy[] = "numpy";
 static const char __pyx_k_range[] = "range";
-static const char __pyx_k_rcond[] = "rcond";
 static const char __pyx_k_shape[] = "shape";
+static const char __pyx_k_split[] = "split";
 static const char __pyx_k_start[] = "start";
 static const char __pyx_k_tools[] = "tools";
 static const char __pyx_k_value[] = "value";
-static const char __pyx_k_G_view[] = "G_view";
-static const char __pyx_k_Q_view[] = "Q_view";
+static const char __pyx_k_vects[] = "vects";
 static const char __pyx_k_Strain[] = "Strain";
 static const char __pyx_k_asdict[] = "asdict";
 static const char __pyx_k_aslist[] = "aslist";
+static const char __pyx_k_cumsum[] = "cumsum";
 static const char __pyx_k_cutoff[] = "cutoff";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_format[] = "format";
 static const char __pyx_k_import[] = "__import__";
-static const char __pyx_k_linalg[] = "linalg";
 static const char __pyx_k_module[] = "__module__";
 static const char __pyx_k_name_2[] = "__name__";
 static const char __pyx_k_natoms[] = "natoms";
+static const char __pyx_k_nprocs[] = "nprocs";
+static const char __pyx_k_object[] = "object";
 static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_setter[] = "setter";
@@ -2015,11 +1998,11 @@ static const char __pyx_k_unpack[] = "unpack";
 static const char __pyx_k_update[] = "update";
 static const char __pyx_k_allkeys[] = "allkeys";
 static const char __pyx_k_asarray[] = "asarray";
-static const char __pyx_k_dG_view[] = "dG_view";
+static const char __pyx_k_batch_G[] = "batch_G";
 static const char __pyx_k_fortran[] = "fortran";
-static const char __pyx_k_gG_view[] = "gG_view";
 static const char __pyx_k_memview[] = "memview";
 static const char __pyx_k_prepare[] = "__prepare__";
+static const char __pyx_k_reshape[] = "reshape";
 static const char __pyx_k_results[] = "results";
 static const char __pyx_k_solve_G[] = "solve_G";
 static const char __pyx_k_Ellipsis[] = "Ellipsis";
@@ -2027,16 +2010,14 @@ static const char __pyx_k_Strain_G[] = "Strain.G";
 static const char __pyx_k_getstate[] = "__getstate__";
 static const char __pyx_k_identity[] = "identity";
 static const char __pyx_k_itemsize[] = "itemsize";
-static const char __pyx_k_maxcoord[] = "maxcoord";
-static const char __pyx_k_nye_view[] = "nye_view";
 static const char __pyx_k_property[] = "property";
 static const char __pyx_k_pyx_type[] = "__pyx_type";
 static const char __pyx_k_qualname[] = "__qualname__";
 static const char __pyx_k_rotation[] = "rotation";
 static const char __pyx_k_setstate[] = "__setstate__";
-static const char __pyx_k_warnings[] = "warnings";
 static const char __pyx_k_Strain__G[] = "_Strain__G";
 static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_batch_nye[] = "batch_nye";
 static const char __pyx_k_enumerate[] = "enumerate";
 static const char __pyx_k_metaclass[] = "__metaclass__";
 static const char __pyx_k_neighbors[] = "neighbors";
@@ -2050,11 +2031,10 @@ static const char __pyx_k_Strain_nye[] = "Strain.nye";
 static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_axes_check[] = "axes_check";
 static const char __pyx_k_basesystem[] = "basesystem";
-static const char __pyx_k_gradG_view[] = "gradG_view";
 static const char __pyx_k_invariant1[] = "invariant1";
 static const char __pyx_k_invariant2[] = "invariant2";
 static const char __pyx_k_invariant3[] = "invariant3";
-static const char __pyx_k_nlist_view[] = "nlist_view";
+static const char __pyx_k_pair_table[] = "pair_table";
 static const char __pyx_k_properties[] = "properties";
 static const char __pyx_k_pyx_result[] = "__pyx_result";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
@@ -2063,18 +2043,20 @@ static const char __pyx_k_PickleError[] = "PickleError";
 static const char __pyx_k_Strain__nye[] = "_Strain__nye";
 static const char __pyx_k_defaultkeys[] = "defaultkeys";
 static const char __pyx_k_NeighborList[] = "NeighborList";
+static const char __pyx_k_batch_strain[] = "batch_strain";
 static const char __pyx_k_broadcast_to[] = "broadcast_to";
 static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
 static const char __pyx_k_stringsource[] = "stringsource";
 static const char __pyx_k_Strain___init[] = "Strain.__init__";
 static const char __pyx_k_Strain_asdict[] = "Strain.asdict";
+static const char __pyx_k_Strain_nprocs[] = "Strain.nprocs";
 static const char __pyx_k_Strain_strain[] = "Strain.strain";
 static const char __pyx_k_Strain_system[] = "Strain.system";
 static const char __pyx_k_baseneighbors[] = "baseneighbors";
-static const char __pyx_k_cos_theta_max[] = "cos_theta_max";
 static const char __pyx_k_pyx_getbuffer[] = "__pyx_getbuffer";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_set_p_vectors[] = "set_p_vectors";
+static const char __pyx_k_Strain__nprocs[] = "_Strain__nprocs";
 static const char __pyx_k_Strain__strain[] = "_Strain__strain";
 static const char __pyx_k_Strain__system[] = "_Strain__system";
 static const char __pyx_k_Strain_solve_G[] = "Strain.solve_G";
@@ -2126,7 +2108,6 @@ static const char __pyx_k_unable_to_allocate_array_data[] = "unable to allocate
 static const char __pyx_k_strided_and_direct_or_indirect[] = "<strided and direct or indirect>";
 static const char __pyx_k_basesystem_and_p_vectors_cannot[] = "basesystem and p_vectors cannot both be given";
 static const char __pyx_k_neighbors_or_cutoff_is_required[] = "neighbors or cutoff is required";
-static const char __pyx_k_An_atom_lacks_pair_sets_Check_ne[] = "An atom lacks pair sets. Check neighbor list";
 static const char __pyx_k_Buffer_view_does_not_expose_stri[] = "Buffer view does not expose strides";
 static const char __pyx_k_Can_only_create_a_buffer_that_is[] = "Can only create a buffer that is contiguous in memory.";
 static const char __pyx_k_Cannot_assign_to_read_only_memor[] = "Cannot assign to read-only memoryview";
@@ -2141,9 +2122,9 @@ static const char __pyx_k_Unable_to_convert_item_to_object[] = "Unable to conver
 static const char __pyx_k_got_differing_extents_in_dimensi[] = "got differing extents in dimension %d (got %d and %d)";
 static const char __pyx_k_neighbors_and_cutoff_cannot_both[] = "neighbors and cutoff cannot both be given";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
+static const char __pyx_k_nprocs_must_be_a_positive_intege[] = "nprocs must be a positive integer";
 static const char __pyx_k_unable_to_allocate_shape_and_str[] = "unable to allocate shape and strides.";
 static PyObject *__pyx_n_s_ASCII;
-static PyObject *__pyx_kp_u_An_atom_lacks_pair_sets_Check_ne;
 static PyObject *__pyx_kp_s_Buffer_view_does_not_expose_stri;
 static PyObject *__pyx_kp_s_Can_only_create_a_buffer_that_is;
 static PyObject *__pyx_kp_s_Cannot_assign_to_read_only_memor;
@@ -2154,7 +2135,6 @@ static PyObject *__pyx_n_s_Ellipsis;
 static PyObject *__pyx_kp_s_Empty_shape_tuple_for_cython_arr;
 static PyObject *__pyx_n_s_G;
 static PyObject *__pyx_n_u_G;
-static PyObject *__pyx_n_s_G_view;
 static PyObject *__pyx_kp_s_Incompatible_checksums_s_vs_0xb0;
 static PyObject *__pyx_n_s_IndexError;
 static PyObject *__pyx_kp_s_Indirect_dimensions_not_supporte;
@@ -2166,10 +2146,7 @@ static PyObject *__pyx_kp_s_MemoryView_of_r_object;
 static PyObject *__pyx_n_s_NeighborList;
 static PyObject *__pyx_n_b_O;
 static PyObject *__pyx_kp_s_Out_of_bounds_on_buffer_access_a;
-static PyObject *__pyx_n_s_P;
 static PyObject *__pyx_n_s_PickleError;
-static PyObject *__pyx_n_s_Q;
-static PyObject *__pyx_n_s_Q_view;
 static PyObject *__pyx_n_s_Strain;
 static PyObject *__pyx_n_s_Strain_G;
 static PyObject *__pyx_n_s_Strain__G;
@@ -2179,6 +2156,7 @@ static PyObject *__pyx_n_s_Strain__invariant1;
 static PyObject *__pyx_n_s_Strain__invariant2;
 static PyObject *__pyx_n_s_Strain__invariant3;
 static PyObject *__pyx_n_s_Strain__neighbors;
+static PyObject *__pyx_n_s_Strain__nprocs;
 static PyObject *__pyx_n_s_Strain__nye;
 static PyObject *__pyx_n_s_Strain__p_vectors;
 static PyObject *__pyx_n_s_Strain__rotation;
@@ -2193,6 +2171,7 @@ static PyObject *__pyx_n_s_Strain_invariant1;
 static PyObject *__pyx_n_s_Strain_invariant2;
 static PyObject *__pyx_n_s_Strain_invariant3;
 static PyObject *__pyx_n_s_Strain_neighbors;
+static PyObject *__pyx_n_s_Strain_nprocs;
 static PyObject *__pyx_n_s_Strain_nye;
 static PyObject *__pyx_n_s_Strain_p_vectors;
 static PyObject *__pyx_n_s_Strain_rotation;
@@ -2207,7 +2186,8 @@ static PyObject *__pyx_n_s_TypeError;
 static PyObject *__pyx_kp_s_Unable_to_convert_item_to_object;
 static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_n_s_View_MemoryView;
-static PyObject *__pyx_n_s__23;
+static PyObject *__pyx_n_s__24;
+static PyObject *__pyx_n_s_all;
 static PyObject *__pyx_n_s_allkeys;
 static PyObject *__pyx_n_s_allocate_buffer;
 static PyObject *__pyx_n_s_angularvelocity;
@@ -2225,6 +2205,10 @@ static PyObject *__pyx_n_s_base;
 static PyObject *__pyx_n_s_baseneighbors;
 static PyObject *__pyx_n_s_basesystem;
 static PyObject *__pyx_kp_u_basesystem_and_p_vectors_cannot;
+static PyObject *__pyx_n_s_batch_G;
+static PyObject *__pyx_n_s_batch_nye;
+static PyObject *__pyx_n_s_batch_strain;
+static PyObject *__pyx_n_s_box;
 static PyObject *__pyx_n_s_broadcast_to;
 static PyObject *__pyx_n_s_build_p_vectors;
 static PyObject *__pyx_n_s_c;
@@ -2235,10 +2219,8 @@ static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_kp_s_contiguous_and_direct;
 static PyObject *__pyx_kp_s_contiguous_and_indirect;
 static PyObject *__pyx_n_s_coord;
-static PyObject *__pyx_n_s_cos_theta_max;
+static PyObject *__pyx_n_s_cumsum;
 static PyObject *__pyx_n_s_cutoff;
-static PyObject *__pyx_n_s_dG;
-static PyObject *__pyx_n_s_dG_view;
 static PyObject *__pyx_n_s_defaultkeys;
 static PyObject *__pyx_n_s_dict;
 static PyObject *__pyx_n_s_doc;
@@ -2253,19 +2235,14 @@ static PyObject *__pyx_n_s_flags;
 static PyObject *__pyx_n_s_format;
 static PyObject *__pyx_n_s_fortran;
 static PyObject *__pyx_n_u_fortran;
-static PyObject *__pyx_n_s_gG;
-static PyObject *__pyx_n_s_gG_view;
 static PyObject *__pyx_n_s_getstate;
 static PyObject *__pyx_kp_s_got_differing_extents_in_dimensi;
-static PyObject *__pyx_n_s_gradG;
-static PyObject *__pyx_n_s_gradG_view;
 static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_s_id;
 static PyObject *__pyx_n_s_identity;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_init;
 static PyObject *__pyx_n_s_inner;
-static PyObject *__pyx_n_u_int64;
 static PyObject *__pyx_n_s_invariant1;
 static PyObject *__pyx_n_u_invariant1;
 static PyObject *__pyx_n_s_invariant2;
@@ -2274,16 +2251,12 @@ static PyObject *__pyx_n_s_invariant3;
 static PyObject *__pyx_n_u_invariant3;
 static PyObject *__pyx_n_s_itemsize;
 static PyObject *__pyx_kp_s_itemsize_0_for_cython_array;
-static PyObject *__pyx_n_s_linalg;
-static PyObject *__pyx_n_s_lstsq;
+static PyObject *__pyx_n_s_j;
 static PyObject *__pyx_n_s_main;
-static PyObject *__pyx_n_s_max;
-static PyObject *__pyx_n_s_maxcoord;
 static PyObject *__pyx_n_s_memview;
 static PyObject *__pyx_n_s_metaclass;
 static PyObject *__pyx_n_s_mode;
 static PyObject *__pyx_n_s_module;
-static PyObject *__pyx_n_s_n;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_name_2;
 static PyObject *__pyx_n_s_natoms;
@@ -2294,18 +2267,22 @@ static PyObject *__pyx_kp_u_neighbors_and_cutoff_cannot_both;
 static PyObject *__pyx_kp_u_neighbors_or_cutoff_is_required;
 static PyObject *__pyx_n_s_new;
 static PyObject *__pyx_n_s_nlist;
-static PyObject *__pyx_n_s_nlist_view;
 static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
 static PyObject *__pyx_n_s_np;
+static PyObject *__pyx_n_s_nprocs;
+static PyObject *__pyx_kp_u_nprocs_must_be_a_positive_intege;
 static PyObject *__pyx_n_s_numpy;
 static PyObject *__pyx_n_s_nye;
 static PyObject *__pyx_n_u_nye;
-static PyObject *__pyx_n_s_nye_view;
 static PyObject *__pyx_n_s_obj;
+static PyObject *__pyx_n_s_object;
 static PyObject *__pyx_n_s_p;
 static PyObject *__pyx_n_s_p_vectors;
 static PyObject *__pyx_n_s_pack;
+static PyObject *__pyx_n_s_pair_table;
+static PyObject *__pyx_n_s_pbc;
 static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_pos;
 static PyObject *__pyx_n_s_prepare;
 static PyObject *__pyx_n_s_properties;
 static PyObject *__pyx_n_s_property;
@@ -2317,13 +2294,12 @@ static PyObject *__pyx_n_s_pyx_state;
 static PyObject *__pyx_n_s_pyx_type;
 static PyObject *__pyx_n_s_pyx_unpickle_Enum;
 static PyObject *__pyx_n_s_pyx_vtable;
-static PyObject *__pyx_n_s_q;
 static PyObject *__pyx_n_s_qualname;
 static PyObject *__pyx_n_s_range;
-static PyObject *__pyx_n_s_rcond;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_reshape;
 static PyObject *__pyx_n_s_results;
 static PyObject *__pyx_n_s_rotation;
 static PyObject *__pyx_n_u_rotation;
@@ -2337,6 +2313,7 @@ static PyObject *__pyx_n_s_shape;
 static PyObject *__pyx_n_s_size;
 static PyObject *__pyx_n_s_solve_G;
 static PyObject *__pyx_n_s_solve_nye;
+static PyObject *__pyx_n_s_split;
 static PyObject *__pyx_n_s_start;
 static PyObject *__pyx_n_s_step;
 static PyObject *__pyx_n_s_stop;
@@ -2357,33 +2334,31 @@ static PyObject *__pyx_kp_u_unknown_property;
 static PyObject *__pyx_n_s_unpack;
 static PyObject *__pyx_n_s_update;
 static PyObject *__pyx_n_s_value;
+static PyObject *__pyx_n_s_vects;
 static PyObject *__pyx_n_s_view;
-static PyObject *__pyx_n_s_warn;
-static PyObject *__pyx_n_s_warnings;
-static PyObject *__pyx_n_s_x;
-static PyObject *__pyx_n_s_y;
-static PyObject *__pyx_n_s_z;
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_system, PyObject *__pyx_v_neighbors, PyObject *__pyx_v_cutoff, PyObject *__pyx_v_p_vectors, PyObject *__pyx_v_theta_max, PyObject *__pyx_v_axes, PyObject *__pyx_v_basesystem, PyObject *__pyx_v_baseneighbors); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_system, PyObject *__pyx_v_neighbors, PyObject *__pyx_v_cutoff, PyObject *__pyx_v_p_vectors, PyObject *__pyx_v_theta_max, PyObject *__pyx_v_axes, PyObject *__pyx_v_basesystem, PyObject *__pyx_v_baseneighbors, PyObject *__pyx_v_nprocs); /* proto */
 static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_2system(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_4p_vectors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_6theta_max(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_8theta_max(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_10neighbors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_12G(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_14strain(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_16invariant1(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_18invariant2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant3(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_22rotation(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_24angularvelocity(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26nye(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_28clear_properties(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_properties); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_properties); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_p_vectors, PyObject *__pyx_v_axes); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_basesystem, PyObject *__pyx_v_neighbors, PyObject *__pyx_v_cutoff); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_38solve_G(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_theta_max); /* proto */
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_40solve_nye(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_10nprocs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_12nprocs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_14neighbors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_16G(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_18strain(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant1(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_22invariant2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_24invariant3(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26rotation(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_28angularvelocity(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30nye(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32clear_properties(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34save_to_system(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_properties); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36asdict(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_properties); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_38set_p_vectors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_p_vectors, PyObject *__pyx_v_axes); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_40build_p_vectors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_basesystem, PyObject *__pyx_v_neighbors, PyObject *__pyx_v_cutoff); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_42solve_G(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_theta_max, PyObject *__pyx_v_nprocs); /* proto */
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_44solve_nye(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_nprocs); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __pyx_array_obj *__pyx_v_self, PyObject *__pyx_v_shape, Py_ssize_t __pyx_v_itemsize, PyObject *__pyx_v_format, PyObject *__pyx_v_mode, int __pyx_v_allocate_buffer); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array_2__getbuffer__(struct __pyx_array_obj *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_array___pyx_pf_15View_dot_MemoryView_5array_4__dealloc__(struct __pyx_array_obj *__pyx_v_self); /* proto */
@@ -2430,7 +2405,6 @@ static PyObject *__pyx_tp_new_array(PyTypeObject *t, PyObject *a, PyObject *k);
 static PyObject *__pyx_tp_new_Enum(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new__memoryviewslice(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_float_180_0;
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_3;
@@ -2439,10 +2413,10 @@ static PyObject *__pyx_int_180;
 static PyObject *__pyx_int_184977713;
 static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_tuple_;
+static PyObject *__pyx_slice__4;
 static PyObject *__pyx_slice__5;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
-static PyObject *__pyx_tuple__4;
 static PyObject *__pyx_tuple__6;
 static PyObject *__pyx_tuple__7;
 static PyObject *__pyx_tuple__8;
@@ -2460,74 +2434,80 @@ static PyObject *__pyx_tuple__19;
 static PyObject *__pyx_tuple__20;
 static PyObject *__pyx_tuple__21;
 static PyObject *__pyx_tuple__22;
-static PyObject *__pyx_tuple__24;
-static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__23;
+static PyObject *__pyx_tuple__25;
 static PyObject *__pyx_tuple__27;
-static PyObject *__pyx_tuple__29;
-static PyObject *__pyx_tuple__31;
-static PyObject *__pyx_tuple__33;
-static PyObject *__pyx_tuple__35;
-static PyObject *__pyx_tuple__37;
-static PyObject *__pyx_tuple__39;
-static PyObject *__pyx_tuple__41;
-static PyObject *__pyx_tuple__43;
-static PyObject *__pyx_tuple__45;
-static PyObject *__pyx_tuple__47;
-static PyObject *__pyx_tuple__49;
-static PyObject *__pyx_tuple__51;
-static PyObject *__pyx_tuple__53;
-static PyObject *__pyx_tuple__55;
-static PyObject *__pyx_tuple__57;
+static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__32;
+static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_tuple__36;
+static PyObject *__pyx_tuple__38;
+static PyObject *__pyx_tuple__40;
+static PyObject *__pyx_tuple__42;
+static PyObject *__pyx_tuple__44;
+static PyObject *__pyx_tuple__46;
+static PyObject *__pyx_tuple__48;
+static PyObject *__pyx_tuple__50;
+static PyObject *__pyx_tuple__52;
+static PyObject *__pyx_tuple__54;
+static PyObject *__pyx_tuple__56;
 static PyObject *__pyx_tuple__58;
 static PyObject *__pyx_tuple__60;
-static PyObject *__pyx_tuple__61;
+static PyObject *__pyx_tuple__62;
 static PyObject *__pyx_tuple__63;
-static PyObject *__pyx_tuple__64;
+static PyObject *__pyx_tuple__65;
 static PyObject *__pyx_tuple__66;
-static PyObject *__pyx_tuple__67;
+static PyObject *__pyx_tuple__68;
 static PyObject *__pyx_tuple__69;
-static PyObject *__pyx_tuple__70;
+static PyObject *__pyx_tuple__71;
 static PyObject *__pyx_tuple__72;
-static PyObject *__pyx_tuple__73;
 static PyObject *__pyx_tuple__74;
 static PyObject *__pyx_tuple__75;
-static PyObject *__pyx_tuple__76;
 static PyObject *__pyx_tuple__77;
-static PyObject *__pyx_codeobj__25;
-static PyObject *__pyx_codeobj__28;
-static PyObject *__pyx_codeobj__30;
-static PyObject *__pyx_codeobj__32;
-static PyObject *__pyx_codeobj__34;
-static PyObject *__pyx_codeobj__36;
-static PyObject *__pyx_codeobj__38;
-static PyObject *__pyx_codeobj__40;
-static PyObject *__pyx_codeobj__42;
-static PyObject *__pyx_codeobj__44;
-static PyObject *__pyx_codeobj__46;
-static PyObject *__pyx_codeobj__48;
-static PyObject *__pyx_codeobj__50;
-static PyObject *__pyx_codeobj__52;
-static PyObject *__pyx_codeobj__54;
-static PyObject *__pyx_codeobj__56;
+static PyObject *__pyx_tuple__78;
+static PyObject *__pyx_tuple__79;
+static PyObject *__pyx_tuple__80;
+static PyObject *__pyx_tuple__81;
+static PyObject *__pyx_tuple__82;
+static PyObject *__pyx_tuple__83;
+static PyObject *__pyx_codeobj__26;
+static PyObject *__pyx_codeobj__29;
+static PyObject *__pyx_codeobj__31;
+static PyObject *__pyx_codeobj__33;
+static PyObject *__pyx_codeobj__35;
+static PyObject *__pyx_codeobj__37;
+static PyObject *__pyx_codeobj__39;
+static PyObject *__pyx_codeobj__41;
+static PyObject *__pyx_codeobj__43;
+static PyObject *__pyx_codeobj__45;
+static PyObject *__pyx_codeobj__47;
+static PyObject *__pyx_codeobj__49;
+static PyObject *__pyx_codeobj__51;
+static PyObject *__pyx_codeobj__53;
+static PyObject *__pyx_codeobj__55;
+static PyObject *__pyx_codeobj__57;
 static PyObject *__pyx_codeobj__59;
-static PyObject *__pyx_codeobj__62;
-static PyObject *__pyx_codeobj__65;
-static PyObject *__pyx_codeobj__68;
-static PyObject *__pyx_codeobj__71;
-static PyObject *__pyx_codeobj__78;
+static PyObject *__pyx_codeobj__61;
+static PyObject *__pyx_codeobj__64;
+static PyObject *__pyx_codeobj__67;
+static PyObject *__pyx_codeobj__70;
+static PyObject *__pyx_codeobj__73;
+static PyObject *__pyx_codeobj__76;
+static PyObject *__pyx_codeobj__84;
 /* Late includes */
 
-/* "atomman/defect/Strain.pyx":20
+/* "atomman/defect/Strain.pyx":18
  * class Strain():
  * 
  *     def __init__(self, system, neighbors=None, cutoff=None, p_vectors=None,             # <<<<<<<<<<<<<<
- *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None):
- *         """
+ *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None,
+ *                  nprocs=1):
  */
 
 /* Python wrapper */
 static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_1__init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain___init__[] = "\n        Class initializer.  Allows for the current and reference state to be\n        specified for performing the calculations.\n        \n        Parameters\n        ----------\n        system : atomman.System\n            The atomic system to compute the per-atom strain properties and Nye\n            tensor for.\n        neighbors : atomman.NeighborList, optional\n            The neighbor list associated with system to use.  Either neighbors\n            or cutoff must be given, or system must have a neighbors attribute.\n        cutoff : float\n            Cutoff distance for computing a neighbor list for system.  Either\n            neighbors or cutoff must be given, or system have a neighbors\n            attribute.\n        p_vectors : array-like object, optional\n            List(s) of radial distance vectors between each atom and its nearest\n            neighbors in a perfect crystal setting.  If one list of p_vectors is\n            given, then it is applied to all atoms.\n        axes : array-like object, optional\n            3x3 array of right-handed orthogonal axes to transform the given p\n            vectors.  Only needed if the orientation of the p vectors differs\n            from the system's orientation.\n        basesystem : atomman.System, optional\n            A reference atomic system to use for constructing the p vectors. \n        baseneighbors : atomman.NeighborList, optional\n            The neighbor list associated with basesystem to use. If basesystem\n            is given, then either baseneighbors or cutoff must be given, or\n            basesystem must have a neighbors attribute.\n        theta_max : float, optional\n            The maximum theta angle in degrees to use when searching for matches\n            between p vectors and q vectors.  Optimum values are dependent on the\n            crystal structure. Default value is 27, which is the original value\n            used for fcc crystals.\n        ";
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain___init__[] = "\n        Class initializer.  Allows for the current and reference state to be\n        specified for performing the calculations.\n        \n        Parameters\n        ----------\n        system : atomman.System\n            The atomic system to compute the per-atom strain properties and Nye\n            tensor for.\n        neighbors : atomman.NeighborList, optional\n            The neighbor list associated with system to use.  Either neighbors\n            or cutoff must be given, or system must have a neighbors attribute.\n        cutoff : float\n            Cutoff distance for computing a neighbor list for system.  Either\n            neighbors or cutoff must be given, or system have a neighbors\n            attribute.\n        p_vectors : array-like object, optional\n            List(s) of radial distance vectors between each atom and its nearest\n            neighbors in a perfect crystal setting.  If one list of p_vectors is\n            given, then it is applied to all atoms.\n        axes : array-like object, optional\n            3x3 array of right-handed orthogonal axes to transform the given p\n            vectors.  Only needed if the orientation of the p vectors differs\n            from the system's orientation.\n        basesystem : atomman.System, optional\n            A reference atomic system to use for constructing the p vectors. \n        baseneighbors : atomman.NeighborList, optional\n            The neighbor list associated with basesystem to use. If basesystem\n            is given, then either baseneighbors or cutoff must be given, or\n            basesystem must have a neighbors attribute.\n        theta_max : float, optional\n            The maximum theta angle in degrees to use when searching for matches\n            between p vectors and q vectors.  Optimum values are dependent on the\n            crystal structure. Default value is 27, which is the original value\n            used for fcc crystals.\n        nprocs : int, optional\n    ""        The number of processes to use when solving for G and the Nye\n            tensor.  Default value is 1.  If greater than 1, the atoms are\n            split into chunks that are solved in parallel by workers that\n            access the system data through shared memory.\n        ";
 static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_1__init__ = {"__init__", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_1__init__, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain___init__};
 static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_1__init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
@@ -2539,6 +2519,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_1__init__(PyObject *_
   PyObject *__pyx_v_axes = 0;
   PyObject *__pyx_v_basesystem = 0;
   PyObject *__pyx_v_baseneighbors = 0;
+  PyObject *__pyx_v_nprocs = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2546,27 +2527,30 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_1__init__(PyObject *_
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_system,&__pyx_n_s_neighbors,&__pyx_n_s_cutoff,&__pyx_n_s_p_vectors,&__pyx_n_s_theta_max,&__pyx_n_s_axes,&__pyx_n_s_basesystem,&__pyx_n_s_baseneighbors,0};
-    PyObject* values[9] = {0,0,0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_system,&__pyx_n_s_neighbors,&__pyx_n_s_cutoff,&__pyx_n_s_p_vectors,&__pyx_n_s_theta_max,&__pyx_n_s_axes,&__pyx_n_s_basesystem,&__pyx_n_s_baseneighbors,&__pyx_n_s_nprocs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
     values[2] = ((PyObject *)((PyObject *)Py_None));
     values[3] = ((PyObject *)((PyObject *)Py_None));
     values[4] = ((PyObject *)((PyObject *)Py_None));
     values[5] = ((PyObject *)((PyObject *)__pyx_int_27));
 
-    /* "atomman/defect/Strain.pyx":21
+    /* "atomman/defect/Strain.pyx":19
  * 
  *     def __init__(self, system, neighbors=None, cutoff=None, p_vectors=None,
- *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None):             # <<<<<<<<<<<<<<
+ *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None,             # <<<<<<<<<<<<<<
+ *                  nprocs=1):
  *         """
- *         Class initializer.  Allows for the current and reference state to be
  */
     values[6] = ((PyObject *)((PyObject *)Py_None));
     values[7] = ((PyObject *)((PyObject *)Py_None));
     values[8] = ((PyObject *)((PyObject *)Py_None));
+    values[9] = ((PyObject *)((PyObject *)__pyx_int_1));
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
         case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
         CYTHON_FALLTHROUGH;
         case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
@@ -2597,7 +2581,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_1__init__(PyObject *_
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_system)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 2, 9, 1); __PYX_ERR(0, 20, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 2, 10, 1); __PYX_ERR(0, 18, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -2641,12 +2625,20 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_1__init__(PyObject *_
           PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_baseneighbors);
           if (value) { values[8] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nprocs);
+          if (value) { values[9] = value; kw_args--; }
+        }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 20, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 18, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
         case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
         CYTHON_FALLTHROUGH;
         case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
@@ -2676,23 +2668,24 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_1__init__(PyObject *_
     __pyx_v_axes = values[6];
     __pyx_v_basesystem = values[7];
     __pyx_v_baseneighbors = values[8];
+    __pyx_v_nprocs = values[9];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 2, 9, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 20, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 2, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 18, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("atomman.defect.Strain.Strain.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain___init__(__pyx_self, __pyx_v_self, __pyx_v_system, __pyx_v_neighbors, __pyx_v_cutoff, __pyx_v_p_vectors, __pyx_v_theta_max, __pyx_v_axes, __pyx_v_basesystem, __pyx_v_baseneighbors);
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain___init__(__pyx_self, __pyx_v_self, __pyx_v_system, __pyx_v_neighbors, __pyx_v_cutoff, __pyx_v_p_vectors, __pyx_v_theta_max, __pyx_v_axes, __pyx_v_basesystem, __pyx_v_baseneighbors, __pyx_v_nprocs);
 
-  /* "atomman/defect/Strain.pyx":20
+  /* "atomman/defect/Strain.pyx":18
  * class Strain():
  * 
  *     def __init__(self, system, neighbors=None, cutoff=None, p_vectors=None,             # <<<<<<<<<<<<<<
- *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None):
- *         """
+ *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None,
+ *                  nprocs=1):
  */
 
   /* function exit code */
@@ -2700,7 +2693,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_1__init__(PyObject *_
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_system, PyObject *__pyx_v_neighbors, PyObject *__pyx_v_cutoff, PyObject *__pyx_v_p_vectors, PyObject *__pyx_v_theta_max, PyObject *__pyx_v_axes, PyObject *__pyx_v_basesystem, PyObject *__pyx_v_baseneighbors) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_system, PyObject *__pyx_v_neighbors, PyObject *__pyx_v_cutoff, PyObject *__pyx_v_p_vectors, PyObject *__pyx_v_theta_max, PyObject *__pyx_v_axes, PyObject *__pyx_v_basesystem, PyObject *__pyx_v_baseneighbors, PyObject *__pyx_v_nprocs) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -2714,16 +2707,16 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "atomman/defect/Strain.pyx":59
+  /* "atomman/defect/Strain.pyx":63
  *         """
  * 
  *         self.__system = system             # <<<<<<<<<<<<<<
  * 
  *         # Neighbor list setup
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__system, __pyx_v_system) < 0) __PYX_ERR(0, 59, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__system, __pyx_v_system) < 0) __PYX_ERR(0, 63, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":62
+  /* "atomman/defect/Strain.pyx":66
  * 
  *         # Neighbor list setup
  *         if neighbors is not None:             # <<<<<<<<<<<<<<
@@ -2734,7 +2727,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "atomman/defect/Strain.pyx":63
+    /* "atomman/defect/Strain.pyx":67
  *         # Neighbor list setup
  *         if neighbors is not None:
  *             assert cutoff is None, 'neighbors and cutoff cannot both be given'             # <<<<<<<<<<<<<<
@@ -2746,21 +2739,21 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
       __pyx_t_2 = (__pyx_v_cutoff == Py_None);
       if (unlikely(!(__pyx_t_2 != 0))) {
         PyErr_SetObject(PyExc_AssertionError, __pyx_kp_u_neighbors_and_cutoff_cannot_both);
-        __PYX_ERR(0, 63, __pyx_L1_error)
+        __PYX_ERR(0, 67, __pyx_L1_error)
       }
     }
     #endif
 
-    /* "atomman/defect/Strain.pyx":64
+    /* "atomman/defect/Strain.pyx":68
  *         if neighbors is not None:
  *             assert cutoff is None, 'neighbors and cutoff cannot both be given'
  *             self.__neighbors = neighbors             # <<<<<<<<<<<<<<
  *         elif cutoff is not None:
  *             self.__neighbors = NeighborList(system=system, cutoff=cutoff)
  */
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__neighbors, __pyx_v_neighbors) < 0) __PYX_ERR(0, 64, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__neighbors, __pyx_v_neighbors) < 0) __PYX_ERR(0, 68, __pyx_L1_error)
 
-    /* "atomman/defect/Strain.pyx":62
+    /* "atomman/defect/Strain.pyx":66
  * 
  *         # Neighbor list setup
  *         if neighbors is not None:             # <<<<<<<<<<<<<<
@@ -2770,7 +2763,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":65
+  /* "atomman/defect/Strain.pyx":69
  *             assert cutoff is None, 'neighbors and cutoff cannot both be given'
  *             self.__neighbors = neighbors
  *         elif cutoff is not None:             # <<<<<<<<<<<<<<
@@ -2781,27 +2774,27 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
   __pyx_t_1 = (__pyx_t_2 != 0);
   if (__pyx_t_1) {
 
-    /* "atomman/defect/Strain.pyx":66
+    /* "atomman/defect/Strain.pyx":70
  *             self.__neighbors = neighbors
  *         elif cutoff is not None:
  *             self.__neighbors = NeighborList(system=system, cutoff=cutoff)             # <<<<<<<<<<<<<<
  *         elif hasattr(system, 'neighbors'):
  *             self.__neighbors = system.neighbors
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_NeighborList); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_NeighborList); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 70, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_system, __pyx_v_system) < 0) __PYX_ERR(0, 66, __pyx_L1_error)
-    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_cutoff, __pyx_v_cutoff) < 0) __PYX_ERR(0, 66, __pyx_L1_error)
-    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 66, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_system, __pyx_v_system) < 0) __PYX_ERR(0, 70, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_cutoff, __pyx_v_cutoff) < 0) __PYX_ERR(0, 70, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 70, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__neighbors, __pyx_t_5) < 0) __PYX_ERR(0, 66, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__neighbors, __pyx_t_5) < 0) __PYX_ERR(0, 70, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "atomman/defect/Strain.pyx":65
+    /* "atomman/defect/Strain.pyx":69
  *             assert cutoff is None, 'neighbors and cutoff cannot both be given'
  *             self.__neighbors = neighbors
  *         elif cutoff is not None:             # <<<<<<<<<<<<<<
@@ -2811,30 +2804,30 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":67
+  /* "atomman/defect/Strain.pyx":71
  *         elif cutoff is not None:
  *             self.__neighbors = NeighborList(system=system, cutoff=cutoff)
  *         elif hasattr(system, 'neighbors'):             # <<<<<<<<<<<<<<
  *             self.__neighbors = system.neighbors
  *         else:
  */
-  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_system, __pyx_n_u_neighbors); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_system, __pyx_n_u_neighbors); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 71, __pyx_L1_error)
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (likely(__pyx_t_2)) {
 
-    /* "atomman/defect/Strain.pyx":68
+    /* "atomman/defect/Strain.pyx":72
  *             self.__neighbors = NeighborList(system=system, cutoff=cutoff)
  *         elif hasattr(system, 'neighbors'):
  *             self.__neighbors = system.neighbors             # <<<<<<<<<<<<<<
  *         else:
  *             raise ValueError('neighbors or cutoff is required')
  */
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 68, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 72, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__neighbors, __pyx_t_5) < 0) __PYX_ERR(0, 68, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__neighbors, __pyx_t_5) < 0) __PYX_ERR(0, 72, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "atomman/defect/Strain.pyx":67
+    /* "atomman/defect/Strain.pyx":71
  *         elif cutoff is not None:
  *             self.__neighbors = NeighborList(system=system, cutoff=cutoff)
  *         elif hasattr(system, 'neighbors'):             # <<<<<<<<<<<<<<
@@ -2844,7 +2837,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":70
+  /* "atomman/defect/Strain.pyx":74
  *             self.__neighbors = system.neighbors
  *         else:
  *             raise ValueError('neighbors or cutoff is required')             # <<<<<<<<<<<<<<
@@ -2852,15 +2845,15 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
  *         # p vector setup
  */
   /*else*/ {
-    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 70, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 74, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_Raise(__pyx_t_5, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __PYX_ERR(0, 70, __pyx_L1_error)
+    __PYX_ERR(0, 74, __pyx_L1_error)
   }
   __pyx_L3:;
 
-  /* "atomman/defect/Strain.pyx":73
+  /* "atomman/defect/Strain.pyx":77
  * 
  *         # p vector setup
  *         if basesystem is not None:             # <<<<<<<<<<<<<<
@@ -2871,7 +2864,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
   __pyx_t_1 = (__pyx_t_2 != 0);
   if (__pyx_t_1) {
 
-    /* "atomman/defect/Strain.pyx":74
+    /* "atomman/defect/Strain.pyx":78
  *         # p vector setup
  *         if basesystem is not None:
  *             assert p_vectors is None, 'basesystem and p_vectors cannot both be given'             # <<<<<<<<<<<<<<
@@ -2883,37 +2876,37 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
       __pyx_t_1 = (__pyx_v_p_vectors == Py_None);
       if (unlikely(!(__pyx_t_1 != 0))) {
         PyErr_SetObject(PyExc_AssertionError, __pyx_kp_u_basesystem_and_p_vectors_cannot);
-        __PYX_ERR(0, 74, __pyx_L1_error)
+        __PYX_ERR(0, 78, __pyx_L1_error)
       }
     }
     #endif
 
-    /* "atomman/defect/Strain.pyx":75
+    /* "atomman/defect/Strain.pyx":79
  *         if basesystem is not None:
  *             assert p_vectors is None, 'basesystem and p_vectors cannot both be given'
  *             self.build_p_vectors(basesystem, neighbors=baseneighbors, cutoff=cutoff)             # <<<<<<<<<<<<<<
  *         elif p_vectors is not None:
  *             self.set_p_vectors(p_vectors, axes=axes)
  */
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_build_p_vectors); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 75, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_build_p_vectors); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 75, __pyx_L1_error)
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 79, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_v_basesystem);
     __Pyx_GIVEREF(__pyx_v_basesystem);
     PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_basesystem);
-    __pyx_t_3 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_neighbors, __pyx_v_baseneighbors) < 0) __PYX_ERR(0, 75, __pyx_L1_error)
-    if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_cutoff, __pyx_v_cutoff) < 0) __PYX_ERR(0, 75, __pyx_L1_error)
-    __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 75, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_neighbors, __pyx_v_baseneighbors) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_cutoff, __pyx_v_cutoff) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 79, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-    /* "atomman/defect/Strain.pyx":73
+    /* "atomman/defect/Strain.pyx":77
  * 
  *         # p vector setup
  *         if basesystem is not None:             # <<<<<<<<<<<<<<
@@ -2923,7 +2916,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
     goto __pyx_L4;
   }
 
-  /* "atomman/defect/Strain.pyx":76
+  /* "atomman/defect/Strain.pyx":80
  *             assert p_vectors is None, 'basesystem and p_vectors cannot both be given'
  *             self.build_p_vectors(basesystem, neighbors=baseneighbors, cutoff=cutoff)
  *         elif p_vectors is not None:             # <<<<<<<<<<<<<<
@@ -2934,31 +2927,31 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "atomman/defect/Strain.pyx":77
+    /* "atomman/defect/Strain.pyx":81
  *             self.build_p_vectors(basesystem, neighbors=baseneighbors, cutoff=cutoff)
  *         elif p_vectors is not None:
  *             self.set_p_vectors(p_vectors, axes=axes)             # <<<<<<<<<<<<<<
  *         else:
  *             self.__p_vectors = None
  */
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_set_p_vectors); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_set_p_vectors); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 81, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_INCREF(__pyx_v_p_vectors);
     __Pyx_GIVEREF(__pyx_v_p_vectors);
     PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_p_vectors);
-    __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 81, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_axes, __pyx_v_axes) < 0) __PYX_ERR(0, 77, __pyx_L1_error)
-    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_axes, __pyx_v_axes) < 0) __PYX_ERR(0, 81, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 81, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "atomman/defect/Strain.pyx":76
+    /* "atomman/defect/Strain.pyx":80
  *             assert p_vectors is None, 'basesystem and p_vectors cannot both be given'
  *             self.build_p_vectors(basesystem, neighbors=baseneighbors, cutoff=cutoff)
  *         elif p_vectors is not None:             # <<<<<<<<<<<<<<
@@ -2968,7 +2961,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
     goto __pyx_L4;
   }
 
-  /* "atomman/defect/Strain.pyx":79
+  /* "atomman/defect/Strain.pyx":83
  *             self.set_p_vectors(p_vectors, axes=axes)
  *         else:
  *             self.__p_vectors = None             # <<<<<<<<<<<<<<
@@ -2976,27 +2969,36 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
  *         self.theta_max = theta_max
  */
   /*else*/ {
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors, Py_None) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors, Py_None) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
   }
   __pyx_L4:;
 
-  /* "atomman/defect/Strain.pyx":81
+  /* "atomman/defect/Strain.pyx":85
  *             self.__p_vectors = None
  * 
  *         self.theta_max = theta_max             # <<<<<<<<<<<<<<
+ *         self.nprocs = nprocs
  *         self.clear_properties()
- * 
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_theta_max, __pyx_v_theta_max) < 0) __PYX_ERR(0, 81, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_theta_max, __pyx_v_theta_max) < 0) __PYX_ERR(0, 85, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":82
+  /* "atomman/defect/Strain.pyx":86
+ * 
+ *         self.theta_max = theta_max
+ *         self.nprocs = nprocs             # <<<<<<<<<<<<<<
+ *         self.clear_properties()
  * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_nprocs, __pyx_v_nprocs) < 0) __PYX_ERR(0, 86, __pyx_L1_error)
+
+  /* "atomman/defect/Strain.pyx":87
  *         self.theta_max = theta_max
+ *         self.nprocs = nprocs
  *         self.clear_properties()             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_clear_properties); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 82, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_clear_properties); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 87, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
@@ -3010,17 +3012,17 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
   }
   __pyx_t_5 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 87, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "atomman/defect/Strain.pyx":20
+  /* "atomman/defect/Strain.pyx":18
  * class Strain():
  * 
  *     def __init__(self, system, neighbors=None, cutoff=None, p_vectors=None,             # <<<<<<<<<<<<<<
- *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None):
- *         """
+ *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None,
+ *                  nprocs=1):
  */
 
   /* function exit code */
@@ -3039,7 +3041,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain___init__(CYTHON_UNUSE
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":85
+/* "atomman/defect/Strain.pyx":90
  * 
  *     @property
  *     def system(self):             # <<<<<<<<<<<<<<
@@ -3071,7 +3073,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_2system(CYTHON_UNUSED
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("system", 0);
 
-  /* "atomman/defect/Strain.pyx":87
+  /* "atomman/defect/Strain.pyx":92
  *     def system(self):
  *         """atomman.System: The system the properties are being computed for."""
  *         return self.__system             # <<<<<<<<<<<<<<
@@ -3079,13 +3081,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_2system(CYTHON_UNUSED
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__system); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__system); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":85
+  /* "atomman/defect/Strain.pyx":90
  * 
  *     @property
  *     def system(self):             # <<<<<<<<<<<<<<
@@ -3104,7 +3106,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_2system(CYTHON_UNUSED
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":90
+/* "atomman/defect/Strain.pyx":95
  * 
  *     @property
  *     def p_vectors(self):             # <<<<<<<<<<<<<<
@@ -3136,7 +3138,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_4p_vectors(CYTHON_UNU
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("p_vectors", 0);
 
-  /* "atomman/defect/Strain.pyx":92
+  /* "atomman/defect/Strain.pyx":97
  *     def p_vectors(self):
  *         """numpy.NDArray: The per-atom sets of ideal atom positions."""
  *         return self.__p_vectors             # <<<<<<<<<<<<<<
@@ -3144,13 +3146,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_4p_vectors(CYTHON_UNU
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":90
+  /* "atomman/defect/Strain.pyx":95
  * 
  *     @property
  *     def p_vectors(self):             # <<<<<<<<<<<<<<
@@ -3169,7 +3171,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_4p_vectors(CYTHON_UNU
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":95
+/* "atomman/defect/Strain.pyx":100
  * 
  *     @property
  *     def theta_max(self):             # <<<<<<<<<<<<<<
@@ -3201,7 +3203,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_6theta_max(CYTHON_UNU
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("theta_max", 0);
 
-  /* "atomman/defect/Strain.pyx":97
+  /* "atomman/defect/Strain.pyx":102
  *     def theta_max(self):
  *         """float: The maximum angle in degrees to include in the p-q vector pairings."""
  *         return self.__theta_max             # <<<<<<<<<<<<<<
@@ -3209,13 +3211,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_6theta_max(CYTHON_UNU
  *     @theta_max.setter
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__theta_max); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__theta_max); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":95
+  /* "atomman/defect/Strain.pyx":100
  * 
  *     @property
  *     def theta_max(self):             # <<<<<<<<<<<<<<
@@ -3234,7 +3236,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_6theta_max(CYTHON_UNU
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":100
+/* "atomman/defect/Strain.pyx":105
  * 
  *     @theta_max.setter
  *     def theta_max(self, value):             # <<<<<<<<<<<<<<
@@ -3277,11 +3279,11 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_9theta_max(PyObject *
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_value)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("theta_max", 1, 2, 2, 1); __PYX_ERR(0, 100, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("theta_max", 1, 2, 2, 1); __PYX_ERR(0, 105, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "theta_max") < 0)) __PYX_ERR(0, 100, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "theta_max") < 0)) __PYX_ERR(0, 105, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -3294,7 +3296,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_9theta_max(PyObject *
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("theta_max", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 100, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("theta_max", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 105, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("atomman.defect.Strain.Strain.theta_max", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3318,38 +3320,38 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_8theta_max(CYTHON_UNU
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("theta_max", 0);
 
-  /* "atomman/defect/Strain.pyx":101
+  /* "atomman/defect/Strain.pyx":106
  *     @theta_max.setter
  *     def theta_max(self, value):
  *         if value <= 180 and value > 0:             # <<<<<<<<<<<<<<
  *             self.__theta_max = value
  * 
  */
-  __pyx_t_2 = PyObject_RichCompare(__pyx_v_value, __pyx_int_180, Py_LE); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 101, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __pyx_t_2 = PyObject_RichCompare(__pyx_v_value, __pyx_int_180, Py_LE); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   if (__pyx_t_3) {
   } else {
     __pyx_t_1 = __pyx_t_3;
     goto __pyx_L4_bool_binop_done;
   }
-  __pyx_t_2 = PyObject_RichCompare(__pyx_v_value, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 101, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __pyx_t_2 = PyObject_RichCompare(__pyx_v_value, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_1 = __pyx_t_3;
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "atomman/defect/Strain.pyx":102
+    /* "atomman/defect/Strain.pyx":107
  *     def theta_max(self, value):
  *         if value <= 180 and value > 0:
  *             self.__theta_max = value             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__theta_max, __pyx_v_value) < 0) __PYX_ERR(0, 102, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__theta_max, __pyx_v_value) < 0) __PYX_ERR(0, 107, __pyx_L1_error)
 
-    /* "atomman/defect/Strain.pyx":101
+    /* "atomman/defect/Strain.pyx":106
  *     @theta_max.setter
  *     def theta_max(self, value):
  *         if value <= 180 and value > 0:             # <<<<<<<<<<<<<<
@@ -3358,7 +3360,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_8theta_max(CYTHON_UNU
  */
   }
 
-  /* "atomman/defect/Strain.pyx":100
+  /* "atomman/defect/Strain.pyx":105
  * 
  *     @theta_max.setter
  *     def theta_max(self, value):             # <<<<<<<<<<<<<<
@@ -3379,64 +3381,64 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_8theta_max(CYTHON_UNU
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":105
+/* "atomman/defect/Strain.pyx":110
  * 
  *     @property
- *     def neighbors(self):             # <<<<<<<<<<<<<<
- *         """atomman.NeighborList: The list of neighbors for system."""
- *         return self.__neighbors
+ *     def nprocs(self):             # <<<<<<<<<<<<<<
+ *         """int: The number of processes to use when solving."""
+ *         return self.__nprocs
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_11neighbors(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_10neighbors[] = "atomman.NeighborList: The list of neighbors for system.";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_11neighbors = {"neighbors", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_11neighbors, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_10neighbors};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_11neighbors(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_11nprocs(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_10nprocs[] = "int: The number of processes to use when solving.";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_11nprocs = {"nprocs", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_11nprocs, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_10nprocs};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_11nprocs(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("neighbors (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_10neighbors(__pyx_self, ((PyObject *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("nprocs (wrapper)", 0);
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_10nprocs(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_10neighbors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_10nprocs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("neighbors", 0);
+  __Pyx_RefNannySetupContext("nprocs", 0);
 
-  /* "atomman/defect/Strain.pyx":107
- *     def neighbors(self):
- *         """atomman.NeighborList: The list of neighbors for system."""
- *         return self.__neighbors             # <<<<<<<<<<<<<<
+  /* "atomman/defect/Strain.pyx":112
+ *     def nprocs(self):
+ *         """int: The number of processes to use when solving."""
+ *         return self.__nprocs             # <<<<<<<<<<<<<<
  * 
- *     @property
+ *     @nprocs.setter
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__neighbors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nprocs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 112, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":105
+  /* "atomman/defect/Strain.pyx":110
  * 
  *     @property
- *     def neighbors(self):             # <<<<<<<<<<<<<<
- *         """atomman.NeighborList: The list of neighbors for system."""
- *         return self.__neighbors
+ *     def nprocs(self):             # <<<<<<<<<<<<<<
+ *         """int: The number of processes to use when solving."""
+ *         return self.__nprocs
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("atomman.defect.Strain.Strain.neighbors", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("atomman.defect.Strain.Strain.nprocs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3444,106 +3446,332 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_10neighbors(CYTHON_UN
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":110
+/* "atomman/defect/Strain.pyx":115
  * 
- *     @property
- *     def G(self):             # <<<<<<<<<<<<<<
- *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
- *         if self.__G is None:
+ *     @nprocs.setter
+ *     def nprocs(self, value):             # <<<<<<<<<<<<<<
+ *         value = int(value)
+ *         if value < 1:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_13G(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_12G[] = "numpy.NDArray : The computed per-atom lattice correspondence tensor";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_13G = {"G", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_13G, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_12G};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_13G(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_13nprocs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_13nprocs = {"nprocs", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_13nprocs, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_13nprocs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_value = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("G (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_12G(__pyx_self, ((PyObject *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("nprocs (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_value,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_value)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("nprocs", 1, 2, 2, 1); __PYX_ERR(0, 115, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "nprocs") < 0)) __PYX_ERR(0, 115, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_value = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("nprocs", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 115, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("atomman.defect.Strain.Strain.nprocs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_12nprocs(__pyx_self, __pyx_v_self, __pyx_v_value);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_12G(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_12nprocs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   int __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("G", 0);
+  __Pyx_RefNannySetupContext("nprocs", 0);
+  __Pyx_INCREF(__pyx_v_value);
 
-  /* "atomman/defect/Strain.pyx":112
- *     def G(self):
- *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
- *         if self.__G is None:             # <<<<<<<<<<<<<<
- *             self.solve_G()
- *         return self.__G
+  /* "atomman/defect/Strain.pyx":116
+ *     @nprocs.setter
+ *     def nprocs(self, value):
+ *         value = int(value)             # <<<<<<<<<<<<<<
+ *         if value < 1:
+ *             raise ValueError('nprocs must be a positive integer')
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__pyx_t_1 == Py_None);
+  __Pyx_DECREF_SET(__pyx_v_value, __pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "atomman/defect/Strain.pyx":117
+ *     def nprocs(self, value):
+ *         value = int(value)
+ *         if value < 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError('nprocs must be a positive integer')
+ *         self.__nprocs = value
+ */
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_int_1, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 117, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = (__pyx_t_2 != 0);
-  if (__pyx_t_3) {
+  if (unlikely(__pyx_t_2)) {
 
-    /* "atomman/defect/Strain.pyx":113
- *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
- *         if self.__G is None:
- *             self.solve_G()             # <<<<<<<<<<<<<<
- *         return self.__G
+    /* "atomman/defect/Strain.pyx":118
+ *         value = int(value)
+ *         if value < 1:
+ *             raise ValueError('nprocs must be a positive integer')             # <<<<<<<<<<<<<<
+ *         self.__nprocs = value
  * 
  */
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_solve_G); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 113, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-        __Pyx_INCREF(__pyx_t_5);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_4, function);
-      }
-    }
-    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 118, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 118, __pyx_L1_error)
 
-    /* "atomman/defect/Strain.pyx":112
- *     def G(self):
- *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
- *         if self.__G is None:             # <<<<<<<<<<<<<<
- *             self.solve_G()
- *         return self.__G
+    /* "atomman/defect/Strain.pyx":117
+ *     def nprocs(self, value):
+ *         value = int(value)
+ *         if value < 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError('nprocs must be a positive integer')
+ *         self.__nprocs = value
  */
   }
 
-  /* "atomman/defect/Strain.pyx":114
- *         if self.__G is None:
- *             self.solve_G()
- *         return self.__G             # <<<<<<<<<<<<<<
+  /* "atomman/defect/Strain.pyx":119
+ *         if value < 1:
+ *             raise ValueError('nprocs must be a positive integer')
+ *         self.__nprocs = value             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nprocs, __pyx_v_value) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
+
+  /* "atomman/defect/Strain.pyx":115
+ * 
+ *     @nprocs.setter
+ *     def nprocs(self, value):             # <<<<<<<<<<<<<<
+ *         value = int(value)
+ *         if value < 1:
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("atomman.defect.Strain.Strain.nprocs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "atomman/defect/Strain.pyx":122
+ * 
+ *     @property
+ *     def neighbors(self):             # <<<<<<<<<<<<<<
+ *         """atomman.NeighborList: The list of neighbors for system."""
+ *         return self.__neighbors
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_15neighbors(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_14neighbors[] = "atomman.NeighborList: The list of neighbors for system.";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_15neighbors = {"neighbors", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_15neighbors, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_14neighbors};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_15neighbors(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("neighbors (wrapper)", 0);
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_14neighbors(__pyx_self, ((PyObject *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_14neighbors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("neighbors", 0);
+
+  /* "atomman/defect/Strain.pyx":124
+ *     def neighbors(self):
+ *         """atomman.NeighborList: The list of neighbors for system."""
+ *         return self.__neighbors             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__neighbors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 124, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":110
+  /* "atomman/defect/Strain.pyx":122
+ * 
+ *     @property
+ *     def neighbors(self):             # <<<<<<<<<<<<<<
+ *         """atomman.NeighborList: The list of neighbors for system."""
+ *         return self.__neighbors
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("atomman.defect.Strain.Strain.neighbors", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "atomman/defect/Strain.pyx":127
+ * 
+ *     @property
+ *     def G(self):             # <<<<<<<<<<<<<<
+ *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
+ *         if self.__G is None:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_17G(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_16G[] = "numpy.NDArray : The computed per-atom lattice correspondence tensor";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_17G = {"G", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_17G, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_16G};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_17G(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("G (wrapper)", 0);
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_16G(__pyx_self, ((PyObject *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_16G(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("G", 0);
+
+  /* "atomman/defect/Strain.pyx":129
+ *     def G(self):
+ *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
+ *         if self.__G is None:             # <<<<<<<<<<<<<<
+ *             self.solve_G()
+ *         return self.__G
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__pyx_t_1 == Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "atomman/defect/Strain.pyx":130
+ *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
+ *         if self.__G is None:
+ *             self.solve_G()             # <<<<<<<<<<<<<<
+ *         return self.__G
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_solve_G); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "atomman/defect/Strain.pyx":129
+ *     def G(self):
+ *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
+ *         if self.__G is None:             # <<<<<<<<<<<<<<
+ *             self.solve_G()
+ *         return self.__G
+ */
+  }
+
+  /* "atomman/defect/Strain.pyx":131
+ *         if self.__G is None:
+ *             self.solve_G()
+ *         return self.__G             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "atomman/defect/Strain.pyx":127
  * 
  *     @property
  *     def G(self):             # <<<<<<<<<<<<<<
@@ -3564,7 +3792,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_12G(CYTHON_UNUSED PyO
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":117
+/* "atomman/defect/Strain.pyx":134
  * 
  *     @property
  *     def strain(self):             # <<<<<<<<<<<<<<
@@ -3573,21 +3801,21 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_12G(CYTHON_UNUSED PyO
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_15strain(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_14strain[] = "numpy.NDArray : The computed per-atom strain tensor";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_15strain = {"strain", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_15strain, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_14strain};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_15strain(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_19strain(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_18strain[] = "numpy.NDArray : The computed per-atom strain tensor";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_19strain = {"strain", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_19strain, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_18strain};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_19strain(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("strain (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_14strain(__pyx_self, ((PyObject *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_18strain(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_14strain(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_18strain(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3599,40 +3827,40 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_14strain(CYTHON_UNUSE
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("strain", 0);
 
-  /* "atomman/defect/Strain.pyx":119
+  /* "atomman/defect/Strain.pyx":136
  *     def strain(self):
  *         """numpy.NDArray : The computed per-atom strain tensor"""
  *         if self.__strain is None:             # <<<<<<<<<<<<<<
  *             self.__strain = strain_c(self.G)
  *         return self.__strain
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 119, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = (__pyx_t_1 == Py_None);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "atomman/defect/Strain.pyx":120
+    /* "atomman/defect/Strain.pyx":137
  *         """numpy.NDArray : The computed per-atom strain tensor"""
  *         if self.__strain is None:
  *             self.__strain = strain_c(self.G)             # <<<<<<<<<<<<<<
  *         return self.__strain
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 120, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 120, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 137, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_strain_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 120, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_strain_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __PYX_XDEC_MEMVIEW(&__pyx_t_4, 1);
     __pyx_t_4.memview = NULL;
     __pyx_t_4.data = NULL;
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__strain, __pyx_t_1) < 0) __PYX_ERR(0, 120, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__strain, __pyx_t_1) < 0) __PYX_ERR(0, 137, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":119
+    /* "atomman/defect/Strain.pyx":136
  *     def strain(self):
  *         """numpy.NDArray : The computed per-atom strain tensor"""
  *         if self.__strain is None:             # <<<<<<<<<<<<<<
@@ -3641,7 +3869,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_14strain(CYTHON_UNUSE
  */
   }
 
-  /* "atomman/defect/Strain.pyx":121
+  /* "atomman/defect/Strain.pyx":138
  *         if self.__strain is None:
  *             self.__strain = strain_c(self.G)
  *         return self.__strain             # <<<<<<<<<<<<<<
@@ -3649,13 +3877,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_14strain(CYTHON_UNUSE
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":117
+  /* "atomman/defect/Strain.pyx":134
  * 
  *     @property
  *     def strain(self):             # <<<<<<<<<<<<<<
@@ -3675,7 +3903,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_14strain(CYTHON_UNUSE
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":124
+/* "atomman/defect/Strain.pyx":141
  * 
  *     @property
  *     def invariant1(self):             # <<<<<<<<<<<<<<
@@ -3684,21 +3912,21 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_14strain(CYTHON_UNUSE
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_17invariant1(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_16invariant1[] = "numpy.NDArray : The computed per-atom first strain invariant";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_17invariant1 = {"invariant1", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_17invariant1, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_16invariant1};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_17invariant1(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_21invariant1(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_20invariant1[] = "numpy.NDArray : The computed per-atom first strain invariant";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_21invariant1 = {"invariant1", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_21invariant1, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_20invariant1};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_21invariant1(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("invariant1 (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_16invariant1(__pyx_self, ((PyObject *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant1(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_16invariant1(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant1(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3710,40 +3938,40 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_16invariant1(CYTHON_U
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("invariant1", 0);
 
-  /* "atomman/defect/Strain.pyx":126
+  /* "atomman/defect/Strain.pyx":143
  *     def invariant1(self):
  *         """numpy.NDArray : The computed per-atom first strain invariant"""
  *         if self.__invariant1 is None:             # <<<<<<<<<<<<<<
  *             self.__invariant1 = invariant1_c(self.strain)
  *         return self.__invariant1
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 143, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = (__pyx_t_1 == Py_None);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "atomman/defect/Strain.pyx":127
+    /* "atomman/defect/Strain.pyx":144
  *         """numpy.NDArray : The computed per-atom first strain invariant"""
  *         if self.__invariant1 is None:
  *             self.__invariant1 = invariant1_c(self.strain)             # <<<<<<<<<<<<<<
  *         return self.__invariant1
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 127, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 144, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_invariant1_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_invariant1_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __PYX_XDEC_MEMVIEW(&__pyx_t_4, 1);
     __pyx_t_4.memview = NULL;
     __pyx_t_4.data = NULL;
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant1, __pyx_t_1) < 0) __PYX_ERR(0, 127, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant1, __pyx_t_1) < 0) __PYX_ERR(0, 144, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":126
+    /* "atomman/defect/Strain.pyx":143
  *     def invariant1(self):
  *         """numpy.NDArray : The computed per-atom first strain invariant"""
  *         if self.__invariant1 is None:             # <<<<<<<<<<<<<<
@@ -3752,7 +3980,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_16invariant1(CYTHON_U
  */
   }
 
-  /* "atomman/defect/Strain.pyx":128
+  /* "atomman/defect/Strain.pyx":145
  *         if self.__invariant1 is None:
  *             self.__invariant1 = invariant1_c(self.strain)
  *         return self.__invariant1             # <<<<<<<<<<<<<<
@@ -3760,13 +3988,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_16invariant1(CYTHON_U
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":124
+  /* "atomman/defect/Strain.pyx":141
  * 
  *     @property
  *     def invariant1(self):             # <<<<<<<<<<<<<<
@@ -3786,7 +4014,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_16invariant1(CYTHON_U
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":131
+/* "atomman/defect/Strain.pyx":148
  * 
  *     @property
  *     def invariant2(self):             # <<<<<<<<<<<<<<
@@ -3795,21 +4023,21 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_16invariant1(CYTHON_U
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_19invariant2(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_18invariant2[] = "numpy.NDArray : The computed per-atom second strain invariant";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_19invariant2 = {"invariant2", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_19invariant2, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_18invariant2};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_19invariant2(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_23invariant2(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_22invariant2[] = "numpy.NDArray : The computed per-atom second strain invariant";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_23invariant2 = {"invariant2", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_23invariant2, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_22invariant2};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_23invariant2(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("invariant2 (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_18invariant2(__pyx_self, ((PyObject *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_22invariant2(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_18invariant2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_22invariant2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3821,40 +4049,40 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_18invariant2(CYTHON_U
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("invariant2", 0);
 
-  /* "atomman/defect/Strain.pyx":133
+  /* "atomman/defect/Strain.pyx":150
  *     def invariant2(self):
  *         """numpy.NDArray : The computed per-atom second strain invariant"""
  *         if self.__invariant2 is None:             # <<<<<<<<<<<<<<
  *             self.__invariant2 = invariant2_c(self.strain)
  *         return self.__invariant2
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = (__pyx_t_1 == Py_None);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "atomman/defect/Strain.pyx":134
+    /* "atomman/defect/Strain.pyx":151
  *         """numpy.NDArray : The computed per-atom second strain invariant"""
  *         if self.__invariant2 is None:
  *             self.__invariant2 = invariant2_c(self.strain)             # <<<<<<<<<<<<<<
  *         return self.__invariant2
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_invariant2_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_invariant2_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __PYX_XDEC_MEMVIEW(&__pyx_t_4, 1);
     __pyx_t_4.memview = NULL;
     __pyx_t_4.data = NULL;
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant2, __pyx_t_1) < 0) __PYX_ERR(0, 134, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant2, __pyx_t_1) < 0) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":133
+    /* "atomman/defect/Strain.pyx":150
  *     def invariant2(self):
  *         """numpy.NDArray : The computed per-atom second strain invariant"""
  *         if self.__invariant2 is None:             # <<<<<<<<<<<<<<
@@ -3863,7 +4091,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_18invariant2(CYTHON_U
  */
   }
 
-  /* "atomman/defect/Strain.pyx":135
+  /* "atomman/defect/Strain.pyx":152
  *         if self.__invariant2 is None:
  *             self.__invariant2 = invariant2_c(self.strain)
  *         return self.__invariant2             # <<<<<<<<<<<<<<
@@ -3871,13 +4099,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_18invariant2(CYTHON_U
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":131
+  /* "atomman/defect/Strain.pyx":148
  * 
  *     @property
  *     def invariant2(self):             # <<<<<<<<<<<<<<
@@ -3897,7 +4125,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_18invariant2(CYTHON_U
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":138
+/* "atomman/defect/Strain.pyx":155
  * 
  *     @property
  *     def invariant3(self):             # <<<<<<<<<<<<<<
@@ -3906,21 +4134,21 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_18invariant2(CYTHON_U
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_21invariant3(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_20invariant3[] = "numpy.NDArray : The computed per-atom third strain invariant";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_21invariant3 = {"invariant3", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_21invariant3, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_20invariant3};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_21invariant3(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_25invariant3(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_24invariant3[] = "numpy.NDArray : The computed per-atom third strain invariant";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_25invariant3 = {"invariant3", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_25invariant3, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_24invariant3};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_25invariant3(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("invariant3 (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant3(__pyx_self, ((PyObject *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_24invariant3(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant3(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_24invariant3(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3932,40 +4160,40 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant3(CYTHON_U
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("invariant3", 0);
 
-  /* "atomman/defect/Strain.pyx":140
+  /* "atomman/defect/Strain.pyx":157
  *     def invariant3(self):
  *         """numpy.NDArray : The computed per-atom third strain invariant"""
  *         if self.__invariant3 is None:             # <<<<<<<<<<<<<<
  *             self.__invariant3 = invariant3_c(self.strain)
  *         return self.__invariant3
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = (__pyx_t_1 == Py_None);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "atomman/defect/Strain.pyx":141
+    /* "atomman/defect/Strain.pyx":158
  *         """numpy.NDArray : The computed per-atom third strain invariant"""
  *         if self.__invariant3 is None:
  *             self.__invariant3 = invariant3_c(self.strain)             # <<<<<<<<<<<<<<
  *         return self.__invariant3
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 158, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 141, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 158, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_invariant3_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_invariant3_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 158, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __PYX_XDEC_MEMVIEW(&__pyx_t_4, 1);
     __pyx_t_4.memview = NULL;
     __pyx_t_4.data = NULL;
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant3, __pyx_t_1) < 0) __PYX_ERR(0, 141, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant3, __pyx_t_1) < 0) __PYX_ERR(0, 158, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":140
+    /* "atomman/defect/Strain.pyx":157
  *     def invariant3(self):
  *         """numpy.NDArray : The computed per-atom third strain invariant"""
  *         if self.__invariant3 is None:             # <<<<<<<<<<<<<<
@@ -3974,7 +4202,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant3(CYTHON_U
  */
   }
 
-  /* "atomman/defect/Strain.pyx":142
+  /* "atomman/defect/Strain.pyx":159
  *         if self.__invariant3 is None:
  *             self.__invariant3 = invariant3_c(self.strain)
  *         return self.__invariant3             # <<<<<<<<<<<<<<
@@ -3982,13 +4210,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant3(CYTHON_U
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":138
+  /* "atomman/defect/Strain.pyx":155
  * 
  *     @property
  *     def invariant3(self):             # <<<<<<<<<<<<<<
@@ -4008,7 +4236,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant3(CYTHON_U
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":145
+/* "atomman/defect/Strain.pyx":162
  * 
  *     @property
  *     def rotation(self):             # <<<<<<<<<<<<<<
@@ -4017,21 +4245,21 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_20invariant3(CYTHON_U
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_23rotation(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_22rotation[] = "numpy.NDArray : The computed per-atom rotation tensor";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_23rotation = {"rotation", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_23rotation, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_22rotation};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_23rotation(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_27rotation(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_26rotation[] = "numpy.NDArray : The computed per-atom rotation tensor";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_27rotation = {"rotation", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_27rotation, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_26rotation};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_27rotation(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("rotation (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_22rotation(__pyx_self, ((PyObject *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_26rotation(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_22rotation(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26rotation(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4043,40 +4271,40 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_22rotation(CYTHON_UNU
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("rotation", 0);
 
-  /* "atomman/defect/Strain.pyx":147
+  /* "atomman/defect/Strain.pyx":164
  *     def rotation(self):
  *         """numpy.NDArray : The computed per-atom rotation tensor"""
  *         if self.__rotation is None:             # <<<<<<<<<<<<<<
  *             self.__rotation = rotation_c(self.G)
  *         return self.__rotation
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__rotation); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__rotation); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = (__pyx_t_1 == Py_None);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "atomman/defect/Strain.pyx":148
+    /* "atomman/defect/Strain.pyx":165
  *         """numpy.NDArray : The computed per-atom rotation tensor"""
  *         if self.__rotation is None:
  *             self.__rotation = rotation_c(self.G)             # <<<<<<<<<<<<<<
  *         return self.__rotation
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 165, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_rotation_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_rotation_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __PYX_XDEC_MEMVIEW(&__pyx_t_4, 1);
     __pyx_t_4.memview = NULL;
     __pyx_t_4.data = NULL;
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__rotation, __pyx_t_1) < 0) __PYX_ERR(0, 148, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__rotation, __pyx_t_1) < 0) __PYX_ERR(0, 165, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":147
+    /* "atomman/defect/Strain.pyx":164
  *     def rotation(self):
  *         """numpy.NDArray : The computed per-atom rotation tensor"""
  *         if self.__rotation is None:             # <<<<<<<<<<<<<<
@@ -4085,7 +4313,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_22rotation(CYTHON_UNU
  */
   }
 
-  /* "atomman/defect/Strain.pyx":149
+  /* "atomman/defect/Strain.pyx":166
  *         if self.__rotation is None:
  *             self.__rotation = rotation_c(self.G)
  *         return self.__rotation             # <<<<<<<<<<<<<<
@@ -4093,13 +4321,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_22rotation(CYTHON_UNU
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__rotation); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__rotation); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":145
+  /* "atomman/defect/Strain.pyx":162
  * 
  *     @property
  *     def rotation(self):             # <<<<<<<<<<<<<<
@@ -4119,7 +4347,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_22rotation(CYTHON_UNU
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":152
+/* "atomman/defect/Strain.pyx":169
  * 
  *     @property
  *     def angularvelocity(self):             # <<<<<<<<<<<<<<
@@ -4128,21 +4356,21 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_22rotation(CYTHON_UNU
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_25angularvelocity(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_24angularvelocity[] = "numpy.NDArray : The computed per-atom angular velocity";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_25angularvelocity = {"angularvelocity", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_25angularvelocity, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_24angularvelocity};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_25angularvelocity(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_29angularvelocity(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_28angularvelocity[] = "numpy.NDArray : The computed per-atom angular velocity";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_29angularvelocity = {"angularvelocity", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_29angularvelocity, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_28angularvelocity};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_29angularvelocity(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("angularvelocity (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_24angularvelocity(__pyx_self, ((PyObject *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_28angularvelocity(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_24angularvelocity(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_28angularvelocity(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4154,40 +4382,40 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_24angularvelocity(CYT
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("angularvelocity", 0);
 
-  /* "atomman/defect/Strain.pyx":154
+  /* "atomman/defect/Strain.pyx":171
  *     def angularvelocity(self):
  *         """numpy.NDArray : The computed per-atom angular velocity"""
  *         if self.__angularvelocity is None:             # <<<<<<<<<<<<<<
  *             self.__angularvelocity = angularvelocity_c(self.rotation)
  *         return self.__angularvelocity
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__angularvelocity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 154, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__angularvelocity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = (__pyx_t_1 == Py_None);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "atomman/defect/Strain.pyx":155
+    /* "atomman/defect/Strain.pyx":172
  *         """numpy.NDArray : The computed per-atom angular velocity"""
  *         if self.__angularvelocity is None:
  *             self.__angularvelocity = angularvelocity_c(self.rotation)             # <<<<<<<<<<<<<<
  *         return self.__angularvelocity
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_rotation); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_rotation); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 172, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_angularvelocity_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_angularvelocity_c(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __PYX_XDEC_MEMVIEW(&__pyx_t_4, 1);
     __pyx_t_4.memview = NULL;
     __pyx_t_4.data = NULL;
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__angularvelocity, __pyx_t_1) < 0) __PYX_ERR(0, 155, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__angularvelocity, __pyx_t_1) < 0) __PYX_ERR(0, 172, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":154
+    /* "atomman/defect/Strain.pyx":171
  *     def angularvelocity(self):
  *         """numpy.NDArray : The computed per-atom angular velocity"""
  *         if self.__angularvelocity is None:             # <<<<<<<<<<<<<<
@@ -4196,7 +4424,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_24angularvelocity(CYT
  */
   }
 
-  /* "atomman/defect/Strain.pyx":156
+  /* "atomman/defect/Strain.pyx":173
  *         if self.__angularvelocity is None:
  *             self.__angularvelocity = angularvelocity_c(self.rotation)
  *         return self.__angularvelocity             # <<<<<<<<<<<<<<
@@ -4204,13 +4432,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_24angularvelocity(CYT
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__angularvelocity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__angularvelocity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":152
+  /* "atomman/defect/Strain.pyx":169
  * 
  *     @property
  *     def angularvelocity(self):             # <<<<<<<<<<<<<<
@@ -4230,7 +4458,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_24angularvelocity(CYT
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":159
+/* "atomman/defect/Strain.pyx":176
  * 
  *     @property
  *     def nye(self):             # <<<<<<<<<<<<<<
@@ -4239,21 +4467,21 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_24angularvelocity(CYT
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_27nye(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_26nye[] = "numpy.NDArray : The computed per-atom Nye tensor";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_27nye = {"nye", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_27nye, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_26nye};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_27nye(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_31nye(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_30nye[] = "numpy.NDArray : The computed per-atom Nye tensor";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_31nye = {"nye", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_31nye, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_30nye};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_31nye(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("nye (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_26nye(__pyx_self, ((PyObject *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_30nye(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26nye(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30nye(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4266,28 +4494,28 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26nye(CYTHON_UNUSED P
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("nye", 0);
 
-  /* "atomman/defect/Strain.pyx":161
+  /* "atomman/defect/Strain.pyx":178
  *     def nye(self):
  *         """numpy.NDArray : The computed per-atom Nye tensor"""
  *         if self.__nye is None:             # <<<<<<<<<<<<<<
  *             self.solve_nye()
  *         return self.__nye
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nye); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nye); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = (__pyx_t_1 == Py_None);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "atomman/defect/Strain.pyx":162
+    /* "atomman/defect/Strain.pyx":179
  *         """numpy.NDArray : The computed per-atom Nye tensor"""
  *         if self.__nye is None:
  *             self.solve_nye()             # <<<<<<<<<<<<<<
  *         return self.__nye
  * 
  */
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_solve_nye); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 162, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_solve_nye); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 179, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
@@ -4301,12 +4529,12 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26nye(CYTHON_UNUSED P
     }
     __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 162, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":161
+    /* "atomman/defect/Strain.pyx":178
  *     def nye(self):
  *         """numpy.NDArray : The computed per-atom Nye tensor"""
  *         if self.__nye is None:             # <<<<<<<<<<<<<<
@@ -4315,7 +4543,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26nye(CYTHON_UNUSED P
  */
   }
 
-  /* "atomman/defect/Strain.pyx":163
+  /* "atomman/defect/Strain.pyx":180
  *         if self.__nye is None:
  *             self.solve_nye()
  *         return self.__nye             # <<<<<<<<<<<<<<
@@ -4323,13 +4551,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26nye(CYTHON_UNUSED P
  *     def clear_properties(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nye); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nye); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":159
+  /* "atomman/defect/Strain.pyx":176
  * 
  *     @property
  *     def nye(self):             # <<<<<<<<<<<<<<
@@ -4350,7 +4578,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26nye(CYTHON_UNUSED P
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":165
+/* "atomman/defect/Strain.pyx":182
  *         return self.__nye
  * 
  *     def clear_properties(self):             # <<<<<<<<<<<<<<
@@ -4359,21 +4587,21 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_26nye(CYTHON_UNUSED P
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_29clear_properties(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_28clear_properties[] = "\n        Clears all computed properties. Allows for the values to be recomputed\n        using different settings.\n        ";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_29clear_properties = {"clear_properties", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_29clear_properties, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_28clear_properties};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_29clear_properties(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_33clear_properties(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_32clear_properties[] = "\n        Clears all computed properties. Allows for the values to be recomputed\n        using different settings.\n        ";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_33clear_properties = {"clear_properties", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_33clear_properties, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_32clear_properties};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_33clear_properties(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("clear_properties (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_28clear_properties(__pyx_self, ((PyObject *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_32clear_properties(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_28clear_properties(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32clear_properties(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
@@ -4381,79 +4609,79 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_28clear_properties(CY
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("clear_properties", 0);
 
-  /* "atomman/defect/Strain.pyx":170
+  /* "atomman/defect/Strain.pyx":187
  *         using different settings.
  *         """
  *         self.__G = None             # <<<<<<<<<<<<<<
  *         self.__strain = None
  *         self.__invariant1 = None
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__G, Py_None) < 0) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__G, Py_None) < 0) __PYX_ERR(0, 187, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":171
+  /* "atomman/defect/Strain.pyx":188
  *         """
  *         self.__G = None
  *         self.__strain = None             # <<<<<<<<<<<<<<
  *         self.__invariant1 = None
  *         self.__invariant2 = None
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__strain, Py_None) < 0) __PYX_ERR(0, 171, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__strain, Py_None) < 0) __PYX_ERR(0, 188, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":172
+  /* "atomman/defect/Strain.pyx":189
  *         self.__G = None
  *         self.__strain = None
  *         self.__invariant1 = None             # <<<<<<<<<<<<<<
  *         self.__invariant2 = None
  *         self.__invariant3 = None
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant1, Py_None) < 0) __PYX_ERR(0, 172, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant1, Py_None) < 0) __PYX_ERR(0, 189, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":173
+  /* "atomman/defect/Strain.pyx":190
  *         self.__strain = None
  *         self.__invariant1 = None
  *         self.__invariant2 = None             # <<<<<<<<<<<<<<
  *         self.__invariant3 = None
  *         self.__angularvelocity = None
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant2, Py_None) < 0) __PYX_ERR(0, 173, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant2, Py_None) < 0) __PYX_ERR(0, 190, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":174
+  /* "atomman/defect/Strain.pyx":191
  *         self.__invariant1 = None
  *         self.__invariant2 = None
  *         self.__invariant3 = None             # <<<<<<<<<<<<<<
  *         self.__angularvelocity = None
  *         self.__rotation = None
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant3, Py_None) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant3, Py_None) < 0) __PYX_ERR(0, 191, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":175
+  /* "atomman/defect/Strain.pyx":192
  *         self.__invariant2 = None
  *         self.__invariant3 = None
  *         self.__angularvelocity = None             # <<<<<<<<<<<<<<
  *         self.__rotation = None
  *         self.__nye = None
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__angularvelocity, Py_None) < 0) __PYX_ERR(0, 175, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__angularvelocity, Py_None) < 0) __PYX_ERR(0, 192, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":176
+  /* "atomman/defect/Strain.pyx":193
  *         self.__invariant3 = None
  *         self.__angularvelocity = None
  *         self.__rotation = None             # <<<<<<<<<<<<<<
  *         self.__nye = None
  * 
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__rotation, Py_None) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__rotation, Py_None) < 0) __PYX_ERR(0, 193, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":177
+  /* "atomman/defect/Strain.pyx":194
  *         self.__angularvelocity = None
  *         self.__rotation = None
  *         self.__nye = None             # <<<<<<<<<<<<<<
  * 
  *     def save_to_system(self, properties=None):
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nye, Py_None) < 0) __PYX_ERR(0, 177, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nye, Py_None) < 0) __PYX_ERR(0, 194, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":165
+  /* "atomman/defect/Strain.pyx":182
  *         return self.__nye
  * 
  *     def clear_properties(self):             # <<<<<<<<<<<<<<
@@ -4473,7 +4701,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_28clear_properties(CY
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":179
+/* "atomman/defect/Strain.pyx":196
  *         self.__nye = None
  * 
  *     def save_to_system(self, properties=None):             # <<<<<<<<<<<<<<
@@ -4482,10 +4710,10 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_28clear_properties(CY
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_31save_to_system(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_30save_to_system[] = "\n        Saves the computed per-atom strain properties to the given system.\n\n        Parameters\n        ----------\n        properties : str or list, optional\n            One or more properties.  If not given, will include strain,\n            invariant1, invariant2, invariant3, angularvelocity and nye.\n        ";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_31save_to_system = {"save_to_system", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_31save_to_system, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_30save_to_system};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_31save_to_system(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_35save_to_system(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_34save_to_system[] = "\n        Saves the computed per-atom strain properties to the given system.\n\n        Parameters\n        ----------\n        properties : str or list, optional\n            One or more properties.  If not given, will include strain,\n            invariant1, invariant2, invariant3, angularvelocity and nye.\n        ";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_35save_to_system = {"save_to_system", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_35save_to_system, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_34save_to_system};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_35save_to_system(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
   PyObject *__pyx_v_properties = 0;
   int __pyx_lineno = 0;
@@ -4522,7 +4750,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_31save_to_system(PyOb
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "save_to_system") < 0)) __PYX_ERR(0, 179, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "save_to_system") < 0)) __PYX_ERR(0, 196, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4538,20 +4766,20 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_31save_to_system(PyOb
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("save_to_system", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 179, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("save_to_system", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 196, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("atomman.defect.Strain.Strain.save_to_system", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(__pyx_self, __pyx_v_self, __pyx_v_properties);
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_34save_to_system(__pyx_self, __pyx_v_self, __pyx_v_properties);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_properties) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34save_to_system(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_properties) {
   PyObject *__pyx_v_defaultkeys = NULL;
   PyObject *__pyx_v_allkeys = NULL;
   PyObject *__pyx_v_p = NULL;
@@ -4571,14 +4799,14 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
   __Pyx_RefNannySetupContext("save_to_system", 0);
   __Pyx_INCREF(__pyx_v_properties);
 
-  /* "atomman/defect/Strain.pyx":189
+  /* "atomman/defect/Strain.pyx":206
  *             invariant1, invariant2, invariant3, angularvelocity and nye.
  *         """
  *         defaultkeys = ['strain', 'invariant1', 'invariant2', 'invariant3',             # <<<<<<<<<<<<<<
  *                        'angularvelocity', 'nye']
  *         allkeys = ['G', 'rotation'] + defaultkeys
  */
-  __pyx_t_1 = PyList_New(6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 189, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_u_strain);
   __Pyx_GIVEREF(__pyx_n_u_strain);
@@ -4601,14 +4829,14 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
   __pyx_v_defaultkeys = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":191
+  /* "atomman/defect/Strain.pyx":208
  *         defaultkeys = ['strain', 'invariant1', 'invariant2', 'invariant3',
  *                        'angularvelocity', 'nye']
  *         allkeys = ['G', 'rotation'] + defaultkeys             # <<<<<<<<<<<<<<
  * 
  *         if properties is None:
  */
-  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 208, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_u_G);
   __Pyx_GIVEREF(__pyx_n_u_G);
@@ -4616,13 +4844,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
   __Pyx_INCREF(__pyx_n_u_rotation);
   __Pyx_GIVEREF(__pyx_n_u_rotation);
   PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_u_rotation);
-  __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_defaultkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 191, __pyx_L1_error)
+  __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_defaultkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 208, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_allkeys = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "atomman/defect/Strain.pyx":193
+  /* "atomman/defect/Strain.pyx":210
  *         allkeys = ['G', 'rotation'] + defaultkeys
  * 
  *         if properties is None:             # <<<<<<<<<<<<<<
@@ -4633,7 +4861,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
   __pyx_t_4 = (__pyx_t_3 != 0);
   if (__pyx_t_4) {
 
-    /* "atomman/defect/Strain.pyx":194
+    /* "atomman/defect/Strain.pyx":211
  * 
  *         if properties is None:
  *             properties = defaultkeys             # <<<<<<<<<<<<<<
@@ -4643,7 +4871,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
     __Pyx_INCREF(__pyx_v_defaultkeys);
     __Pyx_DECREF_SET(__pyx_v_properties, __pyx_v_defaultkeys);
 
-    /* "atomman/defect/Strain.pyx":193
+    /* "atomman/defect/Strain.pyx":210
  *         allkeys = ['G', 'rotation'] + defaultkeys
  * 
  *         if properties is None:             # <<<<<<<<<<<<<<
@@ -4653,7 +4881,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":196
+  /* "atomman/defect/Strain.pyx":213
  *             properties = defaultkeys
  *         else:
  *             properties = aslist(properties)             # <<<<<<<<<<<<<<
@@ -4661,7 +4889,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
  *             assert p in allkeys, 'unknown property ' + p
  */
   /*else*/ {
-    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_aslist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_aslist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 213, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
@@ -4675,7 +4903,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
     }
     __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v_properties) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_properties);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 213, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF_SET(__pyx_v_properties, __pyx_t_2);
@@ -4683,7 +4911,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
   }
   __pyx_L3:;
 
-  /* "atomman/defect/Strain.pyx":197
+  /* "atomman/defect/Strain.pyx":214
  *         else:
  *             properties = aslist(properties)
  *         for p in properties:             # <<<<<<<<<<<<<<
@@ -4694,26 +4922,26 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
     __pyx_t_2 = __pyx_v_properties; __Pyx_INCREF(__pyx_t_2); __pyx_t_6 = 0;
     __pyx_t_7 = NULL;
   } else {
-    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_properties); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 197, __pyx_L1_error)
+    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_properties); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_7 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 197, __pyx_L1_error)
+    __pyx_t_7 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 214, __pyx_L1_error)
   }
   for (;;) {
     if (likely(!__pyx_t_7)) {
       if (likely(PyList_CheckExact(__pyx_t_2))) {
         if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 197, __pyx_L1_error)
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 214, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 197, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 214, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       } else {
         if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 197, __pyx_L1_error)
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 214, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 197, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 214, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       }
@@ -4723,7 +4951,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 197, __pyx_L1_error)
+          else __PYX_ERR(0, 214, __pyx_L1_error)
         }
         break;
       }
@@ -4732,7 +4960,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
     __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_1);
     __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":198
+    /* "atomman/defect/Strain.pyx":215
  *             properties = aslist(properties)
  *         for p in properties:
  *             assert p in allkeys, 'unknown property ' + p             # <<<<<<<<<<<<<<
@@ -4741,42 +4969,42 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
  */
     #ifndef CYTHON_WITHOUT_ASSERTIONS
     if (unlikely(!Py_OptimizeFlag)) {
-      __pyx_t_4 = (__Pyx_PySequence_ContainsTF(__pyx_v_p, __pyx_v_allkeys, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 198, __pyx_L1_error)
+      __pyx_t_4 = (__Pyx_PySequence_ContainsTF(__pyx_v_p, __pyx_v_allkeys, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 215, __pyx_L1_error)
       if (unlikely(!(__pyx_t_4 != 0))) {
-        __pyx_t_1 = PyNumber_Add(__pyx_kp_u_unknown_property, __pyx_v_p); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __pyx_t_1 = PyNumber_Add(__pyx_kp_u_unknown_property, __pyx_v_p); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 215, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_5 = PyTuple_Pack(1, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __pyx_t_5 = PyTuple_Pack(1, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 215, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         PyErr_SetObject(PyExc_AssertionError, __pyx_t_5);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __PYX_ERR(0, 198, __pyx_L1_error)
+        __PYX_ERR(0, 215, __pyx_L1_error)
       }
     }
     #endif
 
-    /* "atomman/defect/Strain.pyx":199
+    /* "atomman/defect/Strain.pyx":216
  *         for p in properties:
  *             assert p in allkeys, 'unknown property ' + p
  *             self.system.atoms.view[p] = getattr(self, p)             # <<<<<<<<<<<<<<
  * 
  *     def asdict(self, properties=None):
  */
-    __pyx_t_5 = __Pyx_GetAttr(__pyx_v_self, __pyx_v_p); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 199, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_GetAttr(__pyx_v_self, __pyx_v_p); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_system); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 199, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_system); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_atoms); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 199, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_atoms); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 216, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_view); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 199, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_view); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(PyObject_SetItem(__pyx_t_1, __pyx_v_p, __pyx_t_5) < 0)) __PYX_ERR(0, 199, __pyx_L1_error)
+    if (unlikely(PyObject_SetItem(__pyx_t_1, __pyx_v_p, __pyx_t_5) < 0)) __PYX_ERR(0, 216, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "atomman/defect/Strain.pyx":197
+    /* "atomman/defect/Strain.pyx":214
  *         else:
  *             properties = aslist(properties)
  *         for p in properties:             # <<<<<<<<<<<<<<
@@ -4786,7 +5014,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "atomman/defect/Strain.pyx":179
+  /* "atomman/defect/Strain.pyx":196
  *         self.__nye = None
  * 
  *     def save_to_system(self, properties=None):             # <<<<<<<<<<<<<<
@@ -4814,7 +5042,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":201
+/* "atomman/defect/Strain.pyx":218
  *             self.system.atoms.view[p] = getattr(self, p)
  * 
  *     def asdict(self, properties=None):             # <<<<<<<<<<<<<<
@@ -4823,10 +5051,10 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_30save_to_system(CYTH
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_33asdict(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_32asdict[] = "\n        Returns a dictionary containing the computed per-atom strain properties.\n        This corresponds to the results from the old nye_tensor function.\n\n        Parameters\n        ----------\n        properties : str or list, optional\n            One or more properties.  If not given, will include strain,\n            invariant1, invariant2, invariant3, angularvelocity and nye.\n\n        Returns\n        -------\n        dict\n            Containing each of the computed properties.\n        ";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_33asdict = {"asdict", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_33asdict, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_32asdict};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_33asdict(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_37asdict(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_36asdict[] = "\n        Returns a dictionary containing the computed per-atom strain properties.\n        This corresponds to the results from the old nye_tensor function.\n\n        Parameters\n        ----------\n        properties : str or list, optional\n            One or more properties.  If not given, will include strain,\n            invariant1, invariant2, invariant3, angularvelocity and nye.\n\n        Returns\n        -------\n        dict\n            Containing each of the computed properties.\n        ";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_37asdict = {"asdict", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_37asdict, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_36asdict};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_37asdict(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
   PyObject *__pyx_v_properties = 0;
   int __pyx_lineno = 0;
@@ -4863,7 +5091,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_33asdict(PyObject *__
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "asdict") < 0)) __PYX_ERR(0, 201, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "asdict") < 0)) __PYX_ERR(0, 218, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4879,20 +5107,20 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_33asdict(PyObject *__
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("asdict", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 201, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("asdict", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 218, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("atomman.defect.Strain.Strain.asdict", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(__pyx_self, __pyx_v_self, __pyx_v_properties);
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_36asdict(__pyx_self, __pyx_v_self, __pyx_v_properties);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_properties) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36asdict(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_properties) {
   PyObject *__pyx_v_defaultkeys = NULL;
   PyObject *__pyx_v_allkeys = NULL;
   PyObject *__pyx_v_results = NULL;
@@ -4912,14 +5140,14 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
   __Pyx_RefNannySetupContext("asdict", 0);
   __Pyx_INCREF(__pyx_v_properties);
 
-  /* "atomman/defect/Strain.pyx":217
+  /* "atomman/defect/Strain.pyx":234
  *             Containing each of the computed properties.
  *         """
  *         defaultkeys = ['strain', 'invariant1', 'invariant2', 'invariant3',             # <<<<<<<<<<<<<<
  *                        'angularvelocity', 'nye']
  *         allkeys = ['G', 'rotation'] + defaultkeys
  */
-  __pyx_t_1 = PyList_New(6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 217, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_u_strain);
   __Pyx_GIVEREF(__pyx_n_u_strain);
@@ -4942,14 +5170,14 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
   __pyx_v_defaultkeys = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":219
+  /* "atomman/defect/Strain.pyx":236
  *         defaultkeys = ['strain', 'invariant1', 'invariant2', 'invariant3',
  *                        'angularvelocity', 'nye']
  *         allkeys = ['G', 'rotation'] + defaultkeys             # <<<<<<<<<<<<<<
  *         results = {}
  *         if properties is None:
  */
-  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_u_G);
   __Pyx_GIVEREF(__pyx_n_u_G);
@@ -4957,25 +5185,25 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
   __Pyx_INCREF(__pyx_n_u_rotation);
   __Pyx_GIVEREF(__pyx_n_u_rotation);
   PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_u_rotation);
-  __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_defaultkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_defaultkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_allkeys = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "atomman/defect/Strain.pyx":220
+  /* "atomman/defect/Strain.pyx":237
  *                        'angularvelocity', 'nye']
  *         allkeys = ['G', 'rotation'] + defaultkeys
  *         results = {}             # <<<<<<<<<<<<<<
  *         if properties is None:
  *             properties = defaultkeys
  */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 220, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 237, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_v_results = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "atomman/defect/Strain.pyx":221
+  /* "atomman/defect/Strain.pyx":238
  *         allkeys = ['G', 'rotation'] + defaultkeys
  *         results = {}
  *         if properties is None:             # <<<<<<<<<<<<<<
@@ -4986,7 +5214,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
   __pyx_t_4 = (__pyx_t_3 != 0);
   if (__pyx_t_4) {
 
-    /* "atomman/defect/Strain.pyx":222
+    /* "atomman/defect/Strain.pyx":239
  *         results = {}
  *         if properties is None:
  *             properties = defaultkeys             # <<<<<<<<<<<<<<
@@ -4996,7 +5224,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
     __Pyx_INCREF(__pyx_v_defaultkeys);
     __Pyx_DECREF_SET(__pyx_v_properties, __pyx_v_defaultkeys);
 
-    /* "atomman/defect/Strain.pyx":221
+    /* "atomman/defect/Strain.pyx":238
  *         allkeys = ['G', 'rotation'] + defaultkeys
  *         results = {}
  *         if properties is None:             # <<<<<<<<<<<<<<
@@ -5006,7 +5234,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":224
+  /* "atomman/defect/Strain.pyx":241
  *             properties = defaultkeys
  *         else:
  *             properties = aslist(properties)             # <<<<<<<<<<<<<<
@@ -5014,7 +5242,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
  *         results = {}
  */
   /*else*/ {
-    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_aslist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 224, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_aslist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
@@ -5028,7 +5256,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
     }
     __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v_properties) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_properties);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 224, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 241, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF_SET(__pyx_v_properties, __pyx_t_2);
@@ -5036,19 +5264,19 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
   }
   __pyx_L3:;
 
-  /* "atomman/defect/Strain.pyx":226
+  /* "atomman/defect/Strain.pyx":243
  *             properties = aslist(properties)
  * 
  *         results = {}             # <<<<<<<<<<<<<<
  *         for p in properties:
  *             assert p in allkeys, 'unknown property ' + p
  */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 226, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 243, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF_SET(__pyx_v_results, ((PyObject*)__pyx_t_2));
   __pyx_t_2 = 0;
 
-  /* "atomman/defect/Strain.pyx":227
+  /* "atomman/defect/Strain.pyx":244
  * 
  *         results = {}
  *         for p in properties:             # <<<<<<<<<<<<<<
@@ -5059,26 +5287,26 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
     __pyx_t_2 = __pyx_v_properties; __Pyx_INCREF(__pyx_t_2); __pyx_t_6 = 0;
     __pyx_t_7 = NULL;
   } else {
-    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_properties); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 227, __pyx_L1_error)
+    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_properties); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 244, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_7 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 227, __pyx_L1_error)
+    __pyx_t_7 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 244, __pyx_L1_error)
   }
   for (;;) {
     if (likely(!__pyx_t_7)) {
       if (likely(PyList_CheckExact(__pyx_t_2))) {
         if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 227, __pyx_L1_error)
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 244, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 227, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       } else {
         if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 227, __pyx_L1_error)
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 244, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 227, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       }
@@ -5088,7 +5316,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 227, __pyx_L1_error)
+          else __PYX_ERR(0, 244, __pyx_L1_error)
         }
         break;
       }
@@ -5097,7 +5325,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
     __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_1);
     __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":228
+    /* "atomman/defect/Strain.pyx":245
  *         results = {}
  *         for p in properties:
  *             assert p in allkeys, 'unknown property ' + p             # <<<<<<<<<<<<<<
@@ -5106,33 +5334,33 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
  */
     #ifndef CYTHON_WITHOUT_ASSERTIONS
     if (unlikely(!Py_OptimizeFlag)) {
-      __pyx_t_4 = (__Pyx_PySequence_ContainsTF(__pyx_v_p, __pyx_v_allkeys, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 228, __pyx_L1_error)
+      __pyx_t_4 = (__Pyx_PySequence_ContainsTF(__pyx_v_p, __pyx_v_allkeys, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 245, __pyx_L1_error)
       if (unlikely(!(__pyx_t_4 != 0))) {
-        __pyx_t_1 = PyNumber_Add(__pyx_kp_u_unknown_property, __pyx_v_p); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 228, __pyx_L1_error)
+        __pyx_t_1 = PyNumber_Add(__pyx_kp_u_unknown_property, __pyx_v_p); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 245, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_5 = PyTuple_Pack(1, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 228, __pyx_L1_error)
+        __pyx_t_5 = PyTuple_Pack(1, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 245, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         PyErr_SetObject(PyExc_AssertionError, __pyx_t_5);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __PYX_ERR(0, 228, __pyx_L1_error)
+        __PYX_ERR(0, 245, __pyx_L1_error)
       }
     }
     #endif
 
-    /* "atomman/defect/Strain.pyx":229
+    /* "atomman/defect/Strain.pyx":246
  *         for p in properties:
  *             assert p in allkeys, 'unknown property ' + p
  *             results[p] = getattr(self, p)             # <<<<<<<<<<<<<<
  * 
  *         return results
  */
-    __pyx_t_5 = __Pyx_GetAttr(__pyx_v_self, __pyx_v_p); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 229, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_GetAttr(__pyx_v_self, __pyx_v_p); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 246, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    if (unlikely(PyDict_SetItem(__pyx_v_results, __pyx_v_p, __pyx_t_5) < 0)) __PYX_ERR(0, 229, __pyx_L1_error)
+    if (unlikely(PyDict_SetItem(__pyx_v_results, __pyx_v_p, __pyx_t_5) < 0)) __PYX_ERR(0, 246, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "atomman/defect/Strain.pyx":227
+    /* "atomman/defect/Strain.pyx":244
  * 
  *         results = {}
  *         for p in properties:             # <<<<<<<<<<<<<<
@@ -5142,7 +5370,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "atomman/defect/Strain.pyx":231
+  /* "atomman/defect/Strain.pyx":248
  *             results[p] = getattr(self, p)
  * 
  *         return results             # <<<<<<<<<<<<<<
@@ -5154,7 +5382,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
   __pyx_r = __pyx_v_results;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":201
+  /* "atomman/defect/Strain.pyx":218
  *             self.system.atoms.view[p] = getattr(self, p)
  * 
  *     def asdict(self, properties=None):             # <<<<<<<<<<<<<<
@@ -5180,7 +5408,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":233
+/* "atomman/defect/Strain.pyx":250
  *         return results
  * 
  *     def set_p_vectors(self, p_vectors, axes=None):             # <<<<<<<<<<<<<<
@@ -5189,10 +5417,10 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_32asdict(CYTHON_UNUSE
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_35set_p_vectors(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_34set_p_vectors[] = "\n        Sets the p vectors for each atom according to a single p vector set to use\n        for all atoms or a list of p vector sets defined for each atom individually.\n\n        Parameters\n        ----------\n        p_vectors : array-like object\n            List(s) of radial distance vectors between each atom and its nearest\n            neighbors in a perfect crystal setting.  If one list of p_vectors is\n            given, then it is applied to all atoms.\n        axes : array-like object, optional\n            3x3 array of right-handed orthogonal axes.  If given, will be used to\n            transform the p_vectors before computing the Nye tensor.\n        ";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_35set_p_vectors = {"set_p_vectors", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_35set_p_vectors, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_34set_p_vectors};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_35set_p_vectors(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_39set_p_vectors(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_38set_p_vectors[] = "\n        Sets the p vectors for each atom according to a single p vector set to use\n        for all atoms or a list of p vector sets defined for each atom individually.\n\n        Parameters\n        ----------\n        p_vectors : array-like object\n            List(s) of radial distance vectors between each atom and its nearest\n            neighbors in a perfect crystal setting.  If one list of p_vectors is\n            given, then it is applied to all atoms.\n        axes : array-like object, optional\n            3x3 array of right-handed orthogonal axes.  If given, will be used to\n            transform the p_vectors before computing the Nye tensor.\n        ";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_39set_p_vectors = {"set_p_vectors", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_39set_p_vectors, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_38set_p_vectors};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_39set_p_vectors(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
   PyObject *__pyx_v_p_vectors = 0;
   PyObject *__pyx_v_axes = 0;
@@ -5228,7 +5456,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_35set_p_vectors(PyObj
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_p_vectors)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("set_p_vectors", 0, 2, 3, 1); __PYX_ERR(0, 233, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("set_p_vectors", 0, 2, 3, 1); __PYX_ERR(0, 250, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -5238,7 +5466,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_35set_p_vectors(PyObj
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_p_vectors") < 0)) __PYX_ERR(0, 233, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_p_vectors") < 0)) __PYX_ERR(0, 250, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -5256,20 +5484,20 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_35set_p_vectors(PyObj
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_p_vectors", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 233, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_p_vectors", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 250, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("atomman.defect.Strain.Strain.set_p_vectors", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(__pyx_self, __pyx_v_self, __pyx_v_p_vectors, __pyx_v_axes);
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_38set_p_vectors(__pyx_self, __pyx_v_self, __pyx_v_p_vectors, __pyx_v_axes);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_p_vectors, PyObject *__pyx_v_axes) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_38set_p_vectors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_p_vectors, PyObject *__pyx_v_axes) {
   PyObject *__pyx_v_system = NULL;
   Py_ssize_t __pyx_v_i;
   PyObject *__pyx_r = NULL;
@@ -5291,50 +5519,50 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
   __Pyx_RefNannySetupContext("set_p_vectors", 0);
   __Pyx_INCREF(__pyx_v_p_vectors);
 
-  /* "atomman/defect/Strain.pyx":248
+  /* "atomman/defect/Strain.pyx":265
  *             transform the p_vectors before computing the Nye tensor.
  *         """
  *         system = self.system             # <<<<<<<<<<<<<<
  * 
  *         # Broadcast a single p_vectors list to all atoms
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_system); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_system); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_system = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":251
+  /* "atomman/defect/Strain.pyx":268
  * 
  *         # Broadcast a single p_vectors list to all atoms
  *         if len(p_vectors) == 1:             # <<<<<<<<<<<<<<
  *             p_vectors = np.broadcast_to(p_vectors, (system.natoms, len(p_vectors[0]), 3))
  *         elif len(p_vectors) != system.natoms:
  */
-  __pyx_t_2 = PyObject_Length(__pyx_v_p_vectors); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 251, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(__pyx_v_p_vectors); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 268, __pyx_L1_error)
   __pyx_t_3 = ((__pyx_t_2 == 1) != 0);
   if (__pyx_t_3) {
 
-    /* "atomman/defect/Strain.pyx":252
+    /* "atomman/defect/Strain.pyx":269
  *         # Broadcast a single p_vectors list to all atoms
  *         if len(p_vectors) == 1:
  *             p_vectors = np.broadcast_to(p_vectors, (system.natoms, len(p_vectors[0]), 3))             # <<<<<<<<<<<<<<
  *         elif len(p_vectors) != system.natoms:
  *             p_vectors = np.broadcast_to(p_vectors, (system.natoms, len(p_vectors), 3))
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 269, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_broadcast_to); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_broadcast_to); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 269, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_natoms); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_natoms); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 269, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_p_vectors, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_p_vectors, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 269, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = PyObject_Length(__pyx_t_6); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 252, __pyx_L1_error)
+    __pyx_t_2 = PyObject_Length(__pyx_t_6); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 269, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __pyx_t_6 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 269, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 269, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_GIVEREF(__pyx_t_4);
     PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4);
@@ -5360,7 +5588,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_5)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_p_vectors, __pyx_t_7};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
@@ -5369,14 +5597,14 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_p_vectors, __pyx_t_7};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     } else
     #endif
     {
-      __pyx_t_4 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 252, __pyx_L1_error)
+      __pyx_t_4 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 269, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       if (__pyx_t_6) {
         __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6); __pyx_t_6 = NULL;
@@ -5387,7 +5615,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
       __Pyx_GIVEREF(__pyx_t_7);
       PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_8, __pyx_t_7);
       __pyx_t_7 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
@@ -5395,7 +5623,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     __Pyx_DECREF_SET(__pyx_v_p_vectors, __pyx_t_1);
     __pyx_t_1 = 0;
 
-    /* "atomman/defect/Strain.pyx":251
+    /* "atomman/defect/Strain.pyx":268
  * 
  *         # Broadcast a single p_vectors list to all atoms
  *         if len(p_vectors) == 1:             # <<<<<<<<<<<<<<
@@ -5405,43 +5633,43 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":253
+  /* "atomman/defect/Strain.pyx":270
  *         if len(p_vectors) == 1:
  *             p_vectors = np.broadcast_to(p_vectors, (system.natoms, len(p_vectors[0]), 3))
  *         elif len(p_vectors) != system.natoms:             # <<<<<<<<<<<<<<
  *             p_vectors = np.broadcast_to(p_vectors, (system.natoms, len(p_vectors), 3))
  *         else:
  */
-  __pyx_t_2 = PyObject_Length(__pyx_v_p_vectors); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 253, __pyx_L1_error)
-  __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(__pyx_v_p_vectors); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 270, __pyx_L1_error)
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 270, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_natoms); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_natoms); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 270, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyObject_RichCompare(__pyx_t_1, __pyx_t_5, Py_NE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __pyx_t_4 = PyObject_RichCompare(__pyx_t_1, __pyx_t_5, Py_NE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 270, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 270, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   if (__pyx_t_3) {
 
-    /* "atomman/defect/Strain.pyx":254
+    /* "atomman/defect/Strain.pyx":271
  *             p_vectors = np.broadcast_to(p_vectors, (system.natoms, len(p_vectors[0]), 3))
  *         elif len(p_vectors) != system.natoms:
  *             p_vectors = np.broadcast_to(p_vectors, (system.natoms, len(p_vectors), 3))             # <<<<<<<<<<<<<<
  *         else:
  *             for i in range(len(p_vectors)):
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 254, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 271, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_broadcast_to); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_broadcast_to); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 271, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_natoms); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 254, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_natoms); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 271, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_2 = PyObject_Length(__pyx_v_p_vectors); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 254, __pyx_L1_error)
-    __pyx_t_7 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 254, __pyx_L1_error)
+    __pyx_t_2 = PyObject_Length(__pyx_v_p_vectors); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 271, __pyx_L1_error)
+    __pyx_t_7 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 271, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 254, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 271, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_GIVEREF(__pyx_t_5);
     PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
@@ -5467,7 +5695,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_1)) {
       PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_v_p_vectors, __pyx_t_6};
-      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 271, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -5476,14 +5704,14 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
       PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_v_p_vectors, __pyx_t_6};
-      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 271, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     } else
     #endif
     {
-      __pyx_t_5 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 254, __pyx_L1_error)
+      __pyx_t_5 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 271, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       if (__pyx_t_7) {
         __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -5494,7 +5722,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
       __Pyx_GIVEREF(__pyx_t_6);
       PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_8, __pyx_t_6);
       __pyx_t_6 = 0;
-      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 271, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
@@ -5502,7 +5730,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     __Pyx_DECREF_SET(__pyx_v_p_vectors, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "atomman/defect/Strain.pyx":253
+    /* "atomman/defect/Strain.pyx":270
  *         if len(p_vectors) == 1:
  *             p_vectors = np.broadcast_to(p_vectors, (system.natoms, len(p_vectors[0]), 3))
  *         elif len(p_vectors) != system.natoms:             # <<<<<<<<<<<<<<
@@ -5512,7 +5740,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":256
+  /* "atomman/defect/Strain.pyx":273
  *             p_vectors = np.broadcast_to(p_vectors, (system.natoms, len(p_vectors), 3))
  *         else:
  *             for i in range(len(p_vectors)):             # <<<<<<<<<<<<<<
@@ -5520,24 +5748,24 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
  *                 if p_vectors[i].ndim == 1:
  */
   /*else*/ {
-    __pyx_t_2 = PyObject_Length(__pyx_v_p_vectors); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 256, __pyx_L1_error)
+    __pyx_t_2 = PyObject_Length(__pyx_v_p_vectors); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 273, __pyx_L1_error)
     __pyx_t_9 = __pyx_t_2;
     for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
       __pyx_v_i = __pyx_t_10;
 
-      /* "atomman/defect/Strain.pyx":257
+      /* "atomman/defect/Strain.pyx":274
  *         else:
  *             for i in range(len(p_vectors)):
  *                 p_vectors[i] = np.asarray(p_vectors[i])             # <<<<<<<<<<<<<<
  *                 if p_vectors[i].ndim == 1:
  *                     p_vectors[i] = np.array([p_vectors[i]])
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 274, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_asarray); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 257, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_asarray); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 274, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_p_vectors, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_p_vectors, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 274, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __pyx_t_6 = NULL;
       if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
@@ -5552,46 +5780,46 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
       __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_6, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_1);
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 257, __pyx_L1_error)
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 274, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(__Pyx_SetItemInt(__pyx_v_p_vectors, __pyx_v_i, __pyx_t_4, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) __PYX_ERR(0, 257, __pyx_L1_error)
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_p_vectors, __pyx_v_i, __pyx_t_4, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) __PYX_ERR(0, 274, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "atomman/defect/Strain.pyx":258
+      /* "atomman/defect/Strain.pyx":275
  *             for i in range(len(p_vectors)):
  *                 p_vectors[i] = np.asarray(p_vectors[i])
  *                 if p_vectors[i].ndim == 1:             # <<<<<<<<<<<<<<
  *                     p_vectors[i] = np.array([p_vectors[i]])
  *             p_vectors = np.asarray(p_vectors)
  */
-      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_p_vectors, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 258, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_p_vectors, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 275, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_ndim); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 258, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_ndim); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 275, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_t_5, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 258, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_t_5, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 275, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 258, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 275, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_3) {
 
-        /* "atomman/defect/Strain.pyx":259
+        /* "atomman/defect/Strain.pyx":276
  *                 p_vectors[i] = np.asarray(p_vectors[i])
  *                 if p_vectors[i].ndim == 1:
  *                     p_vectors[i] = np.array([p_vectors[i]])             # <<<<<<<<<<<<<<
  *             p_vectors = np.asarray(p_vectors)
  * 
  */
-        __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_array); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_array); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 276, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_t_5 = __Pyx_GetItemInt(__pyx_v_p_vectors, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_GetItemInt(__pyx_v_p_vectors, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 276, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_GIVEREF(__pyx_t_5);
         PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
@@ -5609,13 +5837,13 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
         __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_6);
         __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 259, __pyx_L1_error)
+        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 276, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_v_p_vectors, __pyx_v_i, __pyx_t_4, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) __PYX_ERR(0, 259, __pyx_L1_error)
+        if (unlikely(__Pyx_SetItemInt(__pyx_v_p_vectors, __pyx_v_i, __pyx_t_4, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) __PYX_ERR(0, 276, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-        /* "atomman/defect/Strain.pyx":258
+        /* "atomman/defect/Strain.pyx":275
  *             for i in range(len(p_vectors)):
  *                 p_vectors[i] = np.asarray(p_vectors[i])
  *                 if p_vectors[i].ndim == 1:             # <<<<<<<<<<<<<<
@@ -5625,16 +5853,16 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
       }
     }
 
-    /* "atomman/defect/Strain.pyx":260
+    /* "atomman/defect/Strain.pyx":277
  *                 if p_vectors[i].ndim == 1:
  *                     p_vectors[i] = np.array([p_vectors[i]])
  *             p_vectors = np.asarray(p_vectors)             # <<<<<<<<<<<<<<
  * 
  *         # Transform p_vectors if axes is given
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_asarray); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 260, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_asarray); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 277, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_1 = NULL;
@@ -5649,7 +5877,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     }
     __pyx_t_4 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_v_p_vectors) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_p_vectors);
     __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 260, __pyx_L1_error)
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 277, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF_SET(__pyx_v_p_vectors, __pyx_t_4);
@@ -5657,7 +5885,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
   }
   __pyx_L3:;
 
-  /* "atomman/defect/Strain.pyx":263
+  /* "atomman/defect/Strain.pyx":280
  * 
  *         # Transform p_vectors if axes is given
  *         if axes is not None:             # <<<<<<<<<<<<<<
@@ -5668,19 +5896,19 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
   __pyx_t_11 = (__pyx_t_3 != 0);
   if (__pyx_t_11) {
 
-    /* "atomman/defect/Strain.pyx":264
+    /* "atomman/defect/Strain.pyx":281
  *         # Transform p_vectors if axes is given
  *         if axes is not None:
  *             p_vectors = np.inner(p_vectors, axes_check(axes))             # <<<<<<<<<<<<<<
  * 
  *         self.__p_vectors = p_vectors
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 281, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_inner); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_inner); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_axes_check); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_axes_check); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 281, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __pyx_t_7 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
@@ -5694,7 +5922,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     }
     __pyx_t_6 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_7, __pyx_v_axes) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_axes);
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 264, __pyx_L1_error)
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 281, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __pyx_t_5 = NULL;
@@ -5712,7 +5940,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_1)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_p_vectors, __pyx_t_6};
-      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 264, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 281, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -5721,14 +5949,14 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_p_vectors, __pyx_t_6};
-      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 264, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 281, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 264, __pyx_L1_error)
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 281, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       if (__pyx_t_5) {
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -5739,7 +5967,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
       __Pyx_GIVEREF(__pyx_t_6);
       PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_8, __pyx_t_6);
       __pyx_t_6 = 0;
-      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 264, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 281, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
@@ -5747,7 +5975,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
     __Pyx_DECREF_SET(__pyx_v_p_vectors, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "atomman/defect/Strain.pyx":263
+    /* "atomman/defect/Strain.pyx":280
  * 
  *         # Transform p_vectors if axes is given
  *         if axes is not None:             # <<<<<<<<<<<<<<
@@ -5756,16 +5984,16 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
  */
   }
 
-  /* "atomman/defect/Strain.pyx":266
+  /* "atomman/defect/Strain.pyx":283
  *             p_vectors = np.inner(p_vectors, axes_check(axes))
  * 
  *         self.__p_vectors = p_vectors             # <<<<<<<<<<<<<<
  * 
  *     def build_p_vectors(self, basesystem, neighbors=None, cutoff=None):
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors, __pyx_v_p_vectors) < 0) __PYX_ERR(0, 266, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors, __pyx_v_p_vectors) < 0) __PYX_ERR(0, 283, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":233
+  /* "atomman/defect/Strain.pyx":250
  *         return results
  * 
  *     def set_p_vectors(self, p_vectors, axes=None):             # <<<<<<<<<<<<<<
@@ -5792,7 +6020,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":268
+/* "atomman/defect/Strain.pyx":285
  *         self.__p_vectors = p_vectors
  * 
  *     def build_p_vectors(self, basesystem, neighbors=None, cutoff=None):             # <<<<<<<<<<<<<<
@@ -5801,10 +6029,10 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_34set_p_vectors(CYTHO
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_37build_p_vectors(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_36build_p_vectors[] = "\n        Builds the p vectors for each atom based on a reference system.\n\n        Parameters\n        ----------\n        basesystem : atomman.system\n            The base/reference system to use.  This should be a defect-free\n            perfect crystal system with atom ids directly corresponding to atoms\n            in any system that you want to analyze with the Nye tensor.\n        neighbors : atomman.NeighborList, optional\n            The neighbor list associated with system to use.  Either neighbors\n            or cutoff must be given, or system must have a neighbors attribute.\n        cutoff : float\n            Cutoff distance for computing a neighbor list for system.  Either\n            neighbors or cutoff must be given, or system have a neighbors\n            attribute.\n        ";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_37build_p_vectors = {"build_p_vectors", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_37build_p_vectors, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_36build_p_vectors};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_37build_p_vectors(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_41build_p_vectors(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_40build_p_vectors[] = "\n        Builds the p vectors for each atom based on a reference system.\n\n        Parameters\n        ----------\n        basesystem : atomman.system\n            The base/reference system to use.  This should be a defect-free\n            perfect crystal system with atom ids directly corresponding to atoms\n            in any system that you want to analyze with the Nye tensor.\n        neighbors : atomman.NeighborList, optional\n            The neighbor list associated with system to use.  Either neighbors\n            or cutoff must be given, or system must have a neighbors attribute.\n        cutoff : float\n            Cutoff distance for computing a neighbor list for system.  Either\n            neighbors or cutoff must be given, or system have a neighbors\n            attribute.\n        ";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_41build_p_vectors = {"build_p_vectors", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_41build_p_vectors, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_40build_p_vectors};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_41build_p_vectors(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
   PyObject *__pyx_v_basesystem = 0;
   PyObject *__pyx_v_neighbors = 0;
@@ -5844,7 +6072,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_37build_p_vectors(PyO
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_basesystem)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("build_p_vectors", 0, 2, 4, 1); __PYX_ERR(0, 268, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("build_p_vectors", 0, 2, 4, 1); __PYX_ERR(0, 285, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -5860,7 +6088,7 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_37build_p_vectors(PyO
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "build_p_vectors") < 0)) __PYX_ERR(0, 268, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "build_p_vectors") < 0)) __PYX_ERR(0, 285, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -5881,22 +6109,24 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_37build_p_vectors(PyO
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("build_p_vectors", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 268, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("build_p_vectors", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 285, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("atomman.defect.Strain.Strain.build_p_vectors", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(__pyx_self, __pyx_v_self, __pyx_v_basesystem, __pyx_v_neighbors, __pyx_v_cutoff);
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_40build_p_vectors(__pyx_self, __pyx_v_self, __pyx_v_basesystem, __pyx_v_neighbors, __pyx_v_cutoff);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_basesystem, PyObject *__pyx_v_neighbors, PyObject *__pyx_v_cutoff) {
-  PyObject *__pyx_v_p = NULL;
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_40build_p_vectors(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_basesystem, PyObject *__pyx_v_neighbors, PyObject *__pyx_v_cutoff) {
   PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_v_j = NULL;
+  PyObject *__pyx_v_vects = NULL;
+  PyObject *__pyx_v_p = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -5904,20 +6134,19 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYT
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *(*__pyx_t_7)(PyObject *);
-  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_8;
   PyObject *__pyx_t_9 = NULL;
-  int __pyx_t_10;
-  PyObject *__pyx_t_11 = NULL;
-  int __pyx_t_12;
+  PyObject *__pyx_t_10 = NULL;
+  Py_ssize_t __pyx_t_11;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("build_p_vectors", 0);
   __Pyx_INCREF(__pyx_v_neighbors);
 
-  /* "atomman/defect/Strain.pyx":288
+  /* "atomman/defect/Strain.pyx":305
  * 
  *         # Neighbor list setup
  *         if neighbors is not None:             # <<<<<<<<<<<<<<
@@ -5928,7 +6157,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYT
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "atomman/defect/Strain.pyx":289
+    /* "atomman/defect/Strain.pyx":306
  *         # Neighbor list setup
  *         if neighbors is not None:
  *             assert cutoff is None, 'neighbors and cutoff cannot both be given'             # <<<<<<<<<<<<<<
@@ -5940,12 +6169,12 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYT
       __pyx_t_2 = (__pyx_v_cutoff == Py_None);
       if (unlikely(!(__pyx_t_2 != 0))) {
         PyErr_SetObject(PyExc_AssertionError, __pyx_kp_u_neighbors_and_cutoff_cannot_both);
-        __PYX_ERR(0, 289, __pyx_L1_error)
+        __PYX_ERR(0, 306, __pyx_L1_error)
       }
     }
     #endif
 
-    /* "atomman/defect/Strain.pyx":288
+    /* "atomman/defect/Strain.pyx":305
  * 
  *         # Neighbor list setup
  *         if neighbors is not None:             # <<<<<<<<<<<<<<
@@ -5955,7 +6184,7 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYT
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":290
+  /* "atomman/defect/Strain.pyx":307
  *         if neighbors is not None:
  *             assert cutoff is None, 'neighbors and cutoff cannot both be given'
  *         elif cutoff is not None:             # <<<<<<<<<<<<<<
@@ -5966,27 +6195,27 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYT
   __pyx_t_1 = (__pyx_t_2 != 0);
   if (__pyx_t_1) {
 
-    /* "atomman/defect/Strain.pyx":291
+    /* "atomman/defect/Strain.pyx":308
  *             assert cutoff is None, 'neighbors and cutoff cannot both be given'
  *         elif cutoff is not None:
  *             neighbors = NeighborList(system=basesystem, cutoff=cutoff)             # <<<<<<<<<<<<<<
  *         elif hasattr(basesystem, 'neighbors'):
  *             neighbors = basesystem.neighbors
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_NeighborList); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 291, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_NeighborList); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 308, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 291, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 308, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_system, __pyx_v_basesystem) < 0) __PYX_ERR(0, 291, __pyx_L1_error)
-    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_cutoff, __pyx_v_cutoff) < 0) __PYX_ERR(0, 291, __pyx_L1_error)
-    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 291, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_system, __pyx_v_basesystem) < 0) __PYX_ERR(0, 308, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_cutoff, __pyx_v_cutoff) < 0) __PYX_ERR(0, 308, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 308, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF_SET(__pyx_v_neighbors, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "atomman/defect/Strain.pyx":290
+    /* "atomman/defect/Strain.pyx":307
  *         if neighbors is not None:
  *             assert cutoff is None, 'neighbors and cutoff cannot both be given'
  *         elif cutoff is not None:             # <<<<<<<<<<<<<<
@@ -5996,30 +6225,30 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYT
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":292
+  /* "atomman/defect/Strain.pyx":309
  *         elif cutoff is not None:
  *             neighbors = NeighborList(system=basesystem, cutoff=cutoff)
  *         elif hasattr(basesystem, 'neighbors'):             # <<<<<<<<<<<<<<
  *             neighbors = basesystem.neighbors
  *         else:
  */
-  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_basesystem, __pyx_n_u_neighbors); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 292, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_basesystem, __pyx_n_u_neighbors); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 309, __pyx_L1_error)
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (likely(__pyx_t_2)) {
 
-    /* "atomman/defect/Strain.pyx":293
+    /* "atomman/defect/Strain.pyx":310
  *             neighbors = NeighborList(system=basesystem, cutoff=cutoff)
  *         elif hasattr(basesystem, 'neighbors'):
  *             neighbors = basesystem.neighbors             # <<<<<<<<<<<<<<
  *         else:
  *             raise ValueError('neighbors or cutoff is required')
  */
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_basesystem, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 293, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_basesystem, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 310, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF_SET(__pyx_v_neighbors, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "atomman/defect/Strain.pyx":292
+    /* "atomman/defect/Strain.pyx":309
  *         elif cutoff is not None:
  *             neighbors = NeighborList(system=basesystem, cutoff=cutoff)
  *         elif hasattr(basesystem, 'neighbors'):             # <<<<<<<<<<<<<<
@@ -6029,191 +6258,380 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYT
     goto __pyx_L3;
   }
 
-  /* "atomman/defect/Strain.pyx":295
+  /* "atomman/defect/Strain.pyx":312
  *             neighbors = basesystem.neighbors
  *         else:
  *             raise ValueError('neighbors or cutoff is required')             # <<<<<<<<<<<<<<
  * 
- *         p = []
+ *         # Compute all neighbor vectors at once and split by atom
  */
   /*else*/ {
-    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 312, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_Raise(__pyx_t_5, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __PYX_ERR(0, 295, __pyx_L1_error)
+    __PYX_ERR(0, 312, __pyx_L1_error)
   }
   __pyx_L3:;
 
-  /* "atomman/defect/Strain.pyx":297
- *             raise ValueError('neighbors or cutoff is required')
- * 
- *         p = []             # <<<<<<<<<<<<<<
- *         for i in range(basesystem.natoms):
- *             p.append(basesystem.dvect(i, neighbors[i]))
- */
-  __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 297, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_v_p = ((PyObject*)__pyx_t_5);
-  __pyx_t_5 = 0;
-
-  /* "atomman/defect/Strain.pyx":298
- * 
- *         p = []
- *         for i in range(basesystem.natoms):             # <<<<<<<<<<<<<<
- *             p.append(basesystem.dvect(i, neighbors[i]))
+  /* "atomman/defect/Strain.pyx":315
  * 
+ *         # Compute all neighbor vectors at once and split by atom
+ *         i, j = pair_table(neighbors.nlist)             # <<<<<<<<<<<<<<
+ *         vects = basesystem.dvect(i, j).reshape(-1, 3)
+ *         p = np.split(vects, np.cumsum(neighbors.coord)[:-1])
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_basesystem, __pyx_n_s_natoms); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 298, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_pair_table); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 315, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
-    __pyx_t_5 = __pyx_t_4; __Pyx_INCREF(__pyx_t_5); __pyx_t_6 = 0;
-    __pyx_t_7 = NULL;
-  } else {
-    __pyx_t_6 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 298, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_7 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_neighbors, __pyx_n_s_nlist); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
   }
+  __pyx_t_5 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_7)) {
-      if (likely(PyList_CheckExact(__pyx_t_5))) {
-        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_5)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 298, __pyx_L1_error)
-        #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 298, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        #endif
-      } else {
-        if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 298, __pyx_L1_error)
-        #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 298, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        #endif
-      }
+  if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
+    PyObject* sequence = __pyx_t_5;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 2)) {
+      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 315, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
     } else {
-      __pyx_t_4 = __pyx_t_7(__pyx_t_5);
-      if (unlikely(!__pyx_t_4)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 298, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_4 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
     }
-    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_4);
-    __pyx_t_4 = 0;
-
-    /* "atomman/defect/Strain.pyx":299
- *         p = []
- *         for i in range(basesystem.natoms):
- *             p.append(basesystem.dvect(i, neighbors[i]))             # <<<<<<<<<<<<<<
- * 
- *         self.__p_vectors = np.asarray(p)
- */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_basesystem, __pyx_n_s_dvect); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 299, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_3);
+    #else
+    __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 315, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 315, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_v_neighbors, __pyx_v_i); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 299, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_9 = NULL;
-    __pyx_t_10 = 0;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_9)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_9);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_10 = 1;
-      }
-    }
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_3)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_v_i, __pyx_t_8};
-      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 299, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_v_i, __pyx_t_8};
-      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 299, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    } else
     #endif
-    {
-      __pyx_t_11 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 299, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_11);
-      if (__pyx_t_9) {
-        __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_9); __pyx_t_9 = NULL;
-      }
-      __Pyx_INCREF(__pyx_v_i);
-      __Pyx_GIVEREF(__pyx_v_i);
-      PyTuple_SET_ITEM(__pyx_t_11, 0+__pyx_t_10, __pyx_v_i);
-      __Pyx_GIVEREF(__pyx_t_8);
-      PyTuple_SET_ITEM(__pyx_t_11, 1+__pyx_t_10, __pyx_t_8);
-      __pyx_t_8 = 0;
-      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_11, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 299, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_p, __pyx_t_4); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 299, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-    /* "atomman/defect/Strain.pyx":298
- * 
- *         p = []
- *         for i in range(basesystem.natoms):             # <<<<<<<<<<<<<<
- *             p.append(basesystem.dvect(i, neighbors[i]))
- * 
- */
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_6 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 315, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_7 = Py_TYPE(__pyx_t_6)->tp_iternext;
+    index = 0; __pyx_t_4 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L4_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_4);
+    index = 1; __pyx_t_3 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_3)) goto __pyx_L4_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 315, __pyx_L1_error)
+    __pyx_t_7 = NULL;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    goto __pyx_L5_unpacking_done;
+    __pyx_L4_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_7 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 315, __pyx_L1_error)
+    __pyx_L5_unpacking_done:;
   }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_i = __pyx_t_4;
+  __pyx_t_4 = 0;
+  __pyx_v_j = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":301
- *             p.append(basesystem.dvect(i, neighbors[i]))
+  /* "atomman/defect/Strain.pyx":316
+ *         # Compute all neighbor vectors at once and split by atom
+ *         i, j = pair_table(neighbors.nlist)
+ *         vects = basesystem.dvect(i, j).reshape(-1, 3)             # <<<<<<<<<<<<<<
+ *         p = np.split(vects, np.cumsum(neighbors.coord)[:-1])
  * 
- *         self.__p_vectors = np.asarray(p)             # <<<<<<<<<<<<<<
- * 
- *     def solve_G(self, theta_max=None):
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 301, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_asarray); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_basesystem, __pyx_n_s_dvect); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 316, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_t_4 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
     __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
     if (likely(__pyx_t_4)) {
       PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
       __Pyx_INCREF(__pyx_t_4);
       __Pyx_INCREF(function);
       __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_8 = 1;
     }
   }
-  __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_p) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_p);
-  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 301, __pyx_L1_error)
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_i, __pyx_v_j};
+    __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 316, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_5);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_i, __pyx_v_j};
+    __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 316, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_5);
+  } else
+  #endif
+  {
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 316, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_i);
+    __Pyx_GIVEREF(__pyx_v_i);
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_8, __pyx_v_i);
+    __Pyx_INCREF(__pyx_v_j);
+    __Pyx_GIVEREF(__pyx_v_j);
+    PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_8, __pyx_v_j);
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 316, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_reshape); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 316, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors, __pyx_t_5) < 0) __PYX_ERR(0, 301, __pyx_L1_error)
+  __pyx_v_vects = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "atomman/defect/Strain.pyx":317
+ *         i, j = pair_table(neighbors.nlist)
+ *         vects = basesystem.dvect(i, j).reshape(-1, 3)
+ *         p = np.split(vects, np.cumsum(neighbors.coord)[:-1])             # <<<<<<<<<<<<<<
+ * 
+ *         if np.all(neighbors.coord == neighbors.coord[0]):
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_split); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_cumsum); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_neighbors, __pyx_n_s_coord); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_10 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
+    __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+    if (likely(__pyx_t_10)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_10);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_9, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = __Pyx_PyObject_GetSlice(__pyx_t_3, 0, -1L, NULL, NULL, &__pyx_slice__4, 0, 1, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_vects, __pyx_t_9};
+    __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 317, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_vects, __pyx_t_9};
+    __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 317, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_4 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 317, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__pyx_t_3) {
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3); __pyx_t_3 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_vects);
+    __Pyx_GIVEREF(__pyx_v_vects);
+    PyTuple_SET_ITEM(__pyx_t_4, 0+__pyx_t_8, __pyx_v_vects);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_8, __pyx_t_9);
+    __pyx_t_9 = 0;
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 317, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_p = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "atomman/defect/Strain.pyx":319
+ *         p = np.split(vects, np.cumsum(neighbors.coord)[:-1])
+ * 
+ *         if np.all(neighbors.coord == neighbors.coord[0]):             # <<<<<<<<<<<<<<
+ *             self.__p_vectors = np.asarray(p)
+ *         else:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_all); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_neighbors, __pyx_n_s_coord); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_neighbors, __pyx_n_s_coord); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_9, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PyObject_RichCompare(__pyx_t_6, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_9); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_3, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 319, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (__pyx_t_2) {
 
-  /* "atomman/defect/Strain.pyx":268
+    /* "atomman/defect/Strain.pyx":320
+ * 
+ *         if np.all(neighbors.coord == neighbors.coord[0]):
+ *             self.__p_vectors = np.asarray(p)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.__p_vectors = np.empty(len(p), dtype=object)
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_asarray); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_4, __pyx_v_p) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_p);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors, __pyx_t_5) < 0) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "atomman/defect/Strain.pyx":319
+ *         p = np.split(vects, np.cumsum(neighbors.coord)[:-1])
+ * 
+ *         if np.all(neighbors.coord == neighbors.coord[0]):             # <<<<<<<<<<<<<<
+ *             self.__p_vectors = np.asarray(p)
+ *         else:
+ */
+    goto __pyx_L6;
+  }
+
+  /* "atomman/defect/Strain.pyx":322
+ *             self.__p_vectors = np.asarray(p)
+ *         else:
+ *             self.__p_vectors = np.empty(len(p), dtype=object)             # <<<<<<<<<<<<<<
+ *             self.__p_vectors[:] = p
+ * 
+ */
+  /*else*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_11 = PyObject_Length(__pyx_v_p); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 322, __pyx_L1_error)
+    __pyx_t_5 = PyInt_FromSsize_t(__pyx_t_11); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_builtin_object) < 0) __PYX_ERR(0, 322, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors, __pyx_t_3) < 0) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "atomman/defect/Strain.pyx":323
+ *         else:
+ *             self.__p_vectors = np.empty(len(p), dtype=object)
+ *             self.__p_vectors[:] = p             # <<<<<<<<<<<<<<
+ * 
+ *     def solve_G(self, theta_max=None, nprocs=None):
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_Strain__p_vectors); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 323, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_PyObject_SetSlice(__pyx_t_3, __pyx_v_p, 0, 0, NULL, NULL, &__pyx_slice__5, 0, 0, 1) < 0) __PYX_ERR(0, 323, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_L6:;
+
+  /* "atomman/defect/Strain.pyx":285
  *         self.__p_vectors = p_vectors
  * 
  *     def build_p_vectors(self, basesystem, neighbors=None, cutoff=None):             # <<<<<<<<<<<<<<
@@ -6228,35 +6646,38 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_36build_p_vectors(CYT
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_10);
   __Pyx_AddTraceback("atomman.defect.Strain.Strain.build_p_vectors", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_p);
   __Pyx_XDECREF(__pyx_v_i);
+  __Pyx_XDECREF(__pyx_v_j);
+  __Pyx_XDECREF(__pyx_v_vects);
+  __Pyx_XDECREF(__pyx_v_p);
   __Pyx_XDECREF(__pyx_v_neighbors);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":303
- *         self.__p_vectors = np.asarray(p)
+/* "atomman/defect/Strain.pyx":325
+ *             self.__p_vectors[:] = p
  * 
- *     def solve_G(self, theta_max=None):             # <<<<<<<<<<<<<<
+ *     def solve_G(self, theta_max=None, nprocs=None):             # <<<<<<<<<<<<<<
  *         """
  *         Computes the lattice correspondence tensor, G, by comparing all neighbor
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_39solve_G(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_38solve_G[] = "\n        Computes the lattice correspondence tensor, G, by comparing all neighbor\n        vectors q in the current system to ideal reference neighbor vectors p.\n        \n        Parameters\n        ----------\n        theta_max : float, optional\n            Allows for the theta_max value set during the class initialization\n            to be changed.  The maximum theta angle in degrees to use when\n            searching for matches between p vectors and q vectors.  Optimum\n            values are dependent on the crystal structure. \n        ";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_39solve_G = {"solve_G", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_39solve_G, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_38solve_G};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_39solve_G(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_43solve_G(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_42solve_G[] = "\n        Computes the lattice correspondence tensor, G, by comparing all neighbor\n        vectors q in the current system to ideal reference neighbor vectors p.\n        \n        Parameters\n        ----------\n        theta_max : float, optional\n            Allows for the theta_max value set during the class initialization\n            to be changed.  The maximum theta angle in degrees to use when\n            searching for matches between p vectors and q vectors.  Optimum\n            values are dependent on the crystal structure. \n        nprocs : int, optional\n            Allows for the nprocs value set during the class initialization\n            to be changed.  If greater than 1, the strain properties derived\n            from G are also computed by the parallel workers.\n        ";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_43solve_G = {"solve_G", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_43solve_G, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_42solve_G};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_43solve_G(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
   PyObject *__pyx_v_theta_max = 0;
+  PyObject *__pyx_v_nprocs = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -6264,13 +6685,16 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_39solve_G(PyObject *_
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("solve_G (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_theta_max,0};
-    PyObject* values[2] = {0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_theta_max,&__pyx_n_s_nprocs,0};
+    PyObject* values[3] = {0,0,0};
     values[1] = ((PyObject *)((PyObject *)Py_None));
+    values[2] = ((PyObject *)((PyObject *)Py_None));
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -6289,12 +6713,20 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_39solve_G(PyObject *_
           PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_theta_max);
           if (value) { values[1] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nprocs);
+          if (value) { values[2] = value; kw_args--; }
+        }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "solve_G") < 0)) __PYX_ERR(0, 303, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "solve_G") < 0)) __PYX_ERR(0, 325, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -6304,36 +6736,27 @@ static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_39solve_G(PyObject *_
     }
     __pyx_v_self = values[0];
     __pyx_v_theta_max = values[1];
+    __pyx_v_nprocs = values[2];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("solve_G", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 303, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("solve_G", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 325, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("atomman.defect.Strain.Strain.solve_G", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_38solve_G(__pyx_self, __pyx_v_self, __pyx_v_theta_max);
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_42solve_G(__pyx_self, __pyx_v_self, __pyx_v_theta_max, __pyx_v_nprocs);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_38solve_G(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_theta_max) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_42solve_G(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_theta_max, PyObject *__pyx_v_nprocs) {
   PyObject *__pyx_v_p_vectors = NULL;
-  double __pyx_v_cos_theta_max;
   PyObject *__pyx_v_system = NULL;
-  PyObject *__pyx_v_neighbors = NULL;
-  PyObject *__pyx_v_maxcoord = NULL;
-  PyObject *__pyx_v_natoms = NULL;
-  PyObject *__pyx_v_G = NULL;
-  PyObject *__pyx_v_P = NULL;
-  PyObject *__pyx_v_Q = NULL;
-  PyObject *__pyx_v_i = NULL;
-  PyObject *__pyx_v_p = NULL;
-  PyObject *__pyx_v_q = NULL;
-  PyObject *__pyx_v_n = NULL;
+  PyObject *__pyx_v_results = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -6341,35 +6764,27 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_38solve_G(CYTHON_UNUS
   int __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  double __pyx_t_6;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  Py_ssize_t __pyx_t_8;
-  PyObject *(*__pyx_t_9)(PyObject *);
-  PyObject *__pyx_t_10 = NULL;
-  int __pyx_t_11;
-  PyObject *__pyx_t_12 = NULL;
-  __Pyx_memviewslice __pyx_t_13 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_t_14 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_t_15 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_t_16 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_8 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("solve_G", 0);
 
-  /* "atomman/defect/Strain.pyx":317
+  /* "atomman/defect/Strain.pyx":343
  *         """
  *         # p vector setup
  *         p_vectors = self.p_vectors             # <<<<<<<<<<<<<<
  *         if p_vectors is None:
  *             raise ValueError('Cannot solve until p_vectors are set')
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_p_vectors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_p_vectors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 343, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_p_vectors = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":318
+  /* "atomman/defect/Strain.pyx":344
  *         # p vector setup
  *         p_vectors = self.p_vectors
  *         if p_vectors is None:             # <<<<<<<<<<<<<<
@@ -6380,20 +6795,20 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_38solve_G(CYTHON_UNUS
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (unlikely(__pyx_t_3)) {
 
-    /* "atomman/defect/Strain.pyx":319
+    /* "atomman/defect/Strain.pyx":345
  *         p_vectors = self.p_vectors
  *         if p_vectors is None:
  *             raise ValueError('Cannot solve until p_vectors are set')             # <<<<<<<<<<<<<<
  * 
  *         # Theta_max setup
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 319, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 319, __pyx_L1_error)
+    __PYX_ERR(0, 345, __pyx_L1_error)
 
-    /* "atomman/defect/Strain.pyx":318
+    /* "atomman/defect/Strain.pyx":344
  *         # p vector setup
  *         p_vectors = self.p_vectors
  *         if p_vectors is None:             # <<<<<<<<<<<<<<
@@ -6402,571 +6817,410 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_38solve_G(CYTHON_UNUS
  */
   }
 
-  /* "atomman/defect/Strain.pyx":322
+  /* "atomman/defect/Strain.pyx":348
  * 
  *         # Theta_max setup
  *         if theta_max is not None:             # <<<<<<<<<<<<<<
  *             self.theta_max = theta_max
- *         cos_theta_max = cos(self.theta_max * pi / 180.0)
+ * 
  */
   __pyx_t_3 = (__pyx_v_theta_max != Py_None);
   __pyx_t_2 = (__pyx_t_3 != 0);
   if (__pyx_t_2) {
 
-    /* "atomman/defect/Strain.pyx":323
+    /* "atomman/defect/Strain.pyx":349
  *         # Theta_max setup
  *         if theta_max is not None:
  *             self.theta_max = theta_max             # <<<<<<<<<<<<<<
- *         cos_theta_max = cos(self.theta_max * pi / 180.0)
  * 
+ *         # nprocs setup
  */
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_theta_max, __pyx_v_theta_max) < 0) __PYX_ERR(0, 323, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_theta_max, __pyx_v_theta_max) < 0) __PYX_ERR(0, 349, __pyx_L1_error)
 
-    /* "atomman/defect/Strain.pyx":322
+    /* "atomman/defect/Strain.pyx":348
  * 
  *         # Theta_max setup
  *         if theta_max is not None:             # <<<<<<<<<<<<<<
  *             self.theta_max = theta_max
- *         cos_theta_max = cos(self.theta_max * pi / 180.0)
+ * 
  */
   }
 
-  /* "atomman/defect/Strain.pyx":324
- *         if theta_max is not None:
- *             self.theta_max = theta_max
- *         cos_theta_max = cos(self.theta_max * pi / 180.0)             # <<<<<<<<<<<<<<
+  /* "atomman/defect/Strain.pyx":352
+ * 
+ *         # nprocs setup
+ *         if nprocs is not None:             # <<<<<<<<<<<<<<
+ *             self.nprocs = nprocs
  * 
- *         # system and neighbors setup
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_theta_max); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyFloat_FromDouble(M_PI); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyNumber_Multiply(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyFloat_TrueDivideObjC(__pyx_t_5, __pyx_float_180_0, 180.0, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_cos_theta_max = cos(__pyx_t_6);
+  __pyx_t_2 = (__pyx_v_nprocs != Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
 
-  /* "atomman/defect/Strain.pyx":327
+    /* "atomman/defect/Strain.pyx":353
+ *         # nprocs setup
+ *         if nprocs is not None:
+ *             self.nprocs = nprocs             # <<<<<<<<<<<<<<
  * 
- *         # system and neighbors setup
- *         system = self.system             # <<<<<<<<<<<<<<
- *         neighbors = self.neighbors
- *         maxcoord = neighbors.coord.max()
+ *         # Compute G for all atoms at once
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_system); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 327, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_v_system = __pyx_t_4;
-  __pyx_t_4 = 0;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_nprocs, __pyx_v_nprocs) < 0) __PYX_ERR(0, 353, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":328
- *         # system and neighbors setup
- *         system = self.system
- *         neighbors = self.neighbors             # <<<<<<<<<<<<<<
- *         maxcoord = neighbors.coord.max()
- *         natoms = system.natoms
+    /* "atomman/defect/Strain.pyx":352
+ * 
+ *         # nprocs setup
+ *         if nprocs is not None:             # <<<<<<<<<<<<<<
+ *             self.nprocs = nprocs
+ * 
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 328, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_v_neighbors = __pyx_t_4;
-  __pyx_t_4 = 0;
+  }
 
-  /* "atomman/defect/Strain.pyx":329
- *         system = self.system
- *         neighbors = self.neighbors
- *         maxcoord = neighbors.coord.max()             # <<<<<<<<<<<<<<
- *         natoms = system.natoms
+  /* "atomman/defect/Strain.pyx":356
  * 
+ *         # Compute G for all atoms at once
+ *         system = self.system             # <<<<<<<<<<<<<<
+ *         self.clear_properties()
+ *         if self.nprocs == 1:
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_neighbors, __pyx_n_s_coord); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 329, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_max); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_system); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 356, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_system = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "atomman/defect/Strain.pyx":357
+ *         # Compute G for all atoms at once
+ *         system = self.system
+ *         self.clear_properties()             # <<<<<<<<<<<<<<
+ *         if self.nprocs == 1:
+ *             self.__G = batch_G(system.atoms.pos, system.box, system.pbc,
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_clear_properties); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 357, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_5 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
     if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
       __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_1, function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
     }
   }
-  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_1);
+  __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 329, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 357, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_maxcoord = __pyx_t_4;
-  __pyx_t_4 = 0;
 
-  /* "atomman/defect/Strain.pyx":330
- *         neighbors = self.neighbors
- *         maxcoord = neighbors.coord.max()
- *         natoms = system.natoms             # <<<<<<<<<<<<<<
- * 
- *         # Initialize variables
+  /* "atomman/defect/Strain.pyx":358
+ *         system = self.system
+ *         self.clear_properties()
+ *         if self.nprocs == 1:             # <<<<<<<<<<<<<<
+ *             self.__G = batch_G(system.atoms.pos, system.box, system.pbc,
+ *                                self.neighbors.nlist, p_vectors,
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_natoms); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 330, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_v_natoms = __pyx_t_4;
-  __pyx_t_4 = 0;
-
-  /* "atomman/defect/Strain.pyx":333
- * 
- *         # Initialize variables
- *         self.clear_properties()             # <<<<<<<<<<<<<<
- *         G = np.empty((natoms, 3, 3))
- *         P = np.empty((maxcoord, 3))
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_clear_properties); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 333, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_1, function);
-    }
-  }
-  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_nprocs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_t_1, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 358, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 358, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_3) {
 
-  /* "atomman/defect/Strain.pyx":334
- *         # Initialize variables
+    /* "atomman/defect/Strain.pyx":359
  *         self.clear_properties()
- *         G = np.empty((natoms, 3, 3))             # <<<<<<<<<<<<<<
- *         P = np.empty((maxcoord, 3))
- *         Q = np.empty((maxcoord, 3))
+ *         if self.nprocs == 1:
+ *             self.__G = batch_G(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                self.neighbors.nlist, p_vectors,
+ *                                theta_max=self.theta_max)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 334, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 334, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 334, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_natoms);
-  __Pyx_GIVEREF(__pyx_v_natoms);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_natoms);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_3);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_int_3);
-  __pyx_t_7 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-    }
-  }
-  __pyx_t_4 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_7, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 334, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_v_G = __pyx_t_4;
-  __pyx_t_4 = 0;
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_batch_G); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_atoms); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_pos); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_box); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_pbc); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+
+    /* "atomman/defect/Strain.pyx":360
+ *         if self.nprocs == 1:
+ *             self.__G = batch_G(system.atoms.pos, system.box, system.pbc,
+ *                                self.neighbors.nlist, p_vectors,             # <<<<<<<<<<<<<<
+ *                                theta_max=self.theta_max)
+ *         else:
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_nlist); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-  /* "atomman/defect/Strain.pyx":335
+    /* "atomman/defect/Strain.pyx":359
  *         self.clear_properties()
- *         G = np.empty((natoms, 3, 3))
- *         P = np.empty((maxcoord, 3))             # <<<<<<<<<<<<<<
- *         Q = np.empty((maxcoord, 3))
- * 
+ *         if self.nprocs == 1:
+ *             self.__G = batch_G(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                self.neighbors.nlist, p_vectors,
+ *                                theta_max=self.theta_max)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 335, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 335, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 335, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_INCREF(__pyx_v_maxcoord);
-  __Pyx_GIVEREF(__pyx_v_maxcoord);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_maxcoord);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_int_3);
-  __pyx_t_7 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_1);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_1, function);
-    }
-  }
-  __pyx_t_4 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_7, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 335, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_P = __pyx_t_4;
-  __pyx_t_4 = 0;
+    __pyx_t_7 = PyTuple_New(5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_8);
+    PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_8);
+    __Pyx_INCREF(__pyx_v_p_vectors);
+    __Pyx_GIVEREF(__pyx_v_p_vectors);
+    PyTuple_SET_ITEM(__pyx_t_7, 4, __pyx_v_p_vectors);
+    __pyx_t_5 = 0;
+    __pyx_t_1 = 0;
+    __pyx_t_6 = 0;
+    __pyx_t_8 = 0;
 
-  /* "atomman/defect/Strain.pyx":336
- *         G = np.empty((natoms, 3, 3))
- *         P = np.empty((maxcoord, 3))
- *         Q = np.empty((maxcoord, 3))             # <<<<<<<<<<<<<<
- * 
- *         # Loop over all atoms
+    /* "atomman/defect/Strain.pyx":361
+ *             self.__G = batch_G(system.atoms.pos, system.box, system.pbc,
+ *                                self.neighbors.nlist, p_vectors,
+ *                                theta_max=self.theta_max)             # <<<<<<<<<<<<<<
+ *         else:
+ *             results = batch_strain(system.atoms.pos, system.box, system.pbc,
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 336, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 336, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 336, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_maxcoord);
-  __Pyx_GIVEREF(__pyx_v_maxcoord);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_maxcoord);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_3);
-  __pyx_t_7 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-    }
-  }
-  __pyx_t_4 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_7, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 336, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_v_Q = __pyx_t_4;
-  __pyx_t_4 = 0;
+    __pyx_t_8 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 361, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_theta_max); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 361, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (PyDict_SetItem(__pyx_t_8, __pyx_n_s_theta_max, __pyx_t_6) < 0) __PYX_ERR(0, 361, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "atomman/defect/Strain.pyx":339
- * 
- *         # Loop over all atoms
- *         for i in range(natoms):             # <<<<<<<<<<<<<<
- *             # Get actual p and q for atom i
- *             p = p_vectors[i]
+    /* "atomman/defect/Strain.pyx":359
+ *         self.clear_properties()
+ *         if self.nprocs == 1:
+ *             self.__G = batch_G(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                self.neighbors.nlist, p_vectors,
+ *                                theta_max=self.theta_max)
  */
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_natoms); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
-    __pyx_t_5 = __pyx_t_4; __Pyx_INCREF(__pyx_t_5); __pyx_t_8 = 0;
-    __pyx_t_9 = NULL;
-  } else {
-    __pyx_t_8 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_9 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 339, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__G, __pyx_t_6) < 0) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "atomman/defect/Strain.pyx":358
+ *         system = self.system
+ *         self.clear_properties()
+ *         if self.nprocs == 1:             # <<<<<<<<<<<<<<
+ *             self.__G = batch_G(system.atoms.pos, system.box, system.pbc,
+ *                                self.neighbors.nlist, p_vectors,
+ */
+    goto __pyx_L6;
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_9)) {
-      if (likely(PyList_CheckExact(__pyx_t_5))) {
-        if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_5)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_4); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 339, __pyx_L1_error)
-        #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        #endif
-      } else {
-        if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_4); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 339, __pyx_L1_error)
-        #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        #endif
-      }
-    } else {
-      __pyx_t_4 = __pyx_t_9(__pyx_t_5);
-      if (unlikely(!__pyx_t_4)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 339, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_4);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_4);
-    __pyx_t_4 = 0;
 
-    /* "atomman/defect/Strain.pyx":341
- *         for i in range(natoms):
- *             # Get actual p and q for atom i
- *             p = p_vectors[i]             # <<<<<<<<<<<<<<
- *             q = system.dvect(i, neighbors[i])
- * 
+  /* "atomman/defect/Strain.pyx":363
+ *                                theta_max=self.theta_max)
+ *         else:
+ *             results = batch_strain(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                    self.neighbors.nlist, p_vectors=p_vectors,
+ *                                    theta_max=self.theta_max, nye=False,
  */
-    __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_v_p_vectors, __pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 341, __pyx_L1_error)
+  /*else*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_batch_strain); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_atoms); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_pos); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_box); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_pbc); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 363, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_4);
-    __pyx_t_4 = 0;
 
-    /* "atomman/defect/Strain.pyx":342
- *             # Get actual p and q for atom i
- *             p = p_vectors[i]
- *             q = system.dvect(i, neighbors[i])             # <<<<<<<<<<<<<<
- * 
- *             # Get the matched P and Q
+    /* "atomman/defect/Strain.pyx":364
+ *         else:
+ *             results = batch_strain(system.atoms.pos, system.box, system.pbc,
+ *                                    self.neighbors.nlist, p_vectors=p_vectors,             # <<<<<<<<<<<<<<
+ *                                    theta_max=self.theta_max, nye=False,
+ *                                    nprocs=self.nprocs)
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_dvect); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 342, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 364, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_neighbors, __pyx_v_i); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 342, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_10 = NULL;
-    __pyx_t_11 = 0;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_1);
-      if (likely(__pyx_t_10)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-        __Pyx_INCREF(__pyx_t_10);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_1, function);
-        __pyx_t_11 = 1;
-      }
-    }
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_1)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_10, __pyx_v_i, __pyx_t_7};
-      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 342, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_10, __pyx_v_i, __pyx_t_7};
-      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 342, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_12 = PyTuple_New(2+__pyx_t_11); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 342, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      if (__pyx_t_10) {
-        __Pyx_GIVEREF(__pyx_t_10); PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_10); __pyx_t_10 = NULL;
-      }
-      __Pyx_INCREF(__pyx_v_i);
-      __Pyx_GIVEREF(__pyx_v_i);
-      PyTuple_SET_ITEM(__pyx_t_12, 0+__pyx_t_11, __pyx_v_i);
-      __Pyx_GIVEREF(__pyx_t_7);
-      PyTuple_SET_ITEM(__pyx_t_12, 1+__pyx_t_11, __pyx_t_7);
-      __pyx_t_7 = 0;
-      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_12, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 342, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-    }
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_nlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_q, __pyx_t_4);
+
+    /* "atomman/defect/Strain.pyx":363
+ *                                theta_max=self.theta_max)
+ *         else:
+ *             results = batch_strain(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                    self.neighbors.nlist, p_vectors=p_vectors,
+ *                                    theta_max=self.theta_max, nye=False,
+ */
+    __pyx_t_1 = PyTuple_New(4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_8);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_t_5);
+    __pyx_t_7 = 0;
+    __pyx_t_8 = 0;
     __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
 
-    /* "atomman/defect/Strain.pyx":345
- * 
- *             # Get the matched P and Q
- *             n = match_pq(p, q, cos_theta_max, P, Q)             # <<<<<<<<<<<<<<
- * 
- *             # Compute lattice correspondence tensor, G, from P and Q
+    /* "atomman/defect/Strain.pyx":364
+ *         else:
+ *             results = batch_strain(system.atoms.pos, system.box, system.pbc,
+ *                                    self.neighbors.nlist, p_vectors=p_vectors,             # <<<<<<<<<<<<<<
+ *                                    theta_max=self.theta_max, nye=False,
+ *                                    nprocs=self.nprocs)
+ */
+    __pyx_t_5 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_p_vectors, __pyx_v_p_vectors) < 0) __PYX_ERR(0, 364, __pyx_L1_error)
+
+    /* "atomman/defect/Strain.pyx":365
+ *             results = batch_strain(system.atoms.pos, system.box, system.pbc,
+ *                                    self.neighbors.nlist, p_vectors=p_vectors,
+ *                                    theta_max=self.theta_max, nye=False,             # <<<<<<<<<<<<<<
+ *                                    nprocs=self.nprocs)
+ *             self.__G = results['G']
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_theta_max); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 365, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_theta_max, __pyx_t_4) < 0) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_nye, Py_False) < 0) __PYX_ERR(0, 364, __pyx_L1_error)
+
+    /* "atomman/defect/Strain.pyx":366
+ *                                    self.neighbors.nlist, p_vectors=p_vectors,
+ *                                    theta_max=self.theta_max, nye=False,
+ *                                    nprocs=self.nprocs)             # <<<<<<<<<<<<<<
+ *             self.__G = results['G']
+ *             self.__strain = results['strain']
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_nprocs); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 366, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_nprocs, __pyx_t_4) < 0) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "atomman/defect/Strain.pyx":363
+ *                                theta_max=self.theta_max)
+ *         else:
+ *             results = batch_strain(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                    self.neighbors.nlist, p_vectors=p_vectors,
+ *                                    theta_max=self.theta_max, nye=False,
  */
-    __pyx_t_13 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_p, PyBUF_WRITABLE); if (unlikely(!__pyx_t_13.memview)) __PYX_ERR(0, 345, __pyx_L1_error)
-    __pyx_t_14 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_q, PyBUF_WRITABLE); if (unlikely(!__pyx_t_14.memview)) __PYX_ERR(0, 345, __pyx_L1_error)
-    __pyx_t_15 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_P, PyBUF_WRITABLE); if (unlikely(!__pyx_t_15.memview)) __PYX_ERR(0, 345, __pyx_L1_error)
-    __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_Q, PyBUF_WRITABLE); if (unlikely(!__pyx_t_16.memview)) __PYX_ERR(0, 345, __pyx_L1_error)
-    __pyx_t_4 = __pyx_f_7atomman_6defect_6Strain_match_pq(__pyx_t_13, __pyx_t_14, __pyx_v_cos_theta_max, __pyx_t_15, __pyx_t_16); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 345, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 363, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __PYX_XDEC_MEMVIEW(&__pyx_t_13, 1);
-    __pyx_t_13.memview = NULL;
-    __pyx_t_13.data = NULL;
-    __PYX_XDEC_MEMVIEW(&__pyx_t_14, 1);
-    __pyx_t_14.memview = NULL;
-    __pyx_t_14.data = NULL;
-    __PYX_XDEC_MEMVIEW(&__pyx_t_15, 1);
-    __pyx_t_15.memview = NULL;
-    __pyx_t_15.data = NULL;
-    __PYX_XDEC_MEMVIEW(&__pyx_t_16, 1);
-    __pyx_t_16.memview = NULL;
-    __pyx_t_16.data = NULL;
-    __Pyx_XDECREF_SET(__pyx_v_n, __pyx_t_4);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_v_results = __pyx_t_4;
     __pyx_t_4 = 0;
 
-    /* "atomman/defect/Strain.pyx":348
- * 
- *             # Compute lattice correspondence tensor, G, from P and Q
- *             if n == 0:             # <<<<<<<<<<<<<<
- *                 G[i] = np.identity(3)
- *                 warnings.warn('An atom lacks pair sets. Check neighbor list')
+    /* "atomman/defect/Strain.pyx":367
+ *                                    theta_max=self.theta_max, nye=False,
+ *                                    nprocs=self.nprocs)
+ *             self.__G = results['G']             # <<<<<<<<<<<<<<
+ *             self.__strain = results['strain']
+ *             self.__invariant1 = results['invariant1']
  */
-    __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_v_n, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 348, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_results, __pyx_n_u_G); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 367, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 348, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__G, __pyx_t_4) < 0) __PYX_ERR(0, 367, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (__pyx_t_2) {
 
-      /* "atomman/defect/Strain.pyx":349
- *             # Compute lattice correspondence tensor, G, from P and Q
- *             if n == 0:
- *                 G[i] = np.identity(3)             # <<<<<<<<<<<<<<
- *                 warnings.warn('An atom lacks pair sets. Check neighbor list')
- *             else:
+    /* "atomman/defect/Strain.pyx":368
+ *                                    nprocs=self.nprocs)
+ *             self.__G = results['G']
+ *             self.__strain = results['strain']             # <<<<<<<<<<<<<<
+ *             self.__invariant1 = results['invariant1']
+ *             self.__invariant2 = results['invariant2']
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_identity); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 349, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_12))) {
-        __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_12);
-        if (likely(__pyx_t_1)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_12);
-          __Pyx_INCREF(__pyx_t_1);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_12, function);
-        }
-      }
-      __pyx_t_4 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_12, __pyx_t_1, __pyx_int_3) : __Pyx_PyObject_CallOneArg(__pyx_t_12, __pyx_int_3);
-      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 349, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      if (unlikely(PyObject_SetItem(__pyx_v_G, __pyx_v_i, __pyx_t_4) < 0)) __PYX_ERR(0, 349, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_results, __pyx_n_u_strain); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 368, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__strain, __pyx_t_4) < 0) __PYX_ERR(0, 368, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "atomman/defect/Strain.pyx":350
- *             if n == 0:
- *                 G[i] = np.identity(3)
- *                 warnings.warn('An atom lacks pair sets. Check neighbor list')             # <<<<<<<<<<<<<<
- *             else:
- *                 G[i] = np.linalg.lstsq(Q[:n], P[:n], rcond=None)[0]
+    /* "atomman/defect/Strain.pyx":369
+ *             self.__G = results['G']
+ *             self.__strain = results['strain']
+ *             self.__invariant1 = results['invariant1']             # <<<<<<<<<<<<<<
+ *             self.__invariant2 = results['invariant2']
+ *             self.__invariant3 = results['invariant3']
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_warnings); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 350, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_warn); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 350, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __pyx_t_12 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
-        __pyx_t_12 = PyMethod_GET_SELF(__pyx_t_1);
-        if (likely(__pyx_t_12)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-          __Pyx_INCREF(__pyx_t_12);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_1, function);
-        }
-      }
-      __pyx_t_4 = (__pyx_t_12) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_12, __pyx_kp_u_An_atom_lacks_pair_sets_Check_ne) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_kp_u_An_atom_lacks_pair_sets_Check_ne);
-      __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 350, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_results, __pyx_n_u_invariant1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant1, __pyx_t_4) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "atomman/defect/Strain.pyx":348
- * 
- *             # Compute lattice correspondence tensor, G, from P and Q
- *             if n == 0:             # <<<<<<<<<<<<<<
- *                 G[i] = np.identity(3)
- *                 warnings.warn('An atom lacks pair sets. Check neighbor list')
+    /* "atomman/defect/Strain.pyx":370
+ *             self.__strain = results['strain']
+ *             self.__invariant1 = results['invariant1']
+ *             self.__invariant2 = results['invariant2']             # <<<<<<<<<<<<<<
+ *             self.__invariant3 = results['invariant3']
+ *             self.__rotation = results['rotation']
  */
-      goto __pyx_L7;
-    }
+    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_results, __pyx_n_u_invariant2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant2, __pyx_t_4) < 0) __PYX_ERR(0, 370, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "atomman/defect/Strain.pyx":352
- *                 warnings.warn('An atom lacks pair sets. Check neighbor list')
- *             else:
- *                 G[i] = np.linalg.lstsq(Q[:n], P[:n], rcond=None)[0]             # <<<<<<<<<<<<<<
- * 
- *         self.__G = G
+    /* "atomman/defect/Strain.pyx":371
+ *             self.__invariant1 = results['invariant1']
+ *             self.__invariant2 = results['invariant2']
+ *             self.__invariant3 = results['invariant3']             # <<<<<<<<<<<<<<
+ *             self.__rotation = results['rotation']
+ *             self.__angularvelocity = results['angularvelocity']
  */
-    /*else*/ {
-      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_linalg); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_lstsq); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_Q, 0, 0, NULL, &__pyx_v_n, NULL, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_12 = __Pyx_PyObject_GetSlice(__pyx_v_P, 0, 0, NULL, &__pyx_v_n, NULL, 0, 0, 1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_GIVEREF(__pyx_t_1);
-      PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_1);
-      __Pyx_GIVEREF(__pyx_t_12);
-      PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_12);
-      __pyx_t_1 = 0;
-      __pyx_t_12 = 0;
-      __pyx_t_12 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      if (PyDict_SetItem(__pyx_t_12, __pyx_n_s_rcond, Py_None) < 0) __PYX_ERR(0, 352, __pyx_L1_error)
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, __pyx_t_12); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __pyx_t_12 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      if (unlikely(PyObject_SetItem(__pyx_v_G, __pyx_v_i, __pyx_t_12) < 0)) __PYX_ERR(0, 352, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-    }
-    __pyx_L7:;
+    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_results, __pyx_n_u_invariant3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 371, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__invariant3, __pyx_t_4) < 0) __PYX_ERR(0, 371, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "atomman/defect/Strain.pyx":339
+    /* "atomman/defect/Strain.pyx":372
+ *             self.__invariant2 = results['invariant2']
+ *             self.__invariant3 = results['invariant3']
+ *             self.__rotation = results['rotation']             # <<<<<<<<<<<<<<
+ *             self.__angularvelocity = results['angularvelocity']
  * 
- *         # Loop over all atoms
- *         for i in range(natoms):             # <<<<<<<<<<<<<<
- *             # Get actual p and q for atom i
- *             p = p_vectors[i]
  */
-  }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_results, __pyx_n_u_rotation); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__rotation, __pyx_t_4) < 0) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "atomman/defect/Strain.pyx":354
- *                 G[i] = np.linalg.lstsq(Q[:n], P[:n], rcond=None)[0]
- * 
- *         self.__G = G             # <<<<<<<<<<<<<<
+    /* "atomman/defect/Strain.pyx":373
+ *             self.__invariant3 = results['invariant3']
+ *             self.__rotation = results['rotation']
+ *             self.__angularvelocity = results['angularvelocity']             # <<<<<<<<<<<<<<
  * 
- *     def solve_nye(self):
+ *     def solve_nye(self, nprocs=None):
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__G, __pyx_v_G) < 0) __PYX_ERR(0, 354, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_results, __pyx_n_u_angularvelocity); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 373, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__angularvelocity, __pyx_t_4) < 0) __PYX_ERR(0, 373, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __pyx_L6:;
 
-  /* "atomman/defect/Strain.pyx":303
- *         self.__p_vectors = np.asarray(p)
+  /* "atomman/defect/Strain.pyx":325
+ *             self.__p_vectors[:] = p
  * 
- *     def solve_G(self, theta_max=None):             # <<<<<<<<<<<<<<
+ *     def solve_G(self, theta_max=None, nprocs=None):             # <<<<<<<<<<<<<<
  *         """
  *         Computes the lattice correspondence tensor, G, by comparing all neighbor
  */
@@ -6978,1506 +7232,455 @@ static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_38solve_G(CYTHON_UNUS
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_12);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_13, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_14, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_15, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_16, 1);
+  __Pyx_XDECREF(__pyx_t_8);
   __Pyx_AddTraceback("atomman.defect.Strain.Strain.solve_G", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_p_vectors);
   __Pyx_XDECREF(__pyx_v_system);
-  __Pyx_XDECREF(__pyx_v_neighbors);
-  __Pyx_XDECREF(__pyx_v_maxcoord);
-  __Pyx_XDECREF(__pyx_v_natoms);
-  __Pyx_XDECREF(__pyx_v_G);
-  __Pyx_XDECREF(__pyx_v_P);
-  __Pyx_XDECREF(__pyx_v_Q);
-  __Pyx_XDECREF(__pyx_v_i);
-  __Pyx_XDECREF(__pyx_v_p);
-  __Pyx_XDECREF(__pyx_v_q);
-  __Pyx_XDECREF(__pyx_v_n);
+  __Pyx_XDECREF(__pyx_v_results);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":356
- *         self.__G = G
+/* "atomman/defect/Strain.pyx":375
+ *             self.__angularvelocity = results['angularvelocity']
  * 
- *     def solve_nye(self):             # <<<<<<<<<<<<<<
+ *     def solve_nye(self, nprocs=None):             # <<<<<<<<<<<<<<
  *         """
  *         Computes the Nye tensor based on the lattice correspondence tensor G
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_41solve_nye(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_7atomman_6defect_6Strain_6Strain_40solve_nye[] = "\n        Computes the Nye tensor based on the lattice correspondence tensor G\n        and the current atomic positions.\n        ";
-static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_41solve_nye = {"solve_nye", (PyCFunction)__pyx_pw_7atomman_6defect_6Strain_6Strain_41solve_nye, METH_O, __pyx_doc_7atomman_6defect_6Strain_6Strain_40solve_nye};
-static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_41solve_nye(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_45solve_nye(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7atomman_6defect_6Strain_6Strain_44solve_nye[] = "\n        Computes the Nye tensor based on the lattice correspondence tensor G\n        and the current atomic positions.\n\n        Parameters\n        ----------\n        nprocs : int, optional\n            Allows for the nprocs value set during the class initialization\n            to be changed.\n        ";
+static PyMethodDef __pyx_mdef_7atomman_6defect_6Strain_6Strain_45solve_nye = {"solve_nye", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7atomman_6defect_6Strain_6Strain_45solve_nye, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7atomman_6defect_6Strain_6Strain_44solve_nye};
+static PyObject *__pyx_pw_7atomman_6defect_6Strain_6Strain_45solve_nye(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_nprocs = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("solve_nye (wrapper)", 0);
-  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_40solve_nye(__pyx_self, ((PyObject *)__pyx_v_self));
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_nprocs,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)((PyObject *)Py_None));
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nprocs);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "solve_nye") < 0)) __PYX_ERR(0, 375, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_nprocs = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("solve_nye", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 375, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("atomman.defect.Strain.Strain.solve_nye", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7atomman_6defect_6Strain_6Strain_44solve_nye(__pyx_self, __pyx_v_self, __pyx_v_nprocs);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_40solve_nye(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_7atomman_6defect_6Strain_6Strain_44solve_nye(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_nprocs) {
   PyObject *__pyx_v_G = NULL;
-  __Pyx_memviewslice __pyx_v_G_view = { 0, 0, { 0 }, { 0 }, { 0 } };
   PyObject *__pyx_v_system = NULL;
-  PyObject *__pyx_v_nlist = NULL;
-  __Pyx_memviewslice __pyx_v_nlist_view = { 0, 0, { 0 }, { 0 }, { 0 } };
-  Py_ssize_t __pyx_v_i;
-  Py_ssize_t __pyx_v_x;
-  Py_ssize_t __pyx_v_y;
-  Py_ssize_t __pyx_v_z;
-  PyObject *__pyx_v_natoms = NULL;
-  PY_LONG_LONG __pyx_v_maxcoord;
-  PyObject *__pyx_v_nye = NULL;
-  __Pyx_memviewslice __pyx_v_nye_view = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_gradG = NULL;
-  __Pyx_memviewslice __pyx_v_gradG_view = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_gG = NULL;
-  __Pyx_memviewslice __pyx_v_gG_view = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_dG = NULL;
-  __Pyx_memviewslice __pyx_v_dG_view = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_Q = NULL;
-  CYTHON_UNUSED __Pyx_memviewslice __pyx_v_Q_view = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_c = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_memviewslice __pyx_t_2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_1;
+  int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
-  __Pyx_memviewslice __pyx_t_4 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  long __pyx_t_5;
-  long __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
   int __pyx_t_10;
-  int __pyx_t_11;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
-  __Pyx_memviewslice __pyx_t_14 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_t_15 = NULL;
-  PyObject *__pyx_t_16 = NULL;
-  Py_ssize_t __pyx_t_17;
-  Py_ssize_t __pyx_t_18;
-  Py_ssize_t __pyx_t_19;
-  Py_ssize_t __pyx_t_20;
-  Py_ssize_t __pyx_t_21;
-  Py_ssize_t __pyx_t_22;
+  PyObject *__pyx_t_11 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("solve_nye", 0);
 
-  /* "atomman/defect/Strain.pyx":361
- *         and the current atomic positions.
- *         """
- *         G = self.G             # <<<<<<<<<<<<<<
- *         cdef double[:,:,::1] G_view = G
- *         system = self.system
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 361, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_G = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "atomman/defect/Strain.pyx":362
+  /* "atomman/defect/Strain.pyx":387
  *         """
- *         G = self.G
- *         cdef double[:,:,::1] G_view = G             # <<<<<<<<<<<<<<
- *         system = self.system
- *         nlist = self.neighbors.nlist
- */
-  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(__pyx_v_G, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 362, __pyx_L1_error)
-  __pyx_v_G_view = __pyx_t_2;
-  __pyx_t_2.memview = NULL;
-  __pyx_t_2.data = NULL;
-
-  /* "atomman/defect/Strain.pyx":363
- *         G = self.G
- *         cdef double[:,:,::1] G_view = G
- *         system = self.system             # <<<<<<<<<<<<<<
- *         nlist = self.neighbors.nlist
- *         cdef long long[:,::1] nlist_view = nlist
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_system); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_system = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "atomman/defect/Strain.pyx":364
- *         cdef double[:,:,::1] G_view = G
- *         system = self.system
- *         nlist = self.neighbors.nlist             # <<<<<<<<<<<<<<
- *         cdef long long[:,::1] nlist_view = nlist
- * 
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 364, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_nlist); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 364, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_nlist = __pyx_t_3;
-  __pyx_t_3 = 0;
-
-  /* "atomman/defect/Strain.pyx":365
- *         system = self.system
- *         nlist = self.neighbors.nlist
- *         cdef long long[:,::1] nlist_view = nlist             # <<<<<<<<<<<<<<
- * 
- *         cdef Py_ssize_t i, x, y, z
- */
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_PY_LONG_LONG(__pyx_v_nlist, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 365, __pyx_L1_error)
-  __pyx_v_nlist_view = __pyx_t_4;
-  __pyx_t_4.memview = NULL;
-  __pyx_t_4.data = NULL;
-
-  /* "atomman/defect/Strain.pyx":370
+ *         # nprocs setup
+ *         if nprocs is not None:             # <<<<<<<<<<<<<<
+ *             self.nprocs = nprocs
  * 
- *         # Variable setup and shortcuts
- *         natoms = G.shape[0]             # <<<<<<<<<<<<<<
- *         cdef long long maxcoord = 0
- *         for i in range(natoms):
- */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_G, __pyx_n_s_shape); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 370, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_3, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 370, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_natoms = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "atomman/defect/Strain.pyx":371
- *         # Variable setup and shortcuts
- *         natoms = G.shape[0]
- *         cdef long long maxcoord = 0             # <<<<<<<<<<<<<<
- *         for i in range(natoms):
- *             if maxcoord < nlist_view[i, 0]:
- */
-  __pyx_v_maxcoord = 0;
-
-  /* "atomman/defect/Strain.pyx":372
- *         natoms = G.shape[0]
- *         cdef long long maxcoord = 0
- *         for i in range(natoms):             # <<<<<<<<<<<<<<
- *             if maxcoord < nlist_view[i, 0]:
- *                 maxcoord = nlist_view[i, 0]
  */
-  __pyx_t_5 = __Pyx_PyInt_As_long(__pyx_v_natoms); if (unlikely((__pyx_t_5 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 372, __pyx_L1_error)
-  __pyx_t_6 = __pyx_t_5;
-  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
-    __pyx_v_i = __pyx_t_7;
+  __pyx_t_1 = (__pyx_v_nprocs != Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
 
-    /* "atomman/defect/Strain.pyx":373
- *         cdef long long maxcoord = 0
- *         for i in range(natoms):
- *             if maxcoord < nlist_view[i, 0]:             # <<<<<<<<<<<<<<
- *                 maxcoord = nlist_view[i, 0]
+    /* "atomman/defect/Strain.pyx":388
+ *         # nprocs setup
+ *         if nprocs is not None:
+ *             self.nprocs = nprocs             # <<<<<<<<<<<<<<
  * 
+ *         G = self.G
  */
-    __pyx_t_8 = __pyx_v_i;
-    __pyx_t_9 = 0;
-    __pyx_t_10 = -1;
-    if (__pyx_t_8 < 0) {
-      __pyx_t_8 += __pyx_v_nlist_view.shape[0];
-      if (unlikely(__pyx_t_8 < 0)) __pyx_t_10 = 0;
-    } else if (unlikely(__pyx_t_8 >= __pyx_v_nlist_view.shape[0])) __pyx_t_10 = 0;
-    if (__pyx_t_9 < 0) {
-      __pyx_t_9 += __pyx_v_nlist_view.shape[1];
-      if (unlikely(__pyx_t_9 < 0)) __pyx_t_10 = 1;
-    } else if (unlikely(__pyx_t_9 >= __pyx_v_nlist_view.shape[1])) __pyx_t_10 = 1;
-    if (unlikely(__pyx_t_10 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_10);
-      __PYX_ERR(0, 373, __pyx_L1_error)
-    }
-    __pyx_t_11 = ((__pyx_v_maxcoord < (*((PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_nlist_view.data + __pyx_t_8 * __pyx_v_nlist_view.strides[0]) )) + __pyx_t_9)) )))) != 0);
-    if (__pyx_t_11) {
-
-      /* "atomman/defect/Strain.pyx":374
- *         for i in range(natoms):
- *             if maxcoord < nlist_view[i, 0]:
- *                 maxcoord = nlist_view[i, 0]             # <<<<<<<<<<<<<<
- * 
- *         nye = np.empty((natoms, 3, 3))
- */
-      __pyx_t_9 = __pyx_v_i;
-      __pyx_t_8 = 0;
-      __pyx_t_10 = -1;
-      if (__pyx_t_9 < 0) {
-        __pyx_t_9 += __pyx_v_nlist_view.shape[0];
-        if (unlikely(__pyx_t_9 < 0)) __pyx_t_10 = 0;
-      } else if (unlikely(__pyx_t_9 >= __pyx_v_nlist_view.shape[0])) __pyx_t_10 = 0;
-      if (__pyx_t_8 < 0) {
-        __pyx_t_8 += __pyx_v_nlist_view.shape[1];
-        if (unlikely(__pyx_t_8 < 0)) __pyx_t_10 = 1;
-      } else if (unlikely(__pyx_t_8 >= __pyx_v_nlist_view.shape[1])) __pyx_t_10 = 1;
-      if (unlikely(__pyx_t_10 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_10);
-        __PYX_ERR(0, 374, __pyx_L1_error)
-      }
-      __pyx_v_maxcoord = (*((PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_nlist_view.data + __pyx_t_9 * __pyx_v_nlist_view.strides[0]) )) + __pyx_t_8)) )));
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_nprocs, __pyx_v_nprocs) < 0) __PYX_ERR(0, 388, __pyx_L1_error)
 
-      /* "atomman/defect/Strain.pyx":373
- *         cdef long long maxcoord = 0
- *         for i in range(natoms):
- *             if maxcoord < nlist_view[i, 0]:             # <<<<<<<<<<<<<<
- *                 maxcoord = nlist_view[i, 0]
+    /* "atomman/defect/Strain.pyx":387
+ *         """
+ *         # nprocs setup
+ *         if nprocs is not None:             # <<<<<<<<<<<<<<
+ *             self.nprocs = nprocs
  * 
  */
-    }
   }
 
-  /* "atomman/defect/Strain.pyx":376
- *                 maxcoord = nlist_view[i, 0]
+  /* "atomman/defect/Strain.pyx":390
+ *             self.nprocs = nprocs
  * 
- *         nye = np.empty((natoms, 3, 3))             # <<<<<<<<<<<<<<
- *         cdef double [:,:,::1] nye_view = nye
- *         gradG = np.empty((3, 3, 3))
+ *         G = self.G             # <<<<<<<<<<<<<<
+ *         system = self.system
+ *         if self.nprocs == 1:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 376, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 376, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 376, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_G); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 390, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_v_natoms);
-  __Pyx_GIVEREF(__pyx_v_natoms);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_natoms);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_3);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_int_3);
-  __pyx_t_13 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_12))) {
-    __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_12);
-    if (likely(__pyx_t_13)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_12);
-      __Pyx_INCREF(__pyx_t_13);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_12, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_13) ? __Pyx_PyObject_Call2Args(__pyx_t_12, __pyx_t_13, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_12, __pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 376, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __pyx_v_nye = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_v_G = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":377
+  /* "atomman/defect/Strain.pyx":391
  * 
- *         nye = np.empty((natoms, 3, 3))
- *         cdef double [:,:,::1] nye_view = nye             # <<<<<<<<<<<<<<
- *         gradG = np.empty((3, 3, 3))
- *         cdef double [:,:,::1] gradG_view = gradG
+ *         G = self.G
+ *         system = self.system             # <<<<<<<<<<<<<<
+ *         if self.nprocs == 1:
+ *             self.__nye = batch_nye(system.atoms.pos, system.box, system.pbc,
  */
-  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(__pyx_v_nye, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 377, __pyx_L1_error)
-  __pyx_v_nye_view = __pyx_t_2;
-  __pyx_t_2.memview = NULL;
-  __pyx_t_2.data = NULL;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_system); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_system = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":378
- *         nye = np.empty((natoms, 3, 3))
- *         cdef double [:,:,::1] nye_view = nye
- *         gradG = np.empty((3, 3, 3))             # <<<<<<<<<<<<<<
- *         cdef double [:,:,::1] gradG_view = gradG
- * 
+  /* "atomman/defect/Strain.pyx":392
+ *         G = self.G
+ *         system = self.system
+ *         if self.nprocs == 1:             # <<<<<<<<<<<<<<
+ *             self.__nye = batch_nye(system.atoms.pos, system.box, system.pbc,
+ *                                    self.neighbors.nlist, G)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_np); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 378, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_nprocs); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 392, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __pyx_t_12 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_12 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_12)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_12);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_12) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_12, __pyx_tuple__3) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_tuple__3);
-  __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 378, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_t_3, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_gradG = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_2) {
 
-  /* "atomman/defect/Strain.pyx":379
- *         cdef double [:,:,::1] nye_view = nye
- *         gradG = np.empty((3, 3, 3))
- *         cdef double [:,:,::1] gradG_view = gradG             # <<<<<<<<<<<<<<
- * 
- *         gG = np.empty((3,3))
+    /* "atomman/defect/Strain.pyx":393
+ *         system = self.system
+ *         if self.nprocs == 1:
+ *             self.__nye = batch_nye(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                    self.neighbors.nlist, G)
+ *         else:
  */
-  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(__pyx_v_gradG, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 379, __pyx_L1_error)
-  __pyx_v_gradG_view = __pyx_t_2;
-  __pyx_t_2.memview = NULL;
-  __pyx_t_2.data = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_batch_nye); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_atoms); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_pos); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_box); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_pbc); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
 
-  /* "atomman/defect/Strain.pyx":381
- *         cdef double [:,:,::1] gradG_view = gradG
- * 
- *         gG = np.empty((3,3))             # <<<<<<<<<<<<<<
- *         cdef double [:,::1] gG_view = gG
- * 
+    /* "atomman/defect/Strain.pyx":394
+ *         if self.nprocs == 1:
+ *             self.__nye = batch_nye(system.atoms.pos, system.box, system.pbc,
+ *                                    self.neighbors.nlist, G)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 381, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 381, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_12))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_12);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_12);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_12, function);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 394, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_nlist); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 394, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = NULL;
+    __pyx_t_10 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_10 = 1;
+      }
     }
-  }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_12, __pyx_t_3, __pyx_tuple__4) : __Pyx_PyObject_CallOneArg(__pyx_t_12, __pyx_tuple__4);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 381, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __pyx_v_gG = __pyx_t_1;
-  __pyx_t_1 = 0;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[6] = {__pyx_t_8, __pyx_t_6, __pyx_t_5, __pyx_t_7, __pyx_t_9, __pyx_v_G};
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_10, 5+__pyx_t_10); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 393, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[6] = {__pyx_t_8, __pyx_t_6, __pyx_t_5, __pyx_t_7, __pyx_t_9, __pyx_v_G};
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_10, 5+__pyx_t_10); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 393, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_11 = PyTuple_New(5+__pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 393, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      if (__pyx_t_8) {
+        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_8); __pyx_t_8 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_11, 0+__pyx_t_10, __pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_11, 1+__pyx_t_10, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_7);
+      PyTuple_SET_ITEM(__pyx_t_11, 2+__pyx_t_10, __pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_9);
+      PyTuple_SET_ITEM(__pyx_t_11, 3+__pyx_t_10, __pyx_t_9);
+      __Pyx_INCREF(__pyx_v_G);
+      __Pyx_GIVEREF(__pyx_v_G);
+      PyTuple_SET_ITEM(__pyx_t_11, 4+__pyx_t_10, __pyx_v_G);
+      __pyx_t_6 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_7 = 0;
+      __pyx_t_9 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_11, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 393, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":382
- * 
- *         gG = np.empty((3,3))
- *         cdef double [:,::1] gG_view = gG             # <<<<<<<<<<<<<<
- * 
- *         dG = np.empty((maxcoord, 3, 3))
+    /* "atomman/defect/Strain.pyx":393
+ *         system = self.system
+ *         if self.nprocs == 1:
+ *             self.__nye = batch_nye(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                    self.neighbors.nlist, G)
+ *         else:
  */
-  __pyx_t_14 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_gG, PyBUF_WRITABLE); if (unlikely(!__pyx_t_14.memview)) __PYX_ERR(0, 382, __pyx_L1_error)
-  __pyx_v_gG_view = __pyx_t_14;
-  __pyx_t_14.memview = NULL;
-  __pyx_t_14.data = NULL;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nye, __pyx_t_4) < 0) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "atomman/defect/Strain.pyx":384
- *         cdef double [:,::1] gG_view = gG
- * 
- *         dG = np.empty((maxcoord, 3, 3))             # <<<<<<<<<<<<<<
- *         cdef double [:,:,::1] dG_view = dG
- * 
+    /* "atomman/defect/Strain.pyx":392
+ *         G = self.G
+ *         system = self.system
+ *         if self.nprocs == 1:             # <<<<<<<<<<<<<<
+ *             self.__nye = batch_nye(system.atoms.pos, system.box, system.pbc,
+ *                                    self.neighbors.nlist, G)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_np); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 384, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 384, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __pyx_t_12 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_maxcoord); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 384, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_13 = PyTuple_New(3); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 384, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_GIVEREF(__pyx_t_12);
-  PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_t_12);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_int_3);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_13, 2, __pyx_int_3);
-  __pyx_t_12 = 0;
-  __pyx_t_12 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_12 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_12)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_12);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-    }
+    goto __pyx_L4;
   }
-  __pyx_t_1 = (__pyx_t_12) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_12, __pyx_t_13) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_13);
-  __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 384, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_dG = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "atomman/defect/Strain.pyx":385
- * 
- *         dG = np.empty((maxcoord, 3, 3))
- *         cdef double [:,:,::1] dG_view = dG             # <<<<<<<<<<<<<<
- * 
- *         Q = np.empty((maxcoord, 3))
- */
-  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(__pyx_v_dG, PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 385, __pyx_L1_error)
-  __pyx_v_dG_view = __pyx_t_2;
-  __pyx_t_2.memview = NULL;
-  __pyx_t_2.data = NULL;
-
-  /* "atomman/defect/Strain.pyx":387
- *         cdef double [:,:,::1] dG_view = dG
- * 
- *         Q = np.empty((maxcoord, 3))             # <<<<<<<<<<<<<<
- *         cdef double [:,::1] Q_view = Q
- * 
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 387, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 387, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_maxcoord); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 387, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_12 = PyTuple_New(2); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 387, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_3);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_12, 1, __pyx_int_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_13))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_13);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_13);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_13, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_13, __pyx_t_3, __pyx_t_12) : __Pyx_PyObject_CallOneArg(__pyx_t_13, __pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 387, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __pyx_v_Q = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "atomman/defect/Strain.pyx":388
- * 
- *         Q = np.empty((maxcoord, 3))
- *         cdef double [:,::1] Q_view = Q             # <<<<<<<<<<<<<<
- * 
- *         # Construct the gradient tensor of G, gradG for each atom
- */
-  __pyx_t_14 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_Q, PyBUF_WRITABLE); if (unlikely(!__pyx_t_14.memview)) __PYX_ERR(0, 388, __pyx_L1_error)
-  __pyx_v_Q_view = __pyx_t_14;
-  __pyx_t_14.memview = NULL;
-  __pyx_t_14.data = NULL;
-
-  /* "atomman/defect/Strain.pyx":391
- * 
- *         # Construct the gradient tensor of G, gradG for each atom
- *         for i in range(natoms):             # <<<<<<<<<<<<<<
- * 
- *             c = nlist_view[i, 0]
- */
-  __pyx_t_5 = __Pyx_PyInt_As_long(__pyx_v_natoms); if (unlikely((__pyx_t_5 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 391, __pyx_L1_error)
-  __pyx_t_6 = __pyx_t_5;
-  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
-    __pyx_v_i = __pyx_t_7;
-
-    /* "atomman/defect/Strain.pyx":393
- *         for i in range(natoms):
- * 
- *             c = nlist_view[i, 0]             # <<<<<<<<<<<<<<
- *             Q[:c] = system.dvect(i, nlist[i, 1:c+1])
- * 
- */
-    __pyx_t_8 = __pyx_v_i;
-    __pyx_t_9 = 0;
-    __pyx_t_10 = -1;
-    if (__pyx_t_8 < 0) {
-      __pyx_t_8 += __pyx_v_nlist_view.shape[0];
-      if (unlikely(__pyx_t_8 < 0)) __pyx_t_10 = 0;
-    } else if (unlikely(__pyx_t_8 >= __pyx_v_nlist_view.shape[0])) __pyx_t_10 = 0;
-    if (__pyx_t_9 < 0) {
-      __pyx_t_9 += __pyx_v_nlist_view.shape[1];
-      if (unlikely(__pyx_t_9 < 0)) __pyx_t_10 = 1;
-    } else if (unlikely(__pyx_t_9 >= __pyx_v_nlist_view.shape[1])) __pyx_t_10 = 1;
-    if (unlikely(__pyx_t_10 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_10);
-      __PYX_ERR(0, 393, __pyx_L1_error)
-    }
-    __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG((*((PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_nlist_view.data + __pyx_t_8 * __pyx_v_nlist_view.strides[0]) )) + __pyx_t_9)) )))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 393, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_XDECREF_SET(__pyx_v_c, __pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "atomman/defect/Strain.pyx":394
- * 
- *             c = nlist_view[i, 0]
- *             Q[:c] = system.dvect(i, nlist[i, 1:c+1])             # <<<<<<<<<<<<<<
- * 
- *             dG_c(G_view, nlist_view, dG_view, i)
- */
-    __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_dvect); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 394, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_13);
-    __pyx_t_12 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 394, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_12);
-    __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 394, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_15 = __Pyx_PyInt_AddObjC(__pyx_v_c, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 394, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_15);
-    __pyx_t_16 = PySlice_New(__pyx_int_1, __pyx_t_15, Py_None); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 394, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_16);
-    __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-    __pyx_t_15 = PyTuple_New(2); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 394, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_15);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_16);
-    PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_t_16);
-    __pyx_t_3 = 0;
-    __pyx_t_16 = 0;
-    __pyx_t_16 = __Pyx_PyObject_GetItem(__pyx_v_nlist, __pyx_t_15); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 394, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_16);
-    __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-    __pyx_t_15 = NULL;
-    __pyx_t_10 = 0;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_13))) {
-      __pyx_t_15 = PyMethod_GET_SELF(__pyx_t_13);
-      if (likely(__pyx_t_15)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_13);
-        __Pyx_INCREF(__pyx_t_15);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_13, function);
-        __pyx_t_10 = 1;
-      }
-    }
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_13)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_15, __pyx_t_12, __pyx_t_16};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_13, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 394, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_13)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_15, __pyx_t_12, __pyx_t_16};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_13, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 394, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_3 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 394, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      if (__pyx_t_15) {
-        __Pyx_GIVEREF(__pyx_t_15); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_15); __pyx_t_15 = NULL;
-      }
-      __Pyx_GIVEREF(__pyx_t_12);
-      PyTuple_SET_ITEM(__pyx_t_3, 0+__pyx_t_10, __pyx_t_12);
-      __Pyx_GIVEREF(__pyx_t_16);
-      PyTuple_SET_ITEM(__pyx_t_3, 1+__pyx_t_10, __pyx_t_16);
-      __pyx_t_12 = 0;
-      __pyx_t_16 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_13, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 394, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-    if (__Pyx_PyObject_SetSlice(__pyx_v_Q, __pyx_t_1, 0, 0, NULL, &__pyx_v_c, NULL, 0, 0, 1) < 0) __PYX_ERR(0, 394, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "atomman/defect/Strain.pyx":396
- *             Q[:c] = system.dvect(i, nlist[i, 1:c+1])
- * 
- *             dG_c(G_view, nlist_view, dG_view, i)             # <<<<<<<<<<<<<<
- * 
- *             for x in range(3):
- */
-    __pyx_t_1 = __pyx_f_7atomman_6defect_6Strain_dG_c(__pyx_v_G_view, __pyx_v_nlist_view, __pyx_v_dG_view, __pyx_v_i); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 396, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "atomman/defect/Strain.pyx":398
- *             dG_c(G_view, nlist_view, dG_view, i)
- * 
- *             for x in range(3):             # <<<<<<<<<<<<<<
- *                 gG[:] = np.linalg.lstsq(Q[:c], dG[:c,x,:], rcond=None)[0]
- * 
- */
-    for (__pyx_t_17 = 0; __pyx_t_17 < 3; __pyx_t_17+=1) {
-      __pyx_v_x = __pyx_t_17;
-
-      /* "atomman/defect/Strain.pyx":399
- * 
- *             for x in range(3):
- *                 gG[:] = np.linalg.lstsq(Q[:c], dG[:c,x,:], rcond=None)[0]             # <<<<<<<<<<<<<<
- * 
- *                 for y in range(3):
- */
-      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_linalg); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_lstsq); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      __pyx_t_13 = __Pyx_PyObject_GetSlice(__pyx_v_Q, 0, 0, NULL, &__pyx_v_c, NULL, 0, 0, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __pyx_t_3 = PySlice_New(Py_None, __pyx_v_c, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_16 = PyInt_FromSsize_t(__pyx_v_x); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_16);
-      __pyx_t_12 = PyTuple_New(3); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_16);
-      PyTuple_SET_ITEM(__pyx_t_12, 1, __pyx_t_16);
-      __Pyx_INCREF(__pyx_slice__5);
-      __Pyx_GIVEREF(__pyx_slice__5);
-      PyTuple_SET_ITEM(__pyx_t_12, 2, __pyx_slice__5);
-      __pyx_t_3 = 0;
-      __pyx_t_16 = 0;
-      __pyx_t_16 = __Pyx_PyObject_GetItem(__pyx_v_dG, __pyx_t_12); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_16);
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __pyx_t_12 = PyTuple_New(2); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __Pyx_GIVEREF(__pyx_t_13);
-      PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_13);
-      __Pyx_GIVEREF(__pyx_t_16);
-      PyTuple_SET_ITEM(__pyx_t_12, 1, __pyx_t_16);
-      __pyx_t_13 = 0;
-      __pyx_t_16 = 0;
-      __pyx_t_16 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_16);
-      if (PyDict_SetItem(__pyx_t_16, __pyx_n_s_rcond, Py_None) < 0) __PYX_ERR(0, 399, __pyx_L1_error)
-      __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_12, __pyx_t_16); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-      __pyx_t_16 = __Pyx_GetItemInt(__pyx_t_13, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_16);
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      if (__Pyx_PyObject_SetSlice(__pyx_v_gG, __pyx_t_16, 0, 0, NULL, NULL, &__pyx_slice__5, 0, 0, 1) < 0) __PYX_ERR(0, 399, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-
-      /* "atomman/defect/Strain.pyx":401
- *                 gG[:] = np.linalg.lstsq(Q[:c], dG[:c,x,:], rcond=None)[0]
- * 
- *                 for y in range(3):             # <<<<<<<<<<<<<<
- *                     for z in range(3):
- *                         gradG_view[x,y,z] = gG_view[z,y]
- */
-      for (__pyx_t_18 = 0; __pyx_t_18 < 3; __pyx_t_18+=1) {
-        __pyx_v_y = __pyx_t_18;
-
-        /* "atomman/defect/Strain.pyx":402
- * 
- *                 for y in range(3):
- *                     for z in range(3):             # <<<<<<<<<<<<<<
- *                         gradG_view[x,y,z] = gG_view[z,y]
- * 
- */
-        for (__pyx_t_19 = 0; __pyx_t_19 < 3; __pyx_t_19+=1) {
-          __pyx_v_z = __pyx_t_19;
-
-          /* "atomman/defect/Strain.pyx":403
- *                 for y in range(3):
- *                     for z in range(3):
- *                         gradG_view[x,y,z] = gG_view[z,y]             # <<<<<<<<<<<<<<
- * 
- *             nye_c(gradG_view, nye_view, i)
- */
-          __pyx_t_9 = __pyx_v_z;
-          __pyx_t_8 = __pyx_v_y;
-          __pyx_t_10 = -1;
-          if (__pyx_t_9 < 0) {
-            __pyx_t_9 += __pyx_v_gG_view.shape[0];
-            if (unlikely(__pyx_t_9 < 0)) __pyx_t_10 = 0;
-          } else if (unlikely(__pyx_t_9 >= __pyx_v_gG_view.shape[0])) __pyx_t_10 = 0;
-          if (__pyx_t_8 < 0) {
-            __pyx_t_8 += __pyx_v_gG_view.shape[1];
-            if (unlikely(__pyx_t_8 < 0)) __pyx_t_10 = 1;
-          } else if (unlikely(__pyx_t_8 >= __pyx_v_gG_view.shape[1])) __pyx_t_10 = 1;
-          if (unlikely(__pyx_t_10 != -1)) {
-            __Pyx_RaiseBufferIndexError(__pyx_t_10);
-            __PYX_ERR(0, 403, __pyx_L1_error)
-          }
-          __pyx_t_20 = __pyx_v_x;
-          __pyx_t_21 = __pyx_v_y;
-          __pyx_t_22 = __pyx_v_z;
-          __pyx_t_10 = -1;
-          if (__pyx_t_20 < 0) {
-            __pyx_t_20 += __pyx_v_gradG_view.shape[0];
-            if (unlikely(__pyx_t_20 < 0)) __pyx_t_10 = 0;
-          } else if (unlikely(__pyx_t_20 >= __pyx_v_gradG_view.shape[0])) __pyx_t_10 = 0;
-          if (__pyx_t_21 < 0) {
-            __pyx_t_21 += __pyx_v_gradG_view.shape[1];
-            if (unlikely(__pyx_t_21 < 0)) __pyx_t_10 = 1;
-          } else if (unlikely(__pyx_t_21 >= __pyx_v_gradG_view.shape[1])) __pyx_t_10 = 1;
-          if (__pyx_t_22 < 0) {
-            __pyx_t_22 += __pyx_v_gradG_view.shape[2];
-            if (unlikely(__pyx_t_22 < 0)) __pyx_t_10 = 2;
-          } else if (unlikely(__pyx_t_22 >= __pyx_v_gradG_view.shape[2])) __pyx_t_10 = 2;
-          if (unlikely(__pyx_t_10 != -1)) {
-            __Pyx_RaiseBufferIndexError(__pyx_t_10);
-            __PYX_ERR(0, 403, __pyx_L1_error)
-          }
-          *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG_view.data + __pyx_t_20 * __pyx_v_gradG_view.strides[0]) ) + __pyx_t_21 * __pyx_v_gradG_view.strides[1]) )) + __pyx_t_22)) )) = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_gG_view.data + __pyx_t_9 * __pyx_v_gG_view.strides[0]) )) + __pyx_t_8)) )));
-        }
-      }
-    }
-
-    /* "atomman/defect/Strain.pyx":405
- *                         gradG_view[x,y,z] = gG_view[z,y]
- * 
- *             nye_c(gradG_view, nye_view, i)             # <<<<<<<<<<<<<<
- * 
- *         self.__nye = nye
- */
-    __pyx_t_16 = __pyx_f_7atomman_6defect_6Strain_nye_c(__pyx_v_gradG_view, __pyx_v_nye_view, __pyx_v_i); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 405, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_16);
-    __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-  }
-
-  /* "atomman/defect/Strain.pyx":407
- *             nye_c(gradG_view, nye_view, i)
- * 
- *         self.__nye = nye             # <<<<<<<<<<<<<<
- * 
- * @cython.boundscheck(False)
- */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nye, __pyx_v_nye) < 0) __PYX_ERR(0, 407, __pyx_L1_error)
-
-  /* "atomman/defect/Strain.pyx":356
- *         self.__G = G
- * 
- *     def solve_nye(self):             # <<<<<<<<<<<<<<
- *         """
- *         Computes the Nye tensor based on the lattice correspondence tensor G
- */
-
-  /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_2, 1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_4, 1);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_13);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_14, 1);
-  __Pyx_XDECREF(__pyx_t_15);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_AddTraceback("atomman.defect.Strain.Strain.solve_nye", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_G);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_G_view, 1);
-  __Pyx_XDECREF(__pyx_v_system);
-  __Pyx_XDECREF(__pyx_v_nlist);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_nlist_view, 1);
-  __Pyx_XDECREF(__pyx_v_natoms);
-  __Pyx_XDECREF(__pyx_v_nye);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_nye_view, 1);
-  __Pyx_XDECREF(__pyx_v_gradG);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_gradG_view, 1);
-  __Pyx_XDECREF(__pyx_v_gG);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_gG_view, 1);
-  __Pyx_XDECREF(__pyx_v_dG);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_dG_view, 1);
-  __Pyx_XDECREF(__pyx_v_Q);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_Q_view, 1);
-  __Pyx_XDECREF(__pyx_v_c);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "atomman/defect/Strain.pyx":411
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * cdef match_pq(double[:,::1] p,             # <<<<<<<<<<<<<<
- *               double[:,::1] q,
- *               double cos_theta_max,
- */
-
-static PyObject *__pyx_f_7atomman_6defect_6Strain_match_pq(__Pyx_memviewslice __pyx_v_p, __Pyx_memviewslice __pyx_v_q, double __pyx_v_cos_theta_max, __Pyx_memviewslice __pyx_v_P, __Pyx_memviewslice __pyx_v_Q) {
-  Py_ssize_t __pyx_v_pnum;
-  Py_ssize_t __pyx_v_qnum;
-  __Pyx_memviewslice __pyx_v_qp_pairs = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_pmag = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_qmag = { 0, 0, { 0 }, { 0 }, { 0 } };
-  double __pyx_v_r1;
-  double __pyx_v_cos_theta_min;
-  double __pyx_v_jrad;
-  double __pyx_v_krad;
-  Py_ssize_t __pyx_v_j;
-  Py_ssize_t __pyx_v_k;
-  Py_ssize_t __pyx_v_n;
-  Py_ssize_t __pyx_v_x;
-  PyObject *__pyx_v_cos_theta = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  __Pyx_memviewslice __pyx_t_5 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
-  Py_ssize_t __pyx_t_10;
-  Py_ssize_t __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
-  Py_ssize_t __pyx_t_13;
-  Py_ssize_t __pyx_t_14;
-  Py_ssize_t __pyx_t_15;
-  Py_ssize_t __pyx_t_16;
-  Py_ssize_t __pyx_t_17;
-  Py_ssize_t __pyx_t_18;
-  Py_ssize_t __pyx_t_19;
-  Py_ssize_t __pyx_t_20;
-  Py_ssize_t __pyx_t_21;
-  Py_ssize_t __pyx_t_22;
-  int __pyx_t_23;
-  Py_ssize_t __pyx_t_24;
-  Py_ssize_t __pyx_t_25;
-  Py_ssize_t __pyx_t_26;
-  double __pyx_t_27;
-  double __pyx_t_28;
-  PY_LONG_LONG __pyx_t_29;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("match_pq", 0);
-
-  /* "atomman/defect/Strain.pyx":421
- *     """
- *     # Parameter initialization
- *     pnum = p.shape[0]             # <<<<<<<<<<<<<<
- *     qnum = q.shape[0]
- *     cdef long long[:] qp_pairs = np.empty(qnum, dtype='int64')
- */
-  __pyx_v_pnum = (__pyx_v_p.shape[0]);
-
-  /* "atomman/defect/Strain.pyx":422
- *     # Parameter initialization
- *     pnum = p.shape[0]
- *     qnum = q.shape[0]             # <<<<<<<<<<<<<<
- *     cdef long long[:] qp_pairs = np.empty(qnum, dtype='int64')
- *     cdef double [:] pmag = np.empty(pnum)
- */
-  __pyx_v_qnum = (__pyx_v_q.shape[0]);
-
-  /* "atomman/defect/Strain.pyx":423
- *     pnum = p.shape[0]
- *     qnum = q.shape[0]
- *     cdef long long[:] qp_pairs = np.empty(qnum, dtype='int64')             # <<<<<<<<<<<<<<
- *     cdef double [:] pmag = np.empty(pnum)
- *     cdef double [:] qmag = np.empty(qnum)
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 423, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 423, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_qnum); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 423, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 423, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 423, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_n_u_int64) < 0) __PYX_ERR(0, 423, __pyx_L1_error)
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 423, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_ds_PY_LONG_LONG(__pyx_t_4, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 423, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_qp_pairs = __pyx_t_5;
-  __pyx_t_5.memview = NULL;
-  __pyx_t_5.data = NULL;
-
-  /* "atomman/defect/Strain.pyx":424
- *     qnum = q.shape[0]
- *     cdef long long[:] qp_pairs = np.empty(qnum, dtype='int64')
- *     cdef double [:] pmag = np.empty(pnum)             # <<<<<<<<<<<<<<
- *     cdef double [:] qmag = np.empty(qnum)
- * 
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 424, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 424, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_pnum); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 424, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_2)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_2);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-    }
-  }
-  __pyx_t_4 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 424, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_4, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 424, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_pmag = __pyx_t_6;
-  __pyx_t_6.memview = NULL;
-  __pyx_t_6.data = NULL;
-
-  /* "atomman/defect/Strain.pyx":425
- *     cdef long long[:] qp_pairs = np.empty(qnum, dtype='int64')
- *     cdef double [:] pmag = np.empty(pnum)
- *     cdef double [:] qmag = np.empty(qnum)             # <<<<<<<<<<<<<<
- * 
- *     cdef double r1 = 1e16
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 425, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 425, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_qnum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 425, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_1);
-    if (likely(__pyx_t_2)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-      __Pyx_INCREF(__pyx_t_2);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_1, function);
-    }
-  }
-  __pyx_t_4 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 425, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_4, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 425, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_qmag = __pyx_t_6;
-  __pyx_t_6.memview = NULL;
-  __pyx_t_6.data = NULL;
-
-  /* "atomman/defect/Strain.pyx":427
- *     cdef double [:] qmag = np.empty(qnum)
- * 
- *     cdef double r1 = 1e16             # <<<<<<<<<<<<<<
- *     cdef double cos_theta_min, jrad, krad
- * 
- */
-  __pyx_v_r1 = 1e16;
-
-  /* "atomman/defect/Strain.pyx":433
- * 
- *     # Compute magnitudes of q and set all qp_pairs to -1
- *     for j in range(qnum):             # <<<<<<<<<<<<<<
- *         qmag[j] = sqrt(q[j,0] * q[j,0] + q[j,1] * q[j,1] + q[j,2] * q[j,2])
- *         qp_pairs[j] = -1
- */
-  __pyx_t_7 = __pyx_v_qnum;
-  __pyx_t_8 = __pyx_t_7;
-  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
-    __pyx_v_j = __pyx_t_9;
-
-    /* "atomman/defect/Strain.pyx":434
- *     # Compute magnitudes of q and set all qp_pairs to -1
- *     for j in range(qnum):
- *         qmag[j] = sqrt(q[j,0] * q[j,0] + q[j,1] * q[j,1] + q[j,2] * q[j,2])             # <<<<<<<<<<<<<<
- *         qp_pairs[j] = -1
- * 
- */
-    __pyx_t_10 = __pyx_v_j;
-    __pyx_t_11 = 0;
-    __pyx_t_12 = __pyx_v_j;
-    __pyx_t_13 = 0;
-    __pyx_t_14 = __pyx_v_j;
-    __pyx_t_15 = 1;
-    __pyx_t_16 = __pyx_v_j;
-    __pyx_t_17 = 1;
-    __pyx_t_18 = __pyx_v_j;
-    __pyx_t_19 = 2;
-    __pyx_t_20 = __pyx_v_j;
-    __pyx_t_21 = 2;
-    __pyx_t_22 = __pyx_v_j;
-    *((double *) ( /* dim=0 */ (__pyx_v_qmag.data + __pyx_t_22 * __pyx_v_qmag.strides[0]) )) = sqrt(((((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_10 * __pyx_v_q.strides[0]) )) + __pyx_t_11)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_12 * __pyx_v_q.strides[0]) )) + __pyx_t_13)) )))) + ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_14 * __pyx_v_q.strides[0]) )) + __pyx_t_15)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_16 * __pyx_v_q.strides[0]) )) + __pyx_t_17)) ))))) + ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_18 * __pyx_v_q.strides[0]) )) + __pyx_t_19)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_20 * __pyx_v_q.strides[0]) )) + __pyx_t_21)) ))))));
-
-    /* "atomman/defect/Strain.pyx":435
- *     for j in range(qnum):
- *         qmag[j] = sqrt(q[j,0] * q[j,0] + q[j,1] * q[j,1] + q[j,2] * q[j,2])
- *         qp_pairs[j] = -1             # <<<<<<<<<<<<<<
- * 
- *     # Compute magnitudes of p and find the shortest r1
- */
-    __pyx_t_21 = __pyx_v_j;
-    *((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_qp_pairs.data + __pyx_t_21 * __pyx_v_qp_pairs.strides[0]) )) = -1LL;
-  }
-
-  /* "atomman/defect/Strain.pyx":438
- * 
- *     # Compute magnitudes of p and find the shortest r1
- *     for k in range(pnum):             # <<<<<<<<<<<<<<
- *         pmag[k] = sqrt(p[k,0] * p[k,0] + p[k,1] * p[k,1] + p[k,2] * p[k,2])
- *         if pmag[k] < r1:
- */
-  __pyx_t_7 = __pyx_v_pnum;
-  __pyx_t_8 = __pyx_t_7;
-  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
-    __pyx_v_k = __pyx_t_9;
-
-    /* "atomman/defect/Strain.pyx":439
- *     # Compute magnitudes of p and find the shortest r1
- *     for k in range(pnum):
- *         pmag[k] = sqrt(p[k,0] * p[k,0] + p[k,1] * p[k,1] + p[k,2] * p[k,2])             # <<<<<<<<<<<<<<
- *         if pmag[k] < r1:
- *             r1 = pmag[k]
- */
-    __pyx_t_21 = __pyx_v_k;
-    __pyx_t_20 = 0;
-    __pyx_t_19 = __pyx_v_k;
-    __pyx_t_18 = 0;
-    __pyx_t_17 = __pyx_v_k;
-    __pyx_t_16 = 1;
-    __pyx_t_15 = __pyx_v_k;
-    __pyx_t_14 = 1;
-    __pyx_t_13 = __pyx_v_k;
-    __pyx_t_12 = 2;
-    __pyx_t_11 = __pyx_v_k;
-    __pyx_t_10 = 2;
-    __pyx_t_22 = __pyx_v_k;
-    *((double *) ( /* dim=0 */ (__pyx_v_pmag.data + __pyx_t_22 * __pyx_v_pmag.strides[0]) )) = sqrt(((((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_21 * __pyx_v_p.strides[0]) )) + __pyx_t_20)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_19 * __pyx_v_p.strides[0]) )) + __pyx_t_18)) )))) + ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_17 * __pyx_v_p.strides[0]) )) + __pyx_t_16)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_15 * __pyx_v_p.strides[0]) )) + __pyx_t_14)) ))))) + ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_13 * __pyx_v_p.strides[0]) )) + __pyx_t_12)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_11 * __pyx_v_p.strides[0]) )) + __pyx_t_10)) ))))));
-
-    /* "atomman/defect/Strain.pyx":440
- *     for k in range(pnum):
- *         pmag[k] = sqrt(p[k,0] * p[k,0] + p[k,1] * p[k,1] + p[k,2] * p[k,2])
- *         if pmag[k] < r1:             # <<<<<<<<<<<<<<
- *             r1 = pmag[k]
- * 
- */
-    __pyx_t_10 = __pyx_v_k;
-    __pyx_t_23 = (((*((double *) ( /* dim=0 */ (__pyx_v_pmag.data + __pyx_t_10 * __pyx_v_pmag.strides[0]) ))) < __pyx_v_r1) != 0);
-    if (__pyx_t_23) {
-
-      /* "atomman/defect/Strain.pyx":441
- *         pmag[k] = sqrt(p[k,0] * p[k,0] + p[k,1] * p[k,1] + p[k,2] * p[k,2])
- *         if pmag[k] < r1:
- *             r1 = pmag[k]             # <<<<<<<<<<<<<<
- * 
- *     # Loop over all q
- */
-      __pyx_t_10 = __pyx_v_k;
-      __pyx_v_r1 = (*((double *) ( /* dim=0 */ (__pyx_v_pmag.data + __pyx_t_10 * __pyx_v_pmag.strides[0]) )));
-
-      /* "atomman/defect/Strain.pyx":440
- *     for k in range(pnum):
- *         pmag[k] = sqrt(p[k,0] * p[k,0] + p[k,1] * p[k,1] + p[k,2] * p[k,2])
- *         if pmag[k] < r1:             # <<<<<<<<<<<<<<
- *             r1 = pmag[k]
- * 
- */
-    }
-  }
-
-  /* "atomman/defect/Strain.pyx":444
- * 
- *     # Loop over all q
- *     for j in range(qnum):             # <<<<<<<<<<<<<<
- *         cos_theta_min = cos_theta_max
- * 
- */
-  __pyx_t_7 = __pyx_v_qnum;
-  __pyx_t_8 = __pyx_t_7;
-  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
-    __pyx_v_j = __pyx_t_9;
-
-    /* "atomman/defect/Strain.pyx":445
- *     # Loop over all q
- *     for j in range(qnum):
- *         cos_theta_min = cos_theta_max             # <<<<<<<<<<<<<<
- * 
- *         # Loop over all p
- */
-    __pyx_v_cos_theta_min = __pyx_v_cos_theta_max;
-
-    /* "atomman/defect/Strain.pyx":448
- * 
- *         # Loop over all p
- *         for k in range(pnum):             # <<<<<<<<<<<<<<
- * 
- *             # Compute cos theta between p and q
- */
-    __pyx_t_24 = __pyx_v_pnum;
-    __pyx_t_25 = __pyx_t_24;
-    for (__pyx_t_26 = 0; __pyx_t_26 < __pyx_t_25; __pyx_t_26+=1) {
-      __pyx_v_k = __pyx_t_26;
-
-      /* "atomman/defect/Strain.pyx":451
- * 
- *             # Compute cos theta between p and q
- *             cos_theta = (q[j,0] * p[k,0] + q[j,1] * p[k,1] + q[j,2] * p[k,2]) / (qmag[j] * pmag[k])             # <<<<<<<<<<<<<<
- * 
- *             # Select q-p pair with the smallest theta angle (largest cos theta)
- */
-      __pyx_t_10 = __pyx_v_j;
-      __pyx_t_11 = 0;
-      __pyx_t_12 = __pyx_v_k;
-      __pyx_t_13 = 0;
-      __pyx_t_14 = __pyx_v_j;
-      __pyx_t_15 = 1;
-      __pyx_t_16 = __pyx_v_k;
-      __pyx_t_17 = 1;
-      __pyx_t_18 = __pyx_v_j;
-      __pyx_t_19 = 2;
-      __pyx_t_20 = __pyx_v_k;
-      __pyx_t_21 = 2;
-      __pyx_t_27 = ((((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_10 * __pyx_v_q.strides[0]) )) + __pyx_t_11)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_12 * __pyx_v_p.strides[0]) )) + __pyx_t_13)) )))) + ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_14 * __pyx_v_q.strides[0]) )) + __pyx_t_15)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_16 * __pyx_v_p.strides[0]) )) + __pyx_t_17)) ))))) + ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_18 * __pyx_v_q.strides[0]) )) + __pyx_t_19)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_20 * __pyx_v_p.strides[0]) )) + __pyx_t_21)) )))));
-      __pyx_t_21 = __pyx_v_j;
-      __pyx_t_20 = __pyx_v_k;
-      __pyx_t_28 = ((*((double *) ( /* dim=0 */ (__pyx_v_qmag.data + __pyx_t_21 * __pyx_v_qmag.strides[0]) ))) * (*((double *) ( /* dim=0 */ (__pyx_v_pmag.data + __pyx_t_20 * __pyx_v_pmag.strides[0]) ))));
-      if (unlikely(__pyx_t_28 == 0)) {
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 451, __pyx_L1_error)
-      }
-      __pyx_t_4 = PyFloat_FromDouble((__pyx_t_27 / __pyx_t_28)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 451, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_XDECREF_SET(__pyx_v_cos_theta, __pyx_t_4);
-      __pyx_t_4 = 0;
-
-      /* "atomman/defect/Strain.pyx":454
- * 
- *             # Select q-p pair with the smallest theta angle (largest cos theta)
- *             if cos_theta > cos_theta_min:             # <<<<<<<<<<<<<<
- *                 cos_theta_min = cos_theta
- *                 qp_pairs[j] = k
- */
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_cos_theta_min); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 454, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_1 = PyObject_RichCompare(__pyx_v_cos_theta, __pyx_t_4, Py_GT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 454, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_23 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_23 < 0)) __PYX_ERR(0, 454, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      if (__pyx_t_23) {
-
-        /* "atomman/defect/Strain.pyx":455
- *             # Select q-p pair with the smallest theta angle (largest cos theta)
- *             if cos_theta > cos_theta_min:
- *                 cos_theta_min = cos_theta             # <<<<<<<<<<<<<<
- *                 qp_pairs[j] = k
- * 
- */
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_cos_theta); if (unlikely((__pyx_t_28 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 455, __pyx_L1_error)
-        __pyx_v_cos_theta_min = __pyx_t_28;
-
-        /* "atomman/defect/Strain.pyx":456
- *             if cos_theta > cos_theta_min:
- *                 cos_theta_min = cos_theta
- *                 qp_pairs[j] = k             # <<<<<<<<<<<<<<
- * 
- *         # Check if the best p is already assigned to another q
- */
-        __pyx_t_20 = __pyx_v_j;
-        *((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_qp_pairs.data + __pyx_t_20 * __pyx_v_qp_pairs.strides[0]) )) = __pyx_v_k;
-
-        /* "atomman/defect/Strain.pyx":454
- * 
- *             # Select q-p pair with the smallest theta angle (largest cos theta)
- *             if cos_theta > cos_theta_min:             # <<<<<<<<<<<<<<
- *                 cos_theta_min = cos_theta
- *                 qp_pairs[j] = k
- */
-      }
-    }
-
-    /* "atomman/defect/Strain.pyx":459
- * 
- *         # Check if the best p is already assigned to another q
- *         if qp_pairs[j] >= 0:             # <<<<<<<<<<<<<<
- *             for k in range(j):
- *                 if qp_pairs[j] == qp_pairs[k]:
- */
-    __pyx_t_20 = __pyx_v_j;
-    __pyx_t_23 = (((*((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_qp_pairs.data + __pyx_t_20 * __pyx_v_qp_pairs.strides[0]) ))) >= 0) != 0);
-    if (__pyx_t_23) {
-
-      /* "atomman/defect/Strain.pyx":460
- *         # Check if the best p is already assigned to another q
- *         if qp_pairs[j] >= 0:
- *             for k in range(j):             # <<<<<<<<<<<<<<
- *                 if qp_pairs[j] == qp_pairs[k]:
- *                     jrad = fabs(r1 - qmag[j])
- */
-      __pyx_t_24 = __pyx_v_j;
-      __pyx_t_25 = __pyx_t_24;
-      for (__pyx_t_26 = 0; __pyx_t_26 < __pyx_t_25; __pyx_t_26+=1) {
-        __pyx_v_k = __pyx_t_26;
-
-        /* "atomman/defect/Strain.pyx":461
- *         if qp_pairs[j] >= 0:
- *             for k in range(j):
- *                 if qp_pairs[j] == qp_pairs[k]:             # <<<<<<<<<<<<<<
- *                     jrad = fabs(r1 - qmag[j])
- *                     krad = fabs(r1 - qmag[k])
- */
-        __pyx_t_20 = __pyx_v_j;
-        __pyx_t_21 = __pyx_v_k;
-        __pyx_t_23 = (((*((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_qp_pairs.data + __pyx_t_20 * __pyx_v_qp_pairs.strides[0]) ))) == (*((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_qp_pairs.data + __pyx_t_21 * __pyx_v_qp_pairs.strides[0]) )))) != 0);
-        if (__pyx_t_23) {
-
-          /* "atomman/defect/Strain.pyx":462
- *             for k in range(j):
- *                 if qp_pairs[j] == qp_pairs[k]:
- *                     jrad = fabs(r1 - qmag[j])             # <<<<<<<<<<<<<<
- *                     krad = fabs(r1 - qmag[k])
- * 
- */
-          __pyx_t_21 = __pyx_v_j;
-          __pyx_v_jrad = fabs((__pyx_v_r1 - (*((double *) ( /* dim=0 */ (__pyx_v_qmag.data + __pyx_t_21 * __pyx_v_qmag.strides[0]) )))));
-
-          /* "atomman/defect/Strain.pyx":463
- *                 if qp_pairs[j] == qp_pairs[k]:
- *                     jrad = fabs(r1 - qmag[j])
- *                     krad = fabs(r1 - qmag[k])             # <<<<<<<<<<<<<<
- * 
- *                     # Remove the p-q pair that is farther from r1
- */
-          __pyx_t_21 = __pyx_v_k;
-          __pyx_v_krad = fabs((__pyx_v_r1 - (*((double *) ( /* dim=0 */ (__pyx_v_qmag.data + __pyx_t_21 * __pyx_v_qmag.strides[0]) )))));
-
-          /* "atomman/defect/Strain.pyx":466
- * 
- *                     # Remove the p-q pair that is farther from r1
- *                     if jrad < krad:             # <<<<<<<<<<<<<<
- *                         qp_pairs[k]=-1
- *                     else:
- */
-          __pyx_t_23 = ((__pyx_v_jrad < __pyx_v_krad) != 0);
-          if (__pyx_t_23) {
 
-            /* "atomman/defect/Strain.pyx":467
- *                     # Remove the p-q pair that is farther from r1
- *                     if jrad < krad:
- *                         qp_pairs[k]=-1             # <<<<<<<<<<<<<<
- *                     else:
- *                         qp_pairs[j]=-1
+  /* "atomman/defect/Strain.pyx":398
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,
+ *                                       self.neighbors.nlist, G=G,
+ *                                       nprocs=self.nprocs)['nye']             # <<<<<<<<<<<<<<
+ * 
+ * @cython.boundscheck(False)
  */
-            __pyx_t_21 = __pyx_v_k;
-            *((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_qp_pairs.data + __pyx_t_21 * __pyx_v_qp_pairs.strides[0]) )) = -1LL;
+  /*else*/ {
 
-            /* "atomman/defect/Strain.pyx":466
- * 
- *                     # Remove the p-q pair that is farther from r1
- *                     if jrad < krad:             # <<<<<<<<<<<<<<
- *                         qp_pairs[k]=-1
- *                     else:
+    /* "atomman/defect/Strain.pyx":396
+ *                                    self.neighbors.nlist, G)
+ *         else:
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                       self.neighbors.nlist, G=G,
+ *                                       nprocs=self.nprocs)['nye']
  */
-            goto __pyx_L17;
-          }
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_batch_strain); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 396, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_atoms); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 396, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_pos); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 396, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_box); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 396, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_system, __pyx_n_s_pbc); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 396, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
 
-          /* "atomman/defect/Strain.pyx":469
- *                         qp_pairs[k]=-1
- *                     else:
- *                         qp_pairs[j]=-1             # <<<<<<<<<<<<<<
+    /* "atomman/defect/Strain.pyx":397
+ *         else:
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,
+ *                                       self.neighbors.nlist, G=G,             # <<<<<<<<<<<<<<
+ *                                       nprocs=self.nprocs)['nye']
  * 
- *     # Construct reduced P, Q matrices from p-q pairs
  */
-          /*else*/ {
-            __pyx_t_21 = __pyx_v_j;
-            *((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_qp_pairs.data + __pyx_t_21 * __pyx_v_qp_pairs.strides[0]) )) = -1LL;
-          }
-          __pyx_L17:;
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_neighbors); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 397, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_nlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 397, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-          /* "atomman/defect/Strain.pyx":461
- *         if qp_pairs[j] >= 0:
- *             for k in range(j):
- *                 if qp_pairs[j] == qp_pairs[k]:             # <<<<<<<<<<<<<<
- *                     jrad = fabs(r1 - qmag[j])
- *                     krad = fabs(r1 - qmag[k])
+    /* "atomman/defect/Strain.pyx":396
+ *                                    self.neighbors.nlist, G)
+ *         else:
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                       self.neighbors.nlist, G=G,
+ *                                       nprocs=self.nprocs)['nye']
  */
-        }
-      }
+    __pyx_t_7 = PyTuple_New(4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 396, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_11);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_11);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_5);
+    __pyx_t_11 = 0;
+    __pyx_t_3 = 0;
+    __pyx_t_9 = 0;
+    __pyx_t_5 = 0;
 
-      /* "atomman/defect/Strain.pyx":459
+    /* "atomman/defect/Strain.pyx":397
+ *         else:
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,
+ *                                       self.neighbors.nlist, G=G,             # <<<<<<<<<<<<<<
+ *                                       nprocs=self.nprocs)['nye']
  * 
- *         # Check if the best p is already assigned to another q
- *         if qp_pairs[j] >= 0:             # <<<<<<<<<<<<<<
- *             for k in range(j):
- *                 if qp_pairs[j] == qp_pairs[k]:
  */
-    }
-  }
+    __pyx_t_5 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 397, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_G, __pyx_v_G) < 0) __PYX_ERR(0, 397, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":472
+    /* "atomman/defect/Strain.pyx":398
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,
+ *                                       self.neighbors.nlist, G=G,
+ *                                       nprocs=self.nprocs)['nye']             # <<<<<<<<<<<<<<
  * 
- *     # Construct reduced P, Q matrices from p-q pairs
- *     n = 0             # <<<<<<<<<<<<<<
- *     for j in range(qnum):
- *         if qp_pairs[j] >= 0:
+ * @cython.boundscheck(False)
  */
-  __pyx_v_n = 0;
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_nprocs); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 398, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_nprocs, __pyx_t_9) < 0) __PYX_ERR(0, 397, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "atomman/defect/Strain.pyx":473
- *     # Construct reduced P, Q matrices from p-q pairs
- *     n = 0
- *     for j in range(qnum):             # <<<<<<<<<<<<<<
- *         if qp_pairs[j] >= 0:
- *             for x in range(3):
- */
-  __pyx_t_7 = __pyx_v_qnum;
-  __pyx_t_8 = __pyx_t_7;
-  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
-    __pyx_v_j = __pyx_t_9;
-
-    /* "atomman/defect/Strain.pyx":474
- *     n = 0
- *     for j in range(qnum):
- *         if qp_pairs[j] >= 0:             # <<<<<<<<<<<<<<
- *             for x in range(3):
- *                 Q[n,x] = q[j,x]
- */
-    __pyx_t_21 = __pyx_v_j;
-    __pyx_t_23 = (((*((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_qp_pairs.data + __pyx_t_21 * __pyx_v_qp_pairs.strides[0]) ))) >= 0) != 0);
-    if (__pyx_t_23) {
-
-      /* "atomman/defect/Strain.pyx":475
- *     for j in range(qnum):
- *         if qp_pairs[j] >= 0:
- *             for x in range(3):             # <<<<<<<<<<<<<<
- *                 Q[n,x] = q[j,x]
- *                 P[n,x] = p[qp_pairs[j],x]
- */
-      for (__pyx_t_24 = 0; __pyx_t_24 < 3; __pyx_t_24+=1) {
-        __pyx_v_x = __pyx_t_24;
-
-        /* "atomman/defect/Strain.pyx":476
- *         if qp_pairs[j] >= 0:
- *             for x in range(3):
- *                 Q[n,x] = q[j,x]             # <<<<<<<<<<<<<<
- *                 P[n,x] = p[qp_pairs[j],x]
- *             n+=1
+    /* "atomman/defect/Strain.pyx":396
+ *                                    self.neighbors.nlist, G)
+ *         else:
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                       self.neighbors.nlist, G=G,
+ *                                       nprocs=self.nprocs)['nye']
  */
-        __pyx_t_21 = __pyx_v_j;
-        __pyx_t_20 = __pyx_v_x;
-        __pyx_t_19 = __pyx_v_n;
-        __pyx_t_18 = __pyx_v_x;
-        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_Q.data + __pyx_t_19 * __pyx_v_Q.strides[0]) )) + __pyx_t_18)) )) = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_q.data + __pyx_t_21 * __pyx_v_q.strides[0]) )) + __pyx_t_20)) )));
-
-        /* "atomman/defect/Strain.pyx":477
- *             for x in range(3):
- *                 Q[n,x] = q[j,x]
- *                 P[n,x] = p[qp_pairs[j],x]             # <<<<<<<<<<<<<<
- *             n+=1
- * 
- */
-        __pyx_t_20 = __pyx_v_j;
-        __pyx_t_29 = (*((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_qp_pairs.data + __pyx_t_20 * __pyx_v_qp_pairs.strides[0]) )));
-        __pyx_t_21 = __pyx_v_x;
-        __pyx_t_18 = __pyx_v_n;
-        __pyx_t_19 = __pyx_v_x;
-        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_P.data + __pyx_t_18 * __pyx_v_P.strides[0]) )) + __pyx_t_19)) )) = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_p.data + __pyx_t_29 * __pyx_v_p.strides[0]) )) + __pyx_t_21)) )));
-      }
+    __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, __pyx_t_5); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 396, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-      /* "atomman/defect/Strain.pyx":478
- *                 Q[n,x] = q[j,x]
- *                 P[n,x] = p[qp_pairs[j],x]
- *             n+=1             # <<<<<<<<<<<<<<
+    /* "atomman/defect/Strain.pyx":398
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,
+ *                                       self.neighbors.nlist, G=G,
+ *                                       nprocs=self.nprocs)['nye']             # <<<<<<<<<<<<<<
  * 
- *     # Return number of matching P-Q pairs
+ * @cython.boundscheck(False)
  */
-      __pyx_v_n = (__pyx_v_n + 1);
+    __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_t_9, __pyx_n_u_nye); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 398, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-      /* "atomman/defect/Strain.pyx":474
- *     n = 0
- *     for j in range(qnum):
- *         if qp_pairs[j] >= 0:             # <<<<<<<<<<<<<<
- *             for x in range(3):
- *                 Q[n,x] = q[j,x]
+    /* "atomman/defect/Strain.pyx":396
+ *                                    self.neighbors.nlist, G)
+ *         else:
+ *             self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,             # <<<<<<<<<<<<<<
+ *                                       self.neighbors.nlist, G=G,
+ *                                       nprocs=self.nprocs)['nye']
  */
-    }
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_Strain__nye, __pyx_t_5) < 0) __PYX_ERR(0, 396, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
+  __pyx_L4:;
 
-  /* "atomman/defect/Strain.pyx":481
+  /* "atomman/defect/Strain.pyx":375
+ *             self.__angularvelocity = results['angularvelocity']
  * 
- *     # Return number of matching P-Q pairs
- *     return n             # <<<<<<<<<<<<<<
- * 
- * @cython.boundscheck(False)
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_n); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 481, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "atomman/defect/Strain.pyx":411
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * cdef match_pq(double[:,::1] p,             # <<<<<<<<<<<<<<
- *               double[:,::1] q,
- *               double cos_theta_max,
+ *     def solve_nye(self, nprocs=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Computes the Nye tensor based on the lattice correspondence tensor G
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_5, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_6, 1);
-  __Pyx_AddTraceback("atomman.defect.Strain.match_pq", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("atomman.defect.Strain.Strain.solve_nye", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
-  __PYX_XDEC_MEMVIEW(&__pyx_v_qp_pairs, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_pmag, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_qmag, 1);
-  __Pyx_XDECREF(__pyx_v_cos_theta);
+  __Pyx_XDECREF(__pyx_v_G);
+  __Pyx_XDECREF(__pyx_v_system);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":485
+/* "atomman/defect/Strain.pyx":402
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef strain_c(const double[:,:,::1] G):             # <<<<<<<<<<<<<<
@@ -8525,7 +7728,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("strain_c", 0);
 
-  /* "atomman/defect/Strain.pyx":490
+  /* "atomman/defect/Strain.pyx":407
  *     """
  *     # Parameter initialization
  *     natoms = G.shape[0]             # <<<<<<<<<<<<<<
@@ -8534,16 +7737,16 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
  */
   __pyx_v_natoms = (__pyx_v_G.shape[0]);
 
-  /* "atomman/defect/Strain.pyx":491
+  /* "atomman/defect/Strain.pyx":408
  *     # Parameter initialization
  *     natoms = G.shape[0]
  *     ident = np.identity(3)             # <<<<<<<<<<<<<<
  *     cdef double [:,::1] identity = ident
  * 
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 408, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_identity); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_identity); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 408, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -8558,39 +7761,39 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_int_3) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_int_3);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 491, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 408, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_ident = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":492
+  /* "atomman/defect/Strain.pyx":409
  *     natoms = G.shape[0]
  *     ident = np.identity(3)
  *     cdef double [:,::1] identity = ident             # <<<<<<<<<<<<<<
  * 
  *     strain = np.empty((natoms, 3, 3))
  */
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_ident, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 492, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_ident, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 409, __pyx_L1_error)
   __pyx_v_identity = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
 
-  /* "atomman/defect/Strain.pyx":494
+  /* "atomman/defect/Strain.pyx":411
  *     cdef double [:,::1] identity = ident
  * 
  *     strain = np.empty((natoms, 3, 3))             # <<<<<<<<<<<<<<
  *     cdef double [:,:,::1] strain_view = strain
  *     cdef Py_ssize_t i, j, k
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 411, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 411, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 411, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 411, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
@@ -8614,25 +7817,25 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 494, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 411, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_strain = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":495
+  /* "atomman/defect/Strain.pyx":412
  * 
  *     strain = np.empty((natoms, 3, 3))
  *     cdef double [:,:,::1] strain_view = strain             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t i, j, k
  * 
  */
-  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(__pyx_v_strain, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 495, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(__pyx_v_strain, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 412, __pyx_L1_error)
   __pyx_v_strain_view = __pyx_t_6;
   __pyx_t_6.memview = NULL;
   __pyx_t_6.data = NULL;
 
-  /* "atomman/defect/Strain.pyx":499
+  /* "atomman/defect/Strain.pyx":416
  * 
  *     # _jk = ((I_jk - G_jk) + (I_kj - G_kj)) / 2
  *     for i in range(natoms):             # <<<<<<<<<<<<<<
@@ -8644,7 +7847,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
   for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
     __pyx_v_i = __pyx_t_9;
 
-    /* "atomman/defect/Strain.pyx":500
+    /* "atomman/defect/Strain.pyx":417
  *     # _jk = ((I_jk - G_jk) + (I_kj - G_kj)) / 2
  *     for i in range(natoms):
  *         for j in range(3):             # <<<<<<<<<<<<<<
@@ -8654,7 +7857,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
     for (__pyx_t_10 = 0; __pyx_t_10 < 3; __pyx_t_10+=1) {
       __pyx_v_j = __pyx_t_10;
 
-      /* "atomman/defect/Strain.pyx":501
+      /* "atomman/defect/Strain.pyx":418
  *     for i in range(natoms):
  *         for j in range(3):
  *             for k in range(3):             # <<<<<<<<<<<<<<
@@ -8664,7 +7867,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
       for (__pyx_t_11 = 0; __pyx_t_11 < 3; __pyx_t_11+=1) {
         __pyx_v_k = __pyx_t_11;
 
-        /* "atomman/defect/Strain.pyx":502
+        /* "atomman/defect/Strain.pyx":419
  *         for j in range(3):
  *             for k in range(3):
  *                 strain_view[i,j,k] = ((identity[j,k] - G[i,j,k]) + (identity[k,j] - G[i,k,j])) / 2.             # <<<<<<<<<<<<<<
@@ -8689,7 +7892,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
     }
   }
 
-  /* "atomman/defect/Strain.pyx":503
+  /* "atomman/defect/Strain.pyx":420
  *             for k in range(3):
  *                 strain_view[i,j,k] = ((identity[j,k] - G[i,j,k]) + (identity[k,j] - G[i,k,j])) / 2.
  *     return strain             # <<<<<<<<<<<<<<
@@ -8701,7 +7904,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
   __pyx_r = __pyx_v_strain;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":485
+  /* "atomman/defect/Strain.pyx":402
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef strain_c(const double[:,:,::1] G):             # <<<<<<<<<<<<<<
@@ -8729,7 +7932,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_strain_c(__Pyx_memviewslice __
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":507
+/* "atomman/defect/Strain.pyx":424
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef invariant1_c(const double [:,:,::1] strain):             # <<<<<<<<<<<<<<
@@ -8767,7 +7970,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant1_c(__Pyx_memviewslic
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("invariant1_c", 0);
 
-  /* "atomman/defect/Strain.pyx":512
+  /* "atomman/defect/Strain.pyx":429
  *     """
  *     # Parameter initialization
  *     natoms = strain.shape[0]             # <<<<<<<<<<<<<<
@@ -8776,19 +7979,19 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant1_c(__Pyx_memviewslic
  */
   __pyx_v_natoms = (__pyx_v_strain.shape[0]);
 
-  /* "atomman/defect/Strain.pyx":514
+  /* "atomman/defect/Strain.pyx":431
  *     natoms = strain.shape[0]
  * 
  *     invar = np.empty(natoms)             # <<<<<<<<<<<<<<
  *     cdef double [::1] invar_view = invar
  *     cdef Py_ssize_t i
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 514, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 431, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 514, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 431, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 514, __pyx_L1_error)
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 431, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -8803,25 +8006,25 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant1_c(__Pyx_memviewslic
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 514, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 431, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_invar = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":515
+  /* "atomman/defect/Strain.pyx":432
  * 
  *     invar = np.empty(natoms)
  *     cdef double [::1] invar_view = invar             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t i
  * 
  */
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_v_invar, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 515, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_v_invar, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 432, __pyx_L1_error)
   __pyx_v_invar_view = __pyx_t_5;
   __pyx_t_5.memview = NULL;
   __pyx_t_5.data = NULL;
 
-  /* "atomman/defect/Strain.pyx":519
+  /* "atomman/defect/Strain.pyx":436
  * 
  *     # I1 = trace(_ij)
  *     for i in range(natoms):             # <<<<<<<<<<<<<<
@@ -8833,7 +8036,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant1_c(__Pyx_memviewslic
   for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
     __pyx_v_i = __pyx_t_8;
 
-    /* "atomman/defect/Strain.pyx":520
+    /* "atomman/defect/Strain.pyx":437
  *     # I1 = trace(_ij)
  *     for i in range(natoms):
  *         invar_view[i] = strain[i,0,0] + strain[i,1,1] + strain[i,2,2]             # <<<<<<<<<<<<<<
@@ -8853,7 +8056,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant1_c(__Pyx_memviewslic
     *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_invar_view.data) + __pyx_t_18)) )) = (((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_9 * __pyx_v_strain.strides[0]) ) + __pyx_t_10 * __pyx_v_strain.strides[1]) )) + __pyx_t_11)) ))) + (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_12 * __pyx_v_strain.strides[0]) ) + __pyx_t_13 * __pyx_v_strain.strides[1]) )) + __pyx_t_14)) )))) + (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_15 * __pyx_v_strain.strides[0]) ) + __pyx_t_16 * __pyx_v_strain.strides[1]) )) + __pyx_t_17)) ))));
   }
 
-  /* "atomman/defect/Strain.pyx":522
+  /* "atomman/defect/Strain.pyx":439
  *         invar_view[i] = strain[i,0,0] + strain[i,1,1] + strain[i,2,2]
  * 
  *     return invar             # <<<<<<<<<<<<<<
@@ -8865,7 +8068,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant1_c(__Pyx_memviewslic
   __pyx_r = __pyx_v_invar;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":507
+  /* "atomman/defect/Strain.pyx":424
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef invariant1_c(const double [:,:,::1] strain):             # <<<<<<<<<<<<<<
@@ -8890,7 +8093,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant1_c(__Pyx_memviewslic
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":526
+/* "atomman/defect/Strain.pyx":443
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef invariant2_c(const double [:,:,::1] strain):             # <<<<<<<<<<<<<<
@@ -8955,7 +8158,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("invariant2_c", 0);
 
-  /* "atomman/defect/Strain.pyx":531
+  /* "atomman/defect/Strain.pyx":448
  *     """
  *     # Parameter initialization
  *     natoms = strain.shape[0]             # <<<<<<<<<<<<<<
@@ -8964,19 +8167,19 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
  */
   __pyx_v_natoms = (__pyx_v_strain.shape[0]);
 
-  /* "atomman/defect/Strain.pyx":533
+  /* "atomman/defect/Strain.pyx":450
  *     natoms = strain.shape[0]
  * 
  *     invar = np.empty(natoms)             # <<<<<<<<<<<<<<
  *     cdef double [::1] invar_view = invar
  *     cdef Py_ssize_t i
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -8991,25 +8194,25 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 533, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_invar = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":534
+  /* "atomman/defect/Strain.pyx":451
  * 
  *     invar = np.empty(natoms)
  *     cdef double [::1] invar_view = invar             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t i
  * 
  */
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_v_invar, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_v_invar, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 451, __pyx_L1_error)
   __pyx_v_invar_view = __pyx_t_5;
   __pyx_t_5.memview = NULL;
   __pyx_t_5.data = NULL;
 
-  /* "atomman/defect/Strain.pyx":538
+  /* "atomman/defect/Strain.pyx":455
  * 
  *     # I2 = trace(_ij)
  *     for i in range(natoms):             # <<<<<<<<<<<<<<
@@ -9021,7 +8224,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
   for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
     __pyx_v_i = __pyx_t_8;
 
-    /* "atomman/defect/Strain.pyx":539
+    /* "atomman/defect/Strain.pyx":456
  *     # I2 = trace(_ij)
  *     for i in range(natoms):
  *         invar_view[i] = ( strain[i,0,0] * strain[i,1,1]             # <<<<<<<<<<<<<<
@@ -9035,7 +8238,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
     __pyx_t_13 = 1;
     __pyx_t_14 = 1;
 
-    /* "atomman/defect/Strain.pyx":540
+    /* "atomman/defect/Strain.pyx":457
  *     for i in range(natoms):
  *         invar_view[i] = ( strain[i,0,0] * strain[i,1,1]
  *                         + strain[i,0,0] * strain[i,2,2]             # <<<<<<<<<<<<<<
@@ -9049,7 +8252,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
     __pyx_t_19 = 2;
     __pyx_t_20 = 2;
 
-    /* "atomman/defect/Strain.pyx":541
+    /* "atomman/defect/Strain.pyx":458
  *         invar_view[i] = ( strain[i,0,0] * strain[i,1,1]
  *                         + strain[i,0,0] * strain[i,2,2]
  *                         + strain[i,1,1] * strain[i,2,2]             # <<<<<<<<<<<<<<
@@ -9063,7 +8266,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
     __pyx_t_25 = 2;
     __pyx_t_26 = 2;
 
-    /* "atomman/defect/Strain.pyx":542
+    /* "atomman/defect/Strain.pyx":459
  *                         + strain[i,0,0] * strain[i,2,2]
  *                         + strain[i,1,1] * strain[i,2,2]
  *                         - strain[i,0,1] * strain[i,1,0]             # <<<<<<<<<<<<<<
@@ -9077,7 +8280,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
     __pyx_t_31 = 1;
     __pyx_t_32 = 0;
 
-    /* "atomman/defect/Strain.pyx":543
+    /* "atomman/defect/Strain.pyx":460
  *                         + strain[i,1,1] * strain[i,2,2]
  *                         - strain[i,0,1] * strain[i,1,0]
  *                         - strain[i,0,2] * strain[i,2,0]             # <<<<<<<<<<<<<<
@@ -9091,7 +8294,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
     __pyx_t_37 = 2;
     __pyx_t_38 = 0;
 
-    /* "atomman/defect/Strain.pyx":544
+    /* "atomman/defect/Strain.pyx":461
  *                         - strain[i,0,1] * strain[i,1,0]
  *                         - strain[i,0,2] * strain[i,2,0]
  *                         - strain[i,1,2] * strain[i,2,1])             # <<<<<<<<<<<<<<
@@ -9105,7 +8308,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
     __pyx_t_43 = 2;
     __pyx_t_44 = 1;
 
-    /* "atomman/defect/Strain.pyx":539
+    /* "atomman/defect/Strain.pyx":456
  *     # I2 = trace(_ij)
  *     for i in range(natoms):
  *         invar_view[i] = ( strain[i,0,0] * strain[i,1,1]             # <<<<<<<<<<<<<<
@@ -9116,7 +8319,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
     *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_invar_view.data) + __pyx_t_45)) )) = (((((((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_9 * __pyx_v_strain.strides[0]) ) + __pyx_t_10 * __pyx_v_strain.strides[1]) )) + __pyx_t_11)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_12 * __pyx_v_strain.strides[0]) ) + __pyx_t_13 * __pyx_v_strain.strides[1]) )) + __pyx_t_14)) )))) + ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_15 * __pyx_v_strain.strides[0]) ) + __pyx_t_16 * __pyx_v_strain.strides[1]) )) + __pyx_t_17)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_18 * __pyx_v_strain.strides[0]) ) + __pyx_t_19 * __pyx_v_strain.strides[1]) )) + __pyx_t_20)) ))))) + ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_21 * __pyx_v_strain.strides[0]) ) + __pyx_t_22 * __pyx_v_strain.strides[1]) )) + __pyx_t_23)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_24 * __pyx_v_strain.strides[0]) ) + __pyx_t_25 * __pyx_v_strain.strides[1]) )) + __pyx_t_26)) ))))) - ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_27 * __pyx_v_strain.strides[0]) ) + __pyx_t_28 * __pyx_v_strain.strides[1]) )) + __pyx_t_29)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_30 * __pyx_v_strain.strides[0]) ) + __pyx_t_31 * __pyx_v_strain.strides[1]) )) + __pyx_t_32)) ))))) - ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_33 * __pyx_v_strain.strides[0]) ) + __pyx_t_34 * __pyx_v_strain.strides[1]) )) + __pyx_t_35)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_36 * __pyx_v_strain.strides[0]) ) + __pyx_t_37 * __pyx_v_strain.strides[1]) )) + __pyx_t_38)) ))))) - ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_39 * __pyx_v_strain.strides[0]) ) + __pyx_t_40 * __pyx_v_strain.strides[1]) )) + __pyx_t_41)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_42 * __pyx_v_strain.strides[0]) ) + __pyx_t_43 * __pyx_v_strain.strides[1]) )) + __pyx_t_44)) )))));
   }
 
-  /* "atomman/defect/Strain.pyx":546
+  /* "atomman/defect/Strain.pyx":463
  *                         - strain[i,1,2] * strain[i,2,1])
  * 
  *     return invar             # <<<<<<<<<<<<<<
@@ -9128,7 +8331,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
   __pyx_r = __pyx_v_invar;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":526
+  /* "atomman/defect/Strain.pyx":443
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef invariant2_c(const double [:,:,::1] strain):             # <<<<<<<<<<<<<<
@@ -9153,7 +8356,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant2_c(__Pyx_memviewslic
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":550
+/* "atomman/defect/Strain.pyx":467
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef invariant3_c(const double [:,:,::1] strain):             # <<<<<<<<<<<<<<
@@ -9227,7 +8430,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("invariant3_c", 0);
 
-  /* "atomman/defect/Strain.pyx":555
+  /* "atomman/defect/Strain.pyx":472
  *     """
  *     # Parameter initialization
  *     natoms = strain.shape[0]             # <<<<<<<<<<<<<<
@@ -9236,19 +8439,19 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
  */
   __pyx_v_natoms = (__pyx_v_strain.shape[0]);
 
-  /* "atomman/defect/Strain.pyx":557
+  /* "atomman/defect/Strain.pyx":474
  *     natoms = strain.shape[0]
  * 
  *     invar = np.empty(natoms)             # <<<<<<<<<<<<<<
  *     cdef double [::1] invar_view = invar
  *     cdef Py_ssize_t i
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 474, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 474, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 474, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -9263,25 +8466,25 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 557, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 474, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_invar = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":558
+  /* "atomman/defect/Strain.pyx":475
  * 
  *     invar = np.empty(natoms)
  *     cdef double [::1] invar_view = invar             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t i
  * 
  */
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_v_invar, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 558, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_v_invar, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 475, __pyx_L1_error)
   __pyx_v_invar_view = __pyx_t_5;
   __pyx_t_5.memview = NULL;
   __pyx_t_5.data = NULL;
 
-  /* "atomman/defect/Strain.pyx":562
+  /* "atomman/defect/Strain.pyx":479
  * 
  *     # I3 = det(_ij)
  *     for i in range(natoms):             # <<<<<<<<<<<<<<
@@ -9293,7 +8496,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
   for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
     __pyx_v_i = __pyx_t_8;
 
-    /* "atomman/defect/Strain.pyx":563
+    /* "atomman/defect/Strain.pyx":480
  *     # I3 = det(_ij)
  *     for i in range(natoms):
  *         invar_view[i] = ( strain[i,0,0] * ( strain[i,1,1] * strain[i,2,2]             # <<<<<<<<<<<<<<
@@ -9310,7 +8513,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
     __pyx_t_16 = 2;
     __pyx_t_17 = 2;
 
-    /* "atomman/defect/Strain.pyx":564
+    /* "atomman/defect/Strain.pyx":481
  *     for i in range(natoms):
  *         invar_view[i] = ( strain[i,0,0] * ( strain[i,1,1] * strain[i,2,2]
  *                                           - strain[i,1,2] * strain[i,2,1])             # <<<<<<<<<<<<<<
@@ -9324,7 +8527,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
     __pyx_t_22 = 2;
     __pyx_t_23 = 1;
 
-    /* "atomman/defect/Strain.pyx":565
+    /* "atomman/defect/Strain.pyx":482
  *         invar_view[i] = ( strain[i,0,0] * ( strain[i,1,1] * strain[i,2,2]
  *                                           - strain[i,1,2] * strain[i,2,1])
  *                         - strain[i,0,1] * ( strain[i,1,0] * strain[i,2,2]             # <<<<<<<<<<<<<<
@@ -9341,7 +8544,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
     __pyx_t_31 = 2;
     __pyx_t_32 = 2;
 
-    /* "atomman/defect/Strain.pyx":566
+    /* "atomman/defect/Strain.pyx":483
  *                                           - strain[i,1,2] * strain[i,2,1])
  *                         - strain[i,0,1] * ( strain[i,1,0] * strain[i,2,2]
  *                                           - strain[i,1,2] * strain[i,2,0])             # <<<<<<<<<<<<<<
@@ -9355,7 +8558,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
     __pyx_t_37 = 2;
     __pyx_t_38 = 0;
 
-    /* "atomman/defect/Strain.pyx":567
+    /* "atomman/defect/Strain.pyx":484
  *                         - strain[i,0,1] * ( strain[i,1,0] * strain[i,2,2]
  *                                           - strain[i,1,2] * strain[i,2,0])
  *                         + strain[i,0,2] * ( strain[i,1,0] * strain[i,2,1]             # <<<<<<<<<<<<<<
@@ -9372,7 +8575,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
     __pyx_t_46 = 2;
     __pyx_t_47 = 1;
 
-    /* "atomman/defect/Strain.pyx":568
+    /* "atomman/defect/Strain.pyx":485
  *                                           - strain[i,1,2] * strain[i,2,0])
  *                         + strain[i,0,2] * ( strain[i,1,0] * strain[i,2,1]
  *                                           - strain[i,1,1] * strain[i,2,0]))             # <<<<<<<<<<<<<<
@@ -9386,7 +8589,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
     __pyx_t_52 = 2;
     __pyx_t_53 = 0;
 
-    /* "atomman/defect/Strain.pyx":563
+    /* "atomman/defect/Strain.pyx":480
  *     # I3 = det(_ij)
  *     for i in range(natoms):
  *         invar_view[i] = ( strain[i,0,0] * ( strain[i,1,1] * strain[i,2,2]             # <<<<<<<<<<<<<<
@@ -9397,7 +8600,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
     *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_invar_view.data) + __pyx_t_54)) )) = ((((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_9 * __pyx_v_strain.strides[0]) ) + __pyx_t_10 * __pyx_v_strain.strides[1]) )) + __pyx_t_11)) ))) * (((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_12 * __pyx_v_strain.strides[0]) ) + __pyx_t_13 * __pyx_v_strain.strides[1]) )) + __pyx_t_14)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_15 * __pyx_v_strain.strides[0]) ) + __pyx_t_16 * __pyx_v_strain.strides[1]) )) + __pyx_t_17)) )))) - ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_18 * __pyx_v_strain.strides[0]) ) + __pyx_t_19 * __pyx_v_strain.strides[1]) )) + __pyx_t_20)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_21 * __pyx_v_strain.strides[0]) ) + __pyx_t_22 * __pyx_v_strain.strides[1]) )) + __pyx_t_23)) )))))) - ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_24 * __pyx_v_strain.strides[0]) ) + __pyx_t_25 * __pyx_v_strain.strides[1]) )) + __pyx_t_26)) ))) * (((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_27 * __pyx_v_strain.strides[0]) ) + __pyx_t_28 * __pyx_v_strain.strides[1]) )) + __pyx_t_29)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_30 * __pyx_v_strain.strides[0]) ) + __pyx_t_31 * __pyx_v_strain.strides[1]) )) + __pyx_t_32)) )))) - ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_33 * __pyx_v_strain.strides[0]) ) + __pyx_t_34 * __pyx_v_strain.strides[1]) )) + __pyx_t_35)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_36 * __pyx_v_strain.strides[0]) ) + __pyx_t_37 * __pyx_v_strain.strides[1]) )) + __pyx_t_38)) ))))))) + ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_39 * __pyx_v_strain.strides[0]) ) + __pyx_t_40 * __pyx_v_strain.strides[1]) )) + __pyx_t_41)) ))) * (((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_42 * __pyx_v_strain.strides[0]) ) + __pyx_t_43 * __pyx_v_strain.strides[1]) )) + __pyx_t_44)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_45 * __pyx_v_strain.strides[0]) ) + __pyx_t_46 * __pyx_v_strain.strides[1]) )) + __pyx_t_47)) )))) - ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_48 * __pyx_v_strain.strides[0]) ) + __pyx_t_49 * __pyx_v_strain.strides[1]) )) + __pyx_t_50)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_strain.data + __pyx_t_51 * __pyx_v_strain.strides[0]) ) + __pyx_t_52 * __pyx_v_strain.strides[1]) )) + __pyx_t_53)) )))))));
   }
 
-  /* "atomman/defect/Strain.pyx":570
+  /* "atomman/defect/Strain.pyx":487
  *                                           - strain[i,1,1] * strain[i,2,0]))
  * 
  *     return invar             # <<<<<<<<<<<<<<
@@ -9409,7 +8612,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
   __pyx_r = __pyx_v_invar;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":550
+  /* "atomman/defect/Strain.pyx":467
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef invariant3_c(const double [:,:,::1] strain):             # <<<<<<<<<<<<<<
@@ -9434,7 +8637,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_invariant3_c(__Pyx_memviewslic
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":574
+/* "atomman/defect/Strain.pyx":491
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef rotation_c(const double[:,:,::1] G):             # <<<<<<<<<<<<<<
@@ -9482,7 +8685,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("rotation_c", 0);
 
-  /* "atomman/defect/Strain.pyx":579
+  /* "atomman/defect/Strain.pyx":496
  *     """
  *     # Parameter initialization
  *     natoms = G.shape[0]             # <<<<<<<<<<<<<<
@@ -9491,16 +8694,16 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
  */
   __pyx_v_natoms = (__pyx_v_G.shape[0]);
 
-  /* "atomman/defect/Strain.pyx":580
+  /* "atomman/defect/Strain.pyx":497
  *     # Parameter initialization
  *     natoms = G.shape[0]
  *     ident = np.identity(3)             # <<<<<<<<<<<<<<
  *     cdef double [:,::1] identity = ident
  * 
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 580, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 497, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_identity); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 580, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_identity); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 497, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -9515,39 +8718,39 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_int_3) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_int_3);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 580, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 497, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_ident = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":581
+  /* "atomman/defect/Strain.pyx":498
  *     natoms = G.shape[0]
  *     ident = np.identity(3)
  *     cdef double [:,::1] identity = ident             # <<<<<<<<<<<<<<
  * 
  *     rotation = np.empty((natoms, 3, 3))
  */
-  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_ident, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 581, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_ident, PyBUF_WRITABLE); if (unlikely(!__pyx_t_4.memview)) __PYX_ERR(0, 498, __pyx_L1_error)
   __pyx_v_identity = __pyx_t_4;
   __pyx_t_4.memview = NULL;
   __pyx_t_4.data = NULL;
 
-  /* "atomman/defect/Strain.pyx":583
+  /* "atomman/defect/Strain.pyx":500
  *     cdef double [:,::1] identity = ident
  * 
  *     rotation = np.empty((natoms, 3, 3))             # <<<<<<<<<<<<<<
  *     cdef double [:,:,::1] rot_view = rotation
  *     cdef Py_ssize_t i, j, k
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 583, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 500, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 583, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 500, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 583, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 500, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 583, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 500, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
@@ -9571,25 +8774,25 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 583, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 500, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_rotation = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":584
+  /* "atomman/defect/Strain.pyx":501
  * 
  *     rotation = np.empty((natoms, 3, 3))
  *     cdef double [:,:,::1] rot_view = rotation             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t i, j, k
  * 
  */
-  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(__pyx_v_rotation, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 584, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(__pyx_v_rotation, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 501, __pyx_L1_error)
   __pyx_v_rot_view = __pyx_t_6;
   __pyx_t_6.memview = NULL;
   __pyx_t_6.data = NULL;
 
-  /* "atomman/defect/Strain.pyx":588
+  /* "atomman/defect/Strain.pyx":505
  * 
  *     # rot_jk = ((I_jk - G_jk) - (I_kj - G_kj)) / 2
  *     for i in range(natoms):             # <<<<<<<<<<<<<<
@@ -9601,7 +8804,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
   for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
     __pyx_v_i = __pyx_t_9;
 
-    /* "atomman/defect/Strain.pyx":589
+    /* "atomman/defect/Strain.pyx":506
  *     # rot_jk = ((I_jk - G_jk) - (I_kj - G_kj)) / 2
  *     for i in range(natoms):
  *         for j in range(3):             # <<<<<<<<<<<<<<
@@ -9611,7 +8814,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
     for (__pyx_t_10 = 0; __pyx_t_10 < 3; __pyx_t_10+=1) {
       __pyx_v_j = __pyx_t_10;
 
-      /* "atomman/defect/Strain.pyx":590
+      /* "atomman/defect/Strain.pyx":507
  *     for i in range(natoms):
  *         for j in range(3):
  *             for k in range(3):             # <<<<<<<<<<<<<<
@@ -9621,7 +8824,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
       for (__pyx_t_11 = 0; __pyx_t_11 < 3; __pyx_t_11+=1) {
         __pyx_v_k = __pyx_t_11;
 
-        /* "atomman/defect/Strain.pyx":591
+        /* "atomman/defect/Strain.pyx":508
  *         for j in range(3):
  *             for k in range(3):
  *                 rot_view[i,j,k] = ((identity[j,k] - G[i,j,k]) - (identity[k,j] - G[i,k,j])) / 2.             # <<<<<<<<<<<<<<
@@ -9646,7 +8849,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
     }
   }
 
-  /* "atomman/defect/Strain.pyx":592
+  /* "atomman/defect/Strain.pyx":509
  *             for k in range(3):
  *                 rot_view[i,j,k] = ((identity[j,k] - G[i,j,k]) - (identity[k,j] - G[i,k,j])) / 2.
  *     return rotation             # <<<<<<<<<<<<<<
@@ -9658,7 +8861,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
   __pyx_r = __pyx_v_rotation;
   goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":574
+  /* "atomman/defect/Strain.pyx":491
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef rotation_c(const double[:,:,::1] G):             # <<<<<<<<<<<<<<
@@ -9686,7 +8889,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_rotation_c(__Pyx_memviewslice
   return __pyx_r;
 }
 
-/* "atomman/defect/Strain.pyx":596
+/* "atomman/defect/Strain.pyx":513
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef angularvelocity_c(const double [:,:,::1] rotation):             # <<<<<<<<<<<<<<
@@ -9733,7 +8936,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_angularvelocity_c(__Pyx_memvie
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("angularvelocity_c", 0);
 
-  /* "atomman/defect/Strain.pyx":601
+  /* "atomman/defect/Strain.pyx":518
  *     """
  *     # Parameter initialization
  *     natoms = rotation.shape[0]             # <<<<<<<<<<<<<<
@@ -9742,19 +8945,19 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_angularvelocity_c(__Pyx_memvie
  */
   __pyx_v_natoms = (__pyx_v_rotation.shape[0]);
 
-  /* "atomman/defect/Strain.pyx":603
+  /* "atomman/defect/Strain.pyx":520
  *     natoms = rotation.shape[0]
  * 
  *     angvel = np.empty(natoms)             # <<<<<<<<<<<<<<
  *     cdef double [::1] angvel_view = angvel
  *     cdef Py_ssize_t i
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 603, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 520, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 603, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 520, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 603, __pyx_L1_error)
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_natoms); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 520, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -9769,25 +8972,25 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_angularvelocity_c(__Pyx_memvie
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 603, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 520, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_angvel = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":604
+  /* "atomman/defect/Strain.pyx":521
  * 
  *     angvel = np.empty(natoms)
  *     cdef double [::1] angvel_view = angvel             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t i
  * 
  */
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_v_angvel, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 604, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_v_angvel, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 521, __pyx_L1_error)
   __pyx_v_angvel_view = __pyx_t_5;
   __pyx_t_5.memview = NULL;
   __pyx_t_5.data = NULL;
 
-  /* "atomman/defect/Strain.pyx":608
+  /* "atomman/defect/Strain.pyx":525
  * 
  *     # a = sqrt(rot_12^2 + rot_13^2 + rot_23^2)
  *     for i in range(natoms):             # <<<<<<<<<<<<<<
@@ -9799,7 +9002,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_angularvelocity_c(__Pyx_memvie
   for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
     __pyx_v_i = __pyx_t_8;
 
-    /* "atomman/defect/Strain.pyx":609
+    /* "atomman/defect/Strain.pyx":526
  *     # a = sqrt(rot_12^2 + rot_13^2 + rot_23^2)
  *     for i in range(natoms):
  *         angvel_view[i] = sqrt( rotation[i,0,1] * rotation[i,0,1]             # <<<<<<<<<<<<<<
@@ -9813,7 +9016,7 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_angularvelocity_c(__Pyx_memvie
     __pyx_t_13 = 0;
     __pyx_t_14 = 1;
 
-    /* "atomman/defect/Strain.pyx":610
+    /* "atomman/defect/Strain.pyx":527
  *     for i in range(natoms):
  *         angvel_view[i] = sqrt( rotation[i,0,1] * rotation[i,0,1]
  *                              + rotation[i,0,2] * rotation[i,0,2]             # <<<<<<<<<<<<<<
@@ -9824,390 +9027,63 @@ static PyObject *__pyx_f_7atomman_6defect_6Strain_angularvelocity_c(__Pyx_memvie
     __pyx_t_16 = 0;
     __pyx_t_17 = 2;
     __pyx_t_18 = __pyx_v_i;
-    __pyx_t_19 = 0;
-    __pyx_t_20 = 2;
-
-    /* "atomman/defect/Strain.pyx":611
- *         angvel_view[i] = sqrt( rotation[i,0,1] * rotation[i,0,1]
- *                              + rotation[i,0,2] * rotation[i,0,2]
- *                              + rotation[i,1,2] * rotation[i,1,2] )             # <<<<<<<<<<<<<<
- *     return angvel
- * 
- */
-    __pyx_t_21 = __pyx_v_i;
-    __pyx_t_22 = 1;
-    __pyx_t_23 = 2;
-    __pyx_t_24 = __pyx_v_i;
-    __pyx_t_25 = 1;
-    __pyx_t_26 = 2;
-
-    /* "atomman/defect/Strain.pyx":609
- *     # a = sqrt(rot_12^2 + rot_13^2 + rot_23^2)
- *     for i in range(natoms):
- *         angvel_view[i] = sqrt( rotation[i,0,1] * rotation[i,0,1]             # <<<<<<<<<<<<<<
- *                              + rotation[i,0,2] * rotation[i,0,2]
- *                              + rotation[i,1,2] * rotation[i,1,2] )
- */
-    __pyx_t_27 = __pyx_v_i;
-    *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_angvel_view.data) + __pyx_t_27)) )) = sqrt(((((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_9 * __pyx_v_rotation.strides[0]) ) + __pyx_t_10 * __pyx_v_rotation.strides[1]) )) + __pyx_t_11)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_12 * __pyx_v_rotation.strides[0]) ) + __pyx_t_13 * __pyx_v_rotation.strides[1]) )) + __pyx_t_14)) )))) + ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_15 * __pyx_v_rotation.strides[0]) ) + __pyx_t_16 * __pyx_v_rotation.strides[1]) )) + __pyx_t_17)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_18 * __pyx_v_rotation.strides[0]) ) + __pyx_t_19 * __pyx_v_rotation.strides[1]) )) + __pyx_t_20)) ))))) + ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_21 * __pyx_v_rotation.strides[0]) ) + __pyx_t_22 * __pyx_v_rotation.strides[1]) )) + __pyx_t_23)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_24 * __pyx_v_rotation.strides[0]) ) + __pyx_t_25 * __pyx_v_rotation.strides[1]) )) + __pyx_t_26)) ))))));
-  }
-
-  /* "atomman/defect/Strain.pyx":612
- *                              + rotation[i,0,2] * rotation[i,0,2]
- *                              + rotation[i,1,2] * rotation[i,1,2] )
- *     return angvel             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_angvel);
-  __pyx_r = __pyx_v_angvel;
-  goto __pyx_L0;
-
-  /* "atomman/defect/Strain.pyx":596
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * cdef angularvelocity_c(const double [:,:,::1] rotation):             # <<<<<<<<<<<<<<
- *     """
- *     Computes the per-atom angular velocity from the rotation tensor
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_5, 1);
-  __Pyx_AddTraceback("atomman.defect.Strain.angularvelocity_c", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_angvel);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_angvel_view, 1);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "atomman/defect/Strain.pyx":618
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * cdef dG_c(const double[:,:,::1] G, const long long[:,::1] nlist, double[:,:,::1] dG, Py_ssize_t i):             # <<<<<<<<<<<<<<
- *     """
- *     Computes the change in G between an atom and each of its neighbors
- */
-
-static PyObject *__pyx_f_7atomman_6defect_6Strain_dG_c(__Pyx_memviewslice __pyx_v_G, __Pyx_memviewslice __pyx_v_nlist, __Pyx_memviewslice __pyx_v_dG, Py_ssize_t __pyx_v_i) {
-  PyObject *__pyx_v_coord = NULL;
-  Py_ssize_t __pyx_v_j;
-  Py_ssize_t __pyx_v_x;
-  Py_ssize_t __pyx_v_y;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  Py_ssize_t __pyx_t_1;
-  Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  long __pyx_t_4;
-  long __pyx_t_5;
-  Py_ssize_t __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  PY_LONG_LONG __pyx_t_9;
-  Py_ssize_t __pyx_t_10;
-  Py_ssize_t __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
-  Py_ssize_t __pyx_t_13;
-  Py_ssize_t __pyx_t_14;
-  Py_ssize_t __pyx_t_15;
-  Py_ssize_t __pyx_t_16;
-  Py_ssize_t __pyx_t_17;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("dG_c", 0);
-
-  /* "atomman/defect/Strain.pyx":622
- *     Computes the change in G between an atom and each of its neighbors
- *     """
- *     coord = nlist[i, 0]             # <<<<<<<<<<<<<<
- *     cdef Py_ssize_t j, x, y
- * 
- */
-  __pyx_t_1 = __pyx_v_i;
-  __pyx_t_2 = 0;
-  __pyx_t_3 = __Pyx_PyInt_From_PY_LONG_LONG((*((PY_LONG_LONG const  *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG const  *) ( /* dim=0 */ (__pyx_v_nlist.data + __pyx_t_1 * __pyx_v_nlist.strides[0]) )) + __pyx_t_2)) )))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 622, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_v_coord = __pyx_t_3;
-  __pyx_t_3 = 0;
-
-  /* "atomman/defect/Strain.pyx":626
- * 
- *     # Calculate change in G between all neighbors
- *     for j in range(coord):             # <<<<<<<<<<<<<<
- *         for x in range(3):
- *             for y in range(3):
- */
-  __pyx_t_4 = __Pyx_PyInt_As_long(__pyx_v_coord); if (unlikely((__pyx_t_4 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 626, __pyx_L1_error)
-  __pyx_t_5 = __pyx_t_4;
-  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
-    __pyx_v_j = __pyx_t_6;
-
-    /* "atomman/defect/Strain.pyx":627
- *     # Calculate change in G between all neighbors
- *     for j in range(coord):
- *         for x in range(3):             # <<<<<<<<<<<<<<
- *             for y in range(3):
- *                 dG[j, x, y] = G[nlist[i, j+1], x, y] - G[i, x, y]
- */
-    for (__pyx_t_7 = 0; __pyx_t_7 < 3; __pyx_t_7+=1) {
-      __pyx_v_x = __pyx_t_7;
-
-      /* "atomman/defect/Strain.pyx":628
- *     for j in range(coord):
- *         for x in range(3):
- *             for y in range(3):             # <<<<<<<<<<<<<<
- *                 dG[j, x, y] = G[nlist[i, j+1], x, y] - G[i, x, y]
- * 
- */
-      for (__pyx_t_8 = 0; __pyx_t_8 < 3; __pyx_t_8+=1) {
-        __pyx_v_y = __pyx_t_8;
-
-        /* "atomman/defect/Strain.pyx":629
- *         for x in range(3):
- *             for y in range(3):
- *                 dG[j, x, y] = G[nlist[i, j+1], x, y] - G[i, x, y]             # <<<<<<<<<<<<<<
- * 
- * @cython.boundscheck(False)
- */
-        __pyx_t_2 = __pyx_v_i;
-        __pyx_t_1 = (__pyx_v_j + 1);
-        __pyx_t_9 = (*((PY_LONG_LONG const  *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG const  *) ( /* dim=0 */ (__pyx_v_nlist.data + __pyx_t_2 * __pyx_v_nlist.strides[0]) )) + __pyx_t_1)) )));
-        __pyx_t_10 = __pyx_v_x;
-        __pyx_t_11 = __pyx_v_y;
-        __pyx_t_12 = __pyx_v_i;
-        __pyx_t_13 = __pyx_v_x;
-        __pyx_t_14 = __pyx_v_y;
-        __pyx_t_15 = __pyx_v_j;
-        __pyx_t_16 = __pyx_v_x;
-        __pyx_t_17 = __pyx_v_y;
-        *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_dG.data + __pyx_t_15 * __pyx_v_dG.strides[0]) ) + __pyx_t_16 * __pyx_v_dG.strides[1]) )) + __pyx_t_17)) )) = ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_G.data + __pyx_t_9 * __pyx_v_G.strides[0]) ) + __pyx_t_10 * __pyx_v_G.strides[1]) )) + __pyx_t_11)) ))) - (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_G.data + __pyx_t_12 * __pyx_v_G.strides[0]) ) + __pyx_t_13 * __pyx_v_G.strides[1]) )) + __pyx_t_14)) ))));
-      }
-    }
-  }
-
-  /* "atomman/defect/Strain.pyx":618
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * cdef dG_c(const double[:,:,::1] G, const long long[:,::1] nlist, double[:,:,::1] dG, Py_ssize_t i):             # <<<<<<<<<<<<<<
- *     """
- *     Computes the change in G between an atom and each of its neighbors
- */
-
-  /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("atomman.defect.Strain.dG_c", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_coord);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "atomman/defect/Strain.pyx":633
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * cdef nye_c(double [:,:,::1] gradG, double [:,:,::1] nye, Py_ssize_t i):             # <<<<<<<<<<<<<<
- *     """
- *     Computes the per-atom Nye tensor from the calculated grad(G).
- */
-
-static PyObject *__pyx_f_7atomman_6defect_6Strain_nye_c(__Pyx_memviewslice __pyx_v_gradG, __Pyx_memviewslice __pyx_v_nye, Py_ssize_t __pyx_v_i) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  Py_ssize_t __pyx_t_1;
-  Py_ssize_t __pyx_t_2;
-  Py_ssize_t __pyx_t_3;
-  Py_ssize_t __pyx_t_4;
-  Py_ssize_t __pyx_t_5;
-  Py_ssize_t __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
-  __Pyx_RefNannySetupContext("nye_c", 0);
-
-  /* "atomman/defect/Strain.pyx":637
- *     Computes the per-atom Nye tensor from the calculated grad(G).
- *     """
- *     nye[i,0,0] = gradG[1,0,2] - gradG[2,0,1]             # <<<<<<<<<<<<<<
- *     nye[i,0,1] = gradG[1,1,2] - gradG[2,1,1]
- *     nye[i,0,2] = gradG[1,2,2] - gradG[2,2,1]
- */
-  __pyx_t_1 = 1;
-  __pyx_t_2 = 0;
-  __pyx_t_3 = 2;
-  __pyx_t_4 = 2;
-  __pyx_t_5 = 0;
-  __pyx_t_6 = 1;
-  __pyx_t_7 = __pyx_v_i;
-  __pyx_t_8 = 0;
-  __pyx_t_9 = 0;
-  *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nye.data + __pyx_t_7 * __pyx_v_nye.strides[0]) ) + __pyx_t_8 * __pyx_v_nye.strides[1]) )) + __pyx_t_9)) )) = ((*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_1 * __pyx_v_gradG.strides[0]) ) + __pyx_t_2 * __pyx_v_gradG.strides[1]) )) + __pyx_t_3)) ))) - (*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_4 * __pyx_v_gradG.strides[0]) ) + __pyx_t_5 * __pyx_v_gradG.strides[1]) )) + __pyx_t_6)) ))));
-
-  /* "atomman/defect/Strain.pyx":638
- *     """
- *     nye[i,0,0] = gradG[1,0,2] - gradG[2,0,1]
- *     nye[i,0,1] = gradG[1,1,2] - gradG[2,1,1]             # <<<<<<<<<<<<<<
- *     nye[i,0,2] = gradG[1,2,2] - gradG[2,2,1]
- *     nye[i,1,0] = gradG[2,0,0] - gradG[0,0,2]
- */
-  __pyx_t_6 = 1;
-  __pyx_t_5 = 1;
-  __pyx_t_4 = 2;
-  __pyx_t_3 = 2;
-  __pyx_t_2 = 1;
-  __pyx_t_1 = 1;
-  __pyx_t_9 = __pyx_v_i;
-  __pyx_t_8 = 0;
-  __pyx_t_7 = 1;
-  *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nye.data + __pyx_t_9 * __pyx_v_nye.strides[0]) ) + __pyx_t_8 * __pyx_v_nye.strides[1]) )) + __pyx_t_7)) )) = ((*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_6 * __pyx_v_gradG.strides[0]) ) + __pyx_t_5 * __pyx_v_gradG.strides[1]) )) + __pyx_t_4)) ))) - (*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_3 * __pyx_v_gradG.strides[0]) ) + __pyx_t_2 * __pyx_v_gradG.strides[1]) )) + __pyx_t_1)) ))));
-
-  /* "atomman/defect/Strain.pyx":639
- *     nye[i,0,0] = gradG[1,0,2] - gradG[2,0,1]
- *     nye[i,0,1] = gradG[1,1,2] - gradG[2,1,1]
- *     nye[i,0,2] = gradG[1,2,2] - gradG[2,2,1]             # <<<<<<<<<<<<<<
- *     nye[i,1,0] = gradG[2,0,0] - gradG[0,0,2]
- *     nye[i,1,1] = gradG[2,1,0] - gradG[0,1,2]
- */
-  __pyx_t_1 = 1;
-  __pyx_t_2 = 2;
-  __pyx_t_3 = 2;
-  __pyx_t_4 = 2;
-  __pyx_t_5 = 2;
-  __pyx_t_6 = 1;
-  __pyx_t_7 = __pyx_v_i;
-  __pyx_t_8 = 0;
-  __pyx_t_9 = 2;
-  *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nye.data + __pyx_t_7 * __pyx_v_nye.strides[0]) ) + __pyx_t_8 * __pyx_v_nye.strides[1]) )) + __pyx_t_9)) )) = ((*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_1 * __pyx_v_gradG.strides[0]) ) + __pyx_t_2 * __pyx_v_gradG.strides[1]) )) + __pyx_t_3)) ))) - (*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_4 * __pyx_v_gradG.strides[0]) ) + __pyx_t_5 * __pyx_v_gradG.strides[1]) )) + __pyx_t_6)) ))));
-
-  /* "atomman/defect/Strain.pyx":640
- *     nye[i,0,1] = gradG[1,1,2] - gradG[2,1,1]
- *     nye[i,0,2] = gradG[1,2,2] - gradG[2,2,1]
- *     nye[i,1,0] = gradG[2,0,0] - gradG[0,0,2]             # <<<<<<<<<<<<<<
- *     nye[i,1,1] = gradG[2,1,0] - gradG[0,1,2]
- *     nye[i,1,2] = gradG[2,2,0] - gradG[0,2,2]
- */
-  __pyx_t_6 = 2;
-  __pyx_t_5 = 0;
-  __pyx_t_4 = 0;
-  __pyx_t_3 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_1 = 2;
-  __pyx_t_9 = __pyx_v_i;
-  __pyx_t_8 = 1;
-  __pyx_t_7 = 0;
-  *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nye.data + __pyx_t_9 * __pyx_v_nye.strides[0]) ) + __pyx_t_8 * __pyx_v_nye.strides[1]) )) + __pyx_t_7)) )) = ((*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_6 * __pyx_v_gradG.strides[0]) ) + __pyx_t_5 * __pyx_v_gradG.strides[1]) )) + __pyx_t_4)) ))) - (*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_3 * __pyx_v_gradG.strides[0]) ) + __pyx_t_2 * __pyx_v_gradG.strides[1]) )) + __pyx_t_1)) ))));
-
-  /* "atomman/defect/Strain.pyx":641
- *     nye[i,0,2] = gradG[1,2,2] - gradG[2,2,1]
- *     nye[i,1,0] = gradG[2,0,0] - gradG[0,0,2]
- *     nye[i,1,1] = gradG[2,1,0] - gradG[0,1,2]             # <<<<<<<<<<<<<<
- *     nye[i,1,2] = gradG[2,2,0] - gradG[0,2,2]
- *     nye[i,2,0] = gradG[0,0,1] - gradG[1,0,0]
- */
-  __pyx_t_1 = 2;
-  __pyx_t_2 = 1;
-  __pyx_t_3 = 0;
-  __pyx_t_4 = 0;
-  __pyx_t_5 = 1;
-  __pyx_t_6 = 2;
-  __pyx_t_7 = __pyx_v_i;
-  __pyx_t_8 = 1;
-  __pyx_t_9 = 1;
-  *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nye.data + __pyx_t_7 * __pyx_v_nye.strides[0]) ) + __pyx_t_8 * __pyx_v_nye.strides[1]) )) + __pyx_t_9)) )) = ((*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_1 * __pyx_v_gradG.strides[0]) ) + __pyx_t_2 * __pyx_v_gradG.strides[1]) )) + __pyx_t_3)) ))) - (*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_4 * __pyx_v_gradG.strides[0]) ) + __pyx_t_5 * __pyx_v_gradG.strides[1]) )) + __pyx_t_6)) ))));
-
-  /* "atomman/defect/Strain.pyx":642
- *     nye[i,1,0] = gradG[2,0,0] - gradG[0,0,2]
- *     nye[i,1,1] = gradG[2,1,0] - gradG[0,1,2]
- *     nye[i,1,2] = gradG[2,2,0] - gradG[0,2,2]             # <<<<<<<<<<<<<<
- *     nye[i,2,0] = gradG[0,0,1] - gradG[1,0,0]
- *     nye[i,2,1] = gradG[0,1,1] - gradG[1,1,0]
- */
-  __pyx_t_6 = 2;
-  __pyx_t_5 = 2;
-  __pyx_t_4 = 0;
-  __pyx_t_3 = 0;
-  __pyx_t_2 = 2;
-  __pyx_t_1 = 2;
-  __pyx_t_9 = __pyx_v_i;
-  __pyx_t_8 = 1;
-  __pyx_t_7 = 2;
-  *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nye.data + __pyx_t_9 * __pyx_v_nye.strides[0]) ) + __pyx_t_8 * __pyx_v_nye.strides[1]) )) + __pyx_t_7)) )) = ((*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_6 * __pyx_v_gradG.strides[0]) ) + __pyx_t_5 * __pyx_v_gradG.strides[1]) )) + __pyx_t_4)) ))) - (*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_3 * __pyx_v_gradG.strides[0]) ) + __pyx_t_2 * __pyx_v_gradG.strides[1]) )) + __pyx_t_1)) ))));
-
-  /* "atomman/defect/Strain.pyx":643
- *     nye[i,1,1] = gradG[2,1,0] - gradG[0,1,2]
- *     nye[i,1,2] = gradG[2,2,0] - gradG[0,2,2]
- *     nye[i,2,0] = gradG[0,0,1] - gradG[1,0,0]             # <<<<<<<<<<<<<<
- *     nye[i,2,1] = gradG[0,1,1] - gradG[1,1,0]
- *     nye[i,2,2] = gradG[0,2,1] - gradG[1,2,0]
+    __pyx_t_19 = 0;
+    __pyx_t_20 = 2;
+
+    /* "atomman/defect/Strain.pyx":528
+ *         angvel_view[i] = sqrt( rotation[i,0,1] * rotation[i,0,1]
+ *                              + rotation[i,0,2] * rotation[i,0,2]
+ *                              + rotation[i,1,2] * rotation[i,1,2] )             # <<<<<<<<<<<<<<
+ *     return angvel
  */
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_3 = 1;
-  __pyx_t_4 = 1;
-  __pyx_t_5 = 0;
-  __pyx_t_6 = 0;
-  __pyx_t_7 = __pyx_v_i;
-  __pyx_t_8 = 2;
-  __pyx_t_9 = 0;
-  *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nye.data + __pyx_t_7 * __pyx_v_nye.strides[0]) ) + __pyx_t_8 * __pyx_v_nye.strides[1]) )) + __pyx_t_9)) )) = ((*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_1 * __pyx_v_gradG.strides[0]) ) + __pyx_t_2 * __pyx_v_gradG.strides[1]) )) + __pyx_t_3)) ))) - (*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_4 * __pyx_v_gradG.strides[0]) ) + __pyx_t_5 * __pyx_v_gradG.strides[1]) )) + __pyx_t_6)) ))));
+    __pyx_t_21 = __pyx_v_i;
+    __pyx_t_22 = 1;
+    __pyx_t_23 = 2;
+    __pyx_t_24 = __pyx_v_i;
+    __pyx_t_25 = 1;
+    __pyx_t_26 = 2;
 
-  /* "atomman/defect/Strain.pyx":644
- *     nye[i,1,2] = gradG[2,2,0] - gradG[0,2,2]
- *     nye[i,2,0] = gradG[0,0,1] - gradG[1,0,0]
- *     nye[i,2,1] = gradG[0,1,1] - gradG[1,1,0]             # <<<<<<<<<<<<<<
- *     nye[i,2,2] = gradG[0,2,1] - gradG[1,2,0]
+    /* "atomman/defect/Strain.pyx":526
+ *     # a = sqrt(rot_12^2 + rot_13^2 + rot_23^2)
+ *     for i in range(natoms):
+ *         angvel_view[i] = sqrt( rotation[i,0,1] * rotation[i,0,1]             # <<<<<<<<<<<<<<
+ *                              + rotation[i,0,2] * rotation[i,0,2]
+ *                              + rotation[i,1,2] * rotation[i,1,2] )
  */
-  __pyx_t_6 = 0;
-  __pyx_t_5 = 1;
-  __pyx_t_4 = 1;
-  __pyx_t_3 = 1;
-  __pyx_t_2 = 1;
-  __pyx_t_1 = 0;
-  __pyx_t_9 = __pyx_v_i;
-  __pyx_t_8 = 2;
-  __pyx_t_7 = 1;
-  *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nye.data + __pyx_t_9 * __pyx_v_nye.strides[0]) ) + __pyx_t_8 * __pyx_v_nye.strides[1]) )) + __pyx_t_7)) )) = ((*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_6 * __pyx_v_gradG.strides[0]) ) + __pyx_t_5 * __pyx_v_gradG.strides[1]) )) + __pyx_t_4)) ))) - (*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_3 * __pyx_v_gradG.strides[0]) ) + __pyx_t_2 * __pyx_v_gradG.strides[1]) )) + __pyx_t_1)) ))));
+    __pyx_t_27 = __pyx_v_i;
+    *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_angvel_view.data) + __pyx_t_27)) )) = sqrt(((((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_9 * __pyx_v_rotation.strides[0]) ) + __pyx_t_10 * __pyx_v_rotation.strides[1]) )) + __pyx_t_11)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_12 * __pyx_v_rotation.strides[0]) ) + __pyx_t_13 * __pyx_v_rotation.strides[1]) )) + __pyx_t_14)) )))) + ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_15 * __pyx_v_rotation.strides[0]) ) + __pyx_t_16 * __pyx_v_rotation.strides[1]) )) + __pyx_t_17)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_18 * __pyx_v_rotation.strides[0]) ) + __pyx_t_19 * __pyx_v_rotation.strides[1]) )) + __pyx_t_20)) ))))) + ((*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_21 * __pyx_v_rotation.strides[0]) ) + __pyx_t_22 * __pyx_v_rotation.strides[1]) )) + __pyx_t_23)) ))) * (*((double const  *) ( /* dim=2 */ ((char *) (((double const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_rotation.data + __pyx_t_24 * __pyx_v_rotation.strides[0]) ) + __pyx_t_25 * __pyx_v_rotation.strides[1]) )) + __pyx_t_26)) ))))));
+  }
 
-  /* "atomman/defect/Strain.pyx":645
- *     nye[i,2,0] = gradG[0,0,1] - gradG[1,0,0]
- *     nye[i,2,1] = gradG[0,1,1] - gradG[1,1,0]
- *     nye[i,2,2] = gradG[0,2,1] - gradG[1,2,0]             # <<<<<<<<<<<<<<
+  /* "atomman/defect/Strain.pyx":529
+ *                              + rotation[i,0,2] * rotation[i,0,2]
+ *                              + rotation[i,1,2] * rotation[i,1,2] )
+ *     return angvel             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 2;
-  __pyx_t_3 = 1;
-  __pyx_t_4 = 1;
-  __pyx_t_5 = 2;
-  __pyx_t_6 = 0;
-  __pyx_t_7 = __pyx_v_i;
-  __pyx_t_8 = 2;
-  __pyx_t_9 = 2;
-  *((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nye.data + __pyx_t_7 * __pyx_v_nye.strides[0]) ) + __pyx_t_8 * __pyx_v_nye.strides[1]) )) + __pyx_t_9)) )) = ((*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_1 * __pyx_v_gradG.strides[0]) ) + __pyx_t_2 * __pyx_v_gradG.strides[1]) )) + __pyx_t_3)) ))) - (*((double *) ( /* dim=2 */ ((char *) (((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gradG.data + __pyx_t_4 * __pyx_v_gradG.strides[0]) ) + __pyx_t_5 * __pyx_v_gradG.strides[1]) )) + __pyx_t_6)) ))));
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_angvel);
+  __pyx_r = __pyx_v_angvel;
+  goto __pyx_L0;
 
-  /* "atomman/defect/Strain.pyx":633
+  /* "atomman/defect/Strain.pyx":513
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
- * cdef nye_c(double [:,:,::1] gradG, double [:,:,::1] nye, Py_ssize_t i):             # <<<<<<<<<<<<<<
+ * cdef angularvelocity_c(const double [:,:,::1] rotation):             # <<<<<<<<<<<<<<
  *     """
- *     Computes the per-atom Nye tensor from the calculated grad(G).
+ *     Computes the per-atom angular velocity from the rotation tensor
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_5, 1);
+  __Pyx_AddTraceback("atomman.defect.Strain.angularvelocity_c", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_angvel);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_angvel_view, 1);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -10416,7 +9292,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *         if itemsize <= 0:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 133, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 133, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10448,7 +9324,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *         if not isinstance(format, bytes):
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 136, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 136, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10575,7 +9451,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 148, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 148, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10849,7 +9725,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *             if self.dtype_is_object:
  */
-      __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 176, __pyx_L1_error)
+      __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 176, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_10);
       __Pyx_Raise(__pyx_t_10, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
@@ -11093,7 +9969,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array_2__getbuffer__(stru
  *         info.buf = self.data
  *         info.len = self.len
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 192, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 192, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -11827,7 +10703,7 @@ static PyObject *__pyx_pf___pyx_array___reduce_cython__(CYTHON_UNUSED struct __p
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -11883,7 +10759,7 @@ static PyObject *__pyx_pf___pyx_array_2__setstate_cython__(CYTHON_UNUSED struct
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -13593,7 +12469,7 @@ static int __pyx_memoryview___pyx_pf_15View_dot_MemoryView_10memoryview_6__setit
  * 
  *         have_slices, index = _unellipsify(index, self.view.ndim)
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 418, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 418, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -14641,7 +13517,7 @@ static PyObject *__pyx_memoryview_convert_item_to_object(struct __pyx_memoryview
  *         else:
  *             if len(self.view.format) == 1:
  */
-      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 495, __pyx_L5_except_error)
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 495, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_Raise(__pyx_t_6, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -15003,7 +13879,7 @@ static int __pyx_memoryview___pyx_pf_15View_dot_MemoryView_10memoryview_8__getbu
  * 
  *         if flags & PyBUF_ND:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 520, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 520, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -15552,7 +14428,7 @@ static PyObject *__pyx_pf_15View_dot_MemoryView_10memoryview_7strides___get__(st
  * 
  *         return tuple([stride for stride in self.view.strides[:self.view.ndim]])
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 570, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 570, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -15669,7 +14545,7 @@ static PyObject *__pyx_pf_15View_dot_MemoryView_10memoryview_10suboffsets___get_
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->view.ndim); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 577, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Multiply(__pyx_tuple__17, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 577, __pyx_L1_error)
+    __pyx_t_3 = PyNumber_Multiply(__pyx_tuple__18, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 577, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = __pyx_t_3;
@@ -16707,7 +15583,7 @@ static PyObject *__pyx_pf___pyx_memoryview___reduce_cython__(CYTHON_UNUSED struc
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -16763,7 +15639,7 @@ static PyObject *__pyx_pf___pyx_memoryview_2__setstate_cython__(CYTHON_UNUSED st
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -17424,7 +16300,7 @@ static PyObject *assert_direct_dimensions(Py_ssize_t *__pyx_v_suboffsets, int __
  * 
  * 
  */
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 703, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 703, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_Raise(__pyx_t_5, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -19608,7 +18484,7 @@ static PyObject *__pyx_pf___pyx_memoryviewslice___reduce_cython__(CYTHON_UNUSED
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -19664,7 +18540,7 @@ static PyObject *__pyx_pf___pyx_memoryviewslice_2__setstate_cython__(CYTHON_UNUS
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -23993,7 +22869,6 @@ static struct PyModuleDef __pyx_moduledef = {
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_ASCII, __pyx_k_ASCII, sizeof(__pyx_k_ASCII), 0, 0, 1, 1},
-  {&__pyx_kp_u_An_atom_lacks_pair_sets_Check_ne, __pyx_k_An_atom_lacks_pair_sets_Check_ne, sizeof(__pyx_k_An_atom_lacks_pair_sets_Check_ne), 0, 1, 0, 0},
   {&__pyx_kp_s_Buffer_view_does_not_expose_stri, __pyx_k_Buffer_view_does_not_expose_stri, sizeof(__pyx_k_Buffer_view_does_not_expose_stri), 0, 0, 1, 0},
   {&__pyx_kp_s_Can_only_create_a_buffer_that_is, __pyx_k_Can_only_create_a_buffer_that_is, sizeof(__pyx_k_Can_only_create_a_buffer_that_is), 0, 0, 1, 0},
   {&__pyx_kp_s_Cannot_assign_to_read_only_memor, __pyx_k_Cannot_assign_to_read_only_memor, sizeof(__pyx_k_Cannot_assign_to_read_only_memor), 0, 0, 1, 0},
@@ -24004,7 +22879,6 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_Empty_shape_tuple_for_cython_arr, __pyx_k_Empty_shape_tuple_for_cython_arr, sizeof(__pyx_k_Empty_shape_tuple_for_cython_arr), 0, 0, 1, 0},
   {&__pyx_n_s_G, __pyx_k_G, sizeof(__pyx_k_G), 0, 0, 1, 1},
   {&__pyx_n_u_G, __pyx_k_G, sizeof(__pyx_k_G), 0, 1, 0, 1},
-  {&__pyx_n_s_G_view, __pyx_k_G_view, sizeof(__pyx_k_G_view), 0, 0, 1, 1},
   {&__pyx_kp_s_Incompatible_checksums_s_vs_0xb0, __pyx_k_Incompatible_checksums_s_vs_0xb0, sizeof(__pyx_k_Incompatible_checksums_s_vs_0xb0), 0, 0, 1, 0},
   {&__pyx_n_s_IndexError, __pyx_k_IndexError, sizeof(__pyx_k_IndexError), 0, 0, 1, 1},
   {&__pyx_kp_s_Indirect_dimensions_not_supporte, __pyx_k_Indirect_dimensions_not_supporte, sizeof(__pyx_k_Indirect_dimensions_not_supporte), 0, 0, 1, 0},
@@ -24016,10 +22890,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_NeighborList, __pyx_k_NeighborList, sizeof(__pyx_k_NeighborList), 0, 0, 1, 1},
   {&__pyx_n_b_O, __pyx_k_O, sizeof(__pyx_k_O), 0, 0, 0, 1},
   {&__pyx_kp_s_Out_of_bounds_on_buffer_access_a, __pyx_k_Out_of_bounds_on_buffer_access_a, sizeof(__pyx_k_Out_of_bounds_on_buffer_access_a), 0, 0, 1, 0},
-  {&__pyx_n_s_P, __pyx_k_P, sizeof(__pyx_k_P), 0, 0, 1, 1},
   {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
-  {&__pyx_n_s_Q, __pyx_k_Q, sizeof(__pyx_k_Q), 0, 0, 1, 1},
-  {&__pyx_n_s_Q_view, __pyx_k_Q_view, sizeof(__pyx_k_Q_view), 0, 0, 1, 1},
   {&__pyx_n_s_Strain, __pyx_k_Strain, sizeof(__pyx_k_Strain), 0, 0, 1, 1},
   {&__pyx_n_s_Strain_G, __pyx_k_Strain_G, sizeof(__pyx_k_Strain_G), 0, 0, 1, 1},
   {&__pyx_n_s_Strain__G, __pyx_k_Strain__G, sizeof(__pyx_k_Strain__G), 0, 0, 1, 1},
@@ -24029,6 +22900,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_Strain__invariant2, __pyx_k_Strain__invariant2, sizeof(__pyx_k_Strain__invariant2), 0, 0, 1, 1},
   {&__pyx_n_s_Strain__invariant3, __pyx_k_Strain__invariant3, sizeof(__pyx_k_Strain__invariant3), 0, 0, 1, 1},
   {&__pyx_n_s_Strain__neighbors, __pyx_k_Strain__neighbors, sizeof(__pyx_k_Strain__neighbors), 0, 0, 1, 1},
+  {&__pyx_n_s_Strain__nprocs, __pyx_k_Strain__nprocs, sizeof(__pyx_k_Strain__nprocs), 0, 0, 1, 1},
   {&__pyx_n_s_Strain__nye, __pyx_k_Strain__nye, sizeof(__pyx_k_Strain__nye), 0, 0, 1, 1},
   {&__pyx_n_s_Strain__p_vectors, __pyx_k_Strain__p_vectors, sizeof(__pyx_k_Strain__p_vectors), 0, 0, 1, 1},
   {&__pyx_n_s_Strain__rotation, __pyx_k_Strain__rotation, sizeof(__pyx_k_Strain__rotation), 0, 0, 1, 1},
@@ -24043,6 +22915,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_Strain_invariant2, __pyx_k_Strain_invariant2, sizeof(__pyx_k_Strain_invariant2), 0, 0, 1, 1},
   {&__pyx_n_s_Strain_invariant3, __pyx_k_Strain_invariant3, sizeof(__pyx_k_Strain_invariant3), 0, 0, 1, 1},
   {&__pyx_n_s_Strain_neighbors, __pyx_k_Strain_neighbors, sizeof(__pyx_k_Strain_neighbors), 0, 0, 1, 1},
+  {&__pyx_n_s_Strain_nprocs, __pyx_k_Strain_nprocs, sizeof(__pyx_k_Strain_nprocs), 0, 0, 1, 1},
   {&__pyx_n_s_Strain_nye, __pyx_k_Strain_nye, sizeof(__pyx_k_Strain_nye), 0, 0, 1, 1},
   {&__pyx_n_s_Strain_p_vectors, __pyx_k_Strain_p_vectors, sizeof(__pyx_k_Strain_p_vectors), 0, 0, 1, 1},
   {&__pyx_n_s_Strain_rotation, __pyx_k_Strain_rotation, sizeof(__pyx_k_Strain_rotation), 0, 0, 1, 1},
@@ -24057,7 +22930,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_Unable_to_convert_item_to_object, __pyx_k_Unable_to_convert_item_to_object, sizeof(__pyx_k_Unable_to_convert_item_to_object), 0, 0, 1, 0},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_n_s_View_MemoryView, __pyx_k_View_MemoryView, sizeof(__pyx_k_View_MemoryView), 0, 0, 1, 1},
-  {&__pyx_n_s__23, __pyx_k__23, sizeof(__pyx_k__23), 0, 0, 1, 1},
+  {&__pyx_n_s__24, __pyx_k__24, sizeof(__pyx_k__24), 0, 0, 1, 1},
+  {&__pyx_n_s_all, __pyx_k_all, sizeof(__pyx_k_all), 0, 0, 1, 1},
   {&__pyx_n_s_allkeys, __pyx_k_allkeys, sizeof(__pyx_k_allkeys), 0, 0, 1, 1},
   {&__pyx_n_s_allocate_buffer, __pyx_k_allocate_buffer, sizeof(__pyx_k_allocate_buffer), 0, 0, 1, 1},
   {&__pyx_n_s_angularvelocity, __pyx_k_angularvelocity, sizeof(__pyx_k_angularvelocity), 0, 0, 1, 1},
@@ -24075,6 +22949,10 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_baseneighbors, __pyx_k_baseneighbors, sizeof(__pyx_k_baseneighbors), 0, 0, 1, 1},
   {&__pyx_n_s_basesystem, __pyx_k_basesystem, sizeof(__pyx_k_basesystem), 0, 0, 1, 1},
   {&__pyx_kp_u_basesystem_and_p_vectors_cannot, __pyx_k_basesystem_and_p_vectors_cannot, sizeof(__pyx_k_basesystem_and_p_vectors_cannot), 0, 1, 0, 0},
+  {&__pyx_n_s_batch_G, __pyx_k_batch_G, sizeof(__pyx_k_batch_G), 0, 0, 1, 1},
+  {&__pyx_n_s_batch_nye, __pyx_k_batch_nye, sizeof(__pyx_k_batch_nye), 0, 0, 1, 1},
+  {&__pyx_n_s_batch_strain, __pyx_k_batch_strain, sizeof(__pyx_k_batch_strain), 0, 0, 1, 1},
+  {&__pyx_n_s_box, __pyx_k_box, sizeof(__pyx_k_box), 0, 0, 1, 1},
   {&__pyx_n_s_broadcast_to, __pyx_k_broadcast_to, sizeof(__pyx_k_broadcast_to), 0, 0, 1, 1},
   {&__pyx_n_s_build_p_vectors, __pyx_k_build_p_vectors, sizeof(__pyx_k_build_p_vectors), 0, 0, 1, 1},
   {&__pyx_n_s_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 0, 1, 1},
@@ -24085,10 +22963,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_contiguous_and_direct, __pyx_k_contiguous_and_direct, sizeof(__pyx_k_contiguous_and_direct), 0, 0, 1, 0},
   {&__pyx_kp_s_contiguous_and_indirect, __pyx_k_contiguous_and_indirect, sizeof(__pyx_k_contiguous_and_indirect), 0, 0, 1, 0},
   {&__pyx_n_s_coord, __pyx_k_coord, sizeof(__pyx_k_coord), 0, 0, 1, 1},
-  {&__pyx_n_s_cos_theta_max, __pyx_k_cos_theta_max, sizeof(__pyx_k_cos_theta_max), 0, 0, 1, 1},
+  {&__pyx_n_s_cumsum, __pyx_k_cumsum, sizeof(__pyx_k_cumsum), 0, 0, 1, 1},
   {&__pyx_n_s_cutoff, __pyx_k_cutoff, sizeof(__pyx_k_cutoff), 0, 0, 1, 1},
-  {&__pyx_n_s_dG, __pyx_k_dG, sizeof(__pyx_k_dG), 0, 0, 1, 1},
-  {&__pyx_n_s_dG_view, __pyx_k_dG_view, sizeof(__pyx_k_dG_view), 0, 0, 1, 1},
   {&__pyx_n_s_defaultkeys, __pyx_k_defaultkeys, sizeof(__pyx_k_defaultkeys), 0, 0, 1, 1},
   {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
   {&__pyx_n_s_doc, __pyx_k_doc, sizeof(__pyx_k_doc), 0, 0, 1, 1},
@@ -24103,19 +22979,14 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
   {&__pyx_n_s_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 0, 1, 1},
   {&__pyx_n_u_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 1, 0, 1},
-  {&__pyx_n_s_gG, __pyx_k_gG, sizeof(__pyx_k_gG), 0, 0, 1, 1},
-  {&__pyx_n_s_gG_view, __pyx_k_gG_view, sizeof(__pyx_k_gG_view), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
   {&__pyx_kp_s_got_differing_extents_in_dimensi, __pyx_k_got_differing_extents_in_dimensi, sizeof(__pyx_k_got_differing_extents_in_dimensi), 0, 0, 1, 0},
-  {&__pyx_n_s_gradG, __pyx_k_gradG, sizeof(__pyx_k_gradG), 0, 0, 1, 1},
-  {&__pyx_n_s_gradG_view, __pyx_k_gradG_view, sizeof(__pyx_k_gradG_view), 0, 0, 1, 1},
   {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_s_id, __pyx_k_id, sizeof(__pyx_k_id), 0, 0, 1, 1},
   {&__pyx_n_s_identity, __pyx_k_identity, sizeof(__pyx_k_identity), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
   {&__pyx_n_s_inner, __pyx_k_inner, sizeof(__pyx_k_inner), 0, 0, 1, 1},
-  {&__pyx_n_u_int64, __pyx_k_int64, sizeof(__pyx_k_int64), 0, 1, 0, 1},
   {&__pyx_n_s_invariant1, __pyx_k_invariant1, sizeof(__pyx_k_invariant1), 0, 0, 1, 1},
   {&__pyx_n_u_invariant1, __pyx_k_invariant1, sizeof(__pyx_k_invariant1), 0, 1, 0, 1},
   {&__pyx_n_s_invariant2, __pyx_k_invariant2, sizeof(__pyx_k_invariant2), 0, 0, 1, 1},
@@ -24124,16 +22995,12 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_u_invariant3, __pyx_k_invariant3, sizeof(__pyx_k_invariant3), 0, 1, 0, 1},
   {&__pyx_n_s_itemsize, __pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 0, 1, 1},
   {&__pyx_kp_s_itemsize_0_for_cython_array, __pyx_k_itemsize_0_for_cython_array, sizeof(__pyx_k_itemsize_0_for_cython_array), 0, 0, 1, 0},
-  {&__pyx_n_s_linalg, __pyx_k_linalg, sizeof(__pyx_k_linalg), 0, 0, 1, 1},
-  {&__pyx_n_s_lstsq, __pyx_k_lstsq, sizeof(__pyx_k_lstsq), 0, 0, 1, 1},
+  {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-  {&__pyx_n_s_max, __pyx_k_max, sizeof(__pyx_k_max), 0, 0, 1, 1},
-  {&__pyx_n_s_maxcoord, __pyx_k_maxcoord, sizeof(__pyx_k_maxcoord), 0, 0, 1, 1},
   {&__pyx_n_s_memview, __pyx_k_memview, sizeof(__pyx_k_memview), 0, 0, 1, 1},
   {&__pyx_n_s_metaclass, __pyx_k_metaclass, sizeof(__pyx_k_metaclass), 0, 0, 1, 1},
   {&__pyx_n_s_mode, __pyx_k_mode, sizeof(__pyx_k_mode), 0, 0, 1, 1},
   {&__pyx_n_s_module, __pyx_k_module, sizeof(__pyx_k_module), 0, 0, 1, 1},
-  {&__pyx_n_s_n, __pyx_k_n, sizeof(__pyx_k_n), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
   {&__pyx_n_s_natoms, __pyx_k_natoms, sizeof(__pyx_k_natoms), 0, 0, 1, 1},
@@ -24144,18 +23011,22 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_u_neighbors_or_cutoff_is_required, __pyx_k_neighbors_or_cutoff_is_required, sizeof(__pyx_k_neighbors_or_cutoff_is_required), 0, 1, 0, 0},
   {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
   {&__pyx_n_s_nlist, __pyx_k_nlist, sizeof(__pyx_k_nlist), 0, 0, 1, 1},
-  {&__pyx_n_s_nlist_view, __pyx_k_nlist_view, sizeof(__pyx_k_nlist_view), 0, 0, 1, 1},
   {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
   {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
+  {&__pyx_n_s_nprocs, __pyx_k_nprocs, sizeof(__pyx_k_nprocs), 0, 0, 1, 1},
+  {&__pyx_kp_u_nprocs_must_be_a_positive_intege, __pyx_k_nprocs_must_be_a_positive_intege, sizeof(__pyx_k_nprocs_must_be_a_positive_intege), 0, 1, 0, 0},
   {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
   {&__pyx_n_s_nye, __pyx_k_nye, sizeof(__pyx_k_nye), 0, 0, 1, 1},
   {&__pyx_n_u_nye, __pyx_k_nye, sizeof(__pyx_k_nye), 0, 1, 0, 1},
-  {&__pyx_n_s_nye_view, __pyx_k_nye_view, sizeof(__pyx_k_nye_view), 0, 0, 1, 1},
   {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
+  {&__pyx_n_s_object, __pyx_k_object, sizeof(__pyx_k_object), 0, 0, 1, 1},
   {&__pyx_n_s_p, __pyx_k_p, sizeof(__pyx_k_p), 0, 0, 1, 1},
   {&__pyx_n_s_p_vectors, __pyx_k_p_vectors, sizeof(__pyx_k_p_vectors), 0, 0, 1, 1},
   {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
+  {&__pyx_n_s_pair_table, __pyx_k_pair_table, sizeof(__pyx_k_pair_table), 0, 0, 1, 1},
+  {&__pyx_n_s_pbc, __pyx_k_pbc, sizeof(__pyx_k_pbc), 0, 0, 1, 1},
   {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_pos, __pyx_k_pos, sizeof(__pyx_k_pos), 0, 0, 1, 1},
   {&__pyx_n_s_prepare, __pyx_k_prepare, sizeof(__pyx_k_prepare), 0, 0, 1, 1},
   {&__pyx_n_s_properties, __pyx_k_properties, sizeof(__pyx_k_properties), 0, 0, 1, 1},
   {&__pyx_n_s_property, __pyx_k_property, sizeof(__pyx_k_property), 0, 0, 1, 1},
@@ -24167,13 +23038,12 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_unpickle_Enum, __pyx_k_pyx_unpickle_Enum, sizeof(__pyx_k_pyx_unpickle_Enum), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
-  {&__pyx_n_s_q, __pyx_k_q, sizeof(__pyx_k_q), 0, 0, 1, 1},
   {&__pyx_n_s_qualname, __pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
-  {&__pyx_n_s_rcond, __pyx_k_rcond, sizeof(__pyx_k_rcond), 0, 0, 1, 1},
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_reshape, __pyx_k_reshape, sizeof(__pyx_k_reshape), 0, 0, 1, 1},
   {&__pyx_n_s_results, __pyx_k_results, sizeof(__pyx_k_results), 0, 0, 1, 1},
   {&__pyx_n_s_rotation, __pyx_k_rotation, sizeof(__pyx_k_rotation), 0, 0, 1, 1},
   {&__pyx_n_u_rotation, __pyx_k_rotation, sizeof(__pyx_k_rotation), 0, 1, 0, 1},
@@ -24187,6 +23057,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
   {&__pyx_n_s_solve_G, __pyx_k_solve_G, sizeof(__pyx_k_solve_G), 0, 0, 1, 1},
   {&__pyx_n_s_solve_nye, __pyx_k_solve_nye, sizeof(__pyx_k_solve_nye), 0, 0, 1, 1},
+  {&__pyx_n_s_split, __pyx_k_split, sizeof(__pyx_k_split), 0, 0, 1, 1},
   {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
   {&__pyx_n_s_step, __pyx_k_step, sizeof(__pyx_k_step), 0, 0, 1, 1},
   {&__pyx_n_s_stop, __pyx_k_stop, sizeof(__pyx_k_stop), 0, 0, 1, 1},
@@ -24207,18 +23078,15 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
   {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
   {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
+  {&__pyx_n_s_vects, __pyx_k_vects, sizeof(__pyx_k_vects), 0, 0, 1, 1},
   {&__pyx_n_s_view, __pyx_k_view, sizeof(__pyx_k_view), 0, 0, 1, 1},
-  {&__pyx_n_s_warn, __pyx_k_warn, sizeof(__pyx_k_warn), 0, 0, 1, 1},
-  {&__pyx_n_s_warnings, __pyx_k_warnings, sizeof(__pyx_k_warnings), 0, 0, 1, 1},
-  {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
-  {&__pyx_n_s_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 0, 1, 1},
-  {&__pyx_n_s_z, __pyx_k_z, sizeof(__pyx_k_z), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_property = __Pyx_GetBuiltinName(__pyx_n_s_property); if (!__pyx_builtin_property) __PYX_ERR(0, 84, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 70, __pyx_L1_error)
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 256, __pyx_L1_error)
+  __pyx_builtin_property = __Pyx_GetBuiltinName(__pyx_n_s_property); if (!__pyx_builtin_property) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 273, __pyx_L1_error)
+  __pyx_builtin_object = __Pyx_GetBuiltinName(__pyx_n_s_object); if (!__pyx_builtin_object) __PYX_ERR(0, 322, __pyx_L1_error)
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(1, 148, __pyx_L1_error)
   __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(1, 151, __pyx_L1_error)
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
@@ -24234,61 +23102,72 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "atomman/defect/Strain.pyx":70
+  /* "atomman/defect/Strain.pyx":74
  *             self.__neighbors = system.neighbors
  *         else:
  *             raise ValueError('neighbors or cutoff is required')             # <<<<<<<<<<<<<<
  * 
  *         # p vector setup
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_neighbors_or_cutoff_is_required); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_neighbors_or_cutoff_is_required); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "atomman/defect/Strain.pyx":319
- *         p_vectors = self.p_vectors
- *         if p_vectors is None:
- *             raise ValueError('Cannot solve until p_vectors are set')             # <<<<<<<<<<<<<<
+  /* "atomman/defect/Strain.pyx":118
+ *         value = int(value)
+ *         if value < 1:
+ *             raise ValueError('nprocs must be a positive integer')             # <<<<<<<<<<<<<<
+ *         self.__nprocs = value
  * 
- *         # Theta_max setup
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_Cannot_solve_until_p_vectors_are); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_nprocs_must_be_a_positive_intege); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 118, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "atomman/defect/Strain.pyx":378
- *         nye = np.empty((natoms, 3, 3))
- *         cdef double [:,:,::1] nye_view = nye
- *         gradG = np.empty((3, 3, 3))             # <<<<<<<<<<<<<<
- *         cdef double [:,:,::1] gradG_view = gradG
+  /* "atomman/defect/Strain.pyx":316
+ *         # Compute all neighbor vectors at once and split by atom
+ *         i, j = pair_table(neighbors.nlist)
+ *         vects = basesystem.dvect(i, j).reshape(-1, 3)             # <<<<<<<<<<<<<<
+ *         p = np.split(vects, np.cumsum(neighbors.coord)[:-1])
  * 
  */
-  __pyx_tuple__3 = PyTuple_Pack(3, __pyx_int_3, __pyx_int_3, __pyx_int_3); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_tuple__3 = PyTuple_Pack(2, __pyx_int_neg_1, __pyx_int_3); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 316, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
 
-  /* "atomman/defect/Strain.pyx":381
- *         cdef double [:,:,::1] gradG_view = gradG
- * 
- *         gG = np.empty((3,3))             # <<<<<<<<<<<<<<
- *         cdef double [:,::1] gG_view = gG
+  /* "atomman/defect/Strain.pyx":317
+ *         i, j = pair_table(neighbors.nlist)
+ *         vects = basesystem.dvect(i, j).reshape(-1, 3)
+ *         p = np.split(vects, np.cumsum(neighbors.coord)[:-1])             # <<<<<<<<<<<<<<
  * 
+ *         if np.all(neighbors.coord == neighbors.coord[0]):
  */
-  __pyx_tuple__4 = PyTuple_Pack(2, __pyx_int_3, __pyx_int_3); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 381, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_slice__4 = PySlice_New(Py_None, __pyx_int_neg_1, Py_None); if (unlikely(!__pyx_slice__4)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__4);
+  __Pyx_GIVEREF(__pyx_slice__4);
 
-  /* "atomman/defect/Strain.pyx":399
- * 
- *             for x in range(3):
- *                 gG[:] = np.linalg.lstsq(Q[:c], dG[:c,x,:], rcond=None)[0]             # <<<<<<<<<<<<<<
+  /* "atomman/defect/Strain.pyx":323
+ *         else:
+ *             self.__p_vectors = np.empty(len(p), dtype=object)
+ *             self.__p_vectors[:] = p             # <<<<<<<<<<<<<<
  * 
- *                 for y in range(3):
+ *     def solve_G(self, theta_max=None, nprocs=None):
  */
-  __pyx_slice__5 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__5)) __PYX_ERR(0, 399, __pyx_L1_error)
+  __pyx_slice__5 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__5)) __PYX_ERR(0, 323, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_slice__5);
   __Pyx_GIVEREF(__pyx_slice__5);
 
+  /* "atomman/defect/Strain.pyx":345
+ *         p_vectors = self.p_vectors
+ *         if p_vectors is None:
+ *             raise ValueError('Cannot solve until p_vectors are set')             # <<<<<<<<<<<<<<
+ * 
+ *         # Theta_max setup
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Cannot_solve_until_p_vectors_are); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
   /* "View.MemoryView":133
  * 
  *         if not self.ndim:
@@ -24296,9 +23175,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if itemsize <= 0:
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_s_Empty_shape_tuple_for_cython_arr); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 133, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_s_Empty_shape_tuple_for_cython_arr); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 133, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
 
   /* "View.MemoryView":136
  * 
@@ -24307,9 +23186,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if not isinstance(format, bytes):
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_s_itemsize_0_for_cython_array); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 136, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_itemsize_0_for_cython_array); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
 
   /* "View.MemoryView":148
  * 
@@ -24318,9 +23197,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_shape_and_str); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 148, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_shape_and_str); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
 
   /* "View.MemoryView":176
  *             self.data = <char *>malloc(self.len)
@@ -24329,9 +23208,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *             if self.dtype_is_object:
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_array_data); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 176, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_array_data); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
 
   /* "View.MemoryView":192
  *             bufmode = PyBUF_F_CONTIGUOUS | PyBUF_ANY_CONTIGUOUS
@@ -24340,9 +23219,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         info.buf = self.data
  *         info.len = self.len
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_Can_only_create_a_buffer_that_is); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 192, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_Can_only_create_a_buffer_that_is); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -24350,18 +23229,18 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
 
   /* "View.MemoryView":418
  *     def __setitem__(memoryview self, object index, object value):
@@ -24370,9 +23249,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         have_slices, index = _unellipsify(index, self.view.ndim)
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_Cannot_assign_to_read_only_memor); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 418, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_Cannot_assign_to_read_only_memor); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 418, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
 
   /* "View.MemoryView":495
  *             result = struct.unpack(self.view.format, bytesitem)
@@ -24381,9 +23260,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         else:
  *             if len(self.view.format) == 1:
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_convert_item_to_object); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 495, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_convert_item_to_object); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 495, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
 
   /* "View.MemoryView":520
  *     def __getbuffer__(self, Py_buffer *info, int flags):
@@ -24392,9 +23271,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if flags & PyBUF_ND:
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_Cannot_create_writable_memory_vi); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 520, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_Cannot_create_writable_memory_vi); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(1, 520, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
 
   /* "View.MemoryView":570
  *         if self.view.strides == NULL:
@@ -24403,9 +23282,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         return tuple([stride for stride in self.view.strides[:self.view.ndim]])
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_Buffer_view_does_not_expose_stri); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(1, 570, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_Buffer_view_does_not_expose_stri); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 570, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
 
   /* "View.MemoryView":577
  *     def suboffsets(self):
@@ -24414,12 +23293,12 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         return tuple([suboffset for suboffset in self.view.suboffsets[:self.view.ndim]])
  */
-  __pyx_tuple__17 = PyTuple_New(1); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 577, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
+  __pyx_tuple__18 = PyTuple_New(1); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(1, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
   __Pyx_INCREF(__pyx_int_neg_1);
   __Pyx_GIVEREF(__pyx_int_neg_1);
-  PyTuple_SET_ITEM(__pyx_tuple__17, 0, __pyx_int_neg_1);
-  __Pyx_GIVEREF(__pyx_tuple__17);
+  PyTuple_SET_ITEM(__pyx_tuple__18, 0, __pyx_int_neg_1);
+  __Pyx_GIVEREF(__pyx_tuple__18);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -24427,18 +23306,18 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
 
   /* "View.MemoryView":703
  *     for suboffset in suboffsets[:ndim]:
@@ -24447,9 +23326,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_Indirect_dimensions_not_supporte); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(1, 703, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_Indirect_dimensions_not_supporte); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(1, 703, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -24457,288 +23336,315 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__21);
-  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
 
-  /* "atomman/defect/Strain.pyx":20
+  /* "atomman/defect/Strain.pyx":18
  * class Strain():
  * 
  *     def __init__(self, system, neighbors=None, cutoff=None, p_vectors=None,             # <<<<<<<<<<<<<<
- *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None):
- *         """
- */
-  __pyx_tuple__24 = PyTuple_Pack(9, __pyx_n_s_self, __pyx_n_s_system, __pyx_n_s_neighbors, __pyx_n_s_cutoff, __pyx_n_s_p_vectors, __pyx_n_s_theta_max, __pyx_n_s_axes, __pyx_n_s_basesystem, __pyx_n_s_baseneighbors); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
-  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(9, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_init, 20, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 20, __pyx_L1_error)
-  __pyx_tuple__26 = PyTuple_Pack(7, ((PyObject *)Py_None), ((PyObject *)Py_None), ((PyObject *)Py_None), ((PyObject *)__pyx_int_27), ((PyObject *)Py_None), ((PyObject *)Py_None), ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__26);
-  __Pyx_GIVEREF(__pyx_tuple__26);
+ *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None,
+ *                  nprocs=1):
+ */
+  __pyx_tuple__25 = PyTuple_Pack(10, __pyx_n_s_self, __pyx_n_s_system, __pyx_n_s_neighbors, __pyx_n_s_cutoff, __pyx_n_s_p_vectors, __pyx_n_s_theta_max, __pyx_n_s_axes, __pyx_n_s_basesystem, __pyx_n_s_baseneighbors, __pyx_n_s_nprocs); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(10, 0, 10, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_init, 18, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __pyx_tuple__27 = PyTuple_Pack(8, ((PyObject *)Py_None), ((PyObject *)Py_None), ((PyObject *)Py_None), ((PyObject *)__pyx_int_27), ((PyObject *)Py_None), ((PyObject *)Py_None), ((PyObject *)Py_None), ((PyObject *)__pyx_int_1)); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
 
-  /* "atomman/defect/Strain.pyx":85
+  /* "atomman/defect/Strain.pyx":90
  * 
  *     @property
  *     def system(self):             # <<<<<<<<<<<<<<
  *         """atomman.System: The system the properties are being computed for."""
  *         return self.__system
  */
-  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 85, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_system, 85, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_system, 90, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 90, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":90
+  /* "atomman/defect/Strain.pyx":95
  * 
  *     @property
  *     def p_vectors(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray: The per-atom sets of ideal atom positions."""
  *         return self.__p_vectors
  */
-  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 90, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
-  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_p_vectors, 90, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __pyx_tuple__30 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_p_vectors, 95, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 95, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":95
+  /* "atomman/defect/Strain.pyx":100
  * 
  *     @property
  *     def theta_max(self):             # <<<<<<<<<<<<<<
  *         """float: The maximum angle in degrees to include in the p-q vector pairings."""
  *         return self.__theta_max
  */
-  __pyx_tuple__31 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 95, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__31);
-  __Pyx_GIVEREF(__pyx_tuple__31);
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_theta_max, 95, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_tuple__32 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_theta_max, 100, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 100, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":100
+  /* "atomman/defect/Strain.pyx":105
  * 
  *     @theta_max.setter
  *     def theta_max(self, value):             # <<<<<<<<<<<<<<
  *         if value <= 180 and value > 0:
  *             self.__theta_max = value
  */
-  __pyx_tuple__33 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_value); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 100, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__33);
-  __Pyx_GIVEREF(__pyx_tuple__33);
-  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_theta_max, 100, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_tuple__34 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_value); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_theta_max, 105, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 105, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":105
+  /* "atomman/defect/Strain.pyx":110
+ * 
+ *     @property
+ *     def nprocs(self):             # <<<<<<<<<<<<<<
+ *         """int: The number of processes to use when solving."""
+ *         return self.__nprocs
+ */
+  __pyx_tuple__36 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_nprocs, 110, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 110, __pyx_L1_error)
+
+  /* "atomman/defect/Strain.pyx":115
+ * 
+ *     @nprocs.setter
+ *     def nprocs(self, value):             # <<<<<<<<<<<<<<
+ *         value = int(value)
+ *         if value < 1:
+ */
+  __pyx_tuple__38 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_value); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_nprocs, 115, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 115, __pyx_L1_error)
+
+  /* "atomman/defect/Strain.pyx":122
  * 
  *     @property
  *     def neighbors(self):             # <<<<<<<<<<<<<<
  *         """atomman.NeighborList: The list of neighbors for system."""
  *         return self.__neighbors
  */
-  __pyx_tuple__35 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 105, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__35);
-  __Pyx_GIVEREF(__pyx_tuple__35);
-  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_neighbors, 105, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_tuple__40 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_neighbors, 122, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 122, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":110
+  /* "atomman/defect/Strain.pyx":127
  * 
  *     @property
  *     def G(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
  *         if self.__G is None:
  */
-  __pyx_tuple__37 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(0, 110, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__37);
-  __Pyx_GIVEREF(__pyx_tuple__37);
-  __pyx_codeobj__38 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__37, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_G, 110, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__38)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __pyx_tuple__42 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
+  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_G, 127, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(0, 127, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":117
+  /* "atomman/defect/Strain.pyx":134
  * 
  *     @property
  *     def strain(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom strain tensor"""
  *         if self.__strain is None:
  */
-  __pyx_tuple__39 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__39);
-  __Pyx_GIVEREF(__pyx_tuple__39);
-  __pyx_codeobj__40 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_strain, 117, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__40)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __pyx_tuple__44 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
+  __pyx_codeobj__45 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__44, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_strain, 134, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__45)) __PYX_ERR(0, 134, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":124
+  /* "atomman/defect/Strain.pyx":141
  * 
  *     @property
  *     def invariant1(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom first strain invariant"""
  *         if self.__invariant1 is None:
  */
-  __pyx_tuple__41 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__41)) __PYX_ERR(0, 124, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__41);
-  __Pyx_GIVEREF(__pyx_tuple__41);
-  __pyx_codeobj__42 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__41, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_invariant1, 124, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__42)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __pyx_tuple__46 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_invariant1, 141, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(0, 141, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":131
+  /* "atomman/defect/Strain.pyx":148
  * 
  *     @property
  *     def invariant2(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom second strain invariant"""
  *         if self.__invariant2 is None:
  */
-  __pyx_tuple__43 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__43)) __PYX_ERR(0, 131, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__43);
-  __Pyx_GIVEREF(__pyx_tuple__43);
-  __pyx_codeobj__44 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__43, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_invariant2, 131, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__44)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_tuple__48 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+  __pyx_codeobj__49 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__48, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_invariant2, 148, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__49)) __PYX_ERR(0, 148, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":138
+  /* "atomman/defect/Strain.pyx":155
  * 
  *     @property
  *     def invariant3(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom third strain invariant"""
  *         if self.__invariant3 is None:
  */
-  __pyx_tuple__45 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__45)) __PYX_ERR(0, 138, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__45);
-  __Pyx_GIVEREF(__pyx_tuple__45);
-  __pyx_codeobj__46 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__45, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_invariant3, 138, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__46)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_tuple__50 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__50)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__50);
+  __Pyx_GIVEREF(__pyx_tuple__50);
+  __pyx_codeobj__51 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_invariant3, 155, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__51)) __PYX_ERR(0, 155, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":145
+  /* "atomman/defect/Strain.pyx":162
  * 
  *     @property
  *     def rotation(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom rotation tensor"""
  *         if self.__rotation is None:
  */
-  __pyx_tuple__47 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__47)) __PYX_ERR(0, 145, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__47);
-  __Pyx_GIVEREF(__pyx_tuple__47);
-  __pyx_codeobj__48 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__47, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_rotation, 145, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__48)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __pyx_tuple__52 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__52)) __PYX_ERR(0, 162, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__52);
+  __Pyx_GIVEREF(__pyx_tuple__52);
+  __pyx_codeobj__53 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__52, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_rotation, 162, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__53)) __PYX_ERR(0, 162, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":152
+  /* "atomman/defect/Strain.pyx":169
  * 
  *     @property
  *     def angularvelocity(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom angular velocity"""
  *         if self.__angularvelocity is None:
  */
-  __pyx_tuple__49 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__49)) __PYX_ERR(0, 152, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__49);
-  __Pyx_GIVEREF(__pyx_tuple__49);
-  __pyx_codeobj__50 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__49, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_angularvelocity, 152, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__50)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_tuple__54 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__54)) __PYX_ERR(0, 169, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__54);
+  __Pyx_GIVEREF(__pyx_tuple__54);
+  __pyx_codeobj__55 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__54, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_angularvelocity, 169, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__55)) __PYX_ERR(0, 169, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":159
+  /* "atomman/defect/Strain.pyx":176
  * 
  *     @property
  *     def nye(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom Nye tensor"""
  *         if self.__nye is None:
  */
-  __pyx_tuple__51 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__51)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__51);
-  __Pyx_GIVEREF(__pyx_tuple__51);
-  __pyx_codeobj__52 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__51, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_nye, 159, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__52)) __PYX_ERR(0, 159, __pyx_L1_error)
+  __pyx_tuple__56 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__56)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__56);
+  __Pyx_GIVEREF(__pyx_tuple__56);
+  __pyx_codeobj__57 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__56, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_nye, 176, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__57)) __PYX_ERR(0, 176, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":165
+  /* "atomman/defect/Strain.pyx":182
  *         return self.__nye
  * 
  *     def clear_properties(self):             # <<<<<<<<<<<<<<
  *         """
  *         Clears all computed properties. Allows for the values to be recomputed
  */
-  __pyx_tuple__53 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__53)) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__53);
-  __Pyx_GIVEREF(__pyx_tuple__53);
-  __pyx_codeobj__54 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__53, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_clear_properties, 165, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__54)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_tuple__58 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__58)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__58);
+  __Pyx_GIVEREF(__pyx_tuple__58);
+  __pyx_codeobj__59 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__58, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_clear_properties, 182, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__59)) __PYX_ERR(0, 182, __pyx_L1_error)
 
-  /* "atomman/defect/Strain.pyx":179
+  /* "atomman/defect/Strain.pyx":196
  *         self.__nye = None
  * 
  *     def save_to_system(self, properties=None):             # <<<<<<<<<<<<<<
  *         """
  *         Saves the computed per-atom strain properties to the given system.
  */
-  __pyx_tuple__55 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_properties, __pyx_n_s_defaultkeys, __pyx_n_s_allkeys, __pyx_n_s_p); if (unlikely(!__pyx_tuple__55)) __PYX_ERR(0, 179, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__55);
-  __Pyx_GIVEREF(__pyx_tuple__55);
-  __pyx_codeobj__56 = (PyObject*)__Pyx_PyCode_New(2, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__55, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_save_to_system, 179, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__56)) __PYX_ERR(0, 179, __pyx_L1_error)
-  __pyx_tuple__57 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__57)) __PYX_ERR(0, 179, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__57);
-  __Pyx_GIVEREF(__pyx_tuple__57);
+  __pyx_tuple__60 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_properties, __pyx_n_s_defaultkeys, __pyx_n_s_allkeys, __pyx_n_s_p); if (unlikely(!__pyx_tuple__60)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__60);
+  __Pyx_GIVEREF(__pyx_tuple__60);
+  __pyx_codeobj__61 = (PyObject*)__Pyx_PyCode_New(2, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__60, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_save_to_system, 196, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__61)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __pyx_tuple__62 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__62)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__62);
+  __Pyx_GIVEREF(__pyx_tuple__62);
 
-  /* "atomman/defect/Strain.pyx":201
+  /* "atomman/defect/Strain.pyx":218
  *             self.system.atoms.view[p] = getattr(self, p)
  * 
  *     def asdict(self, properties=None):             # <<<<<<<<<<<<<<
  *         """
  *         Returns a dictionary containing the computed per-atom strain properties.
  */
-  __pyx_tuple__58 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_properties, __pyx_n_s_defaultkeys, __pyx_n_s_allkeys, __pyx_n_s_results, __pyx_n_s_p); if (unlikely(!__pyx_tuple__58)) __PYX_ERR(0, 201, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__58);
-  __Pyx_GIVEREF(__pyx_tuple__58);
-  __pyx_codeobj__59 = (PyObject*)__Pyx_PyCode_New(2, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__58, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_asdict, 201, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__59)) __PYX_ERR(0, 201, __pyx_L1_error)
-  __pyx_tuple__60 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__60)) __PYX_ERR(0, 201, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__60);
-  __Pyx_GIVEREF(__pyx_tuple__60);
+  __pyx_tuple__63 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_properties, __pyx_n_s_defaultkeys, __pyx_n_s_allkeys, __pyx_n_s_results, __pyx_n_s_p); if (unlikely(!__pyx_tuple__63)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__63);
+  __Pyx_GIVEREF(__pyx_tuple__63);
+  __pyx_codeobj__64 = (PyObject*)__Pyx_PyCode_New(2, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__63, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_asdict, 218, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__64)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __pyx_tuple__65 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__65)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__65);
+  __Pyx_GIVEREF(__pyx_tuple__65);
 
-  /* "atomman/defect/Strain.pyx":233
+  /* "atomman/defect/Strain.pyx":250
  *         return results
  * 
  *     def set_p_vectors(self, p_vectors, axes=None):             # <<<<<<<<<<<<<<
  *         """
  *         Sets the p vectors for each atom according to a single p vector set to use
  */
-  __pyx_tuple__61 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_p_vectors, __pyx_n_s_axes, __pyx_n_s_system, __pyx_n_s_i); if (unlikely(!__pyx_tuple__61)) __PYX_ERR(0, 233, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__61);
-  __Pyx_GIVEREF(__pyx_tuple__61);
-  __pyx_codeobj__62 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__61, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_set_p_vectors, 233, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__62)) __PYX_ERR(0, 233, __pyx_L1_error)
-  __pyx_tuple__63 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__63)) __PYX_ERR(0, 233, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__63);
-  __Pyx_GIVEREF(__pyx_tuple__63);
+  __pyx_tuple__66 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_p_vectors, __pyx_n_s_axes, __pyx_n_s_system, __pyx_n_s_i); if (unlikely(!__pyx_tuple__66)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__66);
+  __Pyx_GIVEREF(__pyx_tuple__66);
+  __pyx_codeobj__67 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__66, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_set_p_vectors, 250, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__67)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __pyx_tuple__68 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__68)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__68);
+  __Pyx_GIVEREF(__pyx_tuple__68);
 
-  /* "atomman/defect/Strain.pyx":268
+  /* "atomman/defect/Strain.pyx":285
  *         self.__p_vectors = p_vectors
  * 
  *     def build_p_vectors(self, basesystem, neighbors=None, cutoff=None):             # <<<<<<<<<<<<<<
  *         """
  *         Builds the p vectors for each atom based on a reference system.
  */
-  __pyx_tuple__64 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_basesystem, __pyx_n_s_neighbors, __pyx_n_s_cutoff, __pyx_n_s_p, __pyx_n_s_i); if (unlikely(!__pyx_tuple__64)) __PYX_ERR(0, 268, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__64);
-  __Pyx_GIVEREF(__pyx_tuple__64);
-  __pyx_codeobj__65 = (PyObject*)__Pyx_PyCode_New(4, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__64, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_build_p_vectors, 268, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__65)) __PYX_ERR(0, 268, __pyx_L1_error)
-  __pyx_tuple__66 = PyTuple_Pack(2, ((PyObject *)Py_None), ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__66)) __PYX_ERR(0, 268, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__66);
-  __Pyx_GIVEREF(__pyx_tuple__66);
+  __pyx_tuple__69 = PyTuple_Pack(8, __pyx_n_s_self, __pyx_n_s_basesystem, __pyx_n_s_neighbors, __pyx_n_s_cutoff, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_vects, __pyx_n_s_p); if (unlikely(!__pyx_tuple__69)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__69);
+  __Pyx_GIVEREF(__pyx_tuple__69);
+  __pyx_codeobj__70 = (PyObject*)__Pyx_PyCode_New(4, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__69, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_build_p_vectors, 285, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__70)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __pyx_tuple__71 = PyTuple_Pack(2, ((PyObject *)Py_None), ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__71)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__71);
+  __Pyx_GIVEREF(__pyx_tuple__71);
 
-  /* "atomman/defect/Strain.pyx":303
- *         self.__p_vectors = np.asarray(p)
+  /* "atomman/defect/Strain.pyx":325
+ *             self.__p_vectors[:] = p
  * 
- *     def solve_G(self, theta_max=None):             # <<<<<<<<<<<<<<
+ *     def solve_G(self, theta_max=None, nprocs=None):             # <<<<<<<<<<<<<<
  *         """
  *         Computes the lattice correspondence tensor, G, by comparing all neighbor
  */
-  __pyx_tuple__67 = PyTuple_Pack(15, __pyx_n_s_self, __pyx_n_s_theta_max, __pyx_n_s_p_vectors, __pyx_n_s_cos_theta_max, __pyx_n_s_system, __pyx_n_s_neighbors, __pyx_n_s_maxcoord, __pyx_n_s_natoms, __pyx_n_s_G, __pyx_n_s_P, __pyx_n_s_Q, __pyx_n_s_i, __pyx_n_s_p, __pyx_n_s_q, __pyx_n_s_n); if (unlikely(!__pyx_tuple__67)) __PYX_ERR(0, 303, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__67);
-  __Pyx_GIVEREF(__pyx_tuple__67);
-  __pyx_codeobj__68 = (PyObject*)__Pyx_PyCode_New(2, 0, 15, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__67, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_solve_G, 303, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__68)) __PYX_ERR(0, 303, __pyx_L1_error)
-  __pyx_tuple__69 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__69)) __PYX_ERR(0, 303, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__69);
-  __Pyx_GIVEREF(__pyx_tuple__69);
+  __pyx_tuple__72 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_theta_max, __pyx_n_s_nprocs, __pyx_n_s_p_vectors, __pyx_n_s_system, __pyx_n_s_results); if (unlikely(!__pyx_tuple__72)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__72);
+  __Pyx_GIVEREF(__pyx_tuple__72);
+  __pyx_codeobj__73 = (PyObject*)__Pyx_PyCode_New(3, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__72, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_solve_G, 325, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__73)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __pyx_tuple__74 = PyTuple_Pack(2, ((PyObject *)Py_None), ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__74)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__74);
+  __Pyx_GIVEREF(__pyx_tuple__74);
 
-  /* "atomman/defect/Strain.pyx":356
- *         self.__G = G
+  /* "atomman/defect/Strain.pyx":375
+ *             self.__angularvelocity = results['angularvelocity']
  * 
- *     def solve_nye(self):             # <<<<<<<<<<<<<<
+ *     def solve_nye(self, nprocs=None):             # <<<<<<<<<<<<<<
  *         """
  *         Computes the Nye tensor based on the lattice correspondence tensor G
  */
-  __pyx_tuple__70 = PyTuple_Pack(23, __pyx_n_s_self, __pyx_n_s_G, __pyx_n_s_G_view, __pyx_n_s_system, __pyx_n_s_nlist, __pyx_n_s_nlist_view, __pyx_n_s_i, __pyx_n_s_x, __pyx_n_s_y, __pyx_n_s_z, __pyx_n_s_natoms, __pyx_n_s_maxcoord, __pyx_n_s_nye, __pyx_n_s_nye_view, __pyx_n_s_gradG, __pyx_n_s_gradG_view, __pyx_n_s_gG, __pyx_n_s_gG_view, __pyx_n_s_dG, __pyx_n_s_dG_view, __pyx_n_s_Q, __pyx_n_s_Q_view, __pyx_n_s_c); if (unlikely(!__pyx_tuple__70)) __PYX_ERR(0, 356, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__70);
-  __Pyx_GIVEREF(__pyx_tuple__70);
-  __pyx_codeobj__71 = (PyObject*)__Pyx_PyCode_New(1, 0, 23, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__70, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_solve_nye, 356, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__71)) __PYX_ERR(0, 356, __pyx_L1_error)
+  __pyx_tuple__75 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_nprocs, __pyx_n_s_G, __pyx_n_s_system); if (unlikely(!__pyx_tuple__75)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__75);
+  __Pyx_GIVEREF(__pyx_tuple__75);
+  __pyx_codeobj__76 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__75, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_atomman_defect_Strain_pyx, __pyx_n_s_solve_nye, 375, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__76)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __pyx_tuple__77 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__77)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__77);
+  __Pyx_GIVEREF(__pyx_tuple__77);
 
   /* "View.MemoryView":286
  *         return self.name
@@ -24747,9 +23653,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_tuple__72 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__72)) __PYX_ERR(1, 286, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__72);
-  __Pyx_GIVEREF(__pyx_tuple__72);
+  __pyx_tuple__78 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__78)) __PYX_ERR(1, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__78);
+  __Pyx_GIVEREF(__pyx_tuple__78);
 
   /* "View.MemoryView":287
  * 
@@ -24758,9 +23664,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_tuple__73 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__73)) __PYX_ERR(1, 287, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__73);
-  __Pyx_GIVEREF(__pyx_tuple__73);
+  __pyx_tuple__79 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__79)) __PYX_ERR(1, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__79);
+  __Pyx_GIVEREF(__pyx_tuple__79);
 
   /* "View.MemoryView":288
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -24769,9 +23675,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__74 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__74)) __PYX_ERR(1, 288, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__74);
-  __Pyx_GIVEREF(__pyx_tuple__74);
+  __pyx_tuple__80 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__80)) __PYX_ERR(1, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__80);
+  __Pyx_GIVEREF(__pyx_tuple__80);
 
   /* "View.MemoryView":291
  * 
@@ -24780,9 +23686,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_tuple__75 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__75)) __PYX_ERR(1, 291, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__75);
-  __Pyx_GIVEREF(__pyx_tuple__75);
+  __pyx_tuple__81 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__81)) __PYX_ERR(1, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__81);
+  __Pyx_GIVEREF(__pyx_tuple__81);
 
   /* "View.MemoryView":292
  * 
@@ -24791,19 +23697,19 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__76 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__76)) __PYX_ERR(1, 292, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__76);
-  __Pyx_GIVEREF(__pyx_tuple__76);
+  __pyx_tuple__82 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__82)) __PYX_ERR(1, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__82);
+  __Pyx_GIVEREF(__pyx_tuple__82);
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_Enum(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_tuple__77 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__77)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__77);
-  __Pyx_GIVEREF(__pyx_tuple__77);
-  __pyx_codeobj__78 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__77, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__78)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__83 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__83)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__83);
+  __Pyx_GIVEREF(__pyx_tuple__83);
+  __pyx_codeobj__84 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__83, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__84)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -24813,7 +23719,6 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  __pyx_float_180_0 = PyFloat_FromDouble(180.0); if (unlikely(!__pyx_float_180_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -25161,57 +24066,45 @@ if (!__Pyx_RefNanny) {
 
   /* "atomman/defect/Strain.pyx":5
  * 
- * # Standard Python libraries
- * import warnings             # <<<<<<<<<<<<<<
- * 
- * # http://www.numpy.org/
- */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_warnings, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 5, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_warnings, __pyx_t_1) < 0) __PYX_ERR(0, 5, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "atomman/defect/Strain.pyx":8
- * 
  * # http://www.numpy.org/
  * import numpy as np             # <<<<<<<<<<<<<<
  * 
  * # atomman imports
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 5, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":11
+  /* "atomman/defect/Strain.pyx":8
  * 
  * # atomman imports
  * from .. import NeighborList             # <<<<<<<<<<<<<<
  * from ..tools import axes_check, aslist
- * 
+ * from .batch_strain import pair_table, batch_G, batch_nye, batch_strain
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_NeighborList);
   __Pyx_GIVEREF(__pyx_n_s_NeighborList);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_NeighborList);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s__23, __pyx_t_1, 2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s__24, __pyx_t_1, 2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_NeighborList); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_NeighborList); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_NeighborList, __pyx_t_1) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_NeighborList, __pyx_t_1) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "atomman/defect/Strain.pyx":12
+  /* "atomman/defect/Strain.pyx":9
  * # atomman imports
  * from .. import NeighborList
  * from ..tools import axes_check, aslist             # <<<<<<<<<<<<<<
+ * from .batch_strain import pair_table, batch_G, batch_nye, batch_strain
  * 
- * cimport cython
  */
-  __pyx_t_2 = PyList_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_n_s_axes_check);
   __Pyx_GIVEREF(__pyx_n_s_axes_check);
@@ -25219,138 +24112,180 @@ if (!__Pyx_RefNanny) {
   __Pyx_INCREF(__pyx_n_s_aslist);
   __Pyx_GIVEREF(__pyx_n_s_aslist);
   PyList_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_aslist);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_tools, __pyx_t_2, 2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_tools, __pyx_t_2, 2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_axes_check); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_axes_check); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_axes_check, __pyx_t_2) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_axes_check, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_aslist); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_aslist); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_aslist, __pyx_t_2) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_aslist, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":18
- * from libc.math cimport cos, pi, sqrt, fabs
+  /* "atomman/defect/Strain.pyx":10
+ * from .. import NeighborList
+ * from ..tools import axes_check, aslist
+ * from .batch_strain import pair_table, batch_G, batch_nye, batch_strain             # <<<<<<<<<<<<<<
+ * 
+ * cimport cython
+ */
+  __pyx_t_1 = PyList_New(4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_pair_table);
+  __Pyx_GIVEREF(__pyx_n_s_pair_table);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_pair_table);
+  __Pyx_INCREF(__pyx_n_s_batch_G);
+  __Pyx_GIVEREF(__pyx_n_s_batch_G);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_batch_G);
+  __Pyx_INCREF(__pyx_n_s_batch_nye);
+  __Pyx_GIVEREF(__pyx_n_s_batch_nye);
+  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_n_s_batch_nye);
+  __Pyx_INCREF(__pyx_n_s_batch_strain);
+  __Pyx_GIVEREF(__pyx_n_s_batch_strain);
+  PyList_SET_ITEM(__pyx_t_1, 3, __pyx_n_s_batch_strain);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_batch_strain, __pyx_t_1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_pair_table); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pair_table, __pyx_t_1) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_batch_G); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_batch_G, __pyx_t_1) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_batch_nye); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_batch_nye, __pyx_t_1) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_batch_strain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_batch_strain, __pyx_t_1) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "atomman/defect/Strain.pyx":16
+ * from libc.math cimport sqrt
  * 
  * class Strain():             # <<<<<<<<<<<<<<
  * 
  *     def __init__(self, system, neighbors=None, cutoff=None, p_vectors=None,
  */
-  __pyx_t_1 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_empty_tuple, __pyx_n_s_Strain, __pyx_n_s_Strain, (PyObject *) NULL, __pyx_n_s_atomman_defect_Strain, (PyObject *) NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_empty_tuple, __pyx_n_s_Strain, __pyx_n_s_Strain, (PyObject *) NULL, __pyx_n_s_atomman_defect_Strain, (PyObject *) NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
-  /* "atomman/defect/Strain.pyx":20
+  /* "atomman/defect/Strain.pyx":18
  * class Strain():
  * 
  *     def __init__(self, system, neighbors=None, cutoff=None, p_vectors=None,             # <<<<<<<<<<<<<<
- *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None):
- *         """
+ *                  theta_max=27, axes=None, basesystem=None, baseneighbors=None,
+ *                  nprocs=1):
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_1__init__, 0, __pyx_n_s_Strain___init, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__26);
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_init, __pyx_t_2) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_1__init__, 0, __pyx_n_s_Strain___init, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_1, __pyx_tuple__27);
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_init, __pyx_t_1) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":85
+  /* "atomman/defect/Strain.pyx":90
  * 
  *     @property
  *     def system(self):             # <<<<<<<<<<<<<<
  *         """atomman.System: The system the properties are being computed for."""
  *         return self.__system
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_3system, 0, __pyx_n_s_Strain_system, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_3system, 0, __pyx_n_s_Strain_system, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
 
-  /* "atomman/defect/Strain.pyx":84
+  /* "atomman/defect/Strain.pyx":89
  *         self.clear_properties()
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def system(self):
  *         """atomman.System: The system the properties are being computed for."""
  */
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 89, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_system, __pyx_t_3) < 0) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_system, __pyx_t_3) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":90
+  /* "atomman/defect/Strain.pyx":95
  * 
  *     @property
  *     def p_vectors(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray: The per-atom sets of ideal atom positions."""
  *         return self.__p_vectors
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_5p_vectors, 0, __pyx_n_s_Strain_p_vectors, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__30)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_5p_vectors, 0, __pyx_n_s_Strain_p_vectors, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
 
-  /* "atomman/defect/Strain.pyx":89
+  /* "atomman/defect/Strain.pyx":94
  *         return self.__system
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def p_vectors(self):
  *         """numpy.NDArray: The per-atom sets of ideal atom positions."""
  */
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 89, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_p_vectors, __pyx_t_2) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_p_vectors, __pyx_t_1) < 0) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":95
+  /* "atomman/defect/Strain.pyx":100
  * 
  *     @property
  *     def theta_max(self):             # <<<<<<<<<<<<<<
  *         """float: The maximum angle in degrees to include in the p-q vector pairings."""
  *         return self.__theta_max
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_7theta_max, 0, __pyx_n_s_Strain_theta_max, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_7theta_max, 0, __pyx_n_s_Strain_theta_max, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
 
-  /* "atomman/defect/Strain.pyx":94
+  /* "atomman/defect/Strain.pyx":99
  *         return self.__p_vectors
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def theta_max(self):
  *         """float: The maximum angle in degrees to include in the p-q vector pairings."""
  */
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_theta_max, __pyx_t_3) < 0) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_theta_max, __pyx_t_3) < 0) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":99
+  /* "atomman/defect/Strain.pyx":104
  *         return self.__theta_max
  * 
  *     @theta_max.setter             # <<<<<<<<<<<<<<
  *     def theta_max(self, value):
  *         if value <= 180 and value > 0:
  */
-  __pyx_t_2 = PyObject_GetItem(__pyx_t_1, __pyx_n_s_theta_max);
-  if (unlikely(!__pyx_t_2)) {
+  __pyx_t_1 = PyObject_GetItem(__pyx_t_2, __pyx_n_s_theta_max);
+  if (unlikely(!__pyx_t_1)) {
     PyErr_Clear();
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_theta_max);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_theta_max);
   }
-  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_setter); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 99, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_setter); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 104, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":100
+  /* "atomman/defect/Strain.pyx":105
  * 
  *     @theta_max.setter
  *     def theta_max(self, value):             # <<<<<<<<<<<<<<
  *         if value <= 180 and value > 0:
  *             self.__theta_max = value
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_9theta_max, 0, __pyx_n_s_Strain_theta_max, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_9theta_max, 0, __pyx_n_s_Strain_theta_max, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__35)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_5 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
     __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
@@ -25361,333 +24296,403 @@ if (!__Pyx_RefNanny) {
       __Pyx_DECREF_SET(__pyx_t_4, function);
     }
   }
-  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_2);
+  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_1);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 104, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_theta_max, __pyx_t_3) < 0) __PYX_ERR(0, 100, __pyx_L1_error)
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_theta_max, __pyx_t_3) < 0) __PYX_ERR(0, 105, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":105
+  /* "atomman/defect/Strain.pyx":110
+ * 
+ *     @property
+ *     def nprocs(self):             # <<<<<<<<<<<<<<
+ *         """int: The number of processes to use when solving."""
+ *         return self.__nprocs
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_11nprocs, 0, __pyx_n_s_Strain_nprocs, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__37)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+
+  /* "atomman/defect/Strain.pyx":109
+ *             self.__theta_max = value
+ * 
+ *     @property             # <<<<<<<<<<<<<<
+ *     def nprocs(self):
+ *         """int: The number of processes to use when solving."""
+ */
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_nprocs, __pyx_t_4) < 0) __PYX_ERR(0, 110, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "atomman/defect/Strain.pyx":114
+ *         return self.__nprocs
+ * 
+ *     @nprocs.setter             # <<<<<<<<<<<<<<
+ *     def nprocs(self, value):
+ *         value = int(value)
+ */
+  __pyx_t_3 = PyObject_GetItem(__pyx_t_2, __pyx_n_s_nprocs);
+  if (unlikely(!__pyx_t_3)) {
+    PyErr_Clear();
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_nprocs);
+  }
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_setter); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "atomman/defect/Strain.pyx":115
+ * 
+ *     @nprocs.setter
+ *     def nprocs(self, value):             # <<<<<<<<<<<<<<
+ *         value = int(value)
+ *         if value < 1:
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_13nprocs, 0, __pyx_n_s_Strain_nprocs, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__39)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_nprocs, __pyx_t_4) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "atomman/defect/Strain.pyx":122
  * 
  *     @property
  *     def neighbors(self):             # <<<<<<<<<<<<<<
  *         """atomman.NeighborList: The list of neighbors for system."""
  *         return self.__neighbors
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_11neighbors, 0, __pyx_n_s_Strain_neighbors, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__36)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 105, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_15neighbors, 0, __pyx_n_s_Strain_neighbors, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__41)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
 
-  /* "atomman/defect/Strain.pyx":104
- *             self.__theta_max = value
+  /* "atomman/defect/Strain.pyx":121
+ *         self.__nprocs = value
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def neighbors(self):
  *         """atomman.NeighborList: The list of neighbors for system."""
  */
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 104, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_neighbors, __pyx_t_4) < 0) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_neighbors, __pyx_t_1) < 0) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":110
+  /* "atomman/defect/Strain.pyx":127
  * 
  *     @property
  *     def G(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
  *         if self.__G is None:
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_13G, 0, __pyx_n_s_Strain_G, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__38)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 110, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_17G, 0, __pyx_n_s_Strain_G, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__43)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
 
-  /* "atomman/defect/Strain.pyx":109
+  /* "atomman/defect/Strain.pyx":126
  *         return self.__neighbors
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def G(self):
  *         """numpy.NDArray : The computed per-atom lattice correspondence tensor"""
  */
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 109, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_G, __pyx_t_4) < 0) __PYX_ERR(0, 127, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_G, __pyx_t_3) < 0) __PYX_ERR(0, 110, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":117
+  /* "atomman/defect/Strain.pyx":134
  * 
  *     @property
  *     def strain(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom strain tensor"""
  *         if self.__strain is None:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_15strain, 0, __pyx_n_s_Strain_strain, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__40)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_19strain, 0, __pyx_n_s_Strain_strain, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__45)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
 
-  /* "atomman/defect/Strain.pyx":116
+  /* "atomman/defect/Strain.pyx":133
  *         return self.__G
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def strain(self):
  *         """numpy.NDArray : The computed per-atom strain tensor"""
  */
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 116, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_strain, __pyx_t_4) < 0) __PYX_ERR(0, 117, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_strain, __pyx_t_1) < 0) __PYX_ERR(0, 134, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":124
+  /* "atomman/defect/Strain.pyx":141
  * 
  *     @property
  *     def invariant1(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom first strain invariant"""
  *         if self.__invariant1 is None:
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_17invariant1, 0, __pyx_n_s_Strain_invariant1, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__42)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 124, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_21invariant1, 0, __pyx_n_s_Strain_invariant1, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__47)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
 
-  /* "atomman/defect/Strain.pyx":123
+  /* "atomman/defect/Strain.pyx":140
  *         return self.__strain
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def invariant1(self):
  *         """numpy.NDArray : The computed per-atom first strain invariant"""
  */
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 123, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_invariant1, __pyx_t_4) < 0) __PYX_ERR(0, 141, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_invariant1, __pyx_t_3) < 0) __PYX_ERR(0, 124, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":131
+  /* "atomman/defect/Strain.pyx":148
  * 
  *     @property
  *     def invariant2(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom second strain invariant"""
  *         if self.__invariant2 is None:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_19invariant2, 0, __pyx_n_s_Strain_invariant2, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__44)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_23invariant2, 0, __pyx_n_s_Strain_invariant2, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__49)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
 
-  /* "atomman/defect/Strain.pyx":130
+  /* "atomman/defect/Strain.pyx":147
  *         return self.__invariant1
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def invariant2(self):
  *         """numpy.NDArray : The computed per-atom second strain invariant"""
  */
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 130, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_invariant2, __pyx_t_4) < 0) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_invariant2, __pyx_t_1) < 0) __PYX_ERR(0, 148, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":138
+  /* "atomman/defect/Strain.pyx":155
  * 
  *     @property
  *     def invariant3(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom third strain invariant"""
  *         if self.__invariant3 is None:
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_21invariant3, 0, __pyx_n_s_Strain_invariant3, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__46)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 138, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_25invariant3, 0, __pyx_n_s_Strain_invariant3, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__51)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
 
-  /* "atomman/defect/Strain.pyx":137
+  /* "atomman/defect/Strain.pyx":154
  *         return self.__invariant2
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def invariant3(self):
  *         """numpy.NDArray : The computed per-atom third strain invariant"""
  */
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_invariant3, __pyx_t_4) < 0) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_invariant3, __pyx_t_3) < 0) __PYX_ERR(0, 138, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":145
+  /* "atomman/defect/Strain.pyx":162
  * 
  *     @property
  *     def rotation(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom rotation tensor"""
  *         if self.__rotation is None:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_23rotation, 0, __pyx_n_s_Strain_rotation, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__48)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_27rotation, 0, __pyx_n_s_Strain_rotation, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__53)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 162, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
 
-  /* "atomman/defect/Strain.pyx":144
+  /* "atomman/defect/Strain.pyx":161
  *         return self.__invariant3
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def rotation(self):
  *         """numpy.NDArray : The computed per-atom rotation tensor"""
  */
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 144, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_rotation, __pyx_t_4) < 0) __PYX_ERR(0, 145, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_rotation, __pyx_t_1) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":152
+  /* "atomman/defect/Strain.pyx":169
  * 
  *     @property
  *     def angularvelocity(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom angular velocity"""
  *         if self.__angularvelocity is None:
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_25angularvelocity, 0, __pyx_n_s_Strain_angularvelocity, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__50)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 152, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_29angularvelocity, 0, __pyx_n_s_Strain_angularvelocity, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__55)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
 
-  /* "atomman/defect/Strain.pyx":151
+  /* "atomman/defect/Strain.pyx":168
  *         return self.__rotation
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def angularvelocity(self):
  *         """numpy.NDArray : The computed per-atom angular velocity"""
  */
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_angularvelocity, __pyx_t_4) < 0) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_angularvelocity, __pyx_t_3) < 0) __PYX_ERR(0, 152, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "atomman/defect/Strain.pyx":159
+  /* "atomman/defect/Strain.pyx":176
  * 
  *     @property
  *     def nye(self):             # <<<<<<<<<<<<<<
  *         """numpy.NDArray : The computed per-atom Nye tensor"""
  *         if self.__nye is None:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_27nye, 0, __pyx_n_s_Strain_nye, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__52)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_31nye, 0, __pyx_n_s_Strain_nye, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__57)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
 
-  /* "atomman/defect/Strain.pyx":158
+  /* "atomman/defect/Strain.pyx":175
  *         return self.__angularvelocity
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def nye(self):
  *         """numpy.NDArray : The computed per-atom Nye tensor"""
  */
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 158, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_nye, __pyx_t_4) < 0) __PYX_ERR(0, 159, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_property, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_nye, __pyx_t_1) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":165
+  /* "atomman/defect/Strain.pyx":182
  *         return self.__nye
  * 
  *     def clear_properties(self):             # <<<<<<<<<<<<<<
  *         """
  *         Clears all computed properties. Allows for the values to be recomputed
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_29clear_properties, 0, __pyx_n_s_Strain_clear_properties, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__54)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_clear_properties, __pyx_t_4) < 0) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_33clear_properties, 0, __pyx_n_s_Strain_clear_properties, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__59)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_clear_properties, __pyx_t_1) < 0) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":179
+  /* "atomman/defect/Strain.pyx":196
  *         self.__nye = None
  * 
  *     def save_to_system(self, properties=None):             # <<<<<<<<<<<<<<
  *         """
  *         Saves the computed per-atom strain properties to the given system.
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_31save_to_system, 0, __pyx_n_s_Strain_save_to_system, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__56)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 179, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_tuple__57);
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_save_to_system, __pyx_t_4) < 0) __PYX_ERR(0, 179, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_35save_to_system, 0, __pyx_n_s_Strain_save_to_system, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__61)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_1, __pyx_tuple__62);
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_save_to_system, __pyx_t_1) < 0) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":201
+  /* "atomman/defect/Strain.pyx":218
  *             self.system.atoms.view[p] = getattr(self, p)
  * 
  *     def asdict(self, properties=None):             # <<<<<<<<<<<<<<
  *         """
  *         Returns a dictionary containing the computed per-atom strain properties.
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_33asdict, 0, __pyx_n_s_Strain_asdict, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__59)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 201, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_tuple__60);
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_asdict, __pyx_t_4) < 0) __PYX_ERR(0, 201, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_37asdict, 0, __pyx_n_s_Strain_asdict, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__64)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_1, __pyx_tuple__65);
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_asdict, __pyx_t_1) < 0) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":233
+  /* "atomman/defect/Strain.pyx":250
  *         return results
  * 
  *     def set_p_vectors(self, p_vectors, axes=None):             # <<<<<<<<<<<<<<
  *         """
  *         Sets the p vectors for each atom according to a single p vector set to use
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_35set_p_vectors, 0, __pyx_n_s_Strain_set_p_vectors, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__62)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 233, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_tuple__63);
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_set_p_vectors, __pyx_t_4) < 0) __PYX_ERR(0, 233, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_39set_p_vectors, 0, __pyx_n_s_Strain_set_p_vectors, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__67)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_1, __pyx_tuple__68);
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_set_p_vectors, __pyx_t_1) < 0) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":268
+  /* "atomman/defect/Strain.pyx":285
  *         self.__p_vectors = p_vectors
  * 
  *     def build_p_vectors(self, basesystem, neighbors=None, cutoff=None):             # <<<<<<<<<<<<<<
  *         """
  *         Builds the p vectors for each atom based on a reference system.
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_37build_p_vectors, 0, __pyx_n_s_Strain_build_p_vectors, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__65)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 268, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_tuple__66);
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_build_p_vectors, __pyx_t_4) < 0) __PYX_ERR(0, 268, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_41build_p_vectors, 0, __pyx_n_s_Strain_build_p_vectors, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__70)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_1, __pyx_tuple__71);
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_build_p_vectors, __pyx_t_1) < 0) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":303
- *         self.__p_vectors = np.asarray(p)
+  /* "atomman/defect/Strain.pyx":325
+ *             self.__p_vectors[:] = p
  * 
- *     def solve_G(self, theta_max=None):             # <<<<<<<<<<<<<<
+ *     def solve_G(self, theta_max=None, nprocs=None):             # <<<<<<<<<<<<<<
  *         """
  *         Computes the lattice correspondence tensor, G, by comparing all neighbor
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_39solve_G, 0, __pyx_n_s_Strain_solve_G, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__68)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 303, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_tuple__69);
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_solve_G, __pyx_t_4) < 0) __PYX_ERR(0, 303, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_43solve_G, 0, __pyx_n_s_Strain_solve_G, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__73)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_1, __pyx_tuple__74);
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_solve_G, __pyx_t_1) < 0) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":356
- *         self.__G = G
+  /* "atomman/defect/Strain.pyx":375
+ *             self.__angularvelocity = results['angularvelocity']
  * 
- *     def solve_nye(self):             # <<<<<<<<<<<<<<
+ *     def solve_nye(self, nprocs=None):             # <<<<<<<<<<<<<<
  *         """
  *         Computes the Nye tensor based on the lattice correspondence tensor G
  */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_41solve_nye, 0, __pyx_n_s_Strain_solve_nye, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__71)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 356, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_solve_nye, __pyx_t_4) < 0) __PYX_ERR(0, 356, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_7atomman_6defect_6Strain_6Strain_45solve_nye, 0, __pyx_n_s_Strain_solve_nye, NULL, __pyx_n_s_atomman_defect_Strain, __pyx_d, ((PyObject *)__pyx_codeobj__76)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_1, __pyx_tuple__77);
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_solve_nye, __pyx_t_1) < 0) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "atomman/defect/Strain.pyx":18
- * from libc.math cimport cos, pi, sqrt, fabs
+  /* "atomman/defect/Strain.pyx":16
+ * from libc.math cimport sqrt
  * 
  * class Strain():             # <<<<<<<<<<<<<<
  * 
  *     def __init__(self, system, neighbors=None, cutoff=None, p_vectors=None,
  */
-  __pyx_t_4 = __Pyx_Py3ClassCreate(((PyObject*)&__Pyx_DefaultClassType), __pyx_n_s_Strain, __pyx_empty_tuple, __pyx_t_1, NULL, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Strain, __pyx_t_4) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_Py3ClassCreate(((PyObject*)&__Pyx_DefaultClassType), __pyx_n_s_Strain, __pyx_empty_tuple, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Strain, __pyx_t_1) < 0) __PYX_ERR(0, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "atomman/defect/Strain.pyx":1
  * # coding: utf-8             # <<<<<<<<<<<<<<
  * # cython: language_level=3
  * 
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "View.MemoryView":209
  *         info.obj = self
@@ -25696,10 +24701,10 @@ if (!__Pyx_RefNanny) {
  * 
  *     def __dealloc__(array self):
  */
-  __pyx_t_1 = __pyx_capsule_create(((void *)(&__pyx_array_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 209, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem((PyObject *)__pyx_array_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_1) < 0) __PYX_ERR(1, 209, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __pyx_capsule_create(((void *)(&__pyx_array_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 209, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_array_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_2) < 0) __PYX_ERR(1, 209, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_array_type);
 
   /* "View.MemoryView":286
@@ -25709,12 +24714,12 @@ if (!__Pyx_RefNanny) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__72, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 286, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__78, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(generic);
-  __Pyx_DECREF_SET(generic, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(generic, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
 
   /* "View.MemoryView":287
  * 
@@ -25723,12 +24728,12 @@ if (!__Pyx_RefNanny) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__73, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 287, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__79, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(strided);
-  __Pyx_DECREF_SET(strided, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(strided, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
 
   /* "View.MemoryView":288
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -25737,12 +24742,12 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__74, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 288, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__80, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(indirect);
-  __Pyx_DECREF_SET(indirect, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(indirect, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
 
   /* "View.MemoryView":291
  * 
@@ -25751,12 +24756,12 @@ if (!__Pyx_RefNanny) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__75, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 291, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__81, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(contiguous);
-  __Pyx_DECREF_SET(contiguous, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(contiguous, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
 
   /* "View.MemoryView":292
  * 
@@ -25765,12 +24770,12 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__76, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 292, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__82, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(indirect_contiguous);
-  __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
 
   /* "View.MemoryView":316
  * 
@@ -25805,10 +24810,10 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 549, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem((PyObject *)__pyx_memoryview_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_1) < 0) __PYX_ERR(1, 549, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 549, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_memoryview_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_2) < 0) __PYX_ERR(1, 549, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_memoryview_type);
 
   /* "View.MemoryView":995
@@ -25818,10 +24823,10 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 995, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem((PyObject *)__pyx_memoryviewslice_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_1) < 0) __PYX_ERR(1, 995, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 995, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_memoryviewslice_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_2) < 0) __PYX_ERR(1, 995, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_memoryviewslice_type);
 
   /* "(tree fragment)":1
@@ -25829,10 +24834,10 @@ if (!__Pyx_RefNanny) {
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_15View_dot_MemoryView_1__pyx_unpickle_Enum, NULL, __pyx_n_s_View_MemoryView); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Enum, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_15View_dot_MemoryView_1__pyx_unpickle_Enum, NULL, __pyx_n_s_View_MemoryView); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Enum, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "(tree fragment)":11
  *         __pyx_unpickle_Enum__set_state(<Enum> __pyx_result, __pyx_state)
@@ -26941,128 +25946,82 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2,
             unequal = (size != 2) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
                  | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
         } else
-#endif
-            unequal = (size != 1) || (((unsigned long) digits[0]) != (uintval & (unsigned long) PyLong_MASK));
-        if (unequal == 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
-    }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        const long b = intval;
-        double a = PyFloat_AS_DOUBLE(op1);
-        if ((double)a == (double)b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
-    }
-    return (
-        PyObject_RichCompare(op1, op2, Py_EQ));
-}
-
-/* ObjectGetItem */
-#if CYTHON_USE_TYPE_SLOTS
-static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
-    PyObject *runerr;
-    Py_ssize_t key_value;
-    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
-    if (unlikely(!(m && m->sq_item))) {
-        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
-        return NULL;
-    }
-    key_value = __Pyx_PyIndex_AsSsize_t(index);
-    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
-        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
+#endif
+            unequal = (size != 1) || (((unsigned long) digits[0]) != (uintval & (unsigned long) PyLong_MASK));
+        if (unequal == 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
     }
-    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
-        PyErr_Clear();
-        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+        if ((double)a == (double)b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
     }
-    return NULL;
+    return (
+        PyObject_RichCompare(op1, op2, Py_EQ));
 }
-static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
-    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
-    if (likely(m && m->mp_subscript)) {
-        return m->mp_subscript(obj, key);
-    }
-    return __Pyx_PyObject_GetIndex(obj, key);
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
 }
-#endif
 
-/* PyFloatBinop */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyFloat_TrueDivideObjC(PyObject *op1, PyObject *op2, double floatval, int inplace, int zerodivision_check) {
-    const double b = floatval;
-    double a, result;
-    (void)inplace;
-    (void)zerodivision_check;
-    if (likely(PyFloat_CheckExact(op1))) {
-        a = PyFloat_AS_DOUBLE(op1);
-        
-    } else
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op1))) {
-        a = (double) PyInt_AS_LONG(op1);
-        
-    } else
-    #endif
-    if (likely(PyLong_CheckExact(op1))) {
-        #if CYTHON_USE_PYLONG_INTERNALS
-        const digit* digits = ((PyLongObject*)op1)->ob_digit;
-        const Py_ssize_t size = Py_SIZE(op1);
-        switch (size) {
-            case  0: a = 0.0; break;
-            case -1: a = -(double) digits[0]; break;
-            case  1: a = (double) digits[0]; break;
-            case -2:
-            case 2:
-                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
-                    a = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
-                        if (size == -2)
-                            a = -a;
-                        break;
-                    }
-                }
-                CYTHON_FALLTHROUGH;
-            case -3:
-            case 3:
-                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
-                    a = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
-                        if (size == -3)
-                            a = -a;
-                        break;
-                    }
-                }
-                CYTHON_FALLTHROUGH;
-            case -4:
-            case 4:
-                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
-                    a = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
-                        if (size == -4)
-                            a = -a;
-                        break;
-                    }
-                }
-                CYTHON_FALLTHROUGH;
-            default:
-        #else
-        {
-        #endif
-            a = PyLong_AsDouble(op1);
-            if (unlikely(a == -1.0 && PyErr_Occurred())) return NULL;
-            
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
         }
+    }
+    return 0;
+#endif
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
     } else {
-        return (inplace ? PyNumber_InPlaceTrueDivide : PyNumber_TrueDivide)(op1, op2);
+        return __Pyx_IterFinish();
     }
-        
-        PyFPE_START_PROTECT("divide", return NULL)
-        result = a / b;
-        PyFPE_END_PROTECT(result)
-        return PyFloat_FromDouble(result);
+    return 0;
 }
-#endif
 
 /* SliceObject */
-  static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
         Py_ssize_t cstart, Py_ssize_t cstop,
         PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
         int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
@@ -27158,138 +26117,8 @@ bad:
     return NULL;
 }
 
-/* BufferIndexError */
-  static void __Pyx_RaiseBufferIndexError(int axis) {
-  PyErr_Format(PyExc_IndexError,
-     "Out of bounds on buffer access (axis %d)", axis);
-}
-
-/* PyIntBinop */
-  #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
-    (void)inplace;
-    (void)zerodivision_check;
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op1))) {
-        const long b = intval;
-        long x;
-        long a = PyInt_AS_LONG(op1);
-            x = (long)((unsigned long)a + b);
-            if (likely((x^a) >= 0 || (x^b) >= 0))
-                return PyInt_FromLong(x);
-            return PyLong_Type.tp_as_number->nb_add(op1, op2);
-    }
-    #endif
-    #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(PyLong_CheckExact(op1))) {
-        const long b = intval;
-        long a, x;
-#ifdef HAVE_LONG_LONG
-        const PY_LONG_LONG llb = intval;
-        PY_LONG_LONG lla, llx;
-#endif
-        const digit* digits = ((PyLongObject*)op1)->ob_digit;
-        const Py_ssize_t size = Py_SIZE(op1);
-        if (likely(__Pyx_sst_abs(size) <= 1)) {
-            a = likely(size) ? digits[0] : 0;
-            if (size == -1) a = -a;
-        } else {
-            switch (size) {
-                case -2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
-            }
-        }
-                x = a + b;
-            return PyLong_FromLong(x);
-#ifdef HAVE_LONG_LONG
-        long_long:
-                llx = lla + llb;
-            return PyLong_FromLongLong(llx);
-#endif
-        
-        
-    }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        const long b = intval;
-        double a = PyFloat_AS_DOUBLE(op1);
-            double result;
-            PyFPE_START_PROTECT("add", return NULL)
-            result = ((double)a) + (double)b;
-            PyFPE_END_PROTECT(result)
-            return PyFloat_FromDouble(result);
-    }
-    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
-}
-#endif
-
 /* SliceObject */
-  static CYTHON_INLINE int __Pyx_PyObject_SetSlice(PyObject* obj, PyObject* value,
+static CYTHON_INLINE int __Pyx_PyObject_SetSlice(PyObject* obj, PyObject* value,
         Py_ssize_t cstart, Py_ssize_t cstop,
         PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
         int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
@@ -27386,8 +26215,32 @@ bad:
     return -1;
 }
 
+/* DictGetItem */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
+    PyObject *value;
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (!PyErr_Occurred()) {
+            if (unlikely(PyTuple_Check(key))) {
+                PyObject* args = PyTuple_Pack(1, key);
+                if (likely(args)) {
+                    PyErr_SetObject(PyExc_KeyError, args);
+                    Py_DECREF(args);
+                }
+            } else {
+                PyErr_SetObject(PyExc_KeyError, key);
+            }
+        }
+        return NULL;
+    }
+    Py_INCREF(value);
+    return value;
+}
+#endif
+
 /* ArgTypeTest */
-  static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
 {
     if (unlikely(!type)) {
         PyErr_SetString(PyExc_SystemError, "Missing type object");
@@ -27408,7 +26261,7 @@ bad:
 }
 
 /* BytesEquals */
-  static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
 #if CYTHON_COMPILING_IN_PYPY
     return PyObject_RichCompareBool(s1, s2, equals);
 #else
@@ -27455,7 +26308,7 @@ bad:
 }
 
 /* UnicodeEquals */
-  static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
 #if CYTHON_COMPILING_IN_PYPY
     return PyObject_RichCompareBool(s1, s2, equals);
 #else
@@ -27557,15 +26410,44 @@ return_ne:
 }
 
 /* None */
-  static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t a, Py_ssize_t b) {
+static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t a, Py_ssize_t b) {
     Py_ssize_t q = a / b;
     Py_ssize_t r = a - q*b;
     q -= ((r != 0) & ((r ^ b) < 0));
     return q;
 }
 
+/* ObjectGetItem */
+#if CYTHON_USE_TYPE_SLOTS
+static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
+    PyObject *runerr;
+    Py_ssize_t key_value;
+    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
+    if (unlikely(!(m && m->sq_item))) {
+        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
+        return NULL;
+    }
+    key_value = __Pyx_PyIndex_AsSsize_t(index);
+    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
+        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
+    }
+    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
+        PyErr_Clear();
+        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
+    }
+    return NULL;
+}
+static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
+    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(m && m->mp_subscript)) {
+        return m->mp_subscript(obj, key);
+    }
+    return __Pyx_PyObject_GetIndex(obj, key);
+}
+#endif
+
 /* decode_c_string */
-  static CYTHON_INLINE PyObject* __Pyx_decode_c_string(
+static CYTHON_INLINE PyObject* __Pyx_decode_c_string(
          const char* cstring, Py_ssize_t start, Py_ssize_t stop,
          const char* encoding, const char* errors,
          PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors)) {
@@ -27598,7 +26480,7 @@ return_ne:
 }
 
 /* PyErrExceptionMatches */
-  #if CYTHON_FAST_THREAD_STATE
+#if CYTHON_FAST_THREAD_STATE
 static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
     Py_ssize_t i, n;
     n = PyTuple_GET_SIZE(tuple);
@@ -27623,7 +26505,7 @@ static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tsta
 #endif
 
 /* GetAttr3 */
-  static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
     __Pyx_PyThreadState_declare
     __Pyx_PyThreadState_assign
     if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
@@ -27637,26 +26519,13 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject
     return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
 }
 
-/* RaiseTooManyValuesToUnpack */
-  static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
-    PyErr_Format(PyExc_ValueError,
-                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
-}
-
-/* RaiseNeedMoreValuesToUnpack */
-  static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
-                 index, (index == 1) ? "" : "s");
-}
-
 /* RaiseNoneIterError */
-  static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
 }
 
 /* ExtTypeTest */
-  static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     if (unlikely(!type)) {
         PyErr_SetString(PyExc_SystemError, "Missing type object");
         return 0;
@@ -27669,7 +26538,7 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject
 }
 
 /* GetTopmostException */
-  #if CYTHON_USE_EXC_INFO_STACK
+#if CYTHON_USE_EXC_INFO_STACK
 static _PyErr_StackItem *
 __Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
 {
@@ -27684,7 +26553,7 @@ __Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
 #endif
 
 /* SaveResetException */
-  #if CYTHON_FAST_THREAD_STATE
+#if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
     #if CYTHON_USE_EXC_INFO_STACK
     _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
@@ -27725,7 +26594,7 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #endif
 
 /* GetException */
-  #if CYTHON_FAST_THREAD_STATE
+#if CYTHON_FAST_THREAD_STATE
 static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
 #else
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
@@ -27799,7 +26668,7 @@ bad:
 }
 
 /* SwapException */
-  #if CYTHON_FAST_THREAD_STATE
+#if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
     #if CYTHON_USE_EXC_INFO_STACK
@@ -27834,7 +26703,7 @@ static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value,
 #endif
 
 /* Import */
-  static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -27899,7 +26768,7 @@ bad:
 }
 
 /* FastTypeChecks */
-  #if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON
 static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
     while (a) {
         a = a->tp_base;
@@ -27998,13 +26867,137 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 }
 #endif
 
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a + b);
+            if (likely((x^a) >= 0 || (x^b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            }
+        }
+                x = a + b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("add", return NULL)
+            result = ((double)a) + (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#endif
+
 /* None */
-  static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
+static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
     PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
 }
 
 /* None */
-  static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
+static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
     long q = a / b;
     long r = a - q*b;
     q -= ((r != 0) & ((r ^ b) < 0));
@@ -28012,7 +27005,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 }
 
 /* ImportFrom */
-  static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
     PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
     if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
         PyErr_Format(PyExc_ImportError,
@@ -28026,7 +27019,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 }
 
 /* PyObject_GenericGetAttrNoDict */
-  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
     PyErr_Format(PyExc_AttributeError,
 #if PY_MAJOR_VERSION >= 3
@@ -28066,7 +27059,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj
 #endif
 
 /* PyObject_GenericGetAttr */
-  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
     if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
         return PyObject_GenericGetAttr(obj, attr_name);
@@ -28076,7 +27069,7 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 #endif
 
 /* SetVTable */
-  static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
 #if PY_VERSION_HEX >= 0x02070000
     PyObject *ob = PyCapsule_New(vtable, 0, 0);
 #else
@@ -28094,7 +27087,7 @@ bad:
 }
 
 /* PyObjectGetAttrStrNoError */
-  static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
     __Pyx_PyThreadState_declare
     __Pyx_PyThreadState_assign
     if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
@@ -28116,7 +27109,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, P
 }
 
 /* SetupReduce */
-  static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
   int ret;
   PyObject *name_attr;
   name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name_2);
@@ -28200,7 +27193,7 @@ __PYX_GOOD:
 }
 
 /* FetchCommonType */
-  static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
     PyObject* fake_module;
     PyTypeObject* cached_type = NULL;
     fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
@@ -28239,7 +27232,7 @@ bad:
 }
 
 /* CythonFunctionShared */
-  #include <structmember.h>
+#include <structmember.h>
 static PyObject *
 __Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *closure)
 {
@@ -28843,7 +27836,7 @@ static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, Py
 }
 
 /* CythonFunction */
-  static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
     PyObject *op = __Pyx_CyFunction_Init(
         PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
@@ -28856,7 +27849,7 @@ static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, Py
 }
 
 /* CalculateMetaclass */
-  static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
+static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
     Py_ssize_t i, nbases = PyTuple_GET_SIZE(bases);
     for (i=0; i < nbases; i++) {
         PyTypeObject *tmptype;
@@ -28895,7 +27888,7 @@ static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, Py
 }
 
 /* Py3ClassCreate */
-  static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name,
+static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name,
                                            PyObject *qualname, PyObject *mkw, PyObject *modname, PyObject *doc) {
     PyObject *ns;
     if (metaclass) {
@@ -28962,7 +27955,7 @@ static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObj
 }
 
 /* CLineInTraceback */
-  #ifndef CYTHON_CLINE_IN_TRACEBACK
+#ifndef CYTHON_CLINE_IN_TRACEBACK
 static int __Pyx_CLineForTraceback(CYTHON_NCP_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
@@ -29004,7 +27997,7 @@ static int __Pyx_CLineForTraceback(CYTHON_NCP_UNUSED PyThreadState *tstate, int
 #endif
 
 /* CodeObjectCache */
-  static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -29084,7 +28077,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-  #include "compile.h"
+#include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
@@ -29190,8 +28183,8 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 
-  /* MemviewSliceIsContig */
-  static int
+/* MemviewSliceIsContig */
+static int
 __pyx_memviewslice_is_contig(const __Pyx_memviewslice mvs, char order, int ndim)
 {
     int i, index, step, start;
@@ -29213,7 +28206,7 @@ __pyx_memviewslice_is_contig(const __Pyx_memviewslice mvs, char order, int ndim)
 }
 
 /* OverlappingSlices */
-  static void
+static void
 __pyx_get_array_memory_extents(__Pyx_memviewslice *slice,
                                void **out_start, void **out_end,
                                int ndim, size_t itemsize)
@@ -29249,7 +28242,7 @@ __pyx_slices_overlap(__Pyx_memviewslice *slice1,
 }
 
 /* Capsule */
-  static CYTHON_INLINE PyObject *
+static CYTHON_INLINE PyObject *
 __pyx_capsule_create(void *p, CYTHON_UNUSED const char *sig)
 {
     PyObject *cobj;
@@ -29262,7 +28255,7 @@ __pyx_capsule_create(void *p, CYTHON_UNUSED const char *sig)
 }
 
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
     const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -29292,61 +28285,8 @@ __pyx_capsule_create(void *p, CYTHON_UNUSED const char *sig)
     }
 }
 
-/* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value) {
-    const PY_LONG_LONG neg_one = (PY_LONG_LONG) ((PY_LONG_LONG) 0 - (PY_LONG_LONG) 1), const_zero = (PY_LONG_LONG) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
-                                     little, !is_unsigned);
-    }
-}
-
-/* CIntFromPyVerify */
-  #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
-#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
-    }
-
 /* MemviewSliceCopyTemplate */
-  static __Pyx_memviewslice
+static __Pyx_memviewslice
 __pyx_memoryview_copy_new_contig(const __Pyx_memviewslice *from_mvs,
                                  const char *mode, int ndim,
                                  size_t sizeof_dtype, int contig_flag,
@@ -29412,20 +28352,42 @@ no_fail:
     return new_mvs;
 }
 
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
 /* CIntFromPy */
-  static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(long) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (long) val;
+            return (int) val;
         }
     } else
 #endif
@@ -29434,32 +28396,32 @@ no_fail:
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
-                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
-                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
-                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
                         }
                     }
                     break;
@@ -29473,86 +28435,86 @@ no_fail:
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (long) -1;
+                    return (int) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(long) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(long) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
             }
         }
@@ -29561,7 +28523,7 @@ no_fail:
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            long val;
+            int val;
             PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -29581,40 +28543,40 @@ no_fail:
                     return val;
             }
 #endif
-            return (long) -1;
+            return (int) -1;
         }
     } else {
-        long val;
+        int val;
         PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyInt_As_long(tmp);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
+        "value too large to convert to int");
+    return (int) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
+        "can't convert negative value to int");
+    return (int) -1;
 }
 
 /* CIntFromPy */
-  static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(int) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (int) val;
+            return (long) val;
         }
     } else
 #endif
@@ -29623,32 +28585,32 @@ raise_neg_overflow:
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
@@ -29662,86 +28624,86 @@ raise_neg_overflow:
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (int) -1;
+                    return (long) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(int) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(int) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
             }
         }
@@ -29750,7 +28712,7 @@ raise_neg_overflow:
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            int val;
+            long val;
             PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -29770,28 +28732,28 @@ raise_neg_overflow:
                     return val;
             }
 #endif
-            return (int) -1;
+            return (long) -1;
         }
     } else {
-        int val;
+        long val;
         PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
+        "value too large to convert to long");
+    return (long) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
+        "can't convert negative value to long");
+    return (long) -1;
 }
 
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -29822,7 +28784,7 @@ raise_neg_overflow:
 }
 
 /* CIntFromPy */
-  static CYTHON_INLINE char __Pyx_PyInt_As_char(PyObject *x) {
+static CYTHON_INLINE char __Pyx_PyInt_As_char(PyObject *x) {
     const char neg_one = (char) ((char) 0 - (char) 1), const_zero = (char) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -30011,7 +28973,7 @@ raise_neg_overflow:
 }
 
 /* IsLittleEndian */
-  static CYTHON_INLINE int __Pyx_Is_Little_Endian(void)
+static CYTHON_INLINE int __Pyx_Is_Little_Endian(void)
 {
   union {
     uint32_t u32;
@@ -30022,7 +28984,7 @@ raise_neg_overflow:
 }
 
 /* BufferFormatCheck */
-  static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
+static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
                               __Pyx_BufFmt_StackElem* stack,
                               __Pyx_TypeInfo* type) {
   stack[0].field = &ctx->root;
@@ -30524,7 +29486,7 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
 }
 
 /* TypeInfoCompare */
-    static int
+  static int
 __pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b)
 {
     int i;
@@ -30565,7 +29527,7 @@ __pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b)
 }
 
 /* MemviewSliceValidateAndInit */
-    static int
+  static int
 __pyx_check_strides(Py_buffer *buf, int dim, int ndim, int spec)
 {
     if (buf->shape[dim] <= 1)
@@ -30746,7 +29708,7 @@ no_fail:
 }
 
 /* ObjectToMemviewSlice */
-    static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double__const__(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
     int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
@@ -30769,7 +29731,7 @@ __pyx_fail:
 }
 
 /* ObjectToMemviewSlice */
-    static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
     int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
@@ -30792,7 +29754,7 @@ __pyx_fail:
 }
 
 /* ObjectToMemviewSlice */
-    static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_double(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
     int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
@@ -30815,76 +29777,7 @@ __pyx_fail:
 }
 
 /* ObjectToMemviewSlice */
-    static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_PY_LONG_LONG(PyObject *obj, int writable_flag) {
-    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
-    __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
-    int retcode;
-    if (obj == Py_None) {
-        result.memview = (struct __pyx_memoryview_obj *) Py_None;
-        return result;
-    }
-    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
-                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
-                                                 &__Pyx_TypeInfo_PY_LONG_LONG, stack,
-                                                 &result, obj);
-    if (unlikely(retcode == -1))
-        goto __pyx_fail;
-    return result;
-__pyx_fail:
-    result.memview = NULL;
-    result.data = NULL;
-    return result;
-}
-
-/* ObjectToMemviewSlice */
-    static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_PY_LONG_LONG(PyObject *obj, int writable_flag) {
-    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
-    __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
-    int retcode;
-    if (obj == Py_None) {
-        result.memview = (struct __pyx_memoryview_obj *) Py_None;
-        return result;
-    }
-    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
-                                                 PyBUF_RECORDS_RO | writable_flag, 1,
-                                                 &__Pyx_TypeInfo_PY_LONG_LONG, stack,
-                                                 &result, obj);
-    if (unlikely(retcode == -1))
-        goto __pyx_fail;
-    return result;
-__pyx_fail:
-    result.memview = NULL;
-    result.data = NULL;
-    return result;
-}
-
-/* ObjectToMemviewSlice */
-    static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double(PyObject *obj, int writable_flag) {
-    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
-    __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
-    int retcode;
-    if (obj == Py_None) {
-        result.memview = (struct __pyx_memoryview_obj *) Py_None;
-        return result;
-    }
-    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
-                                                 PyBUF_RECORDS_RO | writable_flag, 1,
-                                                 &__Pyx_TypeInfo_double, stack,
-                                                 &result, obj);
-    if (unlikely(retcode == -1))
-        goto __pyx_fail;
-    return result;
-__pyx_fail:
-    result.memview = NULL;
-    result.data = NULL;
-    return result;
-}
-
-/* ObjectToMemviewSlice */
-    static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
     int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
@@ -30907,7 +29800,7 @@ __pyx_fail:
 }
 
 /* CheckBinaryVersion */
-    static int __Pyx_check_binary_version(void) {
+  static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
     PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
     PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
@@ -30923,7 +29816,7 @@ __pyx_fail:
 }
 
 /* InitStrings */
-    static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+  static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
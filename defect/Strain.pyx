@@ -1,24 +1,23 @@
 # coding: utf-8
 # cython: language_level=3
 
-# Standard Python libraries
-import warnings
-
 # http://www.numpy.org/
 import numpy as np
 
 # atomman imports
 from .. import NeighborList
 from ..tools import axes_check, aslist
+from .batch_strain import pair_table, batch_G, batch_nye, batch_strain
 
 cimport cython
 
-from libc.math cimport cos, pi, sqrt, fabs
+from libc.math cimport sqrt
 
 class Strain():
 
     def __init__(self, system, neighbors=None, cutoff=None, p_vectors=None,
-                 theta_max=27, axes=None, basesystem=None, baseneighbors=None):
+                 theta_max=27, axes=None, basesystem=None, baseneighbors=None,
+                 nprocs=1):
         """
         Class initializer.  Allows for the current and reference state to be
         specified for performing the calculations.
@@ -54,6 +53,11 @@ class Strain():
             between p vectors and q vectors.  Optimum values are dependent on the
             crystal structure. Default value is 27, which is the original value
             used for fcc crystals.
+        nprocs : int, optional
+            The number of processes to use when solving for G and the Nye
+            tensor.  Default value is 1.  If greater than 1, the atoms are
+            split into chunks that are solved in parallel by workers that
+            access the system data through shared memory.
         """
         
         self.__system = system
@@ -79,6 +83,7 @@ class Strain():
             self.__p_vectors = None
     
         self.theta_max = theta_max
+        self.nprocs = nprocs
         self.clear_properties()
     
     @property
@@ -101,6 +106,18 @@ class Strain():
         if value <= 180 and value > 0:
             self.__theta_max = value
     
+    @property
+    def nprocs(self):
+        """int: The number of processes to use when solving."""
+        return self.__nprocs
+    
+    @nprocs.setter
+    def nprocs(self, value):
+        value = int(value)
+        if value < 1:
+            raise ValueError('nprocs must be a positive integer')
+        self.__nprocs = value
+    
     @property
     def neighbors(self):
         """atomman.NeighborList: The list of neighbors for system."""
@@ -294,13 +311,18 @@ class Strain():
         else:
             raise ValueError('neighbors or cutoff is required')
 
-        p = []
-        for i in range(basesystem.natoms):
-            p.append(basesystem.dvect(i, neighbors[i]))
+        # Compute all neighbor vectors at once and split by atom
+        i, j = pair_table(neighbors.nlist)
+        vects = basesystem.dvect(i, j).reshape(-1, 3)
+        p = np.split(vects, np.cumsum(neighbors.coord)[:-1])
 
-        self.__p_vectors = np.asarray(p)
+        if np.all(neighbors.coord == neighbors.coord[0]):
+            self.__p_vectors = np.asarray(p)
+        else:
+            self.__p_vectors = np.empty(len(p), dtype=object)
+            self.__p_vectors[:] = p
 
-    def solve_G(self, theta_max=None):
+    def solve_G(self, theta_max=None, nprocs=None):
         """
         Computes the lattice correspondence tensor, G, by comparing all neighbor
         vectors q in the current system to ideal reference neighbor vectors p.
@@ -312,6 +334,10 @@ class Strain():
             to be changed.  The maximum theta angle in degrees to use when
             searching for matches between p vectors and q vectors.  Optimum
             values are dependent on the crystal structure. 
+        nprocs : int, optional
+            Allows for the nprocs value set during the class initialization
+            to be changed.  If greater than 1, the strain properties derived
+            from G are also computed by the parallel workers.
         """
         # p vector setup
         p_vectors = self.p_vectors
@@ -321,164 +347,55 @@ class Strain():
         # Theta_max setup
         if theta_max is not None:
             self.theta_max = theta_max
-        cos_theta_max = cos(self.theta_max * pi / 180.0)
 
-        # system and neighbors setup
-        system = self.system
-        neighbors = self.neighbors
-        maxcoord = neighbors.coord.max()
-        natoms = system.natoms
+        # nprocs setup
+        if nprocs is not None:
+            self.nprocs = nprocs
 
-        # Initialize variables
+        # Compute G for all atoms at once
+        system = self.system
         self.clear_properties()
-        G = np.empty((natoms, 3, 3))
-        P = np.empty((maxcoord, 3))
-        Q = np.empty((maxcoord, 3))
-
-        # Loop over all atoms
-        for i in range(natoms):
-            # Get actual p and q for atom i
-            p = p_vectors[i]
-            q = system.dvect(i, neighbors[i])
-            
-            # Get the matched P and Q
-            n = match_pq(p, q, cos_theta_max, P, Q)
-            
-            # Compute lattice correspondence tensor, G, from P and Q
-            if n == 0:
-                G[i] = np.identity(3)
-                warnings.warn('An atom lacks pair sets. Check neighbor list')
-            else:
-                G[i] = np.linalg.lstsq(Q[:n], P[:n], rcond=None)[0]
-
-        self.__G = G
-
-    def solve_nye(self):
+        if self.nprocs == 1:
+            self.__G = batch_G(system.atoms.pos, system.box, system.pbc,
+                               self.neighbors.nlist, p_vectors,
+                               theta_max=self.theta_max)
+        else:
+            results = batch_strain(system.atoms.pos, system.box, system.pbc,
+                                   self.neighbors.nlist, p_vectors=p_vectors,
+                                   theta_max=self.theta_max, nye=False,
+                                   nprocs=self.nprocs)
+            self.__G = results['G']
+            self.__strain = results['strain']
+            self.__invariant1 = results['invariant1']
+            self.__invariant2 = results['invariant2']
+            self.__invariant3 = results['invariant3']
+            self.__rotation = results['rotation']
+            self.__angularvelocity = results['angularvelocity']
+
+    def solve_nye(self, nprocs=None):
         """
         Computes the Nye tensor based on the lattice correspondence tensor G
         and the current atomic positions.
+
+        Parameters
+        ----------
+        nprocs : int, optional
+            Allows for the nprocs value set during the class initialization
+            to be changed.
         """
+        # nprocs setup
+        if nprocs is not None:
+            self.nprocs = nprocs
+
         G = self.G
-        cdef double[:,:,::1] G_view = G
         system = self.system
-        nlist = self.neighbors.nlist
-        cdef long long[:,::1] nlist_view = nlist
-        
-        cdef Py_ssize_t i, x, y, z
-        
-        # Variable setup and shortcuts
-        natoms = G.shape[0]
-        cdef long long maxcoord = 0
-        for i in range(natoms):
-            if maxcoord < nlist_view[i, 0]:
-                maxcoord = nlist_view[i, 0]
-        
-        nye = np.empty((natoms, 3, 3))
-        cdef double [:,:,::1] nye_view = nye
-        gradG = np.empty((3, 3, 3))
-        cdef double [:,:,::1] gradG_view = gradG
-        
-        gG = np.empty((3,3))
-        cdef double [:,::1] gG_view = gG
-        
-        dG = np.empty((maxcoord, 3, 3))
-        cdef double [:,:,::1] dG_view = dG
-        
-        Q = np.empty((maxcoord, 3))
-        cdef double [:,::1] Q_view = Q
-        
-        # Construct the gradient tensor of G, gradG for each atom
-        for i in range(natoms):
-            
-            c = nlist_view[i, 0]
-            Q[:c] = system.dvect(i, nlist[i, 1:c+1])
-            
-            dG_c(G_view, nlist_view, dG_view, i)
-            
-            for x in range(3):
-                gG[:] = np.linalg.lstsq(Q[:c], dG[:c,x,:], rcond=None)[0]
-                
-                for y in range(3):
-                    for z in range(3):
-                        gradG_view[x,y,z] = gG_view[z,y]
-
-            nye_c(gradG_view, nye_view, i)
-            
-        self.__nye = nye
-
-@cython.boundscheck(False)
-@cython.wraparound(False) 
-cdef match_pq(double[:,::1] p, 
-              double[:,::1] q,
-              double cos_theta_max,
-              double[:,::1] P, 
-              double[:,::1] Q):
-    """
-    Takes p and q neighbor vectors and finds corresponding pairs P and Q based
-    on the angles beween vectors (and interatomic spacing).
-    """
-    # Parameter initialization
-    pnum = p.shape[0]
-    qnum = q.shape[0]
-    cdef long long[:] qp_pairs = np.empty(qnum, dtype='int64')
-    cdef double [:] pmag = np.empty(pnum)
-    cdef double [:] qmag = np.empty(qnum)
-    
-    cdef double r1 = 1e16
-    cdef double cos_theta_min, jrad, krad
-    
-    cdef Py_ssize_t j, k, n, x, y, z
-    
-    # Compute magnitudes of q and set all qp_pairs to -1
-    for j in range(qnum):
-        qmag[j] = sqrt(q[j,0] * q[j,0] + q[j,1] * q[j,1] + q[j,2] * q[j,2])
-        qp_pairs[j] = -1
-        
-    # Compute magnitudes of p and find the shortest r1
-    for k in range(pnum):
-        pmag[k] = sqrt(p[k,0] * p[k,0] + p[k,1] * p[k,1] + p[k,2] * p[k,2])
-        if pmag[k] < r1:
-            r1 = pmag[k]
-    
-    # Loop over all q
-    for j in range(qnum):
-        cos_theta_min = cos_theta_max
-    
-        # Loop over all p
-        for k in range(pnum):
-            
-            # Compute cos theta between p and q
-            cos_theta = (q[j,0] * p[k,0] + q[j,1] * p[k,1] + q[j,2] * p[k,2]) / (qmag[j] * pmag[k])
-            
-            # Select q-p pair with the smallest theta angle (largest cos theta)
-            if cos_theta > cos_theta_min:
-                cos_theta_min = cos_theta
-                qp_pairs[j] = k
-                
-        # Check if the best p is already assigned to another q
-        if qp_pairs[j] >= 0:
-            for k in range(j):
-                if qp_pairs[j] == qp_pairs[k]:
-                    jrad = fabs(r1 - qmag[j])
-                    krad = fabs(r1 - qmag[k])
-
-                    # Remove the p-q pair that is farther from r1
-                    if jrad < krad:
-                        qp_pairs[k]=-1
-                    else:
-                        qp_pairs[j]=-1 
-        
-    # Construct reduced P, Q matrices from p-q pairs
-    n = 0
-    for j in range(qnum):
-        if qp_pairs[j] >= 0:
-            for x in range(3):
-                Q[n,x] = q[j,x]
-                P[n,x] = p[qp_pairs[j],x]
-            n+=1
-            
-    # Return number of matching P-Q pairs 
-    return n
+        if self.nprocs == 1:
+            self.__nye = batch_nye(system.atoms.pos, system.box, system.pbc,
+                                   self.neighbors.nlist, G)
+        else:
+            self.__nye = batch_strain(system.atoms.pos, system.box, system.pbc,
+                                      self.neighbors.nlist, G=G,
+                                      nprocs=self.nprocs)['nye']
 
 @cython.boundscheck(False)
 @cython.wraparound(False) 
@@ -609,37 +526,4 @@ cdef angularvelocity_c(const double [:,:,::1] rotation):
         angvel_view[i] = sqrt( rotation[i,0,1] * rotation[i,0,1]
                              + rotation[i,0,2] * rotation[i,0,2]
                              + rotation[i,1,2] * rotation[i,1,2] )
-    return angvel   
-
-
-
-@cython.boundscheck(False)
-@cython.wraparound(False) 
-cdef dG_c(const double[:,:,::1] G, const long long[:,::1] nlist, double[:,:,::1] dG, Py_ssize_t i):
-    """
-    Computes the change in G between an atom and each of its neighbors
-    """
-    coord = nlist[i, 0]    
-    cdef Py_ssize_t j, x, y
-    
-    # Calculate change in G between all neighbors
-    for j in range(coord):
-        for x in range(3):
-            for y in range(3):
-                dG[j, x, y] = G[nlist[i, j+1], x, y] - G[i, x, y]
-    
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cdef nye_c(double [:,:,::1] gradG, double [:,:,::1] nye, Py_ssize_t i):
-    """
-    Computes the per-atom Nye tensor from the calculated grad(G).
-    """
-    nye[i,0,0] = gradG[1,0,2] - gradG[2,0,1]
-    nye[i,0,1] = gradG[1,1,2] - gradG[2,1,1]
-    nye[i,0,2] = gradG[1,2,2] - gradG[2,2,1]
-    nye[i,1,0] = gradG[2,0,0] - gradG[0,0,2]
-    nye[i,1,1] = gradG[2,1,0] - gradG[0,1,2]
-    nye[i,1,2] = gradG[2,2,0] - gradG[0,2,2]
-    nye[i,2,0] = gradG[0,0,1] - gradG[1,0,0]
-    nye[i,2,1] = gradG[0,1,1] - gradG[1,1,0]
-    nye[i,2,2] = gradG[0,2,1] - gradG[1,2,0]
\ No newline at end of file
+    return angvel
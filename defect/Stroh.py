@@ -109,6 +109,17 @@ class Stroh(VolterraDislocation):
         self.__A = A
         self.__L = L
         self.__k = k
+
+        # Precontract the position-independent terms of the field solutions
+        ii = np.array([1.j])
+        updn = np.array([1, -1, 1, -1, 1, -1])
+        Lb = L.dot(self.burgers)
+        mpn = self.m + np.outer(p, self.n)
+        self.__disp_coeff = 1 / (2 * np.pi * ii) * np.einsum('a,a,ai,a->ai',
+                                                             updn, k, A, Lb)
+        self.__stress_coeff = 1 / (2 * np.pi * ii) * np.einsum('a,a,ijkl,al,ak,a->aij',
+                                                               updn, k, Cijkl,
+                                                               mpn, A, Lb)
     
         # Check that K_tensor is real
         if self.K_tensor.dtype == 'complex128':
@@ -167,7 +178,7 @@ class Stroh(VolterraDislocation):
         # a = b_i K_ij b_j / (4 π)
         return self.burgers.dot(self.K_tensor.dot(self.burgers)) / (4 * np.pi)
     
-    def displacement(self, pos):
+    def displacement(self, pos, chunksize=None, nthreads=None):
         """
         Compute the position-dependent anisotropic displacement.
         
@@ -177,37 +188,32 @@ class Stroh(VolterraDislocation):
         ----------
         pos : array-like object
             3D vector position(s).
+        chunksize : int, optional
+            The maximum number of positions to evaluate at one time.  Setting
+            this limits the memory used by the intermediate arrays.  Default
+            value of None evaluates all positions together.
+        nthreads : int, optional
+            The number of threads to use for evaluating the position chunks.
+            Default value of None performs the evaluation serially.
         
         Returns
         -------
         numpy.ndarray
             The computed 3D vector displacements at all given points.
         """
-        # ii is imaginary unit
-        ii = np.array([1.j])
-        
-        # updn is alternating +-
-        updn = np.array([1, -1, 1, -1, 1, -1])
-        
-        # Convert pos to eta coordinate
-        eta = self.eta(pos)
-        
         # Compute the displacements
-        disp = 1 / (2 * np.pi * ii) * np.einsum('a,a,ai,a,na->ni',
-                                                updn, self.k, self.A,
-                                                self.L.dot(self.burgers),
-                                                np.log(eta))
+        disp = self._evaluate_chunked(self.__displacement_chunk, pos, (3,),
+                                      dtype=complex, chunksize=chunksize,
+                                      nthreads=nthreads)
         
         # Round away near-zero terms
-        disp = np.real_if_close(disp, tol=self.tol)
-        
-        # Reduce single-value solutions
-        if np.asarray(pos).ndim == 1:
-            return disp[0]
-        else:
-            return disp
+        return np.real_if_close(disp, tol=self.tol)
     
-    def stress(self, pos):
+    def __displacement_chunk(self, pos):
+        """Computes the complex displacements for an (n, 3) array of positions"""
+        return np.log(self.eta(pos)).dot(self.__disp_coeff)
+
+    def stress(self, pos, chunksize=None, nthreads=None):
         """
         Compute the position-dependent anisotropic stresses.
         
@@ -217,38 +223,31 @@ class Stroh(VolterraDislocation):
         ----------
         pos : array-like object
             3D vector position(s).
+        chunksize : int, optional
+            The maximum number of positions to evaluate at one time.  Setting
+            this limits the memory used by the intermediate arrays.  Default
+            value of None evaluates all positions together.
+        nthreads : int, optional
+            The number of threads to use for evaluating the position chunks.
+            Default value of None performs the evaluation serially.
         
         Returns
         -------
         numpy.ndarray
             The computed 3x3 stress states at all given points.
         """
-        # ii is imaginary unit
-        ii = np.array([1.j])
-        
-        # updn is alternating +-
-        updn = np.array([1, -1, 1, -1, 1, -1])
-        
-        # Convert pos to eta coordinate
-        eta = self.eta(pos)
-        
-        # Compute mpn factor
-        mpn = self.m + np.outer(self.p, self.n)
-        
         # Compute the stresses
-        stress = 1 / (2 * np.pi * ii) * np.einsum('a,a,ijkl,al,ak,a,na->nij',
-                                                  updn, self.k, self.C.Cijkl,
-                                                  mpn, self.A,
-                                                  self.L.dot(self.burgers),
-                                                  1/eta)
+        stress = self._evaluate_chunked(self.__stress_chunk, pos, (3,3),
+                                        dtype=complex, chunksize=chunksize,
+                                        nthreads=nthreads)
         
         # Round away near-zero terms
-        stress = np.real_if_close(stress, tol=self.tol)
-        
-        if np.asarray(pos).ndim == 1:
-            return stress[0]
-        else:
-            return stress
+        return np.real_if_close(stress, tol=self.tol)
+    
+    def __stress_chunk(self, pos):
+        """Computes the complex stresses for an (n, 3) array of positions"""
+        stress = (1 / self.eta(pos)).dot(self.__stress_coeff.reshape(6, 9))
+        return stress.reshape(-1, 3, 3)
     
     def eta(self, pos):
         """
@@ -1,6 +1,7 @@
 # coding: utf-8
 # Standard Python libraries
 from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 
 # http://www.numpy.org/
 import numpy as np
@@ -215,8 +216,74 @@ class VolterraDislocation(object):
         # a = b_i K_ij b_j / (4 π)
         return self.burgers.dot(self.K_tensor.dot(self.burgers)) / (4 * np.pi)
     
-    def displacement(self, pos):
+    def displacement(self, pos, chunksize=None, nthreads=None):
         raise NotImplementedError('Needs to be defined by subclass')
     
-    def stress(self, pos):
-        raise NotImplementedError('Needs to be defined by subclass')
\ No newline at end of file
+    def stress(self, pos, chunksize=None, nthreads=None):
+        raise NotImplementedError('Needs to be defined by subclass')
+
+    def _evaluate_chunked(self, fxn, pos, valueshape, dtype=float,
+                          chunksize=None, nthreads=None):
+        """
+        Evaluates a position-dependent field function over blocks of
+        positions and collects the results into a single array.  Used by
+        displacement() and stress() of the subclasses to limit the size of
+        the intermediate arrays.
+        
+        Parameters
+        ----------
+        fxn : function
+            The field function to evaluate.  Takes an (n, 3) array of
+            positions and returns an array of shape (n,) + valueshape.
+        pos : array-like object
+            3D vector position(s).
+        valueshape : tuple
+            The shape of the field value computed for a single position.
+        dtype : data-type, optional
+            The data type of the returned values.  Default value is float.
+        chunksize : int, optional
+            The maximum number of positions to evaluate at one time.  If not
+            given, all positions are evaluated together unless nthreads > 1,
+            in which case the positions are evenly divided between the
+            threads.
+        nthreads : int, optional
+            The number of threads to use for evaluating the chunks.  Default
+            value of None evaluates all chunks in the calling thread.
+        
+        Returns
+        -------
+        numpy.ndarray
+            The computed field values at all given points, with shape
+            pos.shape[:-1] + valueshape.  A single position returns an array
+            of shape valueshape.
+        """
+        pos = np.asarray(pos, dtype=float)
+        posshape = pos.shape[:-1]
+        pos = pos.reshape(-1, 3)
+        npos = pos.shape[0]
+        
+        # Set default chunksize
+        if chunksize is None:
+            if nthreads is not None and nthreads > 1:
+                chunksize = -(-npos // nthreads)
+            else:
+                chunksize = npos
+        chunksize = max(int(chunksize), 1)
+        
+        values = np.empty((npos,) + tuple(valueshape), dtype=dtype)
+        
+        def evaluate(start):
+            end = start + chunksize
+            values[start:end] = fxn(pos[start:end])
+        
+        starts = range(0, npos, chunksize)
+        if nthreads is None or nthreads <= 1 or len(starts) <= 1:
+            for start in starts:
+                evaluate(start)
+        else:
+            with ThreadPoolExecutor(max_workers=nthreads) as executor:
+                for result in executor.map(evaluate, starts):
+                    pass
+        
+        # Restore the shape of pos
+        return values.reshape(posshape + tuple(valueshape))
\ No newline at end of file
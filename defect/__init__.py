@@ -24,12 +24,13 @@ from .FreeSurface import FreeSurface
 from .GammaSurface import GammaSurface
 from .StackingFault import StackingFault
 from .pn_arctan_disregistry import pn_arctan_disregistry
+from .pn_graded_x import pn_graded_x
 from .SDVPN import SDVPN
 
 __all__ = ['differential_displacement', 'disregistry', 'dislocation_array',
            'slip_vector', 'nye_tensor', 'nye_tensor_p', 'Stroh', 'FreeSurface',
            'StackingFault', 'Dislocation', 'Strain',
            'GammaSurface', 'free_surface_basis', 'pn_arctan_disregistry',
-           'SDVPN']
+           'pn_graded_x', 'SDVPN']
 __all__.extend(point_all)
 __all__.sort()
\ No newline at end of file
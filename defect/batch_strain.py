@@ -0,0 +1,482 @@
+# coding: utf-8
+# Standard Python libraries
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import warnings
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+from ..core import dvect
+
+def pair_table(nlist, start=0, stop=None):
+    """
+    Converts the rows of a neighbor list array into flat pair index arrays.
+
+    Parameters
+    ----------
+    nlist : numpy.ndarray
+        The neighbor list array where the first column gives the coordination
+        number of each atom and the remaining columns the neighbor ids, i.e.
+        atomman.NeighborList.nlist.
+    start : int, optional
+        The index of the first atom to include.  Default value is 0.
+    stop : int, optional
+        The index after the last atom to include.  Default value of None
+        includes all atoms after start.
+
+    Returns
+    -------
+    i : numpy.ndarray
+        The atom index of each pair.  Pairs are ordered by i and then by the
+        neighbor order in nlist.
+    j : numpy.ndarray
+        The neighbor atom index of each pair.
+    """
+    rows = nlist[start:stop]
+    coord = rows[:, 0]
+    mask = np.arange(rows.shape[1] - 1) < coord[:, np.newaxis]
+
+    i = np.repeat(np.arange(start, start + len(rows)), coord)
+    j = rows[:, 1:][mask]
+
+    return i, j
+
+def pad_p_vectors(p_vectors):
+    """
+    Converts per-atom p vector sets into a regular (natoms, nmax, 3) array.
+    Atoms with fewer than nmax p vectors are padded at the end with nan
+    values.
+
+    Parameters
+    ----------
+    p_vectors : array-like object
+        The per-atom ideal neighbor vectors.
+
+    Returns
+    -------
+    numpy.ndarray
+        The padded p vectors.
+    """
+    try:
+        return np.asarray(p_vectors, dtype=float)
+    except ValueError:
+        pnum = [len(p) for p in p_vectors]
+        padded = np.full((len(p_vectors), max(pnum), 3), np.nan)
+        for k in range(len(p_vectors)):
+            padded[k, :pnum[k]] = p_vectors[k]
+        return padded
+
+def _chunks(nlist, start, stop, chunksize):
+    """
+    Yields atom index ranges with roughly chunksize pairs each.
+    """
+    if stop is None:
+        stop = len(nlist)
+    pairs = np.cumsum(nlist[start:stop, 0])
+
+    s = start
+    while s < stop:
+        offset = pairs[s - start - 1] if s > start else 0
+        e = start + np.searchsorted(pairs, offset + chunksize, side='right')
+        e = min(max(e, s + 1), stop)
+        yield s, e
+        s = e
+
+def _sum_outer(index, u, v, natoms):
+    """
+    Sums the outer products of u and v vectors for each index.
+    """
+    w = np.einsum('ma,mb->mab', u, v).reshape(len(u), -1)
+    result = np.empty((natoms, w.shape[1]))
+    for k in range(w.shape[1]):
+        result[:, k] = np.bincount(index, weights=w[:, k], minlength=natoms)
+
+    return result.reshape((natoms, u.shape[1], v.shape[1]))
+
+def _solve(A, B, singular):
+    """
+    Solves stacked A X = B normal equations for all non-singular A.
+    """
+    X = np.empty(B.shape)
+    ok = ~singular
+    X[ok] = np.linalg.solve(A[ok], B[ok])
+
+    return X
+
+def _singular(A, count):
+    """
+    Identifies stacked normal equation matrices that are rank deficient.
+    """
+    scale = np.trace(A, axis1=1, axis2=2) / 3
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.abs(np.linalg.det(A)) / scale**3
+
+    return (count < 3) | ~(ratio > 1e-8)
+
+def batch_G(pos, box, pbc, nlist, p_vectors, theta_max=27, start=0,
+            stop=None, chunksize=262144):
+    """
+    Computes the lattice correspondence tensor, G, for multiple atoms at
+    once.  All q neighbor vectors are computed from the neighbor pairs in
+    a single call, p-q pairs are matched using vectorized argmax with
+    conflicts resolved by the distance from the shortest p, and the least
+    squares problems are solved using stacked normal equations.
+
+    Parameters
+    ----------
+    pos : numpy.ndarray
+        The atomic positions.
+    box : atomman.Box
+        The system's box.
+    pbc : list of bool
+        The system's periodic boundary conditions.
+    nlist : numpy.ndarray
+        The neighbor list array, i.e. atomman.NeighborList.nlist.
+    p_vectors : numpy.ndarray
+        The per-atom ideal neighbor vectors.  Can be a (natoms, np, 3) array,
+        an array padded by pad_p_vectors, or an object array of per-atom
+        arrays with differing np values.  Atoms are grouped by their number
+        of p vectors.
+    theta_max : float, optional
+        The maximum theta angle in degrees to use when matching p vectors
+        to q vectors.  Default value is 27.
+    start : int, optional
+        The index of the first atom to compute G for.  Default value is 0.
+    stop : int, optional
+        The index after the last atom to compute G for.  Default value of
+        None computes G for all atoms after start.
+    chunksize : int, optional
+        The approximate number of neighbor pairs to evaluate at once.
+        Default value is 262144.
+
+    Returns
+    -------
+    numpy.ndarray
+        The (stop-start, 3, 3) lattice correspondence tensors.
+    """
+    if stop is None:
+        stop = len(nlist)
+    cos_theta_max = np.cos(theta_max * np.pi / 180)
+
+    # Count the number of p vectors of each atom
+    p_vectors = pad_p_vectors(p_vectors)
+    pnum = np.sum(~np.isnan(p_vectors[start:stop, :, 0]), axis=1)
+
+    G = np.empty((stop - start, 3, 3))
+    for s, e in _chunks(nlist, start, stop, chunksize):
+
+        # Compute all q vectors
+        i, j = pair_table(nlist, s, e)
+        q = dvect(pos[i], pos[j], box, pbc)
+        qmag = np.linalg.norm(q, axis=1)
+
+        index = i - s
+        match = np.full(len(q), -1)
+        rad = np.empty(len(q))
+        P = np.empty_like(q)
+        for n in np.unique(pnum[s-start:e-start]):
+            group = pnum[i - start] == n
+            p = p_vectors[i[group], :n]
+            pmag = np.linalg.norm(p, axis=2)
+
+            # Find the p with the smallest angle to each q
+            cos_thetas = np.einsum('mx,mkx->mk', q[group], p) / (qmag[group, np.newaxis] * pmag)
+            best = cos_thetas.argmax(axis=1)
+            best[cos_thetas[np.arange(len(best)), best] <= cos_theta_max] = -1
+
+            match[group] = best
+            P[group] = p[np.arange(len(best)), best]
+
+            # Distance of each q from the shortest p (r1)
+            r1 = pmag.min(axis=1)
+            rad[group] = np.abs(r1 - qmag[group])
+
+        # Resolve p's assigned to multiple q's by keeping the q closest to r1
+        valid = np.where(match >= 0)[0]
+        order = valid[np.lexsort((valid, rad[valid], match[valid], index[valid]))]
+        keep = np.ones(len(order), dtype=bool)
+        keep[1:] = (index[order[1:]] != index[order[:-1]]) | (match[order[1:]] != match[order[:-1]])
+        paired = np.sort(order[keep])
+
+        # Build and solve normal equations
+        natoms = e - s
+        count = np.bincount(index[paired], minlength=natoms)
+        A = _sum_outer(index[paired], q[paired], q[paired], natoms)
+        B = _sum_outer(index[paired], q[paired], P[paired], natoms)
+        singular = _singular(A, count)
+        G[s-start:e-start] = _solve(A, B, singular)
+
+        # Use least squares for rank deficient atoms
+        for k in np.where(singular)[0]:
+            if count[k] == 0:
+                G[s-start+k] = np.identity(3)
+                warnings.warn('An atom lacks pair sets. Check neighbor list')
+            else:
+                pk = paired[index[paired] == k]
+                G[s-start+k] = np.linalg.lstsq(q[pk], P[pk], rcond=None)[0]
+
+    return G
+
+def batch_nye(pos, box, pbc, nlist, G, start=0, stop=None, chunksize=262144):
+    """
+    Computes the Nye tensor for multiple atoms at once from the lattice
+    correspondence tensors, G.  The gradients of G are found by solving the
+    stacked least squares normal equations for all atoms.
+
+    Parameters
+    ----------
+    pos : numpy.ndarray
+        The atomic positions.
+    box : atomman.Box
+        The system's box.
+    pbc : list of bool
+        The system's periodic boundary conditions.
+    nlist : numpy.ndarray
+        The neighbor list array, i.e. atomman.NeighborList.nlist.
+    G : numpy.ndarray
+        The (natoms, 3, 3) lattice correspondence tensors for all atoms.
+    start : int, optional
+        The index of the first atom to compute the Nye tensor for.  Default
+        value is 0.
+    stop : int, optional
+        The index after the last atom to compute the Nye tensor for.
+        Default value of None computes it for all atoms after start.
+    chunksize : int, optional
+        The approximate number of neighbor pairs to evaluate at once.
+        Default value is 262144.
+
+    Returns
+    -------
+    numpy.ndarray
+        The (stop-start, 3, 3) Nye tensors.
+    """
+    if stop is None:
+        stop = len(nlist)
+
+    # Define epsilon array
+    eps = np.array([[[ 0, 0, 0],[ 0, 0, 1],[ 0,-1, 0]],
+                    [[ 0, 0,-1],[ 0, 0, 0],[ 1, 0, 0]],
+                    [[ 0, 1, 0],[-1, 0, 0],[ 0, 0, 0]]])
+
+    nye = np.empty((stop - start, 3, 3))
+    for s, e in _chunks(nlist, start, stop, chunksize):
+        natoms = e - s
+
+        # Compute all q vectors and changes in G
+        i, j = pair_table(nlist, s, e)
+        q = dvect(pos[i], pos[j], box, pbc)
+        dG = (G[j] - G[i]).reshape(-1, 9)
+
+        # Build and solve normal equations: gradG[x,y,z] = X[z,x,y]
+        index = i - s
+        count = np.bincount(index, minlength=natoms)
+        A = _sum_outer(index, q, q, natoms)
+        C = _sum_outer(index, q, dG, natoms)
+        singular = _singular(A, count)
+        X = _solve(A, C, singular)
+
+        # Use least squares for rank deficient atoms
+        for k in np.where(singular)[0]:
+            if count[k] == 0:
+                X[k] = 0.0
+            else:
+                pk = index == k
+                X[k] = np.linalg.lstsq(q[pk], dG[pk], rcond=None)[0]
+
+        gradG = X.reshape(natoms, 3, 3, 3).transpose(0, 2, 3, 1)
+        nye[s-start:e-start] = -1 * np.einsum('ijm,nikm->njk', eps, gradG)
+
+    return nye
+
+def strain_properties(G):
+    """
+    Computes the per-atom strain properties from the lattice correspondence
+    tensors, G.
+
+    Parameters
+    ----------
+    G : numpy.ndarray
+        The (natoms, 3, 3) lattice correspondence tensors.
+
+    Returns
+    -------
+    dict
+        Contains the per-atom 'strain', 'invariant1', 'invariant2',
+        'invariant3', 'rotation' and 'angularvelocity'.
+    """
+    D = np.identity(3) - G
+    strain = (D + D.transpose(0, 2, 1)) / 2.
+    rotation = (D - D.transpose(0, 2, 1)) / 2.
+
+    results = {}
+    results['strain'] = strain
+    results['invariant1'] = np.trace(strain, axis1=1, axis2=2)
+    results['invariant2'] = (strain[:,0,0] * strain[:,1,1]
+                           + strain[:,0,0] * strain[:,2,2]
+                           + strain[:,1,1] * strain[:,2,2]
+                           - strain[:,0,1] * strain[:,1,0]
+                           - strain[:,0,2] * strain[:,2,0]
+                           - strain[:,1,2] * strain[:,2,1])
+    results['invariant3'] = np.linalg.det(strain)
+    results['rotation'] = rotation
+    results['angularvelocity'] = (rotation[:,0,1]**2 + rotation[:,0,2]**2
+                                  + rotation[:,1,2]**2)**0.5
+
+    return results
+
+def _share(shape, dtype=float, array=None):
+    """
+    Creates a shared memory block for an array, optionally copying array
+    into it.  Returns the block and the descriptor used to attach to it.
+    """
+    dtype = np.dtype(dtype)
+    size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    if array is not None:
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf)[:] = array
+
+    return shm, (shm.name, shape, dtype.str)
+
+def _strain_worker(task, start, stop, descriptors, box, pbc, theta_max,
+                   chunksize):
+    """
+    Computes either G and the strain properties or the Nye tensor for a
+    range of atoms using arrays in shared memory.
+    """
+    shms = []
+    views = {}
+    try:
+        for key, (name, shape, dtype) in descriptors.items():
+            shms.append(shared_memory.SharedMemory(name=name))
+            views[key] = np.ndarray(shape, dtype=dtype, buffer=shms[-1].buf)
+
+        if task == 'G':
+            G = batch_G(views['pos'], box, pbc, views['nlist'],
+                        views['p_vectors'], theta_max=theta_max,
+                        start=start, stop=stop, chunksize=chunksize)
+            views['G'][start:stop] = G
+            for key, value in strain_properties(G).items():
+                views[key][start:stop] = value
+        else:
+            views['nye'][start:stop] = batch_nye(views['pos'], box, pbc,
+                                                 views['nlist'], views['G'],
+                                                 start=start, stop=stop,
+                                                 chunksize=chunksize)
+    finally:
+        views.clear()
+        for shm in shms:
+            shm.close()
+
+def batch_strain(pos, box, pbc, nlist, p_vectors=None, G=None, theta_max=27,
+                 nye=True, nprocs=1, chunksize=262144):
+    """
+    Computes G, the strain properties and the Nye tensor for all atoms,
+    optionally splitting the atoms into chunks that are evaluated in
+    parallel.  Parallel workers read the positions, neighbor list, p vectors
+    and G from shared memory and write their results into shared output
+    arrays so that the system is never pickled.
+
+    Parameters
+    ----------
+    pos : numpy.ndarray
+        The atomic positions.
+    box : atomman.Box
+        The system's box.
+    pbc : list of bool
+        The system's periodic boundary conditions.
+    nlist : numpy.ndarray
+        The neighbor list array, i.e. atomman.NeighborList.nlist.
+    p_vectors : array-like object, optional
+        The per-atom ideal neighbor vectors.  Required if G is not given.
+    G : numpy.ndarray, optional
+        Previously computed lattice correspondence tensors.  If given, only
+        the Nye tensor will be computed.
+    theta_max : float, optional
+        The maximum theta angle in degrees to use when matching p vectors
+        to q vectors.  Default value is 27.
+    nye : bool, optional
+        Indicates if the Nye tensor is to be computed.  Default value is
+        True.
+    nprocs : int, optional
+        The number of processes to use.  Default value is 1, which performs
+        all calculations in the current process.
+    chunksize : int, optional
+        The approximate number of neighbor pairs to evaluate at once.
+        Default value is 262144.
+
+    Returns
+    -------
+    dict
+        Contains the per-atom 'G', 'strain', 'invariant1', 'invariant2',
+        'invariant3', 'rotation', 'angularvelocity' and 'nye' values that
+        were computed.
+    """
+    natoms = len(nlist)
+    if G is None and p_vectors is None:
+        raise ValueError('p_vectors or G is required')
+
+    # Serial calculation
+    if nprocs is None or nprocs <= 1:
+        results = {}
+        if G is None:
+            G = batch_G(pos, box, pbc, nlist, p_vectors, theta_max=theta_max,
+                        chunksize=chunksize)
+            results['G'] = G
+            results.update(strain_properties(G))
+        if nye:
+            results['nye'] = batch_nye(pos, box, pbc, nlist, G,
+                                       chunksize=chunksize)
+        return results
+
+    # Build shared input and output arrays
+    tasks = []
+    arrays = {'pos': np.ascontiguousarray(pos, dtype=float),
+              'nlist': np.ascontiguousarray(nlist)}
+    shapes = {}
+    if G is None:
+        tasks.append('G')
+        arrays['p_vectors'] = np.ascontiguousarray(pad_p_vectors(p_vectors))
+        shapes.update({'G': (natoms, 3, 3), 'strain': (natoms, 3, 3),
+                       'invariant1': (natoms,), 'invariant2': (natoms,),
+                       'invariant3': (natoms,), 'rotation': (natoms, 3, 3),
+                       'angularvelocity': (natoms,)})
+    else:
+        arrays['G'] = np.ascontiguousarray(G, dtype=float)
+    if nye:
+        tasks.append('nye')
+        shapes['nye'] = (natoms, 3, 3)
+
+    shms = {}
+    descriptors = {}
+    try:
+        for key, array in arrays.items():
+            shms[key], descriptors[key] = _share(array.shape, array.dtype, array)
+        for key, shape in shapes.items():
+            shms[key], descriptors[key] = _share(shape)
+
+        # Split atoms into several chunks per process for load balancing
+        bounds = np.linspace(0, natoms, 4 * nprocs + 1).astype(int)
+        bounds = np.unique(bounds)
+        starts = bounds[:-1].tolist()
+        stops = bounds[1:].tolist()
+
+        with ProcessPoolExecutor(max_workers=nprocs) as executor:
+            for task in tasks:
+                n = len(starts)
+                list(executor.map(_strain_worker, [task] * n, starts, stops,
+                                  [descriptors] * n, [box] * n, [pbc] * n,
+                                  [theta_max] * n, [chunksize] * n))
+
+        # Copy results out of shared memory
+        results = {}
+        for key, shape in shapes.items():
+            results[key] = np.ndarray(shape, buffer=shms[key].buf).copy()
+
+    finally:
+        for shm in shms.values():
+            shm.close()
+            shm.unlink()
+
+    return results
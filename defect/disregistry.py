@@ -6,7 +6,7 @@ import numpy as np
 from .. import displacement
 
 def disregistry(basesystem, dislsystem, m=[1.0, 0.0, 0.0],
-                n=[0.0, 1.0, 0.0], planepos=[0.0, 0.0, 0.0]):
+                n=[0.0, 1.0, 0.0], planepos=[0.0, 0.0, 0.0], tol=1e-5):
     """
     Computes the disregistry profile for a dislocation system.
     
@@ -15,8 +15,10 @@ def disregistry(basesystem, dislsystem, m=[1.0, 0.0, 0.0],
     basesystem : atomman.System
         A perfect reference system with atoms directly corresponding to atoms
         in dislsystem.
-    dislsystem : atomman.System
-        A dislocation-containing system.
+    dislsystem : atomman.System or list of atomman.System
+        A dislocation-containing system.  A list of systems, such as the
+        frames of a trajectory, can be given to compute the disregistry of
+        all of them at once.
     m : array-like object, optional
         The dislocation solution m unit vector.  This vector is in the slip
         plane and perpendicular to the dislocation line direction.  Default
@@ -29,14 +31,24 @@ def disregistry(basesystem, dislsystem, m=[1.0, 0.0, 0.0],
         A position on the slip plane so that the plane can be fully defined.
         The slip plane position should fall between two planes of atoms.
         Default value is [0,0,0].
+    tol : float, optional
+        Absolute tolerance for identifying atoms that share the same
+        coordinate along m (i.e. belong to the same atomic column).  Unlike
+        numpy.isclose, the tolerance does not scale with the coordinate
+        values.  Default value is 1e-5.
     
     Returns
     -------
     coord : numpy.ndarray
-        The (N,) array of unique coord-coordinates (atomic columns) neighboring
-        the slip plane.
+        The (N,) array of coord-coordinates of the atomic columns neighboring
+        the slip plane.  Atoms within tol of each other along m are grouped
+        into one column, which is given by the smallest of their
+        coordinates, and columns above and below the slip plane within tol
+        of each other share one coord value.  As such, small noise in the basesystem positions does
+        not give separate coord values for the atoms of a column.
     disregistry : numpy.ndarray
-        A (N, 3) array of the dislocation's disregistry at each coord.
+        A (N, 3) array of the dislocation's disregistry at each coord.  If
+        dislsystem is a list, then a (nframes, N, 3) array is returned.
     """
     # Handle m, n and planepos
     m = np.asarray(m, dtype=float)
@@ -47,7 +59,10 @@ def disregistry(basesystem, dislsystem, m=[1.0, 0.0, 0.0],
     
     # Extract pos from basesystem and compute atomic displacements
     basepos = basesystem.atoms.pos
-    disp = displacement(basesystem, dislsystem)
+    if isinstance(dislsystem, (list, tuple)):
+        disp = np.array([displacement(basesystem, system) for system in dislsystem])
+    else:
+        disp = displacement(basesystem, dislsystem)[np.newaxis]
     
     # Transform basepos and planepos to calculation coordinates
     allx = np.dot(basepos, m)
@@ -60,44 +75,70 @@ def disregistry(basesystem, dislsystem, m=[1.0, 0.0, 0.0],
     belowy = uniquey[uniquey < midy].max()
     if np.isclose(abovey, belowy):
         raise ValueError('planepos must fall between atomic planes')
-    #uniquey = np.unique(basepos[:, 1])
-    #abovey = uniquey[uniquey > 0].min()
-    #belowy = uniquey[uniquey < 0].max()
-    
-    # Get coordinates of atoms just above and below slip plane
-    abovex = allx[np.isclose(ally, abovey)]
-    belowx = allx[np.isclose(ally, belowy)]
-    #abovex = basepos[np.isclose(basepos[:, 1], abovey)][:, 0]
-    #belowx = basepos[np.isclose(basepos[:, 1], belowy)][:, 0]
-    
-    # Identify unique coordinates
-    uabovex = np.unique(abovex)
-    ubelowx = np.unique(belowx)
-    coord = np.union1d(uabovex, ubelowx)
     
-    # Get displacements of atoms just above and below slip plane
-    abovedisp = disp[np.isclose(ally, abovey)]
-    belowdisp = disp[np.isclose(ally, belowy)]
-    #abovedisp = disp[np.isclose(basepos[:, 1], abovey)]
-    #belowdisp = disp[np.isclose(basepos[:, 1], belowy)]
+    # Get coordinates and displacements of atoms just above and below slip plane
+    above = np.isclose(ally, abovey)
+    below = np.isclose(ally, belowy)
     
     # Average displacements for the same coordinates
-    abovedispmean = np.empty((len(uabovex), 3))
-    for i, ix in enumerate(uabovex):
-        abovedispmean[i] = abovedisp[np.isclose(abovex, ix)].mean(axis=0)
-    belowdispmean = np.empty((len(ubelowx), 3))
-    for i, ix in enumerate(ubelowx):
-        belowdispmean[i] = belowdisp[np.isclose(belowx, ix)].mean(axis=0)
-    
-    # Linearly interpolate displacement values to all coord
-    abovedispinterp = np.vstack([np.interp(coord, uabovex, abovedispmean[:,0]),
-                                 np.interp(coord, uabovex, abovedispmean[:,1]),
-                                 np.interp(coord, uabovex, abovedispmean[:,2])]).T
-    belowdispinterp = np.vstack([np.interp(coord, ubelowx, belowdispmean[:,0]),
-                                 np.interp(coord, ubelowx, belowdispmean[:,1]),
-                                 np.interp(coord, ubelowx, belowdispmean[:,2])]).T
-    
-    # Calculate disregistry
-    disregistry = abovedispinterp - belowdispinterp
-    
-    return coord, disregistry
\ No newline at end of file
+    uabovex, abovedispmean = _group_mean(allx[above], disp[:, above], tol)
+    ubelowx, belowdispmean = _group_mean(allx[below], disp[:, below], tol)
+    
+    # Identify unique coordinates, merging above and below columns within tol
+    coord = np.union1d(uabovex, ubelowx)
+    coord = coord[np.hstack([True, np.diff(coord) > tol])]
+    
+    # Linearly interpolate displacement values to all coord and compute disregistry
+    disregistry = (_interp(coord, uabovex, abovedispmean)
+                   - _interp(coord, ubelowx, belowdispmean))
+    
+    if isinstance(dislsystem, (list, tuple)):
+        return coord, disregistry
+    else:
+        return coord, disregistry[0]
+
+def _group_mean(x, values, tol):
+    """
+    Groups coordinates that are within tol of their sorted neighbors and
+    averages the values of each group in one pass.
+    
+    Parameters
+    ----------
+    x : numpy.ndarray
+        The (N,) coordinates to group.
+    values : numpy.ndarray
+        The (nframes, N, 3) values to average.
+    tol : float
+        Absolute coordinate tolerance for two atoms to be in the same group.
+    
+    Returns
+    -------
+    ux : numpy.ndarray
+        The (U,) smallest coordinate of each group.
+    means : numpy.ndarray
+        The (nframes, U, 3) mean values of each group.
+    """
+    # Sort coordinates and start a new group at every gap larger than tol
+    order = np.argsort(x, kind='stable')
+    sortx = x[order]
+    starts = np.flatnonzero(np.hstack([True, np.diff(sortx) > tol]))
+    counts = np.diff(np.append(starts, len(sortx)))
+    
+    means = np.add.reduceat(values[:, order], starts, axis=1) / counts[:, np.newaxis]
+    
+    return sortx[starts], means
+
+def _interp(x, xp, fp):
+    """
+    Linearly interpolates (nframes, U, 3) values fp given at (U,) sorted
+    coordinates xp to coordinates x, matching numpy.interp along each frame
+    and component.
+    """
+    if len(xp) == 1:
+        return np.repeat(fp, len(x), axis=1)
+    
+    # Index of the interval containing each x, and the fraction across it
+    j = np.clip(np.searchsorted(xp, x, side='right') - 1, 0, len(xp) - 2)
+    t = np.clip((x - xp[j]) / (xp[j+1] - xp[j]), 0.0, 1.0)[:, np.newaxis]
+    
+    return (1 - t) * fp[:, j] + t * fp[:, j+1]
@@ -1,4 +1,6 @@
 # coding: utf-8
+# Standard Python libraries
+from functools import lru_cache
 
 # http://www.numpy.org/
 import numpy as np
@@ -73,6 +75,54 @@ def free_surface_basis(hkl, box=None, cutboxvector='c', maxindex=None,
     if box is None:
         box = Box()
     
+    # Convert parameters to hashable values and call the cached search
+    hkl = tuple(np.asarray(hkl).flatten().tolist())
+    vects = tuple(box.vects.flatten().tolist())
+    uvws, planenormal = _cached_free_surface_basis(hkl, vects, cutboxvector,
+                                                   maxindex, return_hexagonal,
+                                                   conventional_setting)
+    
+    if return_planenormal:
+        return uvws.copy(), planenormal.copy()
+    else:
+        return uvws.copy()
+
+@lru_cache(maxsize=256)
+def _cached_free_surface_basis(hkl, vects, cutboxvector, maxindex,
+                               return_hexagonal, conventional_setting):
+    """
+    Performs the free_surface_basis() search.  Results are cached based on
+    the parameter values as surface scans typically repeat the search for
+    the same inputs.  Use _cached_free_surface_basis.cache_clear() to clear
+    the cache.
+    
+    Parameters
+    ----------
+    hkl : tuple
+        The Miller (hkl) or Miller-Bravais (hkil) plane indices.
+    vects : tuple
+        The nine values of the box's vects.
+    cutboxvector : str
+        Specifies which of the three box vectors corresponds to the
+        out-of-plane vector.
+    maxindex : int or None
+        Max uvw index value to use in identifying the best uvw set for the
+        out-of-plane vector.
+    return_hexagonal : bool or None
+        Flag for indicating if the returned vectors are expressed in Miller
+        [uvw] format (False) or Miller-Bravais [uvtw] format (True).
+    conventional_setting : str or None
+        The conventional setting that hkl is given relative to.
+    
+    Returns
+    -------
+    uvws : numpy.ndarray
+        3x3 array of Miller [uvw] vectors or 3x4 array of Miller-Bravais [uvtw] vectors to rotate the unit cell for a free surface configuration.
+    planenormal : numpy.ndarray
+        The Cartesian plane normal vector.
+    """
+    box = Box(vects=np.array(vects).reshape(3, 3))
+    
     # Check hkl values
     hkl = np.asarray(hkl)
     
@@ -170,41 +220,29 @@ def free_surface_basis(hkl, box=None, cutboxvector='c', maxindex=None,
     planenormal = s * np.cross(np.inner(a_uvw, box.vects.T),
                                np.inner(b_uvw, box.vects.T))
     
-    # Build gen_vector iterator for testing vectors
-    def gen_vector(n):
-        for kk in range(0, n+1):
-            for sk in [1, -1]:
-                k = sk * kk
-                for jj in range(0, n+1):
-                    for sj in [1, -1]:
-                        j = sj * jj
-                        for ii in range(0, n+1):
-                            for si in [1, -1]:
-                                i = si * ii
-                                if i==0 and j==0 and k==0:
-                                    continue
-                                yield np.array([i, j, k], dtype=int)
+    # Generate all candidate vectors and their Cartesian values
+    uvws = _candidate_vectors(maxindex)
+    carts = uvws.dot(box.vects)
+    mags = np.linalg.norm(carts, axis=1)
+    inplane = np.isclose(carts.dot(planenormal), 0.0)
     
     # First search
-    a_mag = np.linalg.norm(np.inner([maxindex, maxindex, maxindex], box.vects.T))
-    c_angle = 90
+    max_mag = np.linalg.norm(np.inner([maxindex, maxindex, maxindex], box.vects.T))
+    
+    # Find shortest vector in the plane
     a_uvw = None
+    a_candidates = np.where(inplane & (mags < max_mag))[0]
+    if len(a_candidates) > 0:
+        a_uvw = uvws[_first_minimum(a_candidates, mags,
+                                    lambda i: np.linalg.norm(carts[i]))]
+    
+    # Find vector closest to plane normal 
     c_uvw = None
-    for uvw in gen_vector(maxindex):
-        cart = np.inner(uvw, box.vects.T)
-        mag = np.linalg.norm(cart)
-        angle = vect_angle(cart, planenormal)
-        
-        # Find shortest vector in the plane
-        if np.isclose(np.dot(cart, planenormal), 0.0):
-            if mag < a_mag:
-                a_uvw = uvw
-                a_mag = mag
-        
-        # Find vector closest to plane normal 
-        elif angle < c_angle:
-            c_angle = angle
-            c_uvw = uvw
+    c_angles = _angles(carts, planenormal)
+    c_candidates = np.where(~inplane & (c_angles < 90))[0]
+    if len(c_candidates) > 0:
+        c_uvw = uvws[_first_minimum(c_candidates, c_angles,
+                                    lambda i: vect_angle(carts[i], planenormal))]
     
     assert a_uvw is not None, 'Failed to find first vector in slip plane'
     assert c_uvw is not None, 'Failed to find vector near slip plane normal'
@@ -214,25 +252,25 @@ def free_surface_basis(hkl, box=None, cutboxvector='c', maxindex=None,
     
     # Second search
     a_cart = np.inner(a_uvw, box.vects.T)
-    b_mag = np.linalg.norm(np.inner([maxindex, maxindex, maxindex], box.vects.T))
+    b_angles = _angles(carts, a_cart)
+    
+    # Check that vectors are in plane, not parallel to a_uvw and right-handed
+    b_candidates = np.where(inplane
+                            & ~np.isclose(b_angles, 0.0)
+                            & ~np.isclose(b_angles, 180.0)
+                            & (np.cross(a_cart, carts).dot(planenormal) > 0))[0]
+    
+    # Find b_uvw with smallest magnitude and smallest angle
     b_uvw = None
-    min_angle = 180.0
-    for uvw in gen_vector(maxindex):
-        cart = np.inner(uvw, box.vects.T)
-        angle = vect_angle(a_cart, cart)
+    b_candidates = b_candidates[(mags[b_candidates] < max_mag)
+                                | np.isclose(mags[b_candidates], max_mag)]
+    if len(b_candidates) > 0:
+        b_mags = mags[b_candidates]
+        tied = b_candidates[np.isclose(b_mags, b_mags.min())]
         
-        # Check that vector is in plane and not parallel to a_uvw
-        if np.isclose(np.dot(cart, planenormal), 0.0) and not np.isclose(angle, 0.0) and not np.isclose(angle, 180.0):
-            
-            # Check if right-handed
-            if np.dot(np.cross(a_cart, cart), planenormal) > 0:
-                
-                # Find b_uvw with smallest magnitude and smallest angle
-                mag = np.linalg.norm(cart)
-                if (np.isclose(mag, b_mag) and angle < min_angle) or mag < b_mag:
-                    b_uvw = uvw
-                    b_mag = mag
-                    min_angle = angle
+        # Order ties by angle, then by search order
+        order = np.lexsort((tied, np.round(b_angles[tied], 8)))
+        b_uvw = uvws[tied[order[0]]]
     
     assert b_uvw is not None, 'Failed to find second vector in slip plane'
     
@@ -246,8 +284,65 @@ def free_surface_basis(hkl, box=None, cutboxvector='c', maxindex=None,
         
     if return_hexagonal:
         uvws = miller.vector3to4(uvws)
-        
-    if return_planenormal:
-        return uvws, planenormal
-    else:
-        return uvws
\ No newline at end of file
+    
+    return uvws, planenormal
+
+def _candidate_vectors(maxindex):
+    """
+    Generates all integer [uvw] vectors with indices in the range -maxindex
+    to maxindex, excluding [000].  The vectors are ordered by increasing
+    absolute index values with w varying slowest and u fastest.
+    
+    Parameters
+    ----------
+    maxindex : int
+        The maximum absolute index value.
+    
+    Returns
+    -------
+    numpy.ndarray
+        The (N, 3) array of candidate uvw vectors.
+    """
+    values = np.outer(np.arange(maxindex + 1), [1, -1]).flatten()
+    w, v, u = np.meshgrid(values, values, values, indexing='ij')
+    uvws = np.array([u.flatten(), v.flatten(), w.flatten()], dtype=int).T
+    
+    return uvws[np.any(uvws != 0, axis=1)]
+
+def _first_minimum(indices, values, exact):
+    """
+    Identifies the first index with the minimum value.  Candidates within
+    rounding of the vectorized minimum are re-evaluated with the exact scalar
+    expression so that ties are resolved identically to a sequential search.
+    
+    Parameters
+    ----------
+    indices : numpy.ndarray
+        The candidate indices, in search order.
+    values : numpy.ndarray
+        The vectorized values for all indices.
+    exact : function
+        Computes the scalar value for a single index.
+    
+    Returns
+    -------
+    int
+        The selected index.
+    """
+    candidates = values[indices]
+    near = indices[np.isclose(candidates, candidates.min(), rtol=1e-10, atol=1e-10)]
+    
+    return near[np.argmin([exact(i) for i in near])]
+
+def _angles(vects, vect):
+    """
+    Computes the angles in degrees between multiple vectors and a single
+    vector.  Vectorized equivalent of atomman.tools.vect_angle.
+    """
+    u_vects = vects / np.linalg.norm(vects, axis=1)[:, np.newaxis]
+    u_vect = vect / np.linalg.norm(vect)
+    cosine = u_vects.dot(u_vect)
+    cosine[cosine < -1] = -1
+    cosine[cosine > 1] = 1
+    
+    return 180 * np.arccos(cosine) / np.pi
@@ -1,16 +1,14 @@
 # coding: utf-8
-# Standard Python libraries
-import warnings
-
 # http://www.numpy.org/
 import numpy as np
 
 # atomman imports
 from .. import NeighborList
 from ..tools import axes_check
+from .batch_strain import batch_strain
 
 def nye_tensor(system, p_vectors, theta_max = 27, axes=None, neighbors=None,
-               cutoff=None):
+               cutoff=None, nprocs=1):
     """
     Computes strain properties and Nye tensor for a defect containing system.
     
@@ -38,6 +36,10 @@ def nye_tensor(system, p_vectors, theta_max = 27, axes=None, neighbors=None,
         Cutoff distance for computing a neighbor list for system.  Either
         neighbors or cutoff must be given, or system have a neighbors
         attribute.
+    nprocs : int, optional
+        The number of processes to use.  Default value is 1.  If greater than
+        1, the atoms are split into chunks that are solved in parallel by
+        workers that access the system data through shared memory.
     
     Returns
     -------
@@ -65,106 +67,14 @@ def nye_tensor(system, p_vectors, theta_max = 27, axes=None, neighbors=None,
     if axes is not None:
         p_vectors = np.inner(p_vectors, axes_check(axes))
     
-    # Get cos of theta_max
-    cos_theta_max = np.cos(theta_max * np.pi / 180)
-    
-    # Define epsilon array
-    eps = np.array([[[ 0, 0, 0],[ 0, 0, 1],[ 0,-1, 0]],
-                    [[ 0, 0,-1],[ 0, 0, 0],[ 1, 0, 0]],
-                    [[ 0, 1, 0],[-1, 0, 0],[ 0, 0, 0]]])
-    
-    # Identify largest number of nearest neighbors
-    nmax = neighbors.coord.max()
-    
-    # Initialize variables
-    strain = np.empty((system.natoms, 3, 3))
-    inv1 = np.empty(system.natoms)
-    inv2 = np.empty(system.natoms)
-    inv3 = np.empty(system.natoms)
-    ang_vel = np.empty(system.natoms)
-    nye = np.empty((system.natoms, 3, 3))
-    P = np.zeros((nmax, 3))
-    Q = np.zeros((nmax, 3))
-    G = np.empty((system.natoms, 3, 3))
-    gradG = np.empty((3, 3, 3))
-    
-    # Calculate correspondence tensor, G, and strain data for each atom
-    for i in range(system.natoms):
-        p = np.asarray(p_vectors[i])
-        if p.ndim == 1:
-            p = np.array([p])
-        p_mags = np.linalg.norm(p, axis=1)
-        r1 = p_mags.min()
-        
-        # Calculate radial neighbor vectors, q
-        q = system.dvect(i, neighbors[i])
-        if q.ndim == 1:
-            q = np.array([q])
-        q_mags = np.linalg.norm(q, axis=1)
-        
-        # Calculate cos_thetas between all p's and q's.
-        cos_thetas = (np.dot(p, q.T) /q_mags ).T / p_mags
-        
-        # Identify best index matches
-        index_pairing = cos_thetas.argmax(1)
-        
-        # Exclude values where theta is greater than theta_max
-        index_pairing[cos_thetas.max(1) < cos_theta_max] = -1
-        
-        # Search for duplicate index_pairings
-        #u, u_count = np.unique(index_pairing, return_counts=True)
-        
-        # Check if the particular p has already been assigned to another q
-        for n in range(len(q)):
-            if index_pairing[n] >=0:
-                for k in range(n):
-                    if index_pairing[n] == index_pairing[k]:
-                        nrad = abs(r1 - q_mags[n])
-                        krad = abs(r1 - q_mags[k])
-                        # Remove the p-q pair that is farther from r1
-                        if nrad < krad:
-                            index_pairing[k]=-1
-                        else:
-                            index_pairing[n]=-1
-        
-        # Construct reduced P, Q matrices from p-q pairs
-        c = 0
-        for n in range(len(q)):
-            if index_pairing[n] >= 0:
-                Q[c] = q[n]
-                P[c] = p[index_pairing[n]]
-                c+=1
-                
-        # Compute lattice correspondence tensor, G, from P and Q
-        if c == 0:
-            G[i] = np.identity(3)
-            warnings.warn('An atom lacks pair sets. Check neighbor list')
-        else:
-            G[i] = np.linalg.lstsq(Q[:c], P[:c], rcond=None)[0]
-        
-        # Compute strain properties from G
-        strain[i] = ((np.identity(3) - G[i]) + (np.identity(3) - G[i]).T) / 2.
-        inv1[i] = strain[i,0,0] + strain[i,1,1] + strain[i,2,2]
-        inv2[i] = (strain[i,0,0] * strain[i,1,1] 
-                 + strain[i,0,0] * strain[i,2,2] 
-                 + strain[i,1,1] * strain[i,2,2] 
-                - strain[i,0,1]**2 - strain[i,0,2]**2 - strain[i,1,2]**2)
-        inv3[i] = np.linalg.det(strain[i])
-        rot = ((np.identity(3) - G[i]) - (np.identity(3) - G[i]).T) / 2.
-        ang_vel[i] = (rot[0,1]**2 + rot[0,2]**2 + rot[1,2]**2)**0.5
-    
-    # Construct the gradient tensor of G, gradG for each atom
-    for i in range(system.natoms):
-        Q = system.dvect(i, neighbors[i])
-        if Q.ndim == 1:
-            Q = np.array([Q])
-        dG = G[neighbors[i]] - G[i]
-        for x in range(3):
-            gradG[x,:] = np.linalg.lstsq(Q, dG[:,x,:], rcond=None)[0].T
-        
-        # Use gradG to calculate the nye tensor
-        nye[i] = -1*np.einsum('ijm,ikm->jk', eps, gradG)
+    # Compute G, strain properties and Nye tensor for all atoms
+    results = batch_strain(system.atoms.pos, system.box, system.pbc,
+                           neighbors.nlist, p_vectors=p_vectors,
+                           theta_max=theta_max, nprocs=nprocs)
     
-    return {'strain':strain, 'strain_invariant_1':inv1,
-            'strain_invariant_2':inv2, 'strain_invariant_3':inv3,
-            'angular_velocity':ang_vel, 'Nye_tensor':nye}
\ No newline at end of file
+    return {'strain':results['strain'],
+            'strain_invariant_1':results['invariant1'],
+            'strain_invariant_2':results['invariant2'],
+            'strain_invariant_3':results['invariant3'],
+            'angular_velocity':results['angularvelocity'],
+            'Nye_tensor':results['nye']}
\ No newline at end of file
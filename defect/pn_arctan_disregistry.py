@@ -5,7 +5,7 @@ import numpy as np
 
 def pn_arctan_disregistry(xmax=None, xstep=None, xnum=None,
                           burgers=None, center=0.0,
-                          halfwidth=1, normalize=True, shift=True):
+                          halfwidth=1, normalize=True, shift=True, x=None):
     """
     Computes the classic Peierls-Nabarro arctan disregistry for an array of
     points x.
@@ -16,7 +16,8 @@ def pn_arctan_disregistry(xmax=None, xstep=None, xnum=None,
     ----------
     xmax : float or None, optional
         Maximum value of x to use.  Minimum value is taken as -xmax.  At least
-        2 of xmax, xstep, and xnum must be not None.  Default value is None.
+        2 of xmax, xstep, and xnum must be not None unless x is given.
+        Default value is None.
     xstep : float or None, optional
         Step size to use between each x value.  At least 2 of xmax, xstep, and
         xnum must be not None.  Default value is None.
@@ -35,6 +36,9 @@ def pn_arctan_disregistry(xmax=None, xstep=None, xnum=None,
     shift : bool, optional
         If True (default), the disregistry will range [0, 0, 0] to burgers.
         If False, the disregistry will range from -burgers to burgers.
+    x : numpy.ndarray, optional
+        An array of x coordinates to use, such as a non-uniform grid from
+        pn_graded_x().  Cannot be given with xmax, xstep or xnum.
         
     Returns
     -------
@@ -43,8 +47,14 @@ def pn_arctan_disregistry(xmax=None, xstep=None, xnum=None,
     disregistry : numpy.ndarray
         The disregistry vector at each x-coordinate.
     """
+    # Use given x coordinates
+    if x is not None:
+        if xmax is not None or xstep is not None or xnum is not None:
+            raise ValueError('x cannot be given with xmax, xstep or xnum')
+        x = np.asarray(x, dtype=float)
+    
     # Generate missing x parameters
-    if xmax is None:
+    elif xmax is None:
         if xstep is None or xnum is None:
             raise ValueError('At least two parameters must be given')
         xmax = xstep * (xnum - 1) / 2
@@ -63,9 +73,10 @@ def pn_arctan_disregistry(xmax=None, xstep=None, xnum=None,
             raise ValueError('Invalid parameters: xnum or ((2 * xmax) / xstep) not an integer.')
     
     # Generate x and validate
-    x, dx = np.linspace(-1*xmax, xmax, xnum, retstep=True)
-    if not np.isclose(dx, xstep):
-        raise ValueError('Incompatible parameters: xmax = xstep * (xnum - 1) / 2')
+    if xnum is not None:
+        x, dx = np.linspace(-1*xmax, xmax, xnum, retstep=True)
+        if not np.isclose(dx, xstep):
+            raise ValueError('Incompatible parameters: xmax = xstep * (xnum - 1) / 2')
     
     if burgers is None:
         burgers = np.array([1.0, 0.0, 0.0])
@@ -0,0 +1,58 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+def pn_graded_x(xmax, xstep, xcore, ratio=1.1):
+    """
+    Generates a non-uniform array of x coordinates for Peierls-Nabarro
+    models that is fine near the dislocation core and geometrically coarsened
+    towards the far field.  The x coordinates are symmetric about 0 and use
+    a uniform step size of xstep for |x| <= xcore.  Beyond xcore, each step
+    is ratio times larger than the previous one, with the final values
+    adjusted to end exactly at -xmax and xmax.
+    
+    Parameters
+    ----------
+    xmax : float
+        Maximum value of x to use.  Minimum value is taken as -xmax.
+    xstep : float
+        Step size to use between the x values in the core region.
+    xcore : float
+        The half-width of the uniformly spaced core region.  Will be rounded
+        to the nearest multiple of xstep.
+    ratio : float, optional
+        The ratio between successive step sizes outside of the core region.
+        Default value is 1.1.
+    
+    Returns
+    -------
+    numpy.ndarray
+        The x-coordinates.
+    """
+    if ratio < 1.0:
+        raise ValueError('ratio must be >= 1')
+    if xstep <= 0.0:
+        raise ValueError('xstep must be positive')
+    if xcore > xmax:
+        raise ValueError('xcore must be <= xmax')
+    
+    # Uniform core region
+    ncore = int(round(xcore / xstep))
+    pos = list(np.arange(ncore + 1) * xstep)
+    
+    # Geometrically coarsened far-field region
+    step = xstep
+    while pos[-1] < xmax:
+        step *= ratio
+        pos.append(pos[-1] + step)
+    pos = np.array(pos)
+    
+    # End exactly at xmax, merging a final step that is too small
+    if len(pos) > 2 and not np.isclose(pos[-1], xmax):
+        pos[-1] = xmax
+        if pos[-1] - pos[-2] < 0.5 * (pos[-2] - pos[-3]):
+            pos = np.delete(pos, -2)
+    pos[-1] = xmax
+    
+    return np.concatenate([-pos[:0:-1], pos])
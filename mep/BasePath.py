@@ -27,13 +27,20 @@ class BasePath():
             point coordinates.
         gradientfxn : str or function, optional
             The function to use to estimate the gradient of the energy.  Default
-            value of 'cdiff' will use atomman.mep.gradient.central_difference
+            value of 'cdiff' will use atomman.mep.gradient.central_difference.
+            Other str options are 'cstep' for
+            atomman.mep.gradient.complex_step and 'analytic' for
+            atomman.mep.gradient.analytic, which evaluates a gradient function
+            given as the gradfxn keyword in gradientkwargs.  Custom functions
+            must have the signature gradientfxn(energyfxn, coord, **gradientkwargs).
         gradientkwargs : dict, optional
             The keyword arguments (i.e. settings) to use with the gradientfxn.
             Default is an empty dictionary, i.e. default settings of gradientfxn.
         integratorfxn : str or function, optional
             The function to use to integrate relaxation steps.  Default value of
-            'rk' will use atomman.mep.integrator.rungekutta.
+            'rk' will use atomman.mep.integrator.rungekutta.  Other str options
+            are 'euler' for atomman.mep.integrator.euler and 'rk45' for the
+            adaptive atomman.mep.integrator.rk45.
         """
         
         if isinstance(coord, BasePath):
@@ -49,7 +56,7 @@ class BasePath():
         self.integratorfxn = integratorfxn
         
         if gradientkwargs is None:
-            self.__gradientkwargs = {}
+            gradientkwargs = {}
         if isinstance(gradientkwargs, dict):
             self.__gradientkwargs = gradientkwargs
         else:
@@ -73,11 +80,7 @@ class BasePath():
         s[1:] = np.linalg.norm(self.coord[1:] - self.coord[:-1], axis=1)
         
         # Compute the arc length coordinates
-        α = np.empty(len(self.coord))
-        for i in range(len(α)):
-            α[i] = s[:i+1].sum()
-        
-        return α
+        return np.cumsum(s)
 
     @property
     def energyfxn(self):
@@ -94,6 +97,10 @@ class BasePath():
         if isinstance(value, str):
             if value == 'central_difference' or value == 'cdiff':
                 self.__gradientfxn = gradient.central_difference
+            elif value == 'complex_step' or value == 'cstep':
+                self.__gradientfxn = gradient.complex_step
+            elif value == 'analytic':
+                self.__gradientfxn = gradient.analytic
             else:
                 raise ValueError('Unknown gradientfxn style')
         elif callable(value):
@@ -118,6 +125,8 @@ class BasePath():
                 self.__integratorfxn = integrator.rungekutta
             elif value == 'euler':
                 self.__integratorfxn = integrator.euler
+            elif value == 'rk45':
+                self.__integratorfxn = integrator.rk45
             else:
                 raise ValueError('Unknown integratorfxn style')
         elif callable(value):
@@ -1,6 +1,7 @@
 # coding: utf-8
 # Standard Python imports
 import time
+import warnings
 
 # http://www.numpy.org/
 import numpy as np
@@ -75,7 +76,8 @@ class ISMPath(BasePath):
         newcoord = CubicSpline(α, self.coord)(arccoord)
         
         return ISMPath(newcoord, self.energyfxn, gradientfxn=self.gradientfxn,
-                    gradientkwargs=self.gradientkwargs)
+                    gradientkwargs=self.gradientkwargs,
+                    integratorfxn=self.integratorfxn)
 
     def step(self, timestep=None, climbindex=None):
         """
@@ -132,7 +134,7 @@ class ISMPath(BasePath):
         
         # Create intpath from integrated coords
         intpath = ISMPath(icoord, self.energyfxn, self.gradientfxn,
-                          self.gradientkwargs)
+                          self.gradientkwargs, self.integratorfxn)
         
         # Divide full path into segments based on climbindices
         startindices = [0] + aslist(climbindex)
@@ -154,7 +156,7 @@ class ISMPath(BasePath):
         return newpath
     
     def relax(self, relaxsteps=0, climbsteps=0, timestep=None,
-              tolerance=None, climbpoints=1, verbose=True):
+              tolerance=None, climbpoints=1, verbose=True, return_info=False):
         """
         Perform multiple relaxation and/or climb steps until either the
         maximum coordinate displacement per step drops below a tolerance or
@@ -170,7 +172,10 @@ class ISMPath(BasePath):
             is 0: no climbing steps.
         timestep : float, optional
             The size of the timestep to use.  Will use default_timestep if not
-            given.
+            given.  The path points are redistributed after each timestep, so
+            the relaxed path depends on the timestep and it should be kept
+            small even with the adaptive 'rk45' integratorfxn, which only
+            controls the integration error within each timestep.
         tolerance : float, optional
             The coordinate displacement tolerance to use.  Will use
             default_tolerance if not given.
@@ -179,7 +184,26 @@ class ISMPath(BasePath):
             Default value is 1: i.e. only one maximum is refined.
         verbose : bool, optional
             If True (default), informative statements about the relaxation are
-            printed.
+            printed, including the time per step and the number of energy and
+            gradient evaluations.
+        return_info : bool, optional
+            If True, a dict describing the relaxation is also returned.
+            Default value is False.
+            
+        Returns
+        -------
+        ISMPath
+            The relaxed path.
+        dict
+            The number of steps performed and if the tolerance was reached,
+            with keys 'relaxsteps', 'relaxconverged', 'climbsteps' and
+            'climbconverged'.  Only returned if return_info is True.
+        
+        Warns
+        -----
+        RuntimeWarning
+            If the tolerance is not reached within relaxsteps relaxation
+            steps or climbsteps climbing steps.
         """
         
         # Set default timestep
@@ -189,6 +213,15 @@ class ISMPath(BasePath):
         # Set default tolerance
         if tolerance is None:
             tolerance = self.default_tolerance
+        
+        # Wrap energy and gradient functions to count evaluations
+        counts = {'energy': 0, 'gradient': 0}
+        def energyfxn(*args, **kwargs):
+            counts['energy'] += 1
+            return self.energyfxn(*args, **kwargs)
+        def gradientfxn(*args, **kwargs):
+            counts['gradient'] += 1
+            return self.gradientfxn(*args, **kwargs)
 
         if verbose:
             print(f'timestep =  {timestep}')
@@ -196,7 +229,8 @@ class ISMPath(BasePath):
             print(flush=True)
         
         # Set current path
-        currentpath = self
+        currentpath = ISMPath(self.coord, energyfxn, gradientfxn,
+                              self.gradientkwargs, self.integratorfxn)
 
         # ----------------- Relaxation steps ---------------- #
 
@@ -204,6 +238,8 @@ class ISMPath(BasePath):
             print('Starting relaxation steps', flush=True)
         
         # Perform the relaxation steps
+        info = {'relaxsteps': 0, 'relaxconverged': False,
+                'climbsteps': 0, 'climbconverged': False}
         s = time.time()
         for i in range(relaxsteps):
             
@@ -215,16 +251,24 @@ class ISMPath(BasePath):
             
             # Update currentpath to newpath
             currentpath = newpath
+            info['relaxsteps'] = i + 1
 
             # Stop if tolerance reached
             if d < tolerance:
+                info['relaxconverged'] = True
                 break
         
         e = time.time()
+        if relaxsteps > 0 and not info['relaxconverged']:
+            warnings.warn(f'relaxation did not reach tolerance in {relaxsteps} steps',
+                          RuntimeWarning)
         if verbose and relaxsteps > 0:
             print(f'Number of relax steps performed: {i+1}')
             print(f'Final max displacement: {d}')
             print(f'Run time: {e-s} seconds')
+            print(f'Time per step: {(e-s) / (i+1)} seconds')
+            print(f'Energy evaluations: {counts["energy"]}')
+            print(f'Gradient evaluations: {counts["gradient"]}')
             print(flush=True)
         
         # --------- Identify climb coordiates(s) -------- #
@@ -243,6 +287,7 @@ class ISMPath(BasePath):
         # ----------------- Climbing steps ---------------- #
         
         # Perform the climb steps
+        counts['energy'] = counts['gradient'] = 0
         s = time.time()
         for i in range(climbsteps):
             
@@ -254,18 +299,32 @@ class ISMPath(BasePath):
             
             # Update currentpath to newpath
             currentpath = newpath
+            info['climbsteps'] = i + 1
             
             # Stop if tolerance reached
             if d < tolerance:
+                info['climbconverged'] = True
                 break
         
         e = time.time()
+        if climbsteps > 0 and not info['climbconverged']:
+            warnings.warn(f'climbing did not reach tolerance in {climbsteps} steps',
+                          RuntimeWarning)
         if verbose and climbsteps > 0:
             print(f'Number of climb steps performed: {i+1}')
             print(f'Final max displacement: {d}')
             print(f'Run time: {e-s} seconds')
+            print(f'Time per step: {(e-s) / (i+1)} seconds')
+            print(f'Energy evaluations: {counts["energy"]}')
+            print(f'Gradient evaluations: {counts["gradient"]}')
             print(f'Max energy before climb = {energy.max()}', flush=True)
             print(f'Max energy after climb = {currentpath.energy().max()}')
             print(flush=True)
         
-        return currentpath
\ No newline at end of file
+        # Return path with the original energy and gradient functions
+        path = ISMPath(currentpath.coord, self.energyfxn, self.gradientfxn,
+                       self.gradientkwargs, self.integratorfxn)
+        if return_info:
+            return path, info
+        else:
+            return path
\ No newline at end of file
@@ -1,2 +1,4 @@
 # coding: utf-8
-from .central_difference import central_difference
\ No newline at end of file
+from .central_difference import central_difference
+from .complex_step import complex_step
+from .analytic import analytic
@@ -0,0 +1,34 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+def analytic(fxn, coord, gradfxn):
+    """
+    Evaluates a user-supplied analytic gradient function.  Allows for known
+    gradients to be used with the path classes in the same way as the
+    numerical gradient functions.
+    
+    Parameters
+    ----------
+    fxn : function
+        The function to compute gradients for.  Not used, but retained for
+        compatibility with the other gradient functions.
+    coord : array-like object
+        The coordinates to evaluate the gradient at.
+    gradfxn : function
+        The function that returns the gradient of fxn for an array of
+        coordinates.  The returned gradient must have the same shape as
+        coord.
+    
+    Returns
+    -------
+    gradient : array-like object
+        The gradient array with the same shape as coord.
+    """
+    coord = np.asarray(coord)
+    gradient = np.asarray(gradfxn(coord))
+    if gradient.shape != coord.shape:
+        raise ValueError('gradfxn must return an array with the same shape as coord')
+    
+    return gradient
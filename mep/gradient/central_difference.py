@@ -3,7 +3,7 @@
 # http://www.numpy.org/
 import numpy as np
 
-def central_difference(fxn, coord, shift=1e-5):
+def central_difference(fxn, coord, shift=1e-5, order=2, vectorize=False):
     """
     Computes the gradient of a function at a set of coordinates.
     
@@ -18,6 +18,16 @@ def central_difference(fxn, coord, shift=1e-5):
         derivatives will be computed for each of the ten coordinates.
     shift : float
         The shift step size to use when evaluating the derivatives.
+    order : int, optional
+        The order of accuracy of the central difference stencil.  A value
+        of 2 (default) uses the values at ±shift, and a value of 4 uses the
+        values at ±shift and ±2 shift.
+    vectorize : bool, optional
+        If True, all of the displaced coordinates are stacked into a single
+        array of shape (nshifts, *coord.shape) and fxn is called only once.
+        This requires that fxn operates on the final dimension of the array
+        and supports any number of leading dimensions.  If False (default),
+        fxn is called separately for each displacement.
     
     Returns
     -------
@@ -29,22 +39,31 @@ def central_difference(fxn, coord, shift=1e-5):
     # Identify number of derivative dimensions based on final array dimension
     ndim = coord.shape[-1]
     
-    # Build gradient array
-    gradient = np.zeros_like(coord)
-    fps = []
-    fms = []
-    for i in range(ndim):
-        
-        # Create δ vector to displace along one dimension
-        δ = np.zeros(ndim)
-        δ[i] = shift
-        
-        # Compute gradients for that dimension
-        fplus = fxn(coord + δ)
-        fminus = fxn(coord - δ)
-        fps.append(fplus)
-        fms.append(fminus)
-        
-        gradient[..., i] = (fplus - fminus) / (2 * shift)
-    
-    return gradient
\ No newline at end of file
+    # Define the stencil steps and coefficients
+    if order == 2:
+        steps = np.array([1, -1])
+        coeffs = np.array([1, -1])
+        divisor = 2
+    elif order == 4:
+        steps = np.array([2, 1, -1, -2])
+        coeffs = np.array([-1, 8, -8, 1])
+        divisor = 12
+    else:
+        raise ValueError('order must be 2 or 4')
+    
+    # Build δ vectors to displace along each dimension: (ndim, nsteps, ndim)
+    δ = shift * np.einsum('ij,k->ikj', np.identity(ndim), steps)
+    
+    # Evaluate fxn at all displaced coordinates
+    if vectorize:
+        shape = (ndim * len(steps),) + (1,) * (coord.ndim - 1) + (ndim,)
+        values = np.asarray(fxn(coord + δ.reshape(shape)))
+        values = values.reshape((ndim, len(steps)) + values.shape[1:])
+    else:
+        values = np.array([[fxn(coord + δ[i, j]) for j in range(len(steps))]
+                           for i in range(ndim)])
+    
+    # Combine values with the stencil coefficients
+    gradient = np.tensordot(coeffs, values, axes=(0, 1)) / (divisor * shift)
+    
+    return np.moveaxis(gradient, 0, -1)
@@ -0,0 +1,55 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+def complex_step(fxn, coord, shift=1e-20, vectorize=False):
+    """
+    Computes the gradient of a function at a set of coordinates using the
+    complex-step derivative approximation
+    
+        df/dx = Im(f(x + i h)) / h
+    
+    which has no subtractive cancellation error, allowing for very small
+    shift values.  The function must support complex coordinates, i.e. be
+    composed of analytic operations.
+    
+    Parameters
+    ----------
+    fxn : function
+        The function to compute gradients for.
+    coord : array-like object
+        The coordinates to evaluate the gradient at. The number of
+        derivatives calculated will be based on the size of the
+        coordinate's final dimension, i.e. if coord is (10, 3), then three
+        derivatives will be computed for each of the ten coordinates.
+    shift : float, optional
+        The imaginary shift step size to use.  Default value is 1e-20.
+    vectorize : bool, optional
+        If True, all of the displaced coordinates are stacked into a single
+        array of shape (ndim, *coord.shape) and fxn is called only once.
+        This requires that fxn operates on the final dimension of the array
+        and supports any number of leading dimensions.  If False (default),
+        fxn is called separately for each dimension.
+    
+    Returns
+    -------
+    gradient : array-like object
+        The gradient array with the same shape as coord.
+    """
+    coord = np.asarray(coord, dtype=float)
+    
+    # Identify number of derivative dimensions based on final array dimension
+    ndim = coord.shape[-1]
+    
+    # Build imaginary δ vectors to displace along each dimension
+    δ = 1j * shift * np.identity(ndim)
+    
+    # Evaluate fxn at all displaced coordinates
+    if vectorize:
+        shape = (ndim,) + (1,) * (coord.ndim - 1) + (ndim,)
+        values = np.asarray(fxn(coord + δ.reshape(shape)))
+    else:
+        values = np.array([fxn(coord + δ[i]) for i in range(ndim)])
+    
+    return np.moveaxis(np.imag(values) / shift, 0, -1)
@@ -1,3 +1,4 @@
 # coding: utf-8
 from .euler import euler
-from .rungekutta import rungekutta
\ No newline at end of file
+from .rungekutta import rungekutta
+from .rk45 import rk45
@@ -0,0 +1,88 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+# Dormand-Prince 5(4) coefficients
+A = [[],
+     [1/5],
+     [3/40, 9/40],
+     [44/45, -56/15, 32/9],
+     [19372/6561, -25360/2187, 64448/6561, -212/729],
+     [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+     [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84]]
+B5 = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+B4 = np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+def rk45(ratefxn, coord, timestep, errortol=1e-6, maxsubsteps=1000,
+         **kwargs):
+    """
+    Performs adaptive Runge-Kutta ODE integration for a timestep using the
+    Dormand-Prince 5(4) embedded pair.  The timestep is divided into
+    substeps whose sizes are adjusted based on the difference between the
+    fifth and fourth order solutions.
+    
+    The error control only limits the integration error within the
+    timestep.  When used with atomman.mep.ISMPath the points are
+    redistributed after each full timestep, so the timestep must still be
+    kept small for the relaxed path to match the minimum energy path.
+    
+    Parameters
+    ----------
+    ratefxn : function
+        The rate function to use.
+    coord : array-like object
+        The coordinate(s) of the last timestep.
+    timestep : float
+        The timestep value to use.
+    errortol : float, optional
+        The maximum allowed error estimate for the coordinates of each
+        substep.  Default value is 1e-6.
+    maxsubsteps : int, optional
+        The maximum number of substeps to try.  Default value is 1000.
+    **kwargs : any
+        Any extra keyword parameters to pass on to ratefxn.
+    
+    Returns
+    -------
+    array-like object
+        The coordinate(s) moved forward by timestep.
+    
+    Raises
+    ------
+    RuntimeError
+        If the timestep is not completed within maxsubsteps substeps.
+    """
+    coord = np.asarray(coord)
+    
+    t = 0.0
+    h = timestep
+    k1 = ratefxn(coord, **kwargs)
+    for i in range(maxsubsteps):
+        h = min(h, timestep - t)
+        
+        # Evaluate stages
+        k = [k1]
+        for a in A[1:]:
+            k.append(ratefxn(coord + h * sum(aj * kj for aj, kj in zip(a, k)), **kwargs))
+        
+        # Compute fifth order solution and error estimate
+        newcoord = coord + h * sum(b * kj for b, kj in zip(B5, k) if b != 0)
+        error = np.abs(h * sum((b5 - b4) * kj for b5, b4, kj in zip(B5, B4, k))).max()
+        
+        # Accept step
+        if error <= errortol:
+            t += h
+            coord = newcoord
+            k1 = k[6]
+            if np.isclose(t, timestep, rtol=1e-12, atol=0.0):
+                return coord
+        
+        # Adjust substep size
+        if error == 0.0:
+            factor = 5.0
+        else:
+            factor = min(5.0, max(0.2, 0.9 * (errortol / error)**0.2))
+        h *= factor
+    
+    raise RuntimeError('rk45 failed to converge within maxsubsteps')
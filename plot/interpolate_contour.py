@@ -1,10 +1,15 @@
 # coding: utf-8
+# Standard Python libraries
+from collections import OrderedDict
+import hashlib
 
 # http://www.numpy.org/
 import numpy as np
 
 # https://www.scipy.org/
-from scipy.interpolate import griddata
+from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.ndimage import gaussian_filter
+from scipy.spatial import Delaunay
 
 # https://matplotlib.org/
 import matplotlib.patches as mpatches
@@ -21,7 +26,8 @@ def interpolate_contour(system, name, property=None, index=None, magnitude=False
                         plotxaxis='x', plotyaxis='y', xlim=None, ylim=None,
                         zlim=None, xbins=200, ybins=200, dots=True, czero=True,
                         save=False, show=True, length_unit='angstrom',
-                        property_unit=None, cmap='jet'):
+                        property_unit=None, cmap='jet', method='cubic',
+                        sigma=None):
     """
     Creates a contour plot of a system's per-atom properties by interpolating
     properties between atoms.
@@ -94,6 +100,11 @@ def interpolate_contour(system, name, property=None, index=None, magnitude=False
         is None, in which no unit conversion is applied.
     cmap : str, optional
         The name of the matplotlib colormap to use.  Default value is 'jet'.
+    method : str, optional
+        The interpolation method used by grid_interpolate_2d: 'cubic'
+        (default), 'linear', 'binned' or 'gaussian'.
+    sigma : float, optional
+        The Gaussian width in length_unit to use with method 'gaussian'.
     
     Returns
     -------
@@ -170,7 +181,9 @@ def interpolate_contour(system, name, property=None, index=None, magnitude=False
     v = uc.get_in_units(property[in_bounds], property_unit)
     
     # Generate interpolation grid
-    grid, xedges, yedges = grid_interpolate_2d(x, y, v, xbins=xbins, ybins=ybins, range=[xlim, ylim])
+    grid, xedges, yedges = grid_interpolate_2d(x, y, v, xbins=xbins, ybins=ybins,
+                                               range=[xlim, ylim], method=method,
+                                               sigma=sigma)
     
     # Compute intsum and avsum values
     intsum = np.sum(grid)
@@ -193,10 +206,19 @@ def interpolate_contour(system, name, property=None, index=None, magnitude=False
     
     return intsum, avsum
     
-def grid_interpolate_2d(x, y, v, xbins=50, ybins=50, range=None):
+# Recently used triangulations and linear weights, keyed by coordinates
+_triangulation_cache = OrderedDict()
+_triangulation_cache_size = 4
+_weights_cache_size = 4
+
+def grid_interpolate_2d(x, y, v, xbins=50, ybins=50, range=None, method='cubic',
+                        sigma=None):
     """
     Generates 2D grid of property values by interpolating between measured
-    values.
+    values.  The Delaunay triangulation of the coordinates, and the linear
+    interpolation weights of the grid points, are cached so that
+    interpolating several properties of the same atoms only builds them
+    once.
     
     Parameters
     ----------
@@ -215,6 +237,18 @@ def grid_interpolate_2d(x, y, v, xbins=50, ybins=50, range=None):
     range : list, tuple or array-like object
         2x2 list of the [[xmin, xmax], [ymin, ymax]] coordinates for the bins.
         If not given, will use [[x.min(), x.max()], [y.min(), y.max()]].
+    method : str, optional
+        The interpolation method.  'cubic' (default) uses piecewise cubic
+        Clough-Tocher interpolation, as scipy.interpolate.griddata.  'linear'
+        uses piecewise linear barycentric interpolation.  Grid points outside
+        the atoms' convex hull are nan for both.  'binned' averages the
+        values of the atoms closest to each grid point, and 'gaussian'
+        averages the values with Gaussian weights of width sigma.  Both
+        scale linearly with the number of atoms and leave grid points with
+        no nearby atoms as nan.
+    sigma : float, optional
+        The Gaussian width to use with method 'gaussian'.  Default value of
+        None uses twice the larger grid spacing.
     
     Returns
     -------
@@ -225,6 +259,10 @@ def grid_interpolate_2d(x, y, v, xbins=50, ybins=50, range=None):
     yedges : list
         The min, max values of y associated with the grid.
     """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    v = np.asarray(v, dtype=float)
+    
     # Handle range and bins options
     if range is None:
         range=[[x.min() ,x.max()], [y.min(), y.max()]]
@@ -233,14 +271,95 @@ def grid_interpolate_2d(x, y, v, xbins=50, ybins=50, range=None):
     xi = np.linspace(range[0][0], range[0][1], num=xbins)
     yi = np.linspace(range[1][0], range[1][1], num=ybins)
     
-    # Generate 2D grid points
-    x0, y0 = np.meshgrid(xi, yi)
+    if method == 'cubic':
+        x0, y0 = np.meshgrid(xi, yi)
+        interpolator = CloughTocher2DInterpolator(_triangulation(x, y)['tri'], v)
+        grid = interpolator(x0, y0)
+    
+    elif method == 'linear':
+        vertices, weights = _linear_weights(x, y, xi, yi)
+        grid = np.sum(v[vertices] * weights, axis=2)
+    
+    elif method in ['binned', 'gaussian']:
+        
+        # Bins centered on the grid points
+        dx = (xi[-1] - xi[0]) / max(xbins - 1, 1)
+        dy = (yi[-1] - yi[0]) / max(ybins - 1, 1)
+        xe = np.linspace(xi[0] - dx / 2, xi[-1] + dx / 2, num=xbins + 1)
+        ye = np.linspace(yi[0] - dy / 2, yi[-1] + dy / 2, num=ybins + 1)
+        total = np.histogram2d(y, x, bins=[ye, xe], weights=v)[0]
+        count = np.histogram2d(y, x, bins=[ye, xe])[0]
+        
+        # Spread sums and counts with the same Gaussian kernel
+        if method == 'gaussian':
+            if sigma is None:
+                sigma = 2 * max(dx, dy)
+            total = gaussian_filter(total, sigma=(sigma / dy, sigma / dx), mode='constant')
+            count = gaussian_filter(count, sigma=(sigma / dy, sigma / dx), mode='constant')
+            count[count < 1e-3] = 0.0
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            grid = np.where(count > 0, total / count, np.nan)
     
-    # Interpolate values to grid points
-    grid = griddata((x, y), v, (x0, y0),method='cubic')
+    else:
+        raise ValueError('method must be cubic, linear, binned or gaussian')
     
     return grid, range[0], range[1]
 
+def _triangulation(x, y):
+    """
+    Returns the cache entry containing the Delaunay triangulation, 'tri', of
+    the given coordinates, building it if needed.
+    """
+    x = np.ascontiguousarray(x, dtype=float)
+    y = np.ascontiguousarray(y, dtype=float)
+    digest = hashlib.sha256(x.tobytes())
+    digest.update(y.tobytes())
+    key = (len(x), digest.hexdigest())
+    
+    # Compare the stored coordinates so that a digest match is never trusted alone
+    entry = _triangulation_cache.get(key)
+    if (entry is not None and np.array_equal(entry['x'], x)
+            and np.array_equal(entry['y'], y)):
+        _triangulation_cache.move_to_end(key)
+    else:
+        entry = {'x': x.copy(), 'y': y.copy(),
+                 'tri': Delaunay(np.column_stack([x, y])),
+                 'weights': OrderedDict()}
+        _triangulation_cache[key] = entry
+        _triangulation_cache.move_to_end(key)
+        if len(_triangulation_cache) > _triangulation_cache_size:
+            _triangulation_cache.popitem(last=False)
+    return entry
+
+def _linear_weights(x, y, xi, yi):
+    """
+    Returns the triangle vertices and barycentric weights of each grid point
+    for linear interpolation.  Grid points outside the triangulation have nan
+    weights.
+    """
+    cache = _triangulation(x, y)
+    key = (xi[0], xi[-1], len(xi), yi[0], yi[-1], len(yi))
+    if key in cache['weights']:
+        cache['weights'].move_to_end(key)
+    else:
+        tri = cache['tri']
+        x0, y0 = np.meshgrid(xi, yi)
+        points = np.stack([x0, y0], axis=-1)
+        
+        # Barycentric coordinates of each point in its containing triangle
+        simplex = tri.find_simplex(points)
+        transform = tri.transform[simplex]
+        b = np.einsum('...ij,...j->...i', transform[..., :2, :], points - transform[..., 2, :])
+        weights = np.concatenate([b, 1 - b.sum(axis=-1, keepdims=True)], axis=-1)
+        weights[simplex < 0] = np.nan
+        
+        cache['weights'][key] = (tri.simplices[simplex], weights)
+        if len(cache['weights']) > _weights_cache_size:
+            cache['weights'].popitem(last=False)
+    
+    return cache['weights'][key]
+
 def prettygrid(grid, xedges, yedges, cmap='jet', propname='', czero=True,
                scale=1):
     """
@@ -0,0 +1,106 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+class BinIndex():
+    """
+    Spatial index that sorts points into regular cubic bins so that the
+    points near a bounding box can be found without checking every point.
+    Building the index once allows for many region selections of the same
+    points.
+    """
+
+    def __init__(self, pos, binsize=None):
+        """
+        Builds the index.
+
+        Parameters
+        ----------
+        pos : array-like object
+            Nx3 array of coordinates.
+        binsize : float, optional
+            The edge length of the cubic bins.  Default value of None selects
+            a size giving about 8 points per bin.
+        """
+        pos = np.asarray(pos, dtype=float)
+        assert pos.ndim == 2 and pos.shape[1] == 3, 'pos must be an Nx3 array'
+
+        lo = pos.min(axis=0, initial=np.inf) if len(pos) > 0 else np.zeros(3)
+        hi = pos.max(axis=0, initial=-np.inf) if len(pos) > 0 else np.zeros(3)
+        extent = hi - lo
+
+        # Default bins hold about 8 points, but never more than 8N bins exist
+        if binsize is None:
+            volume = np.prod(np.maximum(extent, extent.max() / 100 + 1e-8))
+            binsize = (8 * volume / max(len(pos), 1))**(1 / 3)
+        binsize = float(binsize)
+        assert binsize > 0, 'binsize must be positive'
+        while np.prod(np.floor(extent / binsize) + 1) > 8 * max(len(pos), 1):
+            binsize *= 2
+
+        bins = np.floor((pos - lo) / binsize).astype(np.int64)
+        nbins = np.floor(extent / binsize).astype(np.int64) + 1
+        flat = np.ravel_multi_index(bins.T, nbins)
+
+        self.__lo = lo
+        self.__binsize = binsize
+        self.__nbins = nbins
+        self.__order = np.argsort(flat, kind='stable')
+        self.__starts = np.concatenate([[0], np.cumsum(np.bincount(flat, minlength=np.prod(nbins)))])
+
+    @property
+    def binsize(self):
+        """float : The edge length of the cubic bins"""
+        return self.__binsize
+
+    @property
+    def nbins(self):
+        """numpy.NDArray : The number of bins along each Cartesian direction"""
+        return self.__nbins
+
+    def __len__(self):
+        """int : The number of indexed points"""
+        return len(self.__order)
+
+    def candidates(self, lo, hi):
+        """
+        Finds all points in the bins that overlap a bounding box.  This
+        includes all points inside the bounding box, and may include some
+        points near the box.
+
+        Parameters
+        ----------
+        lo : array-like object
+            The 3D vector of the box's lower bounds.  Values can be -inf.
+        hi : array-like object
+            The 3D vector of the box's upper bounds.  Values can be inf.
+
+        Returns
+        -------
+        numpy.NDArray
+            The indices of the candidate points.
+        """
+        with np.errstate(invalid='ignore'):
+            blo = np.floor((np.asarray(lo, dtype=float) - self.__lo) / self.binsize)
+            bhi = np.floor((np.asarray(hi, dtype=float) - self.__lo) / self.binsize)
+        if (len(self) == 0 or np.any(np.isnan(blo)) or np.any(np.isnan(bhi))
+            or np.any(bhi < 0) or np.any(blo > self.nbins - 1) or np.any(blo > bhi)):
+            return np.zeros(0, dtype=np.int64)
+        blo = np.clip(blo, 0, self.nbins - 1).astype(np.int64)
+        bhi = np.clip(bhi, 0, self.nbins - 1).astype(np.int64)
+
+        # Bins are ordered with z fastest, so each (x, y) column of bins
+        # is one contiguous range of the sorted points
+        ix, iy = np.meshgrid(np.arange(blo[0], bhi[0] + 1),
+                             np.arange(blo[1], bhi[1] + 1), indexing='ij')
+        ix = ix.ravel()
+        iy = iy.ravel()
+        first = np.ravel_multi_index((ix, iy, np.full(len(ix), blo[2])), self.nbins)
+        last = np.ravel_multi_index((ix, iy, np.full(len(ix), bhi[2])), self.nbins)
+        starts = self.__starts[first]
+        lengths = self.__starts[last + 1] - starts
+
+        # Gather all ranges at once
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return self.__order[offsets + np.arange(lengths.sum())]
@@ -0,0 +1,190 @@
+# coding: utf-8
+
+# http://www.numpy.org/
+import numpy as np
+
+from . import Shape
+
+class CompositeShape(Shape):
+    """
+    Template class for shapes built by combining other shapes.  The
+    combined shape is evaluated in one pass over chunks of positions, with
+    points outside the bounding box skipped and each sub-shape only
+    evaluated for the points whose result is still undecided.
+    """
+
+    # Number of positions evaluated together
+    chunksize = 65536
+
+    def __init__(self, shapes):
+        """
+        Defines a shape combined from other shapes.
+
+        Parameters
+        ----------
+        shapes : list of atomman.region.Shape
+            The shapes to combine.
+        """
+        self.shapes = shapes
+
+    @property
+    def shapes(self):
+        """list of atomman.region.Shape : The shapes that are combined"""
+        return self.__shapes
+
+    @shapes.setter
+    def shapes(self, value):
+        value = list(value)
+        for v in value:
+            assert isinstance(v, Shape), 'shapes must be atomman.region.Shape objects'
+        assert len(value) > 0, 'at least one shape is required'
+        self.__shapes = value
+
+    def inside(self, pos, inclusive=True):
+        """
+        Indicates if position(s) are inside the shape.
+
+        Parameters
+        ----------
+        pos : array-like object
+            Nx3 array of coordinates.
+        inclusive : bool, optional
+            Indicates if points on the shape's boundaries are to be included.
+            Default value is True.
+
+        Returns
+        -------
+        numpy.NDArray
+            N array of bool values: True if inside shape
+        """
+        # Ensure pos is a numpy array
+        pos = np.asarray(pos)
+        lo, hi = _padded(*self.bounds())
+
+        result = np.zeros(len(pos), dtype=bool)
+        for start in range(0, len(pos), self.chunksize):
+            chunk = pos[start:start + self.chunksize]
+
+            # Skip points outside the bounding box
+            index = np.where(np.all((chunk >= lo) & (chunk <= hi), axis=1))[0]
+            result[start + index] = self._evaluate(chunk[index], inclusive)
+
+        return result
+
+    def _evaluate(self, pos, inclusive):
+        """Evaluates the combined shape for points within its bounds"""
+        raise NotImplementedError('Base composite shape class cannot be directly used')
+
+class Union(CompositeShape):
+    """
+    Class representing the points inside any of a set of shapes.
+    """
+
+    def _evaluate(self, pos, inclusive):
+        """Evaluates the union for points within its bounds"""
+        result = np.zeros(len(pos), dtype=bool)
+        index = np.arange(len(pos))
+        for shape in self.shapes:
+            inside = shape.inside(pos[index], inclusive=inclusive)
+            result[index[inside]] = True
+            index = index[~inside]
+        return result
+
+    def bounds(self):
+        """
+        Returns an axis-aligned bounding box for the shape.
+
+        Returns
+        -------
+        lo : numpy.NDArray
+            The 3D vector of the lower bounds.
+        hi : numpy.NDArray
+            The 3D vector of the upper bounds.
+        """
+        bounds = [shape.bounds() for shape in self.shapes]
+        return (np.min([b[0] for b in bounds], axis=0),
+                np.max([b[1] for b in bounds], axis=0))
+
+class Intersection(CompositeShape):
+    """
+    Class representing the points inside all of a set of shapes.
+    """
+
+    def _evaluate(self, pos, inclusive):
+        """Evaluates the intersection for points within its bounds"""
+        index = np.arange(len(pos))
+        for shape in self.shapes:
+            index = index[shape.inside(pos[index], inclusive=inclusive)]
+        result = np.zeros(len(pos), dtype=bool)
+        result[index] = True
+        return result
+
+    def bounds(self):
+        """
+        Returns an axis-aligned bounding box for the shape.
+
+        Returns
+        -------
+        lo : numpy.NDArray
+            The 3D vector of the lower bounds.
+        hi : numpy.NDArray
+            The 3D vector of the upper bounds.
+        """
+        bounds = [shape.bounds() for shape in self.shapes]
+        return (np.max([b[0] for b in bounds], axis=0),
+                np.min([b[1] for b in bounds], axis=0))
+
+class Difference(CompositeShape):
+    """
+    Class representing the points inside one shape but not inside any of a
+    set of other shapes.
+    """
+
+    def __init__(self, shape, others):
+        """
+        Defines a difference of shapes.
+
+        Parameters
+        ----------
+        shape : atomman.region.Shape
+            The shape to subtract from.
+        others : atomman.region.Shape or list of atomman.region.Shape
+            The shape(s) to subtract.
+        """
+        if isinstance(others, Shape):
+            others = [others]
+        super().__init__([shape] + list(others))
+
+    def _evaluate(self, pos, inclusive):
+        """
+        Evaluates the difference for points within its bounds.  With
+        inclusive, points on the boundaries of the subtracted shapes are
+        kept.
+        """
+        index = np.arange(len(pos))
+        index = index[self.shapes[0].inside(pos, inclusive=inclusive)]
+        for shape in self.shapes[1:]:
+            index = index[~shape.inside(pos[index], inclusive=not inclusive)]
+        result = np.zeros(len(pos), dtype=bool)
+        result[index] = True
+        return result
+
+    def bounds(self):
+        """
+        Returns an axis-aligned bounding box for the shape.
+
+        Returns
+        -------
+        lo : numpy.NDArray
+            The 3D vector of the lower bounds.
+        hi : numpy.NDArray
+            The 3D vector of the upper bounds.
+        """
+        return self.shapes[0].bounds()
+
+def _padded(lo, hi):
+    """Slightly enlarges bounds so that boundary points are never skipped"""
+    with np.errstate(invalid='ignore'):
+        lo = lo - 1e-8 * np.maximum(1.0, np.abs(lo))
+        hi = hi + 1e-8 * np.maximum(1.0, np.abs(hi))
+    return lo, hi
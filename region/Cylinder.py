@@ -3,7 +3,7 @@
 # http://www.numpy.org/
 import numpy as np
 
-from . import Shape, Plane
+from . import Shape
 
 class Cylinder(Shape):
     """
@@ -113,20 +113,54 @@ class Cylinder(Shape):
         
         axis = self.axis
         
-        # Find points <= radius from axis
+        if self.endcaps:
+            # Test the cheap end planes first, using the same normal vectors
+            # as the Plane objects for the two ends
+            normal1 = -axis / np.linalg.norm(-axis)
+            normal2 = axis / np.linalg.norm(axis)
+            if inclusive:
+                insideends = ((np.inner(normal1, pos) <= np.dot(normal1, self.center1))
+                            & (np.inner(normal2, pos) <= np.dot(normal2, self.center2)))
+            else:
+                insideends = ((np.inner(normal1, pos) < np.dot(normal1, self.center1))
+                            & (np.inner(normal2, pos) < np.dot(normal2, self.center2)))
+            
+            # Only find distances from the axis for points between the ends
+            result = np.zeros(len(pos), dtype=bool)
+            index = np.where(insideends)[0]
+            result[index] = self.__insidecircle(pos[index], axis, inclusive)
+            return result
+        
+        else:
+            return self.__insidecircle(pos, axis, inclusive)
+
+    def __insidecircle(self, pos, axis, inclusive):
+        """Finds points <= radius from axis"""
         distfromaxis = np.linalg.norm(np.cross(pos - self.center1, axis), axis=-1)
         if inclusive:
-            insidecircle = distfromaxis <= self.radius
+            return distfromaxis <= self.radius
         else:
-            insidecircle = distfromaxis < self.radius
+            return distfromaxis < self.radius
 
-        if self.endcaps:
-            # Define end planes
-            plane1 = Plane(-axis, self.center1)
-            plane2 = Plane(axis, self.center2)
-        
-            # Combine tests
-            return insidecircle & plane1.below(pos, inclusive=inclusive) & plane2.below(pos, inclusive=inclusive)
+    def bounds(self):
+        """
+        Returns an axis-aligned bounding box for the shape.  Without endcaps,
+        the cylinder is unbounded along all directions not perpendicular to
+        its axis.
         
+        Returns
+        -------
+        lo : numpy.NDArray
+            The 3D vector of the lower bounds.
+        hi : numpy.NDArray
+            The 3D vector of the upper bounds.
+        """
+        axis = self.axis
+        extent = self.radius * np.sqrt(np.clip(1 - axis**2, 0.0, 1.0))
+        if self.endcaps:
+            lo = np.minimum(self.center1, self.center2) - extent
+            hi = np.maximum(self.center1, self.center2) + extent
         else:
-            return insidecircle
\ No newline at end of file
+            lo = np.where(axis == 0.0, self.center1 - extent, -np.inf)
+            hi = np.where(axis == 0.0, self.center1 + extent, np.inf)
+        return lo, hi
@@ -1,4 +1,6 @@
 # coding: utf-8
+# Standard Python libraries
+from itertools import combinations
 
 # http://www.numpy.org/
 import numpy as np
@@ -57,11 +59,53 @@ class PlaneSet(Shape):
         # Ensure pos is a numpy array 
         pos = np.asarray(pos)
         
-        # Construct test array with all Trues
-        insideplanes = np.ones(len(pos), dtype=bool)
-        
-        # Loop over each plane and check if pos are below
+        # Check each plane only for the points that are below all previous planes
+        index = np.arange(len(pos))
         for plane in self.planes:
-            insideplanes = insideplanes & plane.below(pos, inclusive=inclusive)
+            index = index[plane.below(pos[index], inclusive=inclusive)]
+        
+        insideplanes = np.zeros(len(pos), dtype=bool)
+        insideplanes[index] = True
+        
+        return insideplanes
+
+    def bounds(self):
+        """
+        Returns an axis-aligned bounding box for the shape from the corners
+        of the planes.  Directions in which the shape is unbounded have
+        infinite limits.
+        
+        Returns
+        -------
+        lo : numpy.NDArray
+            The 3D vector of the lower bounds.
+        hi : numpy.NDArray
+            The 3D vector of the upper bounds.
+        """
+        # Close the shape with a very large cube
+        big = 1e12
+        normals = [plane.normal for plane in self.planes] + list(np.vstack([np.identity(3), -np.identity(3)]))
+        offsets = [np.dot(plane.normal, plane.point) for plane in self.planes] + [big] * 6
+        normals = np.array(normals)
+        offsets = np.array(offsets)
+        
+        # Find the corners where any three planes intersect inside all planes
+        corners = []
+        for i, j, k in combinations(range(len(normals)), 3):
+            A = normals[[i, j, k]]
+            if abs(np.linalg.det(A)) < 1e-10:
+                continue
+            corner = np.linalg.solve(A, offsets[[i, j, k]])
+            if np.all(normals.dot(corner) <= offsets + 1e-6 * np.maximum(1.0, np.abs(offsets))):
+                corners.append(corner)
+        
+        # Empty shape
+        if len(corners) == 0:
+            return np.full(3, np.inf), np.full(3, -np.inf)
         
-        return insideplanes
\ No newline at end of file
+        corners = np.array(corners)
+        lo = corners.min(axis=0)
+        hi = corners.max(axis=0)
+        lo[lo <= -big / 2] = -np.inf
+        hi[hi >= big / 2] = np.inf
+        return lo, hi
@@ -1,5 +1,8 @@
 # coding: utf-8
 
+# http://www.numpy.org/
+import numpy as np
+
 class Shape():
     """
     Template class for defining geometric regions in space.
@@ -48,4 +51,30 @@ class Shape():
             N array of bool values: True if outside shape
         """
         return ~self.inside(pos, inclusive=not inclusive)
-        
\ No newline at end of file
+
+    def bounds(self):
+        """
+        Returns an axis-aligned bounding box for the shape, which allows
+        points far from the shape to be skipped.  Directions in which the
+        shape is unbounded have infinite limits.
+        
+        Returns
+        -------
+        lo : numpy.NDArray
+            The 3D vector of the lower bounds.
+        hi : numpy.NDArray
+            The 3D vector of the upper bounds.
+        """
+        return np.full(3, -np.inf), np.full(3, np.inf)
+
+    def __and__(self, other):
+        from .CompositeShape import Intersection
+        return Intersection([self, other])
+
+    def __or__(self, other):
+        from .CompositeShape import Union
+        return Union([self, other])
+
+    def __sub__(self, other):
+        from .CompositeShape import Difference
+        return Difference(self, other)
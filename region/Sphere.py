@@ -78,4 +78,17 @@ class Sphere(Shape):
         if inclusive:
             return rpos <= self.radius
         else:
-            return rpos < self.radius
\ No newline at end of file
+            return rpos < self.radius
+
+    def bounds(self):
+        """
+        Returns an axis-aligned bounding box for the shape.
+        
+        Returns
+        -------
+        lo : numpy.NDArray
+            The 3D vector of the lower bounds.
+        hi : numpy.NDArray
+            The 3D vector of the upper bounds.
+        """
+        return self.center - self.radius, self.center + self.radius
@@ -5,6 +5,10 @@ from .Plane import Plane
 from .PlaneSet import PlaneSet
 from .Sphere import Sphere
 from .Cylinder import Cylinder
+from .CompositeShape import CompositeShape, Union, Intersection, Difference
+from .BinIndex import BinIndex
+from .select import select
 
 
-__all__ = ['Plane', 'PlaneSet', 'Sphere', 'Cylinder', 'Shape']
\ No newline at end of file
+__all__ = ['Plane', 'PlaneSet', 'Sphere', 'Cylinder', 'Shape', 'CompositeShape',
+           'Union', 'Intersection', 'Difference', 'BinIndex', 'select']
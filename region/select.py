@@ -0,0 +1,68 @@
+# coding: utf-8
+# Standard Python libraries
+from itertools import product
+
+# http://www.numpy.org/
+import numpy as np
+
+from .CompositeShape import _padded
+
+def select(shape, pos, inclusive=True, index=None, box=None, pbc=None):
+    """
+    Identifies the points inside a shape, which can be a composite of other
+    shapes.  Only points inside the shape's bounding box are evaluated, and
+    periodic images of the points can be included.
+
+    Parameters
+    ----------
+    shape : atomman.region.Shape
+        The shape, or composite shape built with &, | and -, to select.
+    pos : array-like object
+        Nx3 array of coordinates.
+    inclusive : bool, optional
+        Indicates if points on the shape's boundaries are to be included.
+        Default value is True.
+    index : atomman.region.BinIndex, optional
+        A spatial index built for pos.  If given, only the points in the
+        bins overlapping the shape's bounding box are evaluated.  Otherwise,
+        the bounding box is checked for all points.
+    box : atomman.Box, optional
+        The box to use for periodic images.  Required if pbc is given.
+    pbc : list of bool, optional
+        The periodic boundary conditions.  If given, a point is selected if
+        any of its images shifted by -1, 0 or +1 box vectors along the
+        periodic directions is inside the shape.
+
+    Returns
+    -------
+    numpy.NDArray
+        N array of bool values: True if the point or one of its periodic
+        images is inside the shape.
+    """
+    # Ensure pos is a numpy array
+    pos = np.asarray(pos)
+    lo, hi = _padded(*shape.bounds())
+
+    # Build the periodic image shifts
+    if pbc is not None and np.any(pbc):
+        if box is None:
+            raise ValueError('box is required for periodic images')
+        ranges = [(-1, 0, 1) if p else (0,) for p in pbc]
+        shifts = [np.dot(n, box.vects) for n in product(*ranges)]
+    else:
+        shifts = [np.zeros(3)]
+
+    result = np.zeros(len(pos), dtype=bool)
+    for shift in shifts:
+
+        # Points whose shifted image can be inside the bounding box
+        if index is not None:
+            candidates = index.candidates(lo - shift, hi - shift)
+        else:
+            candidates = np.where(np.all((pos >= lo - shift) & (pos <= hi - shift), axis=1))[0]
+        candidates = candidates[~result[candidates]]
+
+        inside = shape.inside(pos[candidates] + shift, inclusive=inclusive)
+        result[candidates[inside]] = True
+
+    return result
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+# https://docs.pytest.org/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+import atomman as am
+
+def gammasurface(remove=None):
+    """Builds a GammaSurface on a regular 10x10 grid, optionally removing a point"""
+    a1, a2 = np.meshgrid(np.linspace(0, 1, 11)[:-1], np.linspace(0, 1, 11)[:-1])
+    a1 = a1.flatten()
+    a2 = a2.flatten()
+    E_gsf = np.sin(np.pi * a1)**2 + np.sin(np.pi * a2)**2
+    if remove is not None:
+        a1 = np.delete(a1, remove)
+        a2 = np.delete(a2, remove)
+        E_gsf = np.delete(E_gsf, remove)
+    return am.defect.GammaSurface(a1vect=[1, 0, 0], a2vect=[0, 1, 0],
+                                  a1=a1, a2=a2, E_gsf=E_gsf)
+
+def test_failed_spline_fit_keeps_rbf():
+    gamma = gammasurface(remove=55)
+    E_gsf = gamma.E_gsf(a1=[0.25, 0.6], a2=[0.35, 0.8])
+
+    with pytest.raises(ValueError):
+        gamma.interpolation = 'spline'
+    assert gamma.interpolation == 'rbf'
+    assert np.allclose(gamma.E_gsf(a1=[0.25, 0.6], a2=[0.35, 0.8]), E_gsf)
+    gamma.E_gsf_gradient(a1=[0.25, 0.6], a2=[0.35, 0.8])
+
+def test_invalid_interpolation_name():
+    gamma = gammasurface()
+    with pytest.raises(ValueError):
+        gamma.interpolation = 'foo'
+    assert gamma.interpolation == 'rbf'
+
+    with pytest.raises(ValueError):
+        gamma.fit(interpolation='foo')
+    assert gamma.interpolation == 'rbf'
+
+    with pytest.raises(ValueError):
+        am.defect.GammaSurface(interpolation='foo')
+
+def test_spline_fit():
+    gamma = gammasurface()
+    gamma.interpolation = 'spline'
+    assert gamma.interpolation == 'spline'
+    assert np.isclose(gamma.E_gsf(a1=0.5, a2=0.0), 1.0)
+
+def test_mep_three_point_pos():
+    gamma = gammasurface()
+    gamma.interpolation = 'spline'
+    results = gamma.mep(pos=[[0, 0, 0], [0.4, 0.35, 0], [1, 0, 0]],
+                        relaxsteps=50)
+    assert results['path'].coord.shape[1] == 2
+
+    with pytest.raises(ValueError):
+        gamma.mep(pos=[[0, 0, 0], [0.4, 0.35, 0], [1, 0, 0]], npoints=50)
+
+def test_mep_matches_rk():
+    n = 30
+    a1, a2 = np.meshgrid(np.linspace(0, 1, n + 1)[:-1], np.linspace(0, 1, n + 1)[:-1])
+    a1 = a1.flatten()
+    a2 = a2.flatten()
+    E_gsf = (np.sin(np.pi * a1)**2 + 0.5 * np.sin(np.pi * a2)**2
+             + 0.3 * np.sin(np.pi * (a1 + a2))**2)
+    gamma = am.defect.GammaSurface(a1vect=[1, 0, 0], a2vect=[0, 1, 0],
+                                   a1=a1, a2=a2, E_gsf=E_gsf,
+                                   interpolation='spline')
+    pos = [[0, 0, 0], [1, 0, 0]]
+
+    results = gamma.mep(pos=pos)
+    reference = gamma.mep(pos=pos, integratorfxn='rk')
+    assert results['converged']
+    assert reference['converged']
+
+    # Compare against the fixed step path
+    path = results['path']
+    assert np.allclose(path.coord, reference['path'].coord, rtol=0, atol=2e-3)
+    assert np.isclose(results['E_usf'], reference['E_usf'], rtol=1e-4)
+
+    # Check the gradient perpendicular to the path
+    grad = path.grad_energy(path.coord)
+    τ = path.unittangent
+    perp = grad - np.einsum('ij,ij->i', grad, τ)[:, np.newaxis] * τ
+    assert np.linalg.norm(perp, axis=1)[1:-1].max() < 0.05
@@ -0,0 +1,97 @@
+# coding: utf-8
+
+# https://docs.pytest.org/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+import atomman as am
+
+def sdvpn(**kwargs):
+    """Builds an SDVPN model with all energy terms active"""
+    a1, a2 = np.meshgrid(np.linspace(0, 1, 21)[:-1], np.linspace(0, 1, 21)[:-1])
+    a1 = a1.flatten()
+    a2 = a2.flatten()
+    E_gsf = 0.1 * np.sin(np.pi * a1)**2 + 0.05 * np.sin(np.pi * a2)**2
+    gamma = am.defect.GammaSurface(a1vect=[1, 0, 0], a2vect=[0, 0, 1],
+                                   a1=a1, a2=a2, E_gsf=E_gsf,
+                                   interpolation='spline')
+
+    C = am.ElasticConstants(C11=1.0, C12=0.4, C44=0.3)
+    volterra = am.defect.IsotropicVolterraDislocation(C, [1.0, 0.0, 0.0])
+
+    tau = np.zeros((3, 3))
+    tau[0, 1] = tau[1, 0] = 0.01
+    tau[1, 2] = tau[2, 1] = 0.005
+    beta = np.zeros((3, 3))
+    beta[0, 0] = 0.02
+    beta[2, 2] = 0.01
+
+    return am.defect.SDVPN(volterra=volterra, gamma=gamma, tau=tau,
+                           alpha=[0.01, 0.005], beta=beta, **kwargs)
+
+def disregistry(x):
+    """Mixed edge-screw arctan disregistry with a small random perturbation"""
+    δ = am.defect.pn_arctan_disregistry(x=x, burgers=np.array([1.0, 0.0, 0.3]),
+                                        halfwidth=1.5)[1]
+    rng = np.random.default_rng(4)
+    δ[1:-1, 0] += rng.normal(scale=0.01, size=len(x) - 2)
+    δ[1:-1, 2] += rng.normal(scale=0.01, size=len(x) - 2)
+    return δ
+
+def finite_difference(model, x, δ, h=1e-6):
+    """Central difference gradient of the total energy"""
+    gradient = np.zeros_like(δ)
+    for i in range(len(x)):
+        for j in [0, 2]:
+            δp = δ.copy()
+            δm = δ.copy()
+            δp[i, j] += h
+            δm[i, j] -= h
+            gradient[i, j] = (model.total_energy(x, δp)
+                              - model.total_energy(x, δm)) / (2 * h)
+    return gradient
+
+@pytest.mark.parametrize('cdiff', [False, True])
+@pytest.mark.parametrize('fullstress', [True, False])
+def test_gradient_uniform(cdiff, fullstress):
+    model = sdvpn(cdiffelastic=cdiff, cdiffsurface=cdiff, fullstress=fullstress)
+    x = np.linspace(-6, 6, 25)
+    δ = disregistry(x)
+    assert np.allclose(model.total_gradient(x, δ),
+                       finite_difference(model, x, δ), rtol=1e-5, atol=1e-8)
+
+@pytest.mark.parametrize('cdiff', [False, True])
+@pytest.mark.parametrize('fullstress', [True, False])
+def test_gradient_nonuniform(cdiff, fullstress):
+    model = sdvpn(cdiffelastic=cdiff, cdiffsurface=cdiff, fullstress=fullstress)
+    x = am.defect.pn_graded_x(10, 0.5, 2, ratio=1.3)
+    δ = disregistry(x)
+    assert np.allclose(model.total_gradient(x, δ),
+                       finite_difference(model, x, δ), rtol=1e-5, atol=1e-8)
+
+@pytest.mark.parametrize('cdiff', [False, True])
+def test_elastic_energy_fft(cdiff):
+    model = sdvpn(cdiffelastic=cdiff)
+    x = np.linspace(-6, 6, 41)
+    δ = disregistry(x)
+
+    # Direct double sum over χ(i,j,Δx)
+    def ψ(k, Δx):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p = 0.5 * k**2 * Δx**2 * np.log(np.abs(k) * Δx)
+        p[np.isnan(p)] = 0.0
+        return p
+
+    Δx = x[1] - x[0]
+    ρ = model.disldensity(x=x, disregistry=δ, cdiff=cdiff)[1]
+    j = np.arange(len(ρ))
+    energy = 0.0
+    for i in j:
+        χ = 3./2. * Δx**2 + (ψ(i - j, Δx) + ψ(i - j, Δx)
+                             - ψ(i - j + 1, Δx) - ψ(j - i + 1, Δx))
+        energy += np.sum(χ * np.inner(ρ[i].dot(model.K_tensor), ρ)) / (4 * np.pi)
+
+    assert np.isclose(model.elastic_energy(x, δ), energy, rtol=1e-12, atol=0)
@@ -0,0 +1,38 @@
+# coding: utf-8
+
+# https://docs.pytest.org/
+import pytest
+
+# atomman imports
+import atomman as am
+
+def stackingfault():
+    """Builds a (111) stacking fault generator for a small fcc cell"""
+    box = am.Box.cubic(3.6)
+    atoms = am.Atoms(pos=[[0.0, 0.0, 0.0], [0.5, 0.5, 0.0],
+                          [0.5, 0.0, 0.5], [0.0, 0.5, 0.5]])
+    ucell = am.System(atoms=atoms, box=box, scale=True, symbols='Cu')
+    sf = am.defect.StackingFault([1, 1, 1], ucell)
+    sf.surface(sizemults=[1, 1, 2])
+    return sf
+
+def test_dumpfaultmap_resume(tmp_path):
+    sf = stackingfault()
+    content = sf.dumpfaultmap(num_a1=2, num_a2=2, directory=tmp_path,
+                              dumpkwargs={'units': 'metal'})
+    assert len(content['points']) == 4
+    assert content['parameters']['namefmt'] == 'fault-{i1}-{i2}'
+    assert content['parameters']['dumpkwargs'] == {'units': 'metal'}
+
+    # Resuming with the same parameters reuses the manifest
+    content = sf.dumpfaultmap(num_a1=2, num_a2=2, directory=tmp_path,
+                              dumpkwargs={'units': 'metal'})
+    assert len(content['points']) == 4
+
+    # Resuming with a different namefmt or dumpkwargs is not allowed
+    with pytest.raises(ValueError):
+        sf.dumpfaultmap(num_a1=2, num_a2=2, directory=tmp_path,
+                        namefmt='sf-{i1}-{i2}', dumpkwargs={'units': 'metal'})
+    with pytest.raises(ValueError):
+        sf.dumpfaultmap(num_a1=2, num_a2=2, directory=tmp_path,
+                        dumpkwargs={'units': 'real'})
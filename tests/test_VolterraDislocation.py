@@ -0,0 +1,34 @@
+# coding: utf-8
+
+# https://docs.pytest.org/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+import atomman as am
+
+@pytest.fixture(params=['isotropic', 'stroh'])
+def dislsol(request):
+    if request.param == 'isotropic':
+        C = am.ElasticConstants(C11=169.9, C12=122.6, C44=23.65)
+        return am.defect.IsotropicVolterraDislocation(C, [1, 0, 0])
+    else:
+        C = am.ElasticConstants(C11=169.9, C12=122.6, C44=76.2)
+        return am.defect.Stroh(C, [1, 0, 0])
+
+def test_field_shapes(dislsol):
+    x, y = np.meshgrid(np.linspace(1, 2, 5), np.linspace(1, 2, 4))
+    pos = np.stack([x, y, np.zeros_like(x)], axis=-1)
+
+    assert dislsol.displacement(pos).shape == (4, 5, 3)
+    assert dislsol.stress(pos).shape == (4, 5, 3, 3)
+    assert dislsol.displacement([1, 2, 0]).shape == (3,)
+    assert dislsol.stress([1, 2, 0]).shape == (3, 3)
+
+def test_chunked_threaded(dislsol):
+    pos = np.random.default_rng(0).random((4, 5, 3)) + 1
+    stress = dislsol.stress(pos)
+    assert np.allclose(dislsol.stress(pos, chunksize=3, nthreads=2), stress)
+    assert np.allclose(dislsol.stress(pos.reshape(-1, 3)), stress.reshape(-1, 3, 3))
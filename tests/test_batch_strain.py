@@ -0,0 +1,115 @@
+# coding: utf-8
+
+# https://docs.pytest.org/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+import atomman as am
+from atomman.defect.batch_strain import batch_G, batch_nye
+
+def fcc_surface_system():
+    """
+    Builds a perturbed fcc system with a free (001) surface and a bridge site
+    adatom that has only two coplanar neighbors.
+    """
+    a = 3.6
+    box = am.Box.cubic(a)
+    atoms = am.Atoms(pos=[[0.0, 0.0, 0.0], [0.5, 0.5, 0.0],
+                          [0.5, 0.0, 0.5], [0.0, 0.5, 0.5]])
+    ucell = am.System(atoms=atoms, box=box, scale=True)
+    system = ucell.supersize(4, 4, 3)
+
+    # Add a bridge site adatom above the top surface
+    pos = system.atoms.pos
+    top = pos[np.isclose(pos[:, 2], pos[:, 2].max())][0]
+    adatom = top + a * np.array([0.25, 0.25, 0.375**0.5])
+
+    # Open the z boundary with vacuum
+    box = am.Box(avect=system.box.avect, bvect=system.box.bvect,
+                 cvect=system.box.cvect + np.array([0.0, 0.0, 4 * a]),
+                 origin=system.box.origin - np.array([0.0, 0.0, 2 * a]))
+    atoms = am.Atoms(pos=np.vstack([pos, adatom]))
+    system = am.System(atoms=atoms, box=box, pbc=(True, True, False))
+
+    rng = np.random.default_rng(12345)
+    system.atoms.pos += rng.normal(scale=0.01 * a, size=(system.natoms, 3))
+
+    p = 0.5 * a * np.array([[ 1, 1, 0], [-1,-1, 0], [ 1,-1, 0], [-1, 1, 0],
+                            [ 1, 0, 1], [-1, 0,-1], [ 1, 0,-1], [-1, 0, 1],
+                            [ 0, 1, 1], [ 0,-1,-1], [ 0, 1,-1], [ 0,-1, 1]])
+    p_vectors = np.broadcast_to(p, (system.natoms, 12, 3))
+    neighbors = am.NeighborList(system=system, cutoff=0.85 * a)
+
+    return system, neighbors, p_vectors
+
+def reference_G(system, neighbors, p_vectors, theta_max):
+    """Per-atom p-q matching and lstsq solution for G"""
+    cos_theta_max = np.cos(theta_max * np.pi / 180)
+    G = np.empty((system.natoms, 3, 3))
+    for i in range(system.natoms):
+        p = p_vectors[i]
+        q = system.dvect(i, neighbors[i])
+        pmag = np.linalg.norm(p, axis=1)
+        qmag = np.linalg.norm(q, axis=1)
+        r1 = pmag.min()
+
+        pairs = np.full(len(q), -1)
+        for j in range(len(q)):
+            cos_theta = np.dot(p, q[j]) / (pmag * qmag[j])
+            if cos_theta.max() > cos_theta_max:
+                pairs[j] = cos_theta.argmax()
+                for k in range(j):
+                    if pairs[j] == pairs[k]:
+                        if abs(r1 - qmag[j]) < abs(r1 - qmag[k]):
+                            pairs[k] = -1
+                        else:
+                            pairs[j] = -1
+        matched = pairs >= 0
+        G[i] = np.linalg.lstsq(q[matched], p[pairs[matched]], rcond=None)[0]
+
+    return G
+
+def reference_nye(system, neighbors, G):
+    """Per-atom lstsq solution for the Nye tensor"""
+    eps = np.array([[[ 0, 0, 0],[ 0, 0, 1],[ 0,-1, 0]],
+                    [[ 0, 0,-1],[ 0, 0, 0],[ 1, 0, 0]],
+                    [[ 0, 1, 0],[-1, 0, 0],[ 0, 0, 0]]])
+    nye = np.empty((system.natoms, 3, 3))
+    for i in range(system.natoms):
+        q = system.dvect(i, neighbors[i])
+        dG = G[neighbors[i]] - G[i]
+        gradG = np.empty((3, 3, 3))
+        for x in range(3):
+            gradG[x] = np.linalg.lstsq(q, dG[:, x, :], rcond=None)[0].T
+        nye[i] = -1 * np.einsum('ijm,ikm->jk', eps, gradG)
+
+    return nye
+
+@pytest.fixture(scope='module')
+def surface():
+    return fcc_surface_system()
+
+def test_coordination(surface):
+    system, neighbors, p_vectors = surface
+    assert neighbors.coord[:-1].max() == 12
+    assert neighbors.coord[:-1].min() < 12
+    assert neighbors.coord[-1] == 2
+
+def test_batch_G(surface):
+    system, neighbors, p_vectors = surface
+    theta_max = 35
+    G = batch_G(system.atoms.pos, system.box, system.pbc, neighbors.nlist,
+                p_vectors, theta_max=theta_max, chunksize=100)
+    assert np.allclose(G, reference_G(system, neighbors, p_vectors, theta_max),
+                       rtol=0, atol=1e-12)
+
+def test_batch_nye(surface):
+    system, neighbors, p_vectors = surface
+    G = reference_G(system, neighbors, p_vectors, 35)
+    nye = batch_nye(system.atoms.pos, system.box, system.pbc, neighbors.nlist,
+                    G, chunksize=100)
+    assert np.allclose(nye, reference_nye(system, neighbors, G),
+                       rtol=0, atol=1e-10)
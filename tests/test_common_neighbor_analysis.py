@@ -0,0 +1,104 @@
+# coding: utf-8
+
+# https://docs.pytest.org/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+import atomman as am
+
+def crystal(structure, noise=0.0):
+    """Builds a perfect or randomly perturbed fcc, bcc or hcp system"""
+    if structure == 'fcc':
+        a = 3.6
+        box = am.Box.cubic(a)
+        pos = [[0.0, 0.0, 0.0], [0.5, 0.5, 0.0], [0.5, 0.0, 0.5], [0.0, 0.5, 0.5]]
+        sizemults = (4, 4, 4)
+        nn = a / 2**0.5
+    elif structure == 'bcc':
+        a = 2.87
+        box = am.Box.cubic(a)
+        pos = [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]]
+        sizemults = (5, 5, 5)
+        nn = a * 3**0.5 / 2
+    elif structure == 'hcp':
+        a = 2.5
+        box = am.Box.hexagonal(a, a * (8 / 3)**0.5)
+        pos = [[1 / 3, 2 / 3, 0.25], [2 / 3, 1 / 3, 0.75]]
+        sizemults = (5, 5, 4)
+        nn = a
+    ucell = am.System(atoms=am.Atoms(pos=pos), box=box, scale=True)
+    system = ucell.supersize(*sizemults)
+
+    rng = np.random.default_rng(1)
+    system.atoms.pos += rng.normal(scale=noise * nn, size=(system.natoms, 3))
+    system.wrap()
+
+    return system, nn
+
+@pytest.mark.parametrize('noise', [0.0, 0.02])
+@pytest.mark.parametrize('structure', ['fcc', 'bcc', 'hcp'])
+def test_adaptive_cna(structure, noise):
+    system, nn = crystal(structure, noise)
+    types = am.analysis.common_neighbor_analysis(system, cutoff=1.5 * nn,
+                                                 chunksize=100)
+    expected = am.analysis.cna_structures.index(structure)
+    assert np.all(types == expected)
+
+@pytest.mark.parametrize('noise', [0.0, 0.02])
+@pytest.mark.parametrize('structure', ['fcc', 'bcc', 'hcp'])
+def test_conventional_cna(structure, noise):
+    system, nn = crystal(structure, noise)
+    if structure == 'bcc':
+        # Between the second (2/√3 nn) and third (2√2/√3 nn) shells
+        cutoff = 1.39 * nn
+    else:
+        cutoff = (1 + 2**0.5) / 2 * nn
+    types = am.analysis.common_neighbor_analysis(system, cutoff=cutoff,
+                                                 adaptive=False)
+    expected = am.analysis.cna_structures.index(structure)
+    assert np.all(types == expected)
+
+def test_cna_vacancy():
+    system, nn = crystal('fcc')
+    vacancy = system.atoms.pos[0]
+    system = am.System(atoms=am.Atoms(pos=system.atoms.pos[1:]), box=system.box)
+    types = am.analysis.common_neighbor_analysis(system, cutoff=1.5 * nn)
+
+    # Only the nearest neighbors of the vacancy are not fcc
+    r = np.linalg.norm(system.dvect(vacancy, system.atoms.pos), axis=1)
+    assert np.all((types == 0) == np.isclose(r, nn))
+    assert np.sum(types == 0) == 12
+
+@pytest.mark.parametrize('structure, nnn', [('fcc', 12), ('bcc', 8)])
+def test_centrosymmetry_perfect(structure, nnn):
+    system, nn = crystal(structure)
+    csp = am.analysis.centrosymmetry(system, cutoff=1.5 * nn, nnn=nnn)
+    assert np.allclose(csp, 0.0)
+
+def test_centrosymmetry_perturbed():
+    system, nn = crystal('fcc', 0.02)
+    csp = am.analysis.centrosymmetry(system, cutoff=1.5 * nn)
+    assert np.all(csp > 0.0)
+    assert np.all(csp < 0.25 * nn**2)
+
+def test_centrosymmetry_vacancy():
+    system, nn = crystal('fcc')
+    a = 3.6
+    vacancy = system.atoms.pos[0]
+    system = am.System(atoms=am.Atoms(pos=system.atoms.pos[1:]), box=system.box)
+    csp = am.analysis.centrosymmetry(system, cutoff=1.1 * a, chunksize=50)
+
+    # The 12 neighbors of the vacancy lose one centrosymmetric pair
+    r = np.linalg.norm(system.dvect(vacancy, system.atoms.pos), axis=1)
+    neighbors = np.isclose(r, nn)
+    assert neighbors.sum() == 12
+    assert np.allclose(csp[neighbors], a**2 / 2)
+    assert np.allclose(csp[~neighbors], 0.0)
+
+def test_centrosymmetry_nnn():
+    system, nn = crystal('fcc')
+    with pytest.raises(ValueError):
+        am.analysis.centrosymmetry(system, cutoff=1.5 * nn, nnn=11)
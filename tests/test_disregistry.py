@@ -0,0 +1,61 @@
+# coding: utf-8
+
+# https://docs.pytest.org/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+import atomman as am
+
+def column_systems(noise=0.0):
+    """
+    Builds base and displaced systems with 5 atomic columns along x on each
+    side of the y=0 plane, with 4 atoms along z in each column.
+    """
+    x, y, z = np.meshgrid(np.arange(5) + 0.25, [-0.5, 0.5], np.arange(4),
+                          indexing='ij')
+    pos = np.array([x.flatten(), y.flatten(), z.flatten()]).T
+    rng = np.random.default_rng(7)
+    pos[:, 0] += rng.uniform(-noise, noise, size=len(pos))
+
+    box = am.Box(avect=[5, 0, 0], bvect=[0, 4, 0], cvect=[0, 0, 4],
+                 origin=[0, -2, 0])
+    basesystem = am.System(atoms=am.Atoms(pos=pos), box=box)
+
+    # Shift the atoms above the plane by an x-dependent amount
+    disp = np.zeros_like(pos)
+    above = pos[:, 1] > 0
+    disp[above, 0] = 0.1 * np.floor(pos[above, 0])
+    disp[above, 2] = 0.01 * pos[above, 2]
+    dislsystem = am.System(atoms=am.Atoms(pos=pos + disp), box=box)
+
+    return basesystem, dislsystem
+
+def test_one_coord_per_column():
+    basesystem, dislsystem = column_systems(noise=1e-9)
+    coord, disreg = am.defect.disregistry(basesystem, dislsystem)
+
+    assert len(coord) == 5
+    assert np.allclose(coord, np.arange(5) + 0.25, atol=1e-8)
+
+    # Column displacements are averaged over the atoms along z
+    assert np.allclose(disreg[:, 0], 0.1 * np.arange(5))
+    assert np.allclose(disreg[:, 1], 0.0)
+    assert np.allclose(disreg[:, 2], 0.015)
+
+def test_tol_is_absolute():
+    basesystem, dislsystem = column_systems(noise=1e-3)
+    coord, disreg = am.defect.disregistry(basesystem, dislsystem, tol=1e-2)
+    assert len(coord) == 5
+
+    coord, disreg = am.defect.disregistry(basesystem, dislsystem, tol=1e-6)
+    assert len(coord) > 5
+
+def test_multiple_frames():
+    basesystem, dislsystem = column_systems()
+    coord, disreg = am.defect.disregistry(basesystem, [basesystem, dislsystem])
+    assert disreg.shape == (2, 5, 3)
+    assert np.allclose(disreg[0], 0.0)
+    assert np.allclose(disreg[1], am.defect.disregistry(basesystem, dislsystem)[1])
@@ -0,0 +1,24 @@
+# coding: utf-8
+
+# https://docs.pytest.org/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+import atomman as am
+
+def test_cubic_111():
+    uvws = am.defect.free_surface_basis([1, 1, 1])
+    assert np.allclose(uvws, [[-1, 1, 0], [-1, 0, 1], [1, 1, 1]])
+
+def test_second_vector_smallest_angle():
+    # [1,-1,-1] and [2,1,-1] have the same magnitude to within rounding
+    box = am.Box(a=3, b=3, c=5, gamma=120)
+    uvws = am.defect.free_surface_basis([-2, 1, -3], box=box)
+    assert np.allclose(uvws, [[1, 2, 0], [2, 1, -1], [-2, 0, -1]])
+
+    a_cart = uvws[0].dot(box.vects)
+    b_cart = uvws[1].dot(box.vects)
+    assert am.tools.vect_angle(a_cart, b_cart) < 90
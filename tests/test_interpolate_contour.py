@@ -0,0 +1,45 @@
+# coding: utf-8
+
+# Standard Python libraries
+import importlib
+
+# http://www.numpy.org/
+import numpy as np
+
+# https://www.scipy.org/
+from scipy.interpolate import griddata
+
+# atomman imports
+ic = importlib.import_module('atomman.plot.interpolate_contour')
+
+def test_triangulation_cache_checks_coordinates():
+    rng = np.random.default_rng(1)
+    x = rng.random(30)
+    y = rng.random(30)
+    entry = ic._triangulation(x, y)
+    assert ic._triangulation(x.copy(), y.copy()) is entry
+
+    # A stale entry stored under the same key must not be reused
+    entry['x'] = entry['x'] + 1.0
+    assert ic._triangulation(x, y) is not entry
+
+def test_weights_cache_is_bounded():
+    rng = np.random.default_rng(2)
+    x = rng.random(30)
+    y = rng.random(30)
+    for n in range(ic._weights_cache_size + 3):
+        xi = np.linspace(0, 1, 10 + n)
+        vertices, weights = ic._linear_weights(x, y, xi, xi)
+        assert weights.shape == (10 + n, 10 + n, 3)
+    assert len(ic._triangulation(x, y)['weights']) == ic._weights_cache_size
+
+def test_linear_matches_griddata():
+    rng = np.random.default_rng(3)
+    x = rng.random(50)
+    y = rng.random(50)
+    v = np.sin(3 * x) * y
+    for i in range(2):
+        grid, xlim, ylim = ic.grid_interpolate_2d(x, y, v, method='linear')
+        x0, y0 = np.meshgrid(np.linspace(*xlim, num=50), np.linspace(*ylim, num=50))
+        ref = griddata((x, y), v, (x0, y0), method='linear')
+        assert np.allclose(grid, ref, equal_nan=True)
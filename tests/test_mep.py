@@ -0,0 +1,41 @@
+# coding: utf-8
+
+# https://docs.pytest.org/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+# atomman imports
+import atomman as am
+from atomman.mep.integrator import rk45
+
+def test_rk45_exponential():
+    coord = np.array([1.0, 2.0])
+    newcoord = rk45(lambda c, k: -k * c, coord, 2.0, errortol=1e-10, k=1.5)
+    assert np.allclose(newcoord, coord * np.exp(-3.0), rtol=1e-8, atol=0)
+
+def test_rk45_maxsubsteps():
+    with pytest.raises(RuntimeError):
+        rk45(lambda c: -100 * c, np.array([1.0]), 1.0, maxsubsteps=3)
+
+def test_relax_evaluation_counts(capsys):
+    counts = {'energy': 0, 'gradient': 0}
+    def energyfxn(coord):
+        counts['energy'] += 1
+        return np.sum(np.sin(np.pi * coord)**2, axis=-1)
+    def gradientfxn(energyfxn, coord):
+        counts['gradient'] += 1
+        return am.mep.gradient.central_difference(energyfxn, coord)
+
+    coord = np.array([np.linspace(0, 1, 11), 0.1 * np.sin(np.pi * np.linspace(0, 1, 11))]).T
+    path = am.mep.ISMPath(coord, energyfxn, gradientfxn=gradientfxn,
+                          integratorfxn='rk45')
+    with pytest.warns(RuntimeWarning):
+        path.relax(relaxsteps=3, timestep=0.01, verbose=True)
+    out = capsys.readouterr().out
+
+    # The climb point search evaluates the energy once after reporting
+    assert f'Gradient evaluations: {counts["gradient"]}' in out
+    assert f'Energy evaluations: {counts["energy"] - 1}' in out
+    assert counts['gradient'] >= 3 * 7